@@ -90,6 +90,22 @@ CREATE TABLE IF NOT EXISTS tasks (
 );
 
 
+-- =============================================================================
+-- OUTPUT BLOBS
+-- Compressed, deduplicated tool output referenced by attempts
+-- (see database/blobs.py)
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS output_blobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    hash TEXT NOT NULL UNIQUE,              -- SHA-256 of the uncompressed text
+    codec TEXT NOT NULL,                    -- 'zlib' or 'raw'
+    size INTEGER NOT NULL,                  -- Uncompressed size in bytes
+    data BLOB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+
 -- =============================================================================
 -- ATTEMPTS
 -- Every attempt to complete a stage (full execution history)
@@ -123,13 +139,14 @@ CREATE TABLE IF NOT EXISTS attempts (
     -- LLM response (for debugging)
     llm_response_preview TEXT,              -- First 1000 chars of response
 
-    -- Verification outputs (code-verified results)
+    -- Verification outputs (code-verified results); output text lives in
+    -- output_blobs and is only loaded on request
     pytest_exit_code INTEGER,
-    pytest_output TEXT,                     -- Truncated output
+    pytest_output_blob INTEGER REFERENCES output_blobs(id),
     mypy_exit_code INTEGER,
-    mypy_output TEXT,
+    mypy_output_blob INTEGER REFERENCES output_blobs(id),
     ruff_exit_code INTEGER,
-    ruff_output TEXT,
+    ruff_output_blob INTEGER REFERENCES output_blobs(id),
 
     -- Complexity tracking (PLAN8)
     -- NOTE: For existing databases, manually run:
@@ -258,7 +275,8 @@ INSERT OR IGNORE INTO config (key, value, description) VALUES
     ('budget_warning_threshold', '80', 'Percentage of budget that triggers warning'),
     ('heartbeat_interval_seconds', '30', 'Worker heartbeat interval'),
     ('claim_timeout_seconds', '300', 'Task claim expiration timeout'),
-    ('verify_timeout_seconds', '90', 'Timeout in seconds for each pytest/ruff/mypy subprocess');
+    ('verify_timeout_seconds', '90', 'Timeout in seconds for each pytest/ruff/mypy subprocess'),
+    ('retention_days', '30', 'Days a finished run keeps its detail rows before archival');
 
 
 -- =============================================================================
@@ -300,6 +318,112 @@ CREATE INDEX IF NOT EXISTS idx_run_tasks_run_id ON run_tasks(run_id);
 CREATE INDEX IF NOT EXISTS idx_run_tasks_task_id ON run_tasks(task_id);
 
 
+-- =============================================================================
+-- RUN SUMMARIES (Retention)
+-- Compact per-run totals written when a finished run's detail rows are moved
+-- out of the append-only tables (see database/archive.py). The
+-- execution_runs row itself is kept.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS run_summaries (
+    run_id INTEGER PRIMARY KEY REFERENCES execution_runs(id),
+    invocations INTEGER NOT NULL DEFAULT 0,
+    invocation_tokens INTEGER NOT NULL DEFAULT 0,
+    invocation_duration_ms INTEGER NOT NULL DEFAULT 0,
+    circuit_events INTEGER NOT NULL DEFAULT 0,
+    review_findings INTEGER NOT NULL DEFAULT 0,
+    archived_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+
+-- =============================================================================
+-- TASK DEPENDENCIES AND READY QUEUE
+-- tasks.depends_on (JSON) stays the authoritative input; triggers mirror it
+-- into task_dependencies and keep task_ready_queue up to date.
+-- =============================================================================
+
+-- One edge per (task, dependency key). depends_on_id is NULL while the
+-- named task does not exist (a dangling reference) and is resolved when a
+-- task with that key is inserted.
+CREATE TABLE IF NOT EXISTS task_dependencies (
+    task_id INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    depends_on_key TEXT NOT NULL,           -- Key as written in tasks.depends_on
+    depends_on_id INTEGER REFERENCES tasks(id) ON DELETE SET NULL,
+    position INTEGER NOT NULL DEFAULT 0,    -- Index within the depends_on array
+    PRIMARY KEY (task_id, depends_on_key)
+);
+
+-- Reverse lookups: "who depends on X"
+CREATE INDEX IF NOT EXISTS idx_task_dependencies_reverse
+    ON task_dependencies(depends_on_id);
+CREATE INDEX IF NOT EXISTS idx_task_dependencies_dangling
+    ON task_dependencies(depends_on_key) WHERE depends_on_id IS NULL;
+
+-- One row per pending task. unresolved_deps counts dependencies that exist
+-- and are not yet complete/passing; a task is ready when it reaches 0.
+-- Dangling references do not block.
+CREATE TABLE IF NOT EXISTS task_ready_queue (
+    task_id INTEGER PRIMARY KEY REFERENCES tasks(id) ON DELETE CASCADE,
+    phase INTEGER NOT NULL DEFAULT 0,       -- Copied from tasks for index ordering
+    sequence INTEGER NOT NULL DEFAULT 0,
+    unresolved_deps INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_ready_queue_ready
+    ON task_ready_queue(phase, sequence) WHERE unresolved_deps = 0;
+
+
+-- =============================================================================
+-- TASK EVENTS
+-- Change log of task status transitions, appended by trg_task_events_status.
+-- Readers (db/observer.py) poll past the last id they have seen and prune
+-- what they have acknowledged; AUTOINCREMENT keeps ids from being reused.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS task_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL,
+    task_key TEXT NOT NULL,
+    old_status TEXT,
+    new_status TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+
+
+-- =============================================================================
+-- ANALYTICS ROLLUPS
+-- Aggregates behind the /analytics and /metrics/json endpoints, maintained
+-- by the trg_*_rollup triggers on every insert, update and delete so each
+-- always equals the aggregate over the current rows of its source table
+-- (migrations.REBUILD_ANALYTICS_ROLLUPS_SQL recomputes them from scratch).
+-- Averages are stored as a sum plus the number of non-NULL values summed.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS attempt_stage_rollup (
+    stage TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,         -- Sum over attempts with a duration
+    timed INTEGER NOT NULL DEFAULT 0,               -- Attempts with a duration
+    success_duration_ms INTEGER NOT NULL DEFAULT 0, -- The same, successful attempts only
+    success_timed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS invocation_stage_rollup (
+    stage TEXT PRIMARY KEY,
+    invocations INTEGER NOT NULL DEFAULT 0,
+    tokens INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,         -- Sum over invocations with a duration
+    timed INTEGER NOT NULL DEFAULT 0                -- Invocations with a duration
+);
+
+-- Tasks currently complete/passing, by the day they were last updated
+CREATE TABLE IF NOT EXISTS task_completion_rollup (
+    day TEXT PRIMARY KEY,                           -- DATE(tasks.updated_at)
+    completed INTEGER NOT NULL DEFAULT 0
+);
+
+
 -- =============================================================================
 -- INDEXES
 -- Optimize common queries
@@ -307,7 +431,10 @@ CREATE INDEX IF NOT EXISTS idx_run_tasks_task_id ON run_tasks(task_id);
 
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_tasks_spec_id ON tasks(spec_id);
-CREATE INDEX IF NOT EXISTS idx_tasks_phase_seq ON tasks(phase, sequence);
+-- Task list order (the keyset pagination key of GET /tasks) with the list
+-- filter columns, so filtered pages and counts are answered from the index
+CREATE INDEX IF NOT EXISTS idx_tasks_page ON tasks(phase, sequence, id, status, complexity);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_page ON tasks(status, phase, sequence, id, complexity);
 CREATE INDEX IF NOT EXISTS idx_tasks_claimed_by ON tasks(claimed_by);
 CREATE INDEX IF NOT EXISTS idx_tasks_claim_expires ON tasks(claim_expires_at);
 CREATE INDEX IF NOT EXISTS idx_tasks_complexity ON tasks(complexity);  -- PLAN8: Complexity queries
@@ -340,6 +467,269 @@ BEGIN
     UPDATE tasks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
 END;
 
+-- Record every status transition in the task_events change log
+CREATE TRIGGER IF NOT EXISTS trg_task_events_status
+AFTER UPDATE OF status ON tasks
+WHEN OLD.status IS NOT NEW.status
+BEGIN
+    INSERT INTO task_events (task_id, task_key, old_status, new_status)
+    VALUES (NEW.id, NEW.task_key, OLD.status, NEW.status);
+END;
+
+-- Dependency and ready queue maintenance. Every reverse lookup goes
+-- through idx_task_dependencies_reverse or idx_task_dependencies_dangling.
+
+-- New task: resolve edges that named it while it was missing (a
+-- non-terminal task now blocks them), record its own edges, queue it.
+CREATE TRIGGER IF NOT EXISTS trg_task_deps_insert
+AFTER INSERT ON tasks
+BEGIN
+    UPDATE task_dependencies SET depends_on_id = NEW.id
+    WHERE depends_on_key = NEW.task_key AND depends_on_id IS NULL;
+    UPDATE task_ready_queue SET unresolved_deps = unresolved_deps + 1
+    WHERE NEW.status NOT IN ('complete', 'passing')
+      AND task_id IN (SELECT task_id FROM task_dependencies WHERE depends_on_id = NEW.id);
+    INSERT OR IGNORE INTO task_dependencies
+        (task_id, depends_on_key, depends_on_id, position)
+    SELECT NEW.id, dep.value, (SELECT b.id FROM tasks b WHERE b.task_key = dep.value), dep.key
+    FROM json_each(CASE WHEN json_valid(NEW.depends_on) THEN NEW.depends_on END) AS dep
+    WHERE dep.type = 'text' AND typeof(dep.key) = 'integer';   -- String array elements
+    INSERT OR REPLACE INTO task_ready_queue (task_id, phase, sequence, unresolved_deps)
+    SELECT NEW.id, NEW.phase, NEW.sequence, (
+        SELECT COUNT(*)
+        FROM task_dependencies e
+        JOIN tasks b ON b.id = e.depends_on_id
+        WHERE e.task_id = NEW.id AND b.status NOT IN ('complete', 'passing')
+    )
+    WHERE NEW.status = 'pending';
+END;
+
+-- Status change: leave/enter the queue, and adjust dependents' counters
+-- when the task crosses the complete/passing boundary.
+CREATE TRIGGER IF NOT EXISTS trg_task_deps_status
+AFTER UPDATE OF status ON tasks
+WHEN OLD.status IS NOT NEW.status
+BEGIN
+    DELETE FROM task_ready_queue WHERE task_id = NEW.id AND NEW.status != 'pending';
+    UPDATE task_ready_queue
+    SET unresolved_deps = unresolved_deps
+        + CASE WHEN NEW.status IN ('complete', 'passing') THEN -1 ELSE 1 END
+    WHERE (OLD.status IN ('complete', 'passing')) != (NEW.status IN ('complete', 'passing'))
+      AND task_id IN (SELECT task_id FROM task_dependencies WHERE depends_on_id = NEW.id);
+    INSERT OR REPLACE INTO task_ready_queue (task_id, phase, sequence, unresolved_deps)
+    SELECT NEW.id, NEW.phase, NEW.sequence, (
+        SELECT COUNT(*)
+        FROM task_dependencies e
+        JOIN tasks b ON b.id = e.depends_on_id
+        WHERE e.task_id = NEW.id AND b.status NOT IN ('complete', 'passing')
+    )
+    WHERE NEW.status = 'pending';
+END;
+
+-- Dependency list edited: re-mirror the edges and recount
+CREATE TRIGGER IF NOT EXISTS trg_task_deps_depends_on
+AFTER UPDATE OF depends_on ON tasks
+BEGIN
+    DELETE FROM task_dependencies WHERE task_id = NEW.id;
+    INSERT OR IGNORE INTO task_dependencies
+        (task_id, depends_on_key, depends_on_id, position)
+    SELECT NEW.id, dep.value, (SELECT b.id FROM tasks b WHERE b.task_key = dep.value), dep.key
+    FROM json_each(CASE WHEN json_valid(NEW.depends_on) THEN NEW.depends_on END) AS dep
+    WHERE dep.type = 'text' AND typeof(dep.key) = 'integer';   -- String array elements
+    UPDATE task_ready_queue SET unresolved_deps = (
+        SELECT COUNT(*)
+        FROM task_dependencies e
+        JOIN tasks b ON b.id = e.depends_on_id
+        WHERE e.task_id = NEW.id AND b.status NOT IN ('complete', 'passing')
+    )
+    WHERE task_id = NEW.id;
+END;
+
+-- Keep the ordering columns in sync
+CREATE TRIGGER IF NOT EXISTS trg_ready_queue_order
+AFTER UPDATE OF phase, sequence ON tasks
+WHEN NEW.status = 'pending'
+BEGIN
+    UPDATE task_ready_queue SET phase = NEW.phase, sequence = NEW.sequence
+    WHERE task_id = NEW.id;
+END;
+
+-- Renamed task: edges naming the old key become dangling, edges naming
+-- the new key resolve to it
+CREATE TRIGGER IF NOT EXISTS trg_task_deps_rename
+AFTER UPDATE OF task_key ON tasks
+WHEN OLD.task_key IS NOT NEW.task_key
+BEGIN
+    UPDATE task_ready_queue SET unresolved_deps = unresolved_deps - 1
+    WHERE NEW.status NOT IN ('complete', 'passing')
+      AND task_id IN (SELECT task_id FROM task_dependencies WHERE depends_on_id = NEW.id);
+    UPDATE task_dependencies SET depends_on_id = NULL WHERE depends_on_id = NEW.id;
+    UPDATE task_dependencies SET depends_on_id = NEW.id
+    WHERE depends_on_key = NEW.task_key AND depends_on_id IS NULL;
+    UPDATE task_ready_queue SET unresolved_deps = unresolved_deps + 1
+    WHERE NEW.status NOT IN ('complete', 'passing')
+      AND task_id IN (SELECT task_id FROM task_dependencies WHERE depends_on_id = NEW.id);
+END;
+
+-- Deleted task: drop its edges; its dependents now hold dangling references
+CREATE TRIGGER IF NOT EXISTS trg_task_deps_delete
+AFTER DELETE ON tasks
+BEGIN
+    DELETE FROM task_ready_queue WHERE task_id = OLD.id;
+    DELETE FROM task_dependencies WHERE task_id = OLD.id;
+    UPDATE task_ready_queue SET unresolved_deps = unresolved_deps - 1
+    WHERE OLD.status NOT IN ('complete', 'passing')
+      AND task_id IN (SELECT task_id FROM task_dependencies WHERE depends_on_id = OLD.id);
+    UPDATE task_dependencies SET depends_on_id = NULL WHERE depends_on_id = OLD.id;
+END;
+
+
+-- Analytics rollups. Each trigger subtracts the old row's contribution and
+-- adds the new row's; rows whose counts fall to 0 are kept and filtered
+-- out by readers.
+
+CREATE TRIGGER IF NOT EXISTS trg_attempt_rollup_insert
+AFTER INSERT ON attempts
+BEGIN
+    INSERT INTO attempt_stage_rollup
+        (stage, attempts, successes, duration_ms, timed, success_duration_ms, success_timed)
+    VALUES (
+        NEW.stage, 1, NEW.success IS 1,
+        COALESCE(NEW.duration_ms, 0), NEW.duration_ms IS NOT NULL,
+        CASE WHEN NEW.success IS 1 THEN COALESCE(NEW.duration_ms, 0) ELSE 0 END,
+        NEW.success IS 1 AND NEW.duration_ms IS NOT NULL
+    )
+    ON CONFLICT(stage) DO UPDATE SET
+        attempts = attempts + excluded.attempts,
+        successes = successes + excluded.successes,
+        duration_ms = duration_ms + excluded.duration_ms,
+        timed = timed + excluded.timed,
+        success_duration_ms = success_duration_ms + excluded.success_duration_ms,
+        success_timed = success_timed + excluded.success_timed;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_attempt_rollup_update
+AFTER UPDATE OF stage, success, duration_ms ON attempts
+BEGIN
+    UPDATE attempt_stage_rollup SET
+        attempts = attempts - 1,
+        successes = successes - (OLD.success IS 1),
+        duration_ms = duration_ms - COALESCE(OLD.duration_ms, 0),
+        timed = timed - (OLD.duration_ms IS NOT NULL),
+        success_duration_ms = success_duration_ms
+            - CASE WHEN OLD.success IS 1 THEN COALESCE(OLD.duration_ms, 0) ELSE 0 END,
+        success_timed = success_timed - (OLD.success IS 1 AND OLD.duration_ms IS NOT NULL)
+    WHERE stage = OLD.stage;
+    INSERT INTO attempt_stage_rollup
+        (stage, attempts, successes, duration_ms, timed, success_duration_ms, success_timed)
+    VALUES (
+        NEW.stage, 1, NEW.success IS 1,
+        COALESCE(NEW.duration_ms, 0), NEW.duration_ms IS NOT NULL,
+        CASE WHEN NEW.success IS 1 THEN COALESCE(NEW.duration_ms, 0) ELSE 0 END,
+        NEW.success IS 1 AND NEW.duration_ms IS NOT NULL
+    )
+    ON CONFLICT(stage) DO UPDATE SET
+        attempts = attempts + excluded.attempts,
+        successes = successes + excluded.successes,
+        duration_ms = duration_ms + excluded.duration_ms,
+        timed = timed + excluded.timed,
+        success_duration_ms = success_duration_ms + excluded.success_duration_ms,
+        success_timed = success_timed + excluded.success_timed;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_attempt_rollup_delete
+AFTER DELETE ON attempts
+BEGIN
+    UPDATE attempt_stage_rollup SET
+        attempts = attempts - 1,
+        successes = successes - (OLD.success IS 1),
+        duration_ms = duration_ms - COALESCE(OLD.duration_ms, 0),
+        timed = timed - (OLD.duration_ms IS NOT NULL),
+        success_duration_ms = success_duration_ms
+            - CASE WHEN OLD.success IS 1 THEN COALESCE(OLD.duration_ms, 0) ELSE 0 END,
+        success_timed = success_timed - (OLD.success IS 1 AND OLD.duration_ms IS NOT NULL)
+    WHERE stage = OLD.stage;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_invocation_rollup_insert
+AFTER INSERT ON invocations
+BEGIN
+    INSERT INTO invocation_stage_rollup (stage, invocations, tokens, duration_ms, timed)
+    VALUES (
+        NEW.stage, 1, COALESCE(NEW.token_count, 0),
+        COALESCE(NEW.duration_ms, 0), NEW.duration_ms IS NOT NULL
+    )
+    ON CONFLICT(stage) DO UPDATE SET
+        invocations = invocations + excluded.invocations,
+        tokens = tokens + excluded.tokens,
+        duration_ms = duration_ms + excluded.duration_ms,
+        timed = timed + excluded.timed;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_invocation_rollup_update
+AFTER UPDATE OF stage, token_count, duration_ms ON invocations
+BEGIN
+    UPDATE invocation_stage_rollup SET
+        invocations = invocations - 1,
+        tokens = tokens - COALESCE(OLD.token_count, 0),
+        duration_ms = duration_ms - COALESCE(OLD.duration_ms, 0),
+        timed = timed - (OLD.duration_ms IS NOT NULL)
+    WHERE stage = OLD.stage;
+    INSERT INTO invocation_stage_rollup (stage, invocations, tokens, duration_ms, timed)
+    VALUES (
+        NEW.stage, 1, COALESCE(NEW.token_count, 0),
+        COALESCE(NEW.duration_ms, 0), NEW.duration_ms IS NOT NULL
+    )
+    ON CONFLICT(stage) DO UPDATE SET
+        invocations = invocations + excluded.invocations,
+        tokens = tokens + excluded.tokens,
+        duration_ms = duration_ms + excluded.duration_ms,
+        timed = timed + excluded.timed;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_invocation_rollup_delete
+AFTER DELETE ON invocations
+BEGIN
+    UPDATE invocation_stage_rollup SET
+        invocations = invocations - 1,
+        tokens = tokens - COALESCE(OLD.token_count, 0),
+        duration_ms = duration_ms - COALESCE(OLD.duration_ms, 0),
+        timed = timed - (OLD.duration_ms IS NOT NULL)
+    WHERE stage = OLD.stage;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_completion_rollup_insert
+AFTER INSERT ON tasks
+WHEN NEW.status IN ('complete', 'passing') AND DATE(NEW.updated_at) IS NOT NULL
+BEGIN
+    INSERT INTO task_completion_rollup (day, completed)
+    VALUES (DATE(NEW.updated_at), 1)
+    ON CONFLICT(day) DO UPDATE SET completed = completed + 1;
+END;
+
+-- Also fires for the updated_at bump made by trg_task_updated, which moves
+-- a completion to the day of the status change
+CREATE TRIGGER IF NOT EXISTS trg_completion_rollup_update
+AFTER UPDATE OF status, updated_at ON tasks
+WHEN (OLD.status IN ('complete', 'passing') OR NEW.status IN ('complete', 'passing'))
+  AND (OLD.status IS NOT NEW.status OR DATE(OLD.updated_at) IS NOT DATE(NEW.updated_at))
+BEGIN
+    UPDATE task_completion_rollup SET completed = completed - 1
+    WHERE OLD.status IN ('complete', 'passing') AND day = DATE(OLD.updated_at);
+    INSERT INTO task_completion_rollup (day, completed)
+    SELECT DATE(NEW.updated_at), 1
+    WHERE NEW.status IN ('complete', 'passing') AND DATE(NEW.updated_at) IS NOT NULL
+    ON CONFLICT(day) DO UPDATE SET completed = completed + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_completion_rollup_delete
+AFTER DELETE ON tasks
+WHEN OLD.status IN ('complete', 'passing')
+BEGIN
+    UPDATE task_completion_rollup SET completed = completed - 1
+    WHERE day = DATE(OLD.updated_at);
+END;
+
 
 -- =============================================================================
 -- VIEWS
@@ -355,26 +745,22 @@ SELECT
 FROM tasks
 GROUP BY status;
 
--- Ready tasks (pending with dependencies met)
+-- Ready tasks (pending with dependencies met), read from the ready queue
 CREATE VIEW IF NOT EXISTS v_ready_tasks AS
 SELECT t.*
-FROM tasks t
-WHERE t.status = 'pending'
-AND NOT EXISTS (
-    SELECT 1
-    FROM json_each(t.depends_on) AS dep
-    JOIN tasks blocker ON blocker.task_key = dep.value
-    WHERE blocker.status NOT IN ('complete', 'passing')
-)
-ORDER BY t.phase, t.sequence;
+FROM task_ready_queue q
+JOIN tasks t ON t.id = q.task_id
+WHERE q.unresolved_deps = 0
+ORDER BY q.phase, q.sequence;
 
 -- Claimable tasks (ready tasks not claimed or with expired claims)
 CREATE VIEW IF NOT EXISTS v_claimable_tasks AS
 SELECT t.*
-FROM v_ready_tasks t
-WHERE t.claimed_by IS NULL
-   OR t.claim_expires_at < CURRENT_TIMESTAMP
-ORDER BY t.phase, t.sequence;
+FROM task_ready_queue q
+JOIN tasks t ON t.id = q.task_id
+WHERE q.unresolved_deps = 0
+  AND (t.claimed_by IS NULL OR t.claim_expires_at < CURRENT_TIMESTAMP)
+ORDER BY q.phase, q.sequence;
 
 -- Stale tasks (tasks with expired claims that need recovery)
 CREATE VIEW IF NOT EXISTS v_stale_tasks AS
@@ -516,6 +902,8 @@ CREATE INDEX IF NOT EXISTS idx_circuit_breaker_events_created_at
     ON circuit_breaker_events(created_at);
 CREATE INDEX IF NOT EXISTS idx_circuit_breaker_events_event_type
     ON circuit_breaker_events(event_type);
+CREATE INDEX IF NOT EXISTS idx_circuit_breaker_events_run_id
+    ON circuit_breaker_events(run_id);
 
 -- =============================================================================
 -- FAILURE COUNTS (for sliding window mode)
@@ -754,6 +1142,7 @@ CREATE INDEX IF NOT EXISTS idx_srm_task_id ON static_review_metrics(task_id);
 CREATE INDEX IF NOT EXISTS idx_srm_check_name ON static_review_metrics(check_name);
 CREATE INDEX IF NOT EXISTS idx_srm_severity ON static_review_metrics(severity);
 CREATE INDEX IF NOT EXISTS idx_srm_detected_at ON static_review_metrics(detected_at);
+CREATE INDEX IF NOT EXISTS idx_srm_run_id ON static_review_metrics(run_id);
 
 -- View: Summary metrics for promotion decisions
 CREATE VIEW IF NOT EXISTS v_shadow_mode_summary AS
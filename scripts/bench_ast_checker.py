@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark the AST quality checker and gate on regressions.
+
+Writes JSON results for the synthetic corpora (plus an optional directory of
+real-world files) and, when a baseline is given, exits non-zero if any
+detector or check_file timing/memory regressed beyond the tolerance, or if
+check_file no longer fits the 500ms static review timeout.
+
+Usage:
+    # Record a baseline
+    python scripts/bench_ast_checker.py --output bench/ast_baseline.json
+
+    # CI gate against the recorded baseline
+    python scripts/bench_ast_checker.py --compare bench/ast_baseline.json \\
+        --output bench/ast_current.json --tolerance 0.25
+
+    # Include real-world corpus
+    python scripts/bench_ast_checker.py --corpus-dir tests/ --output out.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add src to path so we can import tdd_orchestrator
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tdd_orchestrator.ast_checker.benchmark import (
+    compare_to_baseline,
+    load_real_corpus,
+    run_benchmarks,
+    synthetic_corpora,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--iterations", type=int, default=5, help="Timed runs per measurement")
+    parser.add_argument("--corpus-dir", type=Path, help="Directory of real-world .py files")
+    parser.add_argument("--output", type=Path, help="Write results JSON to this path")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed regression fraction")
+    args = parser.parse_args()
+
+    # check_file logs one INFO line per call; keep benchmark output readable
+    logging.getLogger("tdd_orchestrator").setLevel(logging.WARNING)
+
+    corpora = synthetic_corpora()
+    if args.corpus_dir:
+        corpora.update(load_real_corpus(args.corpus_dir))
+
+    results = run_benchmarks(iterations=args.iterations, corpora=corpora)
+    rendered = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    else:
+        print(rendered)
+
+    for name, corpus in results["corpora"].items():
+        check = corpus.get("check_file", {})
+        print(
+            f"{name:40s} {corpus['lines']:>6d} lines  "
+            f"check_file median {check.get('median_ms', '-')}ms  "
+            f"peak {check.get('peak_kib', '-')}KiB",
+            file=sys.stderr,
+        )
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            print("AST checker benchmark regressions:", file=sys.stderr)
+            for line in regressions:
+                print(f"  - {line}", file=sys.stderr)
+            return 1
+        print("No AST checker benchmark regressions", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
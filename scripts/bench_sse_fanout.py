@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark SSE fan-out to many concurrent subscribers.
+
+Prints (or writes) JSON with idle CPU, fan-out CPU and delivery latency
+percentiles. Optional limits turn it into a CI gate: the exit status is
+non-zero when a limit is exceeded or an event was not delivered.
+
+Usage:
+    # 1,000 subscribers, 50 events
+    python scripts/bench_sse_fanout.py --output bench/sse_fanout.json
+
+    # CI gate
+    python scripts/bench_sse_fanout.py --max-idle-cpu-percent 2 --max-p99-ms 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add src to path so we can import tdd_orchestrator
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tdd_orchestrator.api.sse_benchmark import run_fanout_benchmark
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--subscribers", type=int, default=1_000, help="Concurrent subscribers")
+    parser.add_argument("--events", type=int, default=50, help="Events to publish")
+    parser.add_argument("--interval", type=float, default=0.02, help="Seconds between events")
+    parser.add_argument("--idle-seconds", type=float, default=1.0, help="Idle phase length")
+    parser.add_argument("--output", type=Path, help="Write results JSON to this path")
+    parser.add_argument("--max-idle-cpu-percent", type=float, help="Fail above this idle CPU")
+    parser.add_argument("--max-p99-ms", type=float, help="Fail above this p99 latency")
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        run_fanout_benchmark(
+            subscribers=args.subscribers,
+            events=args.events,
+            interval=args.interval,
+            idle_seconds=args.idle_seconds,
+        )
+    )
+    rendered = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    else:
+        print(rendered)
+
+    idle = results["idle"]
+    latency = results["latency_ms"]
+    print(
+        f"{results['subscribers']} subscribers  idle CPU {idle['cpu_percent']}%  "
+        f"fan-out {results['fanout']['cpu_ms_per_event']}ms CPU/event  "
+        f"latency p50 {latency['p50']}ms p99 {latency['p99']}ms",
+        file=sys.stderr,
+    )
+
+    failures = []
+    if latency["deliveries"] < latency["expected"]:
+        failures.append(f"delivered {latency['deliveries']} of {latency['expected']} events")
+    if args.max_idle_cpu_percent is not None and idle["cpu_percent"] > args.max_idle_cpu_percent:
+        failures.append(f"idle CPU {idle['cpu_percent']}% > {args.max_idle_cpu_percent}%")
+    if args.max_p99_ms is not None and (latency["p99"] or 0) > args.max_p99_ms:
+        failures.append(f"p99 latency {latency['p99']}ms > {args.max_p99_ms}ms")
+    if failures:
+        print("SSE fan-out benchmark failures:", file=sys.stderr)
+        for line in failures:
+            print(f"  - {line}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Callable
 
@@ -20,6 +21,11 @@ class HealthResponse(BaseModel):
 # Global state for broadcaster and callback
 _broadcaster: Any = None
 _registered_callback: Callable[[dict[str, Any]], None] | None = None
+_observer: Any = None
+
+# Publish tasks started from observer callbacks; the loop only keeps weak
+# references, so hold them here until they finish
+_publish_tasks: set[asyncio.Task[None]] = set()
 
 
 def _create_task_status_callback() -> Callable[[dict[str, Any]], None]:
@@ -40,7 +46,12 @@ def _create_task_status_callback() -> Callable[[dict[str, Any]], None]:
                     event="task_status_changed",
                     data=_json.dumps(event),
                 )
-                _broadcaster.publish(sse_event)
+                published = _broadcaster.publish(sse_event)
+                if asyncio.iscoroutine(published):
+                    # Called synchronously from the observer's task
+                    task = asyncio.get_running_loop().create_task(published)
+                    _publish_tasks.add(task)
+                    task.add_done_callback(_publish_tasks.discard)
             except Exception:
                 # Silently catch exceptions to prevent app crashes
                 pass
@@ -56,7 +67,7 @@ async def init_dependencies(app: FastAPI | None = None) -> None:
     """
     import os
 
-    global _broadcaster, _registered_callback
+    global _broadcaster, _registered_callback, _observer
 
     # Import the actual init function from dependencies module
     from tdd_orchestrator.api.dependencies import (
@@ -64,9 +75,14 @@ async def init_dependencies(app: FastAPI | None = None) -> None:
     )
 
     # Create SSE broadcaster
-    from tdd_orchestrator.api.sse import SSEBroadcaster
+    from tdd_orchestrator.api.sse import DEFAULT_QUEUE_SIZE, OverflowPolicy, SSEBroadcaster
 
-    _broadcaster = SSEBroadcaster()
+    # Per-client queue bound and what happens when a client falls behind
+    # (drop_oldest, disconnect or coalesce)
+    _broadcaster = SSEBroadcaster(
+        queue_size=int(os.environ.get("TDD_SSE_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)),
+        overflow=os.environ.get("TDD_SSE_OVERFLOW", OverflowPolicy.DROP_OLDEST),
+    )
 
     # Connect to the database
     from tdd_orchestrator.database.core import OrchestratorDB
@@ -86,6 +102,38 @@ async def init_dependencies(app: FastAPI | None = None) -> None:
 
     register_task_callback(_registered_callback)
 
+    _observer = _create_task_observer(db_instance)
+    await _observer.start()
+
+
+def _create_task_observer(db_instance: Any) -> Any:
+    """Create the observer that feeds task status changes to the callbacks.
+
+    TDD_TASK_OBSERVER selects how changes are picked up:
+
+    - ``poll`` (default): poll the task_events change log, which sees
+      changes committed by any process. The worker pool normally runs in
+      its own process (``tdd-orchestrator run``), separate from the API.
+    - ``bus``: consume this process's database event bus. Only changes
+      made through the API's own connection are seen, but immediately.
+
+    TDD_TASK_OBSERVER_POLL_INTERVAL sets the poll interval in seconds.
+
+    Raises:
+        ValueError: If TDD_TASK_OBSERVER is not ``poll`` or ``bus``.
+    """
+    import os
+
+    from tdd_orchestrator.db.observer import DBObserver, EventBusObserver
+
+    mode = os.environ.get("TDD_TASK_OBSERVER", "poll")
+    if mode == "bus":
+        return EventBusObserver(db_instance)
+    if mode == "poll":
+        interval = float(os.environ.get("TDD_TASK_OBSERVER_POLL_INTERVAL", "1.0"))
+        return DBObserver(db_instance, poll_interval=interval)
+    raise ValueError(f"TDD_TASK_OBSERVER must be 'poll' or 'bus', got {mode!r}")
+
 
 async def shutdown_dependencies(app: FastAPI | None = None) -> None:
     """Shut down application dependencies during shutdown.
@@ -96,7 +144,11 @@ async def shutdown_dependencies(app: FastAPI | None = None) -> None:
     import asyncio
     import inspect
 
-    global _broadcaster, _registered_callback
+    global _broadcaster, _registered_callback, _observer
+
+    if _observer is not None:
+        await _observer.stop()
+        _observer = None
 
     # Unregister the callback first
     if _registered_callback is not None:
@@ -264,6 +316,23 @@ def _configure_cors(app: FastAPI) -> None:
     )
 
 
+def _configure_response_cache(app: FastAPI) -> None:
+    """Serve read-heavy routes from a versioned cache with ETag support.
+
+    The cache is kept on ``app.state.response_cache`` for inspection.
+
+    Args:
+        app: The FastAPI application instance.
+    """
+    from tdd_orchestrator.api.middleware.response_cache import (
+        ResponseCache,
+        ResponseCacheMiddleware,
+    )
+
+    app.state.response_cache = ResponseCache()
+    app.add_middleware(ResponseCacheMiddleware, cache=app.state.response_cache)
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -277,6 +346,8 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Added before CORS so that CORS headers also apply to cached responses
+    _configure_response_cache(app)
     _configure_cors(app)
     _register_error_handlers(app)
     _register_routes(app)
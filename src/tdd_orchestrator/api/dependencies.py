@@ -19,6 +19,17 @@ async def get_db_dep() -> AsyncGenerator[Any, None]:
     yield _db_instance
 
 
+def get_db_instance() -> Any | None:
+    """Return the OrchestratorDB singleton outside of dependency injection.
+
+    For middleware, which runs before route dependencies are resolved.
+
+    Returns:
+        The OrchestratorDB instance, or None if not yet initialized.
+    """
+    return _db_instance
+
+
 def get_broadcaster_dep() -> Any:
     """Dependency that returns the SSEBroadcaster singleton.
 
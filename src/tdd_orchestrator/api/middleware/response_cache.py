@@ -0,0 +1,263 @@
+"""Conditional GET and response caching for read-heavy API routes.
+
+The dashboard polls a handful of aggregate endpoints (task lists and
+counts, progress, JSON metrics, circuit health, analytics) far more often
+than the data behind them changes. ResponseCacheMiddleware keeps the
+rendered JSON body of those routes, keyed by path and query string, along
+with the database version it was rendered at:
+
+- the writer connection's change count covers writes made through this
+  process (read from memory, no query)
+- ``PRAGMA data_version`` on a read connection covers commits from other
+  processes; it is probed at most once per ``probe_interval`` seconds
+
+While the version is unchanged, requests are answered from the cache
+without running the route. Every cached response carries a strong ETag
+derived from its body, and a request whose ``If-None-Match`` matches gets
+an empty 304 response.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from tdd_orchestrator.api.dependencies import get_db_instance
+from tdd_orchestrator.database.connection import ConnectionMixin
+
+# Routes whose responses are cached (exact paths, and path prefixes)
+CACHED_PATHS = frozenset(
+    {"/tasks", "/tasks/stats", "/tasks/progress", "/metrics/json", "/circuits/health"}
+)
+CACHED_PREFIXES = ("/analytics/",)
+
+# Cached responses kept (least recently used are evicted)
+DEFAULT_MAX_ENTRIES = 256
+
+# Minimum seconds between checks for commits from other processes
+DEFAULT_PROBE_INTERVAL = 1.0
+
+# Sent with cached responses: clients may store them but must revalidate
+CACHE_CONTROL = "no-cache"
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counters describing response cache behaviour.
+
+    Attributes:
+        hits: Requests answered from the cache.
+        misses: Requests that ran the route.
+        not_modified: Requests answered with 304 Not Modified.
+        entries: Responses currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    entries: int = 0
+
+
+@dataclass
+class _Entry:
+    """A rendered response and the database version it reflects."""
+
+    version: tuple[int, int]
+    etag: str
+    body: bytes
+    headers: list[tuple[bytes, bytes]]
+
+
+def is_cached_path(path: str) -> bool:
+    """Return whether responses for ``path`` are cached."""
+    path = path.rstrip("/") or "/"
+    return path in CACHED_PATHS or path.startswith(CACHED_PREFIXES)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return whether an If-None-Match header matches ``etag``.
+
+    Uses the weak comparison required for If-None-Match.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class ResponseCache:
+    """Versioned store of rendered responses."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Responses kept before the least recently used is evicted.
+            probe_interval: Minimum seconds between checks for commits from
+                other processes (0 checks on every request).
+        """
+        self.max_entries = max(1, max_entries)
+        self.probe_interval = probe_interval
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._stats = ResponseCacheStats()
+        self._conn: object | None = None
+        self._data_version = 0
+        self._probed_at: float | None = None
+
+    def stats(self) -> ResponseCacheStats:
+        """Return a snapshot of the cache counters."""
+        return ResponseCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            not_modified=self._stats.not_modified,
+            entries=len(self._entries),
+        )
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    async def version(self, db: ConnectionMixin) -> tuple[int, int]:
+        """Return the current version of ``db``'s contents.
+
+        Args:
+            db: The database the cached routes read from.
+
+        Returns:
+            A value that changes whenever the database may have changed.
+        """
+        if db._conn is not self._conn:
+            # A different (or reconnected) database: nothing cached applies
+            self._conn = db._conn
+            self._probed_at = None
+            self.clear()
+        now = time.monotonic()
+        if self._probed_at is None or now - self._probed_at >= self.probe_interval:
+            self._data_version = await db.data_version()
+            self._probed_at = now
+        return (db.local_changes, self._data_version)
+
+    def get(self, key: tuple[str, str], version: tuple[int, int]) -> _Entry | None:
+        """Return the entry for ``key`` if it was rendered at ``version``."""
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def record_not_modified(self) -> None:
+        """Count a request answered with 304 Not Modified."""
+        self._stats.not_modified += 1
+
+    def put(self, key: tuple[str, str], entry: _Entry) -> None:
+        """Store an entry, evicting the least recently used beyond the limit."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving cached responses and 304s for CACHED_PATHS.
+
+    Only GET requests for a connected OrchestratorDB are cached; anything
+    else (including the SSE stream) passes straight through.
+    """
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache | None = None) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            cache: Cache to use (a new one by default).
+        """
+        self.app = app
+        self.cache = cache or ResponseCache()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not is_cached_path(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+        db = get_db_instance()
+        if not isinstance(db, ConnectionMixin) or db._conn is None:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"].rstrip("/") or "/"
+        query = urlencode(sorted(parse_qsl(scope["query_string"].decode("latin-1"))))
+        key = (path, query)
+        # Read before rendering, so a write during rendering is not masked
+        version = await self.cache.version(db)
+
+        entry = self.cache.get(key, version)
+        if entry is None:
+            entry = await self._render(scope, receive, send, version)
+            if entry is None:
+                return
+            self.cache.put(key, entry)
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match, entry.etag):
+            self.cache.record_not_modified()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (b"etag", entry.etag.encode("latin-1")),
+                        (b"cache-control", CACHE_CONTROL.encode("latin-1")),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({"type": "http.response.start", "status": 200, "headers": entry.headers})
+        await send({"type": "http.response.body", "body": entry.body})
+
+    async def _render(
+        self, scope: Scope, receive: Receive, send: Send, version: tuple[int, int]
+    ) -> _Entry | None:
+        """Run the route and capture its response.
+
+        Returns:
+            The cacheable entry, or None if the response was not cacheable
+            and has already been sent as-is.
+        """
+        messages: list[Message] = []
+
+        async def capture(message: Message) -> None:
+            messages.append(message)
+
+        await self.app(scope, receive, capture)
+
+        start = messages[0] if messages else None
+        if start is None or start["status"] != 200:
+            for message in messages:
+                await send(message)
+            return None
+
+        body = b"".join(m.get("body", b"") for m in messages[1:])
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        headers = MutableHeaders(raw=list(start["headers"]))
+        headers["content-length"] = str(len(body))
+        headers["etag"] = etag
+        headers["cache-control"] = CACHE_CONTROL
+        return _Entry(version=version, etag=etag, body=body, headers=headers.raw)
+
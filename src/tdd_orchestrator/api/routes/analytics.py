@@ -4,6 +4,10 @@ Endpoints:
 - GET /analytics/attempts-by-stage - Attempt stats grouped by stage
 - GET /analytics/task-completion-timeline - Task completions over time
 - GET /analytics/invocation-stats - Invocation stats grouped by stage
+
+Each endpoint reads a rollup table maintained by triggers as rows are
+written (see ANALYTICS ROLLUPS in schema.sql), so the cost of a request
+does not grow with the size of the history.
 """
 
 from __future__ import annotations
@@ -18,6 +22,7 @@ from tdd_orchestrator.api.models.responses_analytics import (
     InvocationStatsResponse,
     TaskCompletionTimelineResponse,
 )
+from tdd_orchestrator.database.read_pool import read_connection
 
 router = APIRouter()
 
@@ -29,7 +34,7 @@ async def get_attempts_by_stage(
     """Get attempt statistics grouped by stage.
 
     Returns aggregate stats (total attempts, successes, avg duration)
-    for each pipeline stage from the attempts table.
+    for each pipeline stage from the attempt_stage_rollup table.
 
     Args:
         db: Database dependency (injected).
@@ -41,11 +46,10 @@ async def get_attempts_by_stage(
         HTTPException: 503 if database is not available.
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
-        async with db._conn.execute(
-            "SELECT stage, COUNT(*) as total, "
-            "SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successes, "
-            "AVG(duration_ms) as avg_duration_ms "
-            "FROM attempts GROUP BY stage"
+        async with read_connection(db).execute(
+            "SELECT stage, attempts as total, successes, "
+            "CAST(duration_ms AS REAL) / NULLIF(timed, 0) as avg_duration_ms "
+            "FROM attempt_stage_rollup WHERE attempts > 0 ORDER BY stage"
         ) as cursor:
             rows = await cursor.fetchall()
         stages = [
@@ -75,7 +79,8 @@ async def get_task_completion_timeline(
     """Get task completions over time.
 
     Returns daily counts of completed tasks based on their updated_at
-    timestamp, filtered to tasks with 'complete' or 'passing' status.
+    timestamp, filtered to tasks with 'complete' or 'passing' status,
+    from the task_completion_rollup table.
 
     Args:
         db: Database dependency (injected).
@@ -87,10 +92,9 @@ async def get_task_completion_timeline(
         HTTPException: 503 if database is not available.
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
-        async with db._conn.execute(
-            "SELECT DATE(updated_at) as date, COUNT(*) as completed "
-            "FROM tasks WHERE status IN ('complete', 'passing') "
-            "GROUP BY DATE(updated_at) ORDER BY date"
+        async with read_connection(db).execute(
+            "SELECT day as date, completed "
+            "FROM task_completion_rollup WHERE completed > 0 ORDER BY day"
         ) as cursor:
             rows = await cursor.fetchall()
         timeline = [
@@ -111,7 +115,7 @@ async def get_invocation_stats(
     """Get invocation statistics grouped by stage.
 
     Returns aggregate stats (count, total tokens, avg duration)
-    for each pipeline stage from the invocations table.
+    for each pipeline stage from the invocation_stage_rollup table.
 
     Args:
         db: Database dependency (injected).
@@ -123,11 +127,10 @@ async def get_invocation_stats(
         HTTPException: 503 if database is not available.
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
-        async with db._conn.execute(
-            "SELECT stage, COUNT(*) as count, "
-            "COALESCE(SUM(token_count), 0) as total_tokens, "
-            "AVG(duration_ms) as avg_duration_ms "
-            "FROM invocations GROUP BY stage"
+        async with read_connection(db).execute(
+            "SELECT stage, invocations as count, tokens as total_tokens, "
+            "CAST(duration_ms AS REAL) / NULLIF(timed, 0) as avg_duration_ms "
+            "FROM invocation_stage_rollup WHERE invocations > 0 ORDER BY stage"
         ) as cursor:
             rows = await cursor.fetchall()
         invocations = [
@@ -16,6 +16,7 @@ from tdd_orchestrator.api.models.responses import (
     CircuitBreakerResponse,
     CircuitHealthSummary,
 )
+from tdd_orchestrator.database.read_pool import read_connection
 
 router = APIRouter()
 
@@ -66,7 +67,7 @@ async def get_circuits(
         if state is not None:
             query += " AND state = ?"
             params.append(state)
-        async with db._conn.execute(query, params) as cursor:
+        async with read_connection(db).execute(query, params) as cursor:
             rows = await cursor.fetchall()
         circuits = [_circuit_row_to_dict(row) for row in rows]
         return {"circuits": circuits, "total": len(circuits)}
@@ -86,7 +87,7 @@ async def get_health_summary(
         List of per-level health summaries from v_circuit_health_summary.
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
-        async with db._conn.execute("SELECT * FROM v_circuit_health_summary") as cursor:
+        async with read_connection(db).execute("SELECT * FROM v_circuit_health_summary") as cursor:
             rows = await cursor.fetchall()
         return [
             {
@@ -123,7 +124,7 @@ async def get_circuit(
             circuit_id_int = int(circuit_id)
         except ValueError:
             raise HTTPException(status_code=404, detail=f"Circuit {circuit_id} not found")
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT * FROM v_circuit_breaker_status WHERE id = ?", (circuit_id_int,)
         ) as cursor:
             row = await cursor.fetchone()
@@ -226,14 +227,14 @@ async def get_circuit_events(
             raise HTTPException(status_code=404, detail=f"Circuit {circuit_id} not found")
 
         # Verify circuit exists
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT id FROM circuit_breakers WHERE id = ?", (circuit_id_int,)
         ) as cursor:
             if await cursor.fetchone() is None:
                 raise HTTPException(status_code=404, detail=f"Circuit {circuit_id} not found")
 
         # Fetch events
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT id, event_type, from_state, to_state, created_at, error_context "
             "FROM circuit_breaker_events WHERE circuit_id = ? "
             "ORDER BY created_at DESC LIMIT ?",
@@ -1,4 +1,11 @@
-"""SSE events endpoint for streaming task status updates."""
+"""SSE events endpoint for streaming task status updates.
+
+Each connection's stream blocks on its subscriber queue, so an idle
+client costs nothing until an event arrives. EventSourceResponse watches
+the ASGI receive channel for ``http.disconnect`` and cancels the stream
+when the client goes away, and sends a keep-alive comment on its own
+timer so proxies do not close idle connections.
+"""
 
 from __future__ import annotations
 
@@ -7,7 +14,7 @@ import logging
 from typing import Any, AsyncGenerator
 
 from fastapi import APIRouter, Request
-from sse_starlette.sse import EventSourceResponse
+from sse_starlette import EventSourceResponse, ServerSentEvent
 
 from tdd_orchestrator.api.sse import SSEEvent
 
@@ -15,6 +22,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds between keep-alive comments on an idle stream
+KEEPALIVE_INTERVAL = 15
+
+
+def _keepalive() -> ServerSentEvent:
+    """Build the keep-alive comment (ignored by EventSource clients)."""
+    return ServerSentEvent(comment="keep-alive")
+
 
 def get_broadcaster_dep() -> Any:
     """Get the broadcaster dependency.
@@ -29,38 +44,50 @@ def get_broadcaster_dep() -> Any:
     return _get_broadcaster_dep()
 
 
-async def event_stream(broadcaster: Any) -> AsyncGenerator[dict[str, str], None]:
+async def event_stream(
+    broadcaster: Any, last_event_id: str | None = None, *, encoded: bool = False
+) -> AsyncGenerator[dict[str, str] | bytes, None]:
     """Generate SSE events from the broadcaster.
 
     Args:
         broadcaster: The SSEBroadcaster instance.
+        last_event_id: Last-Event-ID of a reconnecting client; the events it
+            missed are replayed first.
+        encoded: Yield each event's shared wire-format bytes (serialized
+            once for all subscribers) instead of a dict.
 
     Yields:
-        Dict with 'event' and 'data' keys for EventSourceResponse.
+        Dict with 'event', 'data' and (when assigned) 'id' keys for
+        EventSourceResponse, or the encoded event.
     """
     queue: asyncio.Queue[SSEEvent | None] | None = None
     try:
         # Subscribe to broadcaster
-        queue = await broadcaster.subscribe_async()
+        if last_event_id is None:
+            queue = await broadcaster.subscribe_async()
+        else:
+            queue = await broadcaster.subscribe_async(last_event_id=last_event_id)
 
-        # Stream events until sentinel (None) is received
+        # Stream events until sentinel (None) is received. A disconnect
+        # cancels the wait, so there is no need to wake up and check.
         while True:
-            # Use wait_for with a short timeout to allow cancellation checks
-            try:
-                event = await asyncio.wait_for(queue.get(), timeout=0.1)
-            except asyncio.TimeoutError:
-                # Keep-alive: yield nothing but allow loop to check for cancellation
-                continue
-
+            event = await queue.get()
             if event is None:
                 # Sentinel value - stream is complete
                 break
 
+            if encoded:
+                yield event.encode()
+                continue
+
             # Yield event in format expected by EventSourceResponse
-            yield {
+            message = {
                 "event": event.event or "message",
                 "data": event.data,
             }
+            if event.id is not None:
+                message["id"] = event.id
+            yield message
 
     except asyncio.CancelledError:
         # Client disconnected - don't re-raise, let cleanup run
@@ -82,11 +109,20 @@ async def event_stream(broadcaster: Any) -> AsyncGenerator[dict[str, str], None]
 async def get_events(request: Request) -> EventSourceResponse:
     """Stream SSE events from the broadcaster.
 
+    A client reconnecting with a ``Last-Event-ID`` header first receives
+    the events it missed, or a ``snapshot_required`` event when they are
+    no longer buffered.
+
     Args:
-        request: The FastAPI request (for accessing app state if needed).
+        request: The FastAPI request (for the Last-Event-ID header).
 
     Returns:
         EventSourceResponse that streams SSE-formatted events.
     """
     broadcaster = get_broadcaster_dep()
-    return EventSourceResponse(event_stream(broadcaster))
+    last_event_id = request.headers.get("last-event-id")
+    return EventSourceResponse(
+        event_stream(broadcaster, last_event_id, encoded=True),
+        ping=KEEPALIVE_INTERVAL,
+        ping_message_factory=_keepalive,
+    )
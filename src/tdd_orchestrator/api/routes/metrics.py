@@ -6,12 +6,11 @@ from typing import Any
 from fastapi import APIRouter, Depends, Response
 
 from tdd_orchestrator.api.dependencies import get_db_dep
-from tdd_orchestrator.metrics import get_metrics_collector
+from tdd_orchestrator.database.read_pool import read_connection
+from tdd_orchestrator.metrics import PROMETHEUS_CONTENT_TYPE, get_metrics_collector
 
 router = APIRouter()
 
-PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
-
 
 @router.get("")
 def metrics_endpoint() -> Response:
@@ -45,8 +44,8 @@ def metrics_endpoint() -> Response:
 async def metrics_json_endpoint(db: Any = Depends(get_db_dep)) -> dict[str, Any]:
     """Return task metrics in JSON format.
 
-    Queries the tasks table for status counts and the attempts table
-    for average duration statistics.
+    Queries the tasks table for status counts and the attempt rollup
+    table for the average duration of successful attempts.
 
     Returns:
         A dictionary with pending_count, running_count, passed_count,
@@ -54,7 +53,7 @@ async def metrics_json_endpoint(db: Any = Depends(get_db_dep)) -> dict[str, Any]
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
         counts: dict[str, int] = {"pending": 0, "running": 0, "passed": 0, "failed": 0}
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT status, COUNT(*) as cnt FROM tasks GROUP BY status"
         ) as cursor:
             async for row in cursor:
@@ -71,9 +70,9 @@ async def metrics_json_endpoint(db: Any = Depends(get_db_dep)) -> dict[str, Any]
         total = sum(counts.values())
 
         avg_duration: float | None = None
-        async with db._conn.execute(
-            "SELECT AVG(duration_ms) / 1000.0 as avg_sec "
-            "FROM attempts WHERE success = 1 AND duration_ms IS NOT NULL"
+        async with read_connection(db).execute(
+            "SELECT SUM(success_duration_ms) / 1000.0 / NULLIF(SUM(success_timed), 0) "
+            "as avg_sec FROM attempt_stage_rollup"
         ) as cursor:
             row = await cursor.fetchone()
             if row and row["avg_sec"] is not None:
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
 
 from tdd_orchestrator.api.dependencies import get_db_dep
+from tdd_orchestrator.database.read_pool import read_connection
 
 router = APIRouter()
 
@@ -96,7 +97,7 @@ async def get_runs(
             query += " AND status = ?"
             params.append(status.value)
         query += " ORDER BY started_at DESC"
-        async with db._conn.execute(query, params) as cursor:
+        async with read_connection(db).execute(query, params) as cursor:
             rows = await cursor.fetchall()
         runs = [_run_row_to_dict(row) for row in rows]
         return {"runs": runs, "total": len(runs)}
@@ -114,7 +115,7 @@ async def get_current_run_endpoint(
         RunResponse for the active run, or JSONResponse with 404 error.
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT * FROM execution_runs WHERE status = 'running' LIMIT 1"
         ) as cursor:
             row = await cursor.fetchone()
@@ -153,7 +154,7 @@ async def get_run_by_id_endpoint(
                 status_code=404,
                 content={"detail": "Run not found", "error_code": "ERR-RUN-404"},
             )
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT * FROM execution_runs WHERE id = ?", (run_id_int,)
         ) as cursor:
             row = await cursor.fetchone()
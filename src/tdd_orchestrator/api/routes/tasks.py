@@ -1,5 +1,7 @@
 """Tasks router for listing tasks with filtering and pagination."""
 
+import base64
+import binascii
 import json
 from enum import Enum
 from typing import Any
@@ -9,6 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from tdd_orchestrator.api.dependencies import get_broadcaster_dep, get_db_dep
 from tdd_orchestrator.api.models.responses import StatsResponse
 from tdd_orchestrator.api.sse import SSEEvent
+from tdd_orchestrator.database.read_pool import read_connection
 
 router = APIRouter()
 
@@ -58,6 +61,60 @@ class TaskComplexity(str, Enum):
     HIGH = "high"
 
 
+def _task_filters(
+    status: TaskStatus | None,
+    phase: TaskPhase | None,
+    complexity: TaskComplexity | None,
+) -> tuple[str, list[Any]]:
+    """Build the WHERE clause (and its parameters) for the task list filters."""
+    clauses: list[str] = []
+    params: list[Any] = []
+    if status is not None:
+        db_statuses = DB_STATUS_MAP.get(status.value, [status.value])
+        clauses.append(f"status IN ({','.join('?' for _ in db_statuses)})")
+        params.extend(db_statuses)
+    if phase is not None:
+        clauses.append("phase = ?")
+        params.append(phase.value)
+    if complexity is not None:
+        clauses.append("complexity = ?")
+        params.append(complexity.value)
+    return " AND ".join(clauses) or "1=1", params
+
+
+def encode_cursor(phase: int, sequence: int, task_id: int, total: int) -> str:
+    """Build the opaque cursor for the page following a task.
+
+    Args:
+        phase: The last returned task's phase.
+        sequence: The last returned task's sequence.
+        task_id: The last returned task's id.
+        total: The total to report on later pages when they skip counting.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = json.dumps([phase, sequence, task_id, total], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int, int, int]:
+    """Decode a cursor built by encode_cursor().
+
+    Returns:
+        (phase, sequence, task_id, total).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        phase, sequence, task_id, total = (int(v) for v in json.loads(raw))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    return phase, sequence, task_id, total
+
+
 @router.get("")
 async def get_tasks(
     status: TaskStatus | None = Query(None, description="Filter by task status"),
@@ -67,57 +124,87 @@ async def get_tasks(
     ),
     limit: int = Query(20, ge=0, description="Maximum number of tasks to return"),
     offset: int = Query(0, ge=0, description="Number of tasks to skip"),
+    cursor: str | None = Query(
+        None, description="Continue after a previous page (its next_cursor)"
+    ),
+    exact_total: bool = Query(
+        True, description="Recount the total on cursor pages instead of reusing the first count"
+    ),
     db: Any = Depends(get_db_dep),
 ) -> dict[str, Any]:
     """Get list of tasks with optional filtering and pagination.
 
+    Tasks are ordered by (phase, sequence, id). Pass a page's
+    ``next_cursor`` back as ``cursor`` to fetch the next page: it seeks
+    directly to the position after the last task instead of skipping
+    ``offset`` rows, so deep pages cost the same as the first. The page and
+    the filtered total come from a single query; with ``exact_total=false``
+    cursor pages skip counting and report the first page's total
+    (``total_exact`` is false).
+
     Args:
         status: Optional status filter (pending, running, completed, failed).
         phase: Optional phase filter (decomposition, red, green, verify, refactor).
         complexity: Optional complexity filter (low, medium, high).
         limit: Maximum number of tasks to return (default 20).
         offset: Number of tasks to skip for pagination (default 0).
+        cursor: Opaque cursor from a previous page.
+        exact_total: Whether cursor pages recount the total.
         db: Database dependency (injected).
 
     Returns:
-        TaskListResponse with tasks list, total count, limit, and offset.
+        TaskListResponse with tasks list, total count, limit, offset,
+        next_cursor (None on the last page) and total_exact.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
-        query = "SELECT * FROM tasks WHERE 1=1"
-        params: list[Any] = []
-        if status is not None:
-            db_statuses = DB_STATUS_MAP.get(status.value, [status.value])
-            placeholders = ",".join("?" for _ in db_statuses)
-            query += f" AND status IN ({placeholders})"
-            params.extend(db_statuses)
-        if phase is not None:
-            query += " AND phase = ?"
-            params.append(phase.value)
-        if complexity is not None:
-            query += " AND complexity = ?"
-            params.append(complexity.value)
-        query += " ORDER BY phase, sequence"
-        query += " LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-        async with db._conn.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-        # Get total count without limit/offset
-        count_query = "SELECT COUNT(*) as cnt FROM tasks WHERE 1=1"
-        count_params: list[Any] = []
-        if status is not None:
-            db_statuses_c = DB_STATUS_MAP.get(status.value, [status.value])
-            placeholders_c = ",".join("?" for _ in db_statuses_c)
-            count_query += f" AND status IN ({placeholders_c})"
-            count_params.extend(db_statuses_c)
-        if phase is not None:
-            count_query += " AND phase = ?"
-            count_params.append(phase.value)
-        if complexity is not None:
-            count_query += " AND complexity = ?"
-            count_params.append(complexity.value)
-        async with db._conn.execute(count_query, count_params) as cursor:
-            count_row = await cursor.fetchone()
-        total = int(count_row["cnt"]) if count_row else 0
+        where, filter_params = _task_filters(status, phase, complexity)
+        after = ""
+        after_params: list[Any] = []
+        carried_total: int | None = None
+        if cursor is not None:
+            try:
+                *position, carried_total = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail="Invalid cursor") from e
+            after = " AND (phase, sequence, id) > (?, ?, ?)"
+            after_params = position
+
+        total_exact = carried_total is None or exact_total
+        if total_exact:
+            count_sql = f"SELECT COUNT(*) AS total FROM tasks WHERE {where}"
+            count_params = filter_params
+        else:
+            count_sql = "SELECT ? AS total"
+            count_params = [carried_total]
+
+        # One extra row tells whether there is a next page. The LEFT JOIN
+        # keeps the total when the page is empty.
+        query = f"""
+            SELECT c.total, t.* FROM ({count_sql}) AS c
+            LEFT JOIN (
+                SELECT id, task_key, title, status, phase, sequence, complexity
+                FROM tasks WHERE {where}{after}
+                ORDER BY phase, sequence, id LIMIT ? OFFSET ?
+            ) AS t ON 1
+            ORDER BY t.phase, t.sequence, t.id
+        """
+        params = [*count_params, *filter_params, *after_params, limit + 1, offset]
+        async with read_connection(db).execute(query, params) as rows_cursor:
+            rows = await rows_cursor.fetchall()
+        total = int(rows[0]["total"]) if rows else 0
+        page = [row for row in rows if row["id"] is not None]
+
+        next_cursor: str | None = None
+        if len(page) > limit:
+            page = page[:limit]
+            if page:
+                last = page[-1]
+                next_cursor = encode_cursor(
+                    int(last["phase"]), int(last["sequence"]), int(last["id"]), total
+                )
         tasks_list = [
             {
                 "id": str(row["task_key"]),
@@ -127,9 +214,16 @@ async def get_tasks(
                 "sequence": int(row["sequence"]),
                 "complexity": str(row["complexity"]) if row["complexity"] else "medium",
             }
-            for row in rows
+            for row in page
         ]
-        return {"tasks": tasks_list, "total": total, "limit": limit, "offset": offset}
+        return {
+            "tasks": tasks_list,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "total_exact": total_exact,
+        }
     raise HTTPException(status_code=503, detail="Database not available")
 
 
@@ -146,7 +240,7 @@ async def get_stats(db: Any = Depends(get_db_dep)) -> dict[str, int]:
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
         counts: dict[str, int] = {"pending": 0, "running": 0, "passed": 0, "failed": 0}
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT status, COUNT(*) as cnt FROM tasks GROUP BY status"
         ) as cursor:
             async for row in cursor:
@@ -246,6 +340,54 @@ async def get_task_detail_endpoint(
     raise HTTPException(status_code=503, detail="Database not available")
 
 
+@router.get("/{task_key}/attempts/{attempt_id}")
+async def get_attempt_detail_endpoint(
+    task_key: str, attempt_id: int, db: Any = Depends(get_db_dep)
+) -> dict[str, Any]:
+    """Get one attempt of a task including its pytest/mypy/ruff output.
+
+    The output text is stored compressed and only loaded here, not in the
+    task detail or list responses.
+
+    Args:
+        task_key: The unique task identifier.
+        attempt_id: The attempt's database ID.
+        db: Database dependency (injected).
+
+    Returns:
+        Attempt fields plus an ``outputs`` mapping of tool name to text.
+
+    Raises:
+        HTTPException: 404 if the task or attempt is not found.
+    """
+    if db is not None and hasattr(db, "_conn") and db._conn is not None:
+        task: dict[str, Any] | None = await db.get_task_by_key(task_key)
+        if task is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        attempts: list[dict[str, Any]] = await db.get_stage_attempts(int(task["id"]))
+        attempt = next((a for a in attempts if int(a["id"]) == attempt_id), None)
+        if attempt is None:
+            raise HTTPException(status_code=404, detail="Attempt not found")
+        outputs: dict[str, str | None] = await db.get_attempt_outputs(attempt_id) or {}
+
+        return {
+            "id": int(attempt["id"]),
+            "stage": str(attempt["stage"]),
+            "attempt_number": int(attempt["attempt_number"]),
+            "success": bool(attempt["success"]),
+            "error_message": (
+                str(attempt["error_message"]) if attempt.get("error_message") else None
+            ),
+            "started_at": str(attempt["started_at"]) if attempt.get("started_at") else None,
+            "exit_codes": {
+                tool: attempt.get(f"{tool}_exit_code") for tool in ("pytest", "mypy", "ruff")
+            },
+            "outputs": outputs,
+        }
+    raise HTTPException(status_code=503, detail="Database not available")
+
+
 @router.post("/{task_key}/retry")
 async def retry_task_endpoint(
     task_key: str,
@@ -2,9 +2,10 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from tdd_orchestrator.api.dependencies import get_db_dep
+from tdd_orchestrator.database.read_pool import read_connection
 
 router = APIRouter()
 
@@ -62,7 +63,7 @@ async def get_workers(db: Any = Depends(get_db_dep)) -> dict[str, Any]:
         WorkerListResponse with workers list and total count.
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT worker_id, status, registered_at, last_heartbeat,"
             " current_task_id, branch_name FROM workers ORDER BY registered_at"
         ) as cursor:
@@ -96,7 +97,7 @@ async def get_stale_workers(db: Any = Depends(get_db_dep)) -> dict[str, Any]:
         WorkerListResponse with stale workers list and total count.
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
-        async with db._conn.execute("SELECT * FROM v_stale_workers") as cursor:
+        async with read_connection(db).execute("SELECT * FROM v_stale_workers") as cursor:
             rows = await cursor.fetchall()
         workers = [
             {
@@ -127,6 +128,49 @@ async def get_stale_workers(db: Any = Depends(get_db_dep)) -> dict[str, Any]:
     return list_stale_workers()
 
 
+@router.post("/{worker_id}/claims")
+async def claim_tasks_endpoint(
+    worker_id: int,
+    limit: int = Query(default=1, ge=1, le=100),
+    phase: int | None = Query(default=None, ge=0),
+    timeout_seconds: int = Query(default=300, ge=1),
+    db: Any = Depends(get_db_dep),
+) -> dict[str, Any]:
+    """Atomically claim up to ``limit`` ready tasks for an external worker.
+
+    Args:
+        worker_id: The claiming worker's identifier.
+        limit: Maximum number of tasks to claim.
+        phase: Optional phase filter.
+        timeout_seconds: Claim expiration timeout.
+        db: Database dependency (injected).
+
+    Returns:
+        Dictionary with the claimed tasks and their count (empty when
+        nothing is ready).
+
+    Raises:
+        HTTPException: 503 if the database is not available.
+    """
+    if db is not None and hasattr(db, "_conn") and db._conn is not None:
+        tasks: list[dict[str, Any]] = await db.claim_tasks(
+            worker_id, limit, phase=phase, timeout_seconds=timeout_seconds
+        )
+        items = [
+            {
+                "id": int(task["id"]),
+                "task_key": str(task["task_key"]),
+                "title": str(task["title"]),
+                "phase": int(task["phase"]),
+                "sequence": int(task["sequence"]),
+                "claim_expires_at": str(task["claim_expires_at"]),
+            }
+            for task in tasks
+        ]
+        return {"items": items, "total": len(items)}
+    raise HTTPException(status_code=503, detail="Database not available")
+
+
 @router.get("/{worker_id}")
 async def get_worker(
     worker_id: str, db: Any = Depends(get_db_dep)
@@ -144,7 +188,7 @@ async def get_worker(
     """
     if db is not None and hasattr(db, "_conn") and db._conn is not None:
         param: int | str = int(worker_id) if worker_id.isdigit() else worker_id
-        async with db._conn.execute(
+        async with read_connection(db).execute(
             "SELECT worker_id, status, registered_at, last_heartbeat,"
             " current_task_id, branch_name FROM workers WHERE worker_id = ?",
             (param,),
@@ -1,11 +1,71 @@
-"""Server-Sent Events (SSE) broadcaster with graceful shutdown."""
+"""Server-Sent Events (SSE) broadcaster with graceful shutdown.
+
+Published events are stamped with monotonically increasing ids and kept
+in a bounded replay buffer, so a client that reconnects with
+``Last-Event-ID`` receives what it missed. When the events it missed
+have already left the buffer (or were sent by a previous server process)
+it receives a ``snapshot_required`` event instead and should re-fetch
+full state.
+
+Each subscriber gets a bounded queue. When a client falls behind and its
+queue is full, the broadcaster's OverflowPolicy decides what gives:
+the oldest queued event is dropped, the client is disconnected (its
+EventSource reconnects and resumes via Last-Event-ID), or queued task
+status events are coalesced so only the latest status per task is kept.
+Events are encoded to the wire format once and the bytes are shared by
+every subscriber.
+"""
 
 import asyncio
 import json
+import time
+from collections import deque
 from collections.abc import AsyncIterator, Callable, Awaitable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum
 from typing import Any, Coroutine, overload
 
+# Published events kept for Last-Event-ID replay
+DEFAULT_REPLAY_SIZE = 1024
+
+# Events a subscriber may have queued before the overflow policy applies
+DEFAULT_QUEUE_SIZE = 256
+
+# Sent instead of a replay when the requested events are no longer buffered
+SNAPSHOT_REQUIRED_EVENT = "snapshot_required"
+
+# Events coalesced per task_id under OverflowPolicy.COALESCE
+TASK_STATUS_EVENT = "task_status_changed"
+
+
+class OverflowPolicy(str, Enum):
+    """What a full subscriber queue does with a new event."""
+
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+    COALESCE = "coalesce"
+
+
+@dataclass
+class SSEStats:
+    """Counters describing subscriber queue behaviour.
+
+    Attributes:
+        published: Events published.
+        dropped: Events dropped from full subscriber queues.
+        coalesced: Queued task status events superseded by a newer one.
+        disconnected: Subscribers disconnected for falling behind.
+        queue_depth: Events currently queued across all subscribers.
+        max_queue_depth: Deepest subscriber queue right now.
+    """
+
+    published: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    disconnected: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
 
 @dataclass
 class SSEEventData:
@@ -23,6 +83,7 @@ class SSEEvent:
     event: str | None = None
     id: str | None = None
     retry: int | None = None
+    _encoded: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def serialize(self) -> str:
         """Serialize the event to SSE wire protocol format.
@@ -50,6 +111,88 @@ class SSEEvent:
         # Join with newlines and add trailing blank line (double newline)
         return "\n".join(lines) + "\n\n"
 
+    def encode(self) -> bytes:
+        """Return the wire format as bytes, serializing only on first use.
+
+        A published event is shared by every subscriber, so it is encoded
+        once however many clients stream it. Do not modify an event after
+        it has been published.
+        """
+        if self._encoded is None:
+            self._encoded = self.serialize().encode("utf-8")
+        return self._encoded
+
+
+class _ClientQueue(asyncio.Queue[SSEEvent | None]):
+    """Bounded subscriber queue applying the broadcaster's overflow policy."""
+
+    def __init__(self, maxsize: int, policy: OverflowPolicy, stats: SSEStats) -> None:
+        """Initialize the queue.
+
+        Args:
+            maxsize: Events queued before the overflow policy applies.
+            policy: What to do with a new event when the queue is full.
+            stats: The broadcaster's counters.
+        """
+        super().__init__(maxsize=max(1, maxsize))
+        self.policy = policy
+        self._stats = stats
+        # Queued task status event per task_id, and the reverse by identity
+        self._pending_status: dict[str, SSEEvent] = {}
+        self._status_keys: dict[int, str] = {}
+
+    def offer(self, event: SSEEvent, status_key: str | None = None) -> bool:
+        """Queue an event without blocking.
+
+        Args:
+            event: The event to queue.
+            status_key: task_id of a task status event (used to coalesce).
+
+        Returns:
+            False if the subscriber must be disconnected instead.
+        """
+        if status_key is not None and self.policy is OverflowPolicy.COALESCE:
+            superseded = self._pending_status.get(status_key)
+            if superseded is not None:
+                self._discard(superseded)
+                self._stats.coalesced += 1
+        if self.full():
+            if self.policy is OverflowPolicy.DISCONNECT:
+                return False
+            self.get_nowait()
+            self._stats.dropped += 1
+        self.put_nowait(event)
+        if status_key is not None and self.policy is OverflowPolicy.COALESCE:
+            self._pending_status[status_key] = event
+            self._status_keys[id(event)] = status_key
+        return True
+
+    def close(self) -> None:
+        """Discard everything queued and end the stream with the sentinel."""
+        while not self.empty():
+            self.get_nowait()
+        self.put_nowait(None)
+
+    def _discard(self, event: SSEEvent) -> None:
+        """Remove a specific queued event (by identity)."""
+        items: deque[SSEEvent | None] = self._queue  # type: ignore[attr-defined]
+        for index, item in enumerate(items):
+            if item is event:
+                del items[index]
+                break
+        self._forget(event)
+
+    def _forget(self, event: SSEEvent | None) -> None:
+        key = self._status_keys.pop(id(event), None)
+        if key is not None:
+            del self._pending_status[key]
+
+    def _get(self) -> SSEEvent | None:
+        event: SSEEvent | None = super()._get()
+        if self._status_keys:
+            self._forget(event)
+        return event
+
 
 class _SSESubscription:
     """Async iterator wrapper for SSE event queue."""
@@ -94,12 +237,22 @@ class SSEBroadcaster:
     # Type alias for callback subscribers
     _CallbackSubscriber = Callable[[dict[str, Any]], Awaitable[None]]
 
-    def __init__(self, heartbeat_interval: float | None = None) -> None:
+    def __init__(
+        self,
+        heartbeat_interval: float | None = None,
+        replay_size: int = DEFAULT_REPLAY_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
         """Initialize the SSE broadcaster.
 
         Args:
             heartbeat_interval: Optional interval in seconds for sending heartbeats.
                                If provided, a background task will send heartbeat events.
+            replay_size: Published events kept for Last-Event-ID replay.
+            queue_size: Events a subscriber may have queued before the
+                overflow policy applies.
+            overflow: What a full subscriber queue does with a new event.
         """
         self._subscribers: set[asyncio.Queue[SSEEvent | None]] = set()
         self._subscribers_generic: set[asyncio.Queue[Any]] = set()
@@ -109,6 +262,16 @@ class SSEBroadcaster:
         self._heartbeat_interval: float | None = heartbeat_interval
         self._heartbeat_task: asyncio.Task[None] | None = None
 
+        # Replay buffer of (id, event). Ids start at the startup time in
+        # microseconds, so they keep increasing across restarts and an id
+        # from a previous process falls before the buffer.
+        self._replay: deque[tuple[int, SSEEvent]] = deque(maxlen=max(0, replay_size))
+        self._next_id: int = time.time_ns() // 1000
+
+        self._queue_size = max(1, queue_size)
+        self._overflow = OverflowPolicy(overflow)
+        self._stats = SSEStats()
+
         # Start heartbeat task if interval is provided
         if self._heartbeat_interval is not None:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
@@ -118,6 +281,31 @@ class SSEBroadcaster:
         """Return the total number of active subscribers."""
         return len(self._subscribers) + len(self._subscribers_generic) + len(self._callback_subscribers)
 
+    @property
+    def last_event_id(self) -> int:
+        """Return the id of the most recently published event."""
+        return self._next_id - 1
+
+    @property
+    def overflow(self) -> OverflowPolicy:
+        """Return the policy applied when a subscriber queue is full."""
+        return self._overflow
+
+    def stats(self) -> SSEStats:
+        """Return a snapshot of the publish and queue counters."""
+        depths = [queue.qsize() for queue in self._subscribers]
+        return SSEStats(
+            published=self._stats.published,
+            dropped=self._stats.dropped,
+            coalesced=self._stats.coalesced,
+            disconnected=self._stats.disconnected,
+            queue_depth=sum(depths),
+            max_queue_depth=max(depths, default=0),
+        )
+
+    def _new_queue(self) -> _ClientQueue:
+        return _ClientQueue(self._queue_size, self._overflow, self._stats)
+
     @property
     def subscribers(self) -> set[asyncio.Queue[SSEEvent]]:
         """Return the set of SSEEvent subscribers.
@@ -165,7 +353,7 @@ class SSEBroadcaster:
         """
         if queue_or_subscriber is None:
             # New behavior: create queue and return async iterator wrapper
-            new_queue: asyncio.Queue[SSEEvent | None] = asyncio.Queue()
+            new_queue = self._new_queue()
             self._subscribers.add(new_queue)
             return _SSESubscription(new_queue, self)
         elif callable(queue_or_subscriber):
@@ -256,42 +444,129 @@ class SSEBroadcaster:
                 # Silently ignore callback errors (fire-and-forget)
                 pass
 
+    def _record(self, event: SSEEvent) -> None:
+        """Stamp an event with the next id and add it to the replay buffer.
+
+        Events published with an explicit id keep it and are not replayed.
+        """
+        if event.id is not None:
+            return
+        event_id = self._next_id
+        self._next_id += 1
+        event.id = str(event_id)
+        self._replay.append((event_id, event))
+
+    def replay_since(self, last_event_id: str) -> list[SSEEvent] | None:
+        """Return the buffered events published after ``last_event_id``.
+
+        Args:
+            last_event_id: The Last-Event-ID sent by a reconnecting client.
+
+        Returns:
+            The missed events in order (empty if the client is up to date),
+            or None when they can no longer be replayed: the id is unknown,
+            older than the buffer, or from a previous server process.
+        """
+        try:
+            since = int(last_event_id)
+        except ValueError:
+            return None
+        if since == self.last_event_id:
+            return []
+        if since > self.last_event_id or not self._replay or since < self._replay[0][0] - 1:
+            return None
+        return [event for event_id, event in self._replay if event_id > since]
+
+    def _snapshot_required(self, last_event_id: str) -> SSEEvent:
+        """Build the event telling a client its replay gap is too old."""
+        return SSEEvent(
+            event=SNAPSHOT_REQUIRED_EVENT,
+            data=json.dumps({"last_event_id": last_event_id}),
+            # Resume from here once the client has re-fetched state
+            id=str(self.last_event_id),
+        )
+
     async def _publish_sse_event(self, event: SSEEvent) -> None:
         """Async implementation of SSEEvent publishing.
 
-        Detects slow consumers whose queues are full and removes them automatically.
-
         Args:
             event: The SSE event to broadcast.
         """
-        slow_consumers: list[asyncio.Queue[SSEEvent | None]] = []
+        self._record(event)
+        self._fan_out(event)
+
+    def _status_key(self, event: SSEEvent) -> str | None:
+        """Return the task_id a task status event is coalesced on, if any."""
+        if self._overflow is not OverflowPolicy.COALESCE or event.event != TASK_STATUS_EVENT:
+            return None
+        try:
+            task_id = json.loads(event.data).get("task_id")
+        except (ValueError, AttributeError):
+            return None
+        return None if task_id is None else str(task_id)
+
+    def _fan_out(self, event: SSEEvent) -> None:
+        """Deliver an event to every SSEEvent subscriber queue.
+
+        Subscribers that must be disconnected under the overflow policy get
+        the end-of-stream sentinel. Externally supplied queues that are full
+        are treated as slow consumers and removed.
+
+        Args:
+            event: The SSE event to deliver.
+        """
+        self._stats.published += 1
+        status_key = self._status_key(event)
+        removed: list[asyncio.Queue[SSEEvent | None]] = []
 
         for queue in list(self._subscribers):
+            if isinstance(queue, _ClientQueue):
+                if not queue.offer(event, status_key):
+                    queue.close()
+                    self._stats.disconnected += 1
+                    removed.append(queue)
+                continue
             try:
                 queue.put_nowait(event)
             except asyncio.QueueFull:
                 # Mark this queue as a slow consumer to be removed
-                slow_consumers.append(queue)
+                removed.append(queue)
 
-        # Remove all slow consumers from subscribers
-        for queue in slow_consumers:
+        for queue in removed:
             self._subscribers.discard(queue)
 
-    async def subscribe_async(self) -> asyncio.Queue[SSEEvent | None]:
+    async def subscribe_async(
+        self, last_event_id: str | None = None
+    ) -> asyncio.Queue[SSEEvent | None]:
         """Subscribe a new client and return their queue (async version for SSEEvent).
 
         If broadcaster is already shut down, returns a queue with sentinel value.
 
+        Args:
+            last_event_id: Last-Event-ID of a reconnecting client. The events
+                it missed (or a snapshot_required event if they are no
+                longer buffered) are queued ahead of live events.
+
         Returns:
             asyncio.Queue containing SSEEvent or None (sentinel).
         """
         async with self._lock:
-            queue: asyncio.Queue[SSEEvent | None] = asyncio.Queue()
+            queue = self._new_queue()
 
             if self._shutdown:
                 # Already shut down, immediately send sentinel
                 queue.put_nowait(None)
             else:
+                if last_event_id is not None:
+                    # No await between reading the buffer and subscribing,
+                    # so no event is missed or delivered twice
+                    missed = self.replay_since(last_event_id)
+                    # A backlog that overflows the queue would be truncated anyway
+                    if missed is None or len(missed) > self._queue_size:
+                        queue.put_nowait(self._snapshot_required(last_event_id))
+                    else:
+                        for event in missed:
+                            queue.offer(event, self._status_key(event))
                 # Add to active subscribers
                 self._subscribers.add(queue)
 
@@ -319,13 +594,8 @@ class SSEBroadcaster:
                 # No-op after shutdown
                 return
 
-            # Create a copy of subscribers to iterate safely
-            for queue in list(self._subscribers):
-                try:
-                    queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    # Skip if queue is full
-                    pass
+            self._record(event)
+            self._fan_out(event)
 
     async def _heartbeat_loop(self) -> None:
         """Background task that sends periodic heartbeat events to all subscribers."""
@@ -339,9 +609,9 @@ class SSEBroadcaster:
                 if self._shutdown:
                     break
 
-                # Send heartbeat event to all subscribers
+                # Send heartbeat event to all subscribers (not replayed)
                 heartbeat_event = SSEEvent(event="heartbeat", data="")
-                await self.publish(heartbeat_event)
+                self._fan_out(heartbeat_event)
 
             except asyncio.CancelledError:
                 break
@@ -0,0 +1,150 @@
+"""Load benchmark for SSE fan-out.
+
+Connects a large number of concurrent subscribers, each consuming the
+same ``event_stream`` generator the /events route uses, and measures:
+
+- idle CPU: process CPU time while every subscriber waits for an event
+  (a streaming loop that polls shows up here; one that blocks does not)
+- fan-out cost: process CPU time per published event
+- delivery latency: time from publish to each subscriber receiving the
+  event (p50/p95/p99/max)
+
+Everything runs in one process on one event loop, so the numbers are the
+broadcaster's and stream loop's own cost without network or HTTP framing.
+
+Usage (see scripts/bench_sse_fanout.py for the CLI):
+    results = asyncio.run(run_fanout_benchmark(subscribers=1_000))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import platform
+import statistics
+import time
+from typing import Any
+
+from .routes.events import event_stream
+from .sse import SSEBroadcaster, SSEEvent
+
+BENCHMARK_SCHEMA_VERSION = 1
+
+
+async def _consume(
+    broadcaster: SSEBroadcaster, received: list[tuple[float, bytes]], expected: int
+) -> None:
+    """Read ``expected`` events from one stream, recording arrival times."""
+    stream = event_stream(broadcaster, encoded=True)
+    try:
+        async for chunk in stream:
+            assert isinstance(chunk, bytes)
+            received.append((time.perf_counter(), chunk))
+            if len(received) >= expected:
+                break
+    finally:
+        await stream.aclose()
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+async def run_fanout_benchmark(
+    subscribers: int = 1_000,
+    events: int = 50,
+    interval: float = 0.02,
+    idle_seconds: float = 1.0,
+    queue_size: int | None = None,
+    timeout: float = 60.0,
+) -> dict[str, Any]:
+    """Measure idle CPU, fan-out CPU and delivery latency.
+
+    Args:
+        subscribers: Concurrent subscribers.
+        events: Events published during the fan-out phase.
+        interval: Seconds between published events.
+        idle_seconds: Length of the idle phase.
+        queue_size: Per-subscriber queue bound (defaults to ``events`` so
+            nothing is dropped).
+        timeout: Seconds to wait for every subscriber to receive every event.
+
+    Returns:
+        JSON-serializable results.
+    """
+    broadcaster = SSEBroadcaster(queue_size=queue_size or max(1, events))
+    received: list[list[tuple[float, bytes]]] = [[] for _ in range(subscribers)]
+    consumers = [
+        asyncio.create_task(_consume(broadcaster, arrivals, events)) for arrivals in received
+    ]
+
+    try:
+        connect_started = time.perf_counter()
+        while broadcaster.subscriber_count < subscribers:
+            await asyncio.sleep(0.001)
+        connect_s = time.perf_counter() - connect_started
+
+        cpu_started = time.process_time()
+        await asyncio.sleep(idle_seconds)
+        idle_cpu_s = time.process_time() - cpu_started
+
+        published_at: dict[bytes, float] = {}
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        for seq in range(events):
+            event = SSEEvent(event="benchmark", data=json.dumps({"seq": seq}))
+            sent = time.perf_counter()
+            await broadcaster.publish(event)
+            published_at[event.encode()] = sent
+            await asyncio.sleep(interval)
+        done, _ = await asyncio.wait(consumers, timeout=timeout)
+        fanout_wall_s = time.perf_counter() - wall_started
+        fanout_cpu_s = time.process_time() - cpu_started
+    finally:
+        for consumer in consumers:
+            consumer.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+        await broadcaster.shutdown()
+
+    latencies_ms = sorted(
+        (arrived - published_at[chunk]) * 1000
+        for arrivals in received
+        for arrived, chunk in arrivals
+        if chunk in published_at
+    )
+    # process_time() excludes the sleeps between publishes
+    busy_cpu_s = fanout_cpu_s
+    stats = broadcaster.stats()
+    return {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "subscribers": subscribers,
+        "events": events,
+        "interval_s": interval,
+        "connect_s": round(connect_s, 4),
+        "idle": {
+            "seconds": idle_seconds,
+            "cpu_s": round(idle_cpu_s, 4),
+            "cpu_percent": round(100 * idle_cpu_s / idle_seconds, 2) if idle_seconds else 0.0,
+        },
+        "fanout": {
+            "wall_s": round(fanout_wall_s, 4),
+            "cpu_s": round(busy_cpu_s, 4),
+            "cpu_ms_per_event": round(1000 * busy_cpu_s / events, 3) if events else 0.0,
+            "cpu_us_per_delivery": (
+                round(1e6 * busy_cpu_s / len(latencies_ms), 2) if latencies_ms else 0.0
+            ),
+        },
+        "latency_ms": {
+            "deliveries": len(latencies_ms),
+            "expected": subscribers * events,
+            "p50": round(_percentile(latencies_ms, 0.50), 3) if latencies_ms else None,
+            "p95": round(_percentile(latencies_ms, 0.95), 3) if latencies_ms else None,
+            "p99": round(_percentile(latencies_ms, 0.99), 3) if latencies_ms else None,
+            "max": round(latencies_ms[-1], 3) if latencies_ms else None,
+            "mean": round(statistics.fmean(latencies_ms), 3) if latencies_ms else None,
+        },
+        "completed_subscribers": sum(1 for c in done if not c.cancelled()),
+        "dropped": stats.dropped,
+    }
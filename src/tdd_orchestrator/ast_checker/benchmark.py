@@ -0,0 +1,357 @@
+"""Micro-benchmark harness for the AST quality checker.
+
+Static RED review runs ASTQualityChecker.check_file inside a 500ms
+``asyncio.timeout`` (worker_pool/review.py). When the checker gets slower
+than that, the review silently times out and passes every test file
+through. This module measures the checker so regressions show up in CI
+before they show up as skipped reviews.
+
+Corpora:
+    - Synthetic test modules of ~150, ~2,000 and ~10,000 lines
+    - A pathological module with deep block nesting and long expressions
+    - Optional real-world files (any directory of ``.py`` files)
+
+For every corpus the harness times each detector on a pre-parsed tree and
+the whole ``check_file`` call (median/min wall time, lines per second) and
+records peak traced memory. Results are plain JSON; compare_to_baseline()
+diffs two result sets and reports regressions beyond a tolerance.
+
+Usage (see scripts/bench_ast_checker.py for the CLI):
+    results = run_benchmarks(iterations=5)
+    regressions = compare_to_baseline(results, json.loads(baseline_text))
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from .checker import ASTQualityChecker
+from .mock_only_detector import MockOnlyDetector
+from .models import ASTViolation
+from .quality_detectors import (
+    BareExceptDetector,
+    DocstringChecker,
+    PrintDetector,
+    SecretDetector,
+)
+from .stub_detector import StubDetector
+from .test_detectors import (
+    EmptyAssertionCheck,
+    LambdaIterationCheck,
+    MissingAssertionCheck,
+    SemanticContradictionCheck,
+    UnguardedMethodCheck,
+)
+
+BENCHMARK_SCHEMA_VERSION = 1
+
+# Budget enforced by run_static_review (worker_pool/review.py)
+STATIC_REVIEW_TIMEOUT_MS = 500
+
+# Ignore regressions smaller than this many milliseconds (timer noise)
+MIN_REGRESSION_MS = 1.0
+
+DetectorFunc = Callable[[ast.Module, list[str]], list[ASTViolation]]
+
+
+def _visit(cls: Callable[[list[str]], Any]) -> DetectorFunc:
+    def run(tree: ast.Module, source_lines: list[str]) -> list[ASTViolation]:
+        detector = cls(source_lines)
+        detector.visit(tree)
+        violations: list[ASTViolation] = detector.violations
+        return violations
+
+    return run
+
+
+def _semantic(tree: ast.Module, source_lines: list[str]) -> list[ASTViolation]:
+    return SemanticContradictionCheck(source_lines).check(tree)
+
+
+# Detectors in the order ASTQualityChecker.check_file runs them
+DETECTORS: dict[str, DetectorFunc] = {
+    "SecretDetector": _visit(SecretDetector),
+    "BareExceptDetector": _visit(BareExceptDetector),
+    "PrintDetector": _visit(PrintDetector),
+    "DocstringChecker": _visit(DocstringChecker),
+    "StubDetector": _visit(StubDetector),
+    "MissingAssertionCheck": _visit(MissingAssertionCheck),
+    "EmptyAssertionCheck": _visit(EmptyAssertionCheck),
+    "LambdaIterationCheck": _visit(LambdaIterationCheck),
+    "UnguardedMethodCheck": _visit(UnguardedMethodCheck),
+    "SemanticContradictionCheck": _semantic,
+    "MockOnlyDetector": _visit(MockOnlyDetector),
+}
+
+
+# =============================================================================
+# Corpora
+# =============================================================================
+
+_TEST_MODULE_HEADER = '''"""Synthetic benchmark test module."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.service import Service, ServiceError
+
+
+@pytest.fixture
+def service() -> Service:
+    return Service(client=MagicMock())
+
+'''
+
+_TEST_CASE = '''
+class TestCase{n}:
+    """Behaviour group {n}."""
+
+    def test_create_{n}(self, service: Service) -> None:
+        result = service.create(name="item-{n}", size={n})
+        assert result.name == "item-{n}"
+        assert result.size == {n}
+
+    async def test_fetch_{n}(self, service: Service) -> None:
+        # NOTE: exercises the async path
+        items = await service.fetch(limit={n})
+        assert len(items) <= {n}
+        assert all(lambda item: item.ok for item in items) or items == []
+
+    def test_error_{n}(self, service: Service) -> None:
+        with pytest.raises(ServiceError):
+            service.delete(item_id=-{n})
+
+    @patch("app.service.Service.save")
+    def test_mocked_{n}(self, mock_save: MagicMock, service: Service) -> None:
+        mock_save.return_value = True
+        assert service.save({{"id": {n}}}) is True
+        mock_save.assert_called_once()
+'''
+
+
+def generate_test_module(target_lines: int) -> str:
+    """Generate a realistic pytest module of roughly ``target_lines`` lines."""
+    parts = [_TEST_MODULE_HEADER]
+    lines = _TEST_MODULE_HEADER.count("\n")
+    n = 0
+    while lines < target_lines:
+        case = _TEST_CASE.format(n=n)
+        parts.append(case)
+        lines += case.count("\n")
+        n += 1
+    return "".join(parts)
+
+
+def generate_pathological_module(depth: int = 60, expr_terms: int = 150) -> str:
+    """Generate a test module with deeply nested blocks and long expressions.
+
+    Depths are chosen to stay inside CPython's parser and recursion limits
+    while still stressing the recursive NodeVisitor traversal.
+    """
+    lines = ["import pytest", "", "", "def test_deeply_nested(value: int) -> None:"]
+    indent = "    "
+    for level in range(depth):
+        lines.append(f"{indent}if value > {level}:")
+        indent += "    "
+    sum_expr = " + ".join(f"value * {i}" for i in range(expr_terms))
+    lines.append(f"{indent}total = {sum_expr}")
+    lines.append(f"{indent}assert total >= 0")
+    lines.append("")
+    lines.append("")
+    lines.append("def test_wide_boolean(value: int) -> None:")
+    bool_expr = " and ".join(f"value != {i}" for i in range(expr_terms * 4))
+    lines.append(f"    assert {bool_expr}")
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_corpora() -> dict[str, str]:
+    """Return the built-in synthetic corpora keyed by name."""
+    return {
+        "small": generate_test_module(150),
+        "test_2k": generate_test_module(2_000),
+        "test_10k": generate_test_module(10_000),
+        "pathological_nesting": generate_pathological_module(),
+    }
+
+
+def load_real_corpus(directory: Path, limit: int = 20) -> dict[str, str]:
+    """Load up to ``limit`` of the largest ``.py`` files under ``directory``."""
+    files = sorted(directory.rglob("*.py"), key=lambda p: p.stat().st_size, reverse=True)
+    corpus: dict[str, str] = {}
+    for path in files[:limit]:
+        try:
+            corpus[f"real:{path.relative_to(directory).as_posix()}"] = path.read_text(
+                encoding="utf-8"
+            )
+        except (OSError, UnicodeDecodeError):
+            continue
+    return corpus
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+def _timing_stats(samples_s: list[float], line_count: int) -> dict[str, float]:
+    median = statistics.median(samples_s)
+    return {
+        "median_ms": round(median * 1000, 3),
+        "min_ms": round(min(samples_s) * 1000, 3),
+        "lines_per_sec": round(line_count / median, 1) if median > 0 else 0.0,
+    }
+
+
+def _peak_kib(func: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def benchmark_source(
+    name: str,
+    source: str,
+    workdir: Path,
+    iterations: int = 5,
+) -> dict[str, Any]:
+    """Benchmark every detector and ``check_file`` on one source text.
+
+    The source is written as ``test_<n>.py`` so the test-only detectors run,
+    matching how static review sees RED-stage test files.
+    """
+    safe_name = "".join(c if c.isalnum() else "_" for c in name)
+    file_path = workdir / f"test_{safe_name}.py"
+    file_path.write_text(source, encoding="utf-8")
+    source_lines = source.splitlines()
+    line_count = len(source_lines)
+
+    try:
+        tree = ast.parse(source, type_comments=True)
+    except SyntaxError as e:
+        return {"lines": line_count, "error": f"SyntaxError: {e.msg}"}
+
+    detectors: dict[str, Any] = {}
+    for det_name, run in DETECTORS.items():
+        samples: list[float] = []
+        try:
+            for _ in range(iterations):
+                start = time.perf_counter()
+                run(tree, source_lines)
+                samples.append(time.perf_counter() - start)
+        except RecursionError:
+            detectors[det_name] = {"error": "RecursionError"}
+            continue
+        stats: dict[str, Any] = _timing_stats(samples, line_count)
+        stats["peak_kib"] = _peak_kib(partial(run, tree, source_lines))
+        detectors[det_name] = stats
+
+    checker = ASTQualityChecker()
+
+    async def _check() -> list[float]:
+        samples_s: list[float] = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await checker.check_file(file_path)
+            samples_s.append(time.perf_counter() - start)
+        return samples_s
+
+    check_samples = asyncio.run(_check())
+    check_stats: dict[str, Any] = _timing_stats(check_samples, line_count)
+    check_stats["peak_kib"] = _peak_kib(lambda: asyncio.run(checker.check_file(file_path)))
+    check_stats["within_static_review_timeout"] = (
+        check_stats["median_ms"] < STATIC_REVIEW_TIMEOUT_MS
+    )
+
+    return {"lines": line_count, "check_file": check_stats, "detectors": detectors}
+
+
+def run_benchmarks(
+    iterations: int = 5,
+    corpora: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Run the benchmark suite and return JSON-serializable results.
+
+    Args:
+        iterations: Timed repetitions per measurement (median is reported).
+        corpora: Name -> source mapping. Defaults to synthetic_corpora().
+    """
+    sources = corpora if corpora is not None else synthetic_corpora()
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="ast-bench-") as tmp:
+        workdir = Path(tmp)
+        for name, source in sources.items():
+            results[name] = benchmark_source(name, source, workdir, iterations)
+    return {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "iterations": iterations,
+        "timeout_budget_ms": STATIC_REVIEW_TIMEOUT_MS,
+        "corpora": results,
+    }
+
+
+def compare_to_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.25,
+) -> list[str]:
+    """Return human-readable regressions of ``current`` against ``baseline``.
+
+    A metric regresses when it exceeds the baseline by more than
+    ``tolerance`` (fraction) and, for timings, by more than
+    MIN_REGRESSION_MS. Any ``check_file`` median over the static review
+    timeout is always reported. Corpora missing from either side are skipped.
+    """
+    regressions: list[str] = []
+    base_corpora: dict[str, Any] = baseline.get("corpora", {})
+
+    for name, cur in current.get("corpora", {}).items():
+        check = cur.get("check_file", {})
+        if check and not check.get("within_static_review_timeout", True):
+            regressions.append(
+                f"{name}: check_file median {check['median_ms']}ms exceeds "
+                f"{STATIC_REVIEW_TIMEOUT_MS}ms static review timeout"
+            )
+
+        base = base_corpora.get(name)
+        if not base:
+            continue
+
+        pairs: list[tuple[str, dict[str, Any], dict[str, Any]]] = [
+            ("check_file", check, base.get("check_file", {}))
+        ]
+        for det_name, det in cur.get("detectors", {}).items():
+            pairs.append((det_name, det, base.get("detectors", {}).get(det_name, {})))
+
+        for label, cur_stats, base_stats in pairs:
+            if "error" in cur_stats and "error" not in base_stats:
+                regressions.append(f"{name}/{label}: {cur_stats['error']}")
+                continue
+            for metric, floor in (("median_ms", MIN_REGRESSION_MS), ("peak_kib", 0.0)):
+                if metric not in cur_stats or metric not in base_stats:
+                    continue
+                cur_val = float(cur_stats[metric])
+                base_val = float(base_stats[metric])
+                if cur_val > base_val * (1 + tolerance) and cur_val - base_val > floor:
+                    regressions.append(
+                        f"{name}/{label}: {metric} {base_val} -> {cur_val} "
+                        f"(+{(cur_val / base_val - 1) * 100 if base_val else 100:.0f}%)"
+                    )
+    return regressions
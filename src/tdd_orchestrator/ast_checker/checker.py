@@ -204,17 +204,13 @@ class ASTQualityChecker:
                     if match:
                         marker = match.group(1).upper()
                         lineno = token.start[0]
-                        snippet = ""
-                        if 0 < lineno <= len(source_lines):
-                            snippet = source_lines[lineno - 1].strip()
-
                         violations.append(
                             ASTViolation(
                                 pattern="todo_marker",
                                 line_number=lineno,
                                 message=f"{marker} marker found - resolve before committing",
                                 severity="error",
-                                code_snippet=snippet,
+                                source_lines=source_lines,
                             )
                         )
         except tokenize.TokenError as e:
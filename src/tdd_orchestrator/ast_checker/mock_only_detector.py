@@ -86,9 +86,6 @@ class MockOnlyDetector(ast.NodeVisitor):
 
         # Only flag if there are mock assertions and zero real assertions
         if mock_count > 0 and real_count == 0:
-            snippet = ""
-            if 0 < node.lineno <= len(self.source_lines):
-                snippet = self.source_lines[node.lineno - 1].strip()
             self.violations.append(
                 ASTViolation(
                     pattern="mock_only_test",
@@ -98,7 +95,7 @@ class MockOnlyDetector(ast.NodeVisitor):
                         f"all against mocks — no real behavior is verified"
                     ),
                     severity="warning",
-                    code_snippet=snippet,
+                    source_lines=self.source_lines,
                 )
             )
 
@@ -8,7 +8,10 @@ for violations, results, and configuration.
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from typing import Any
 
 # Secret detection patterns
 AWS_KEY_PATTERN = re.compile(r"AKIA[A-Z0-9]{16}")
@@ -41,10 +44,14 @@ LONG_SECRET_PATTERN = re.compile(r"^[A-Za-z0-9+/=_-]{32,}$")
 TODO_PATTERN = re.compile(r"#\s*(TODO|FIXME|HACK|XXX)\b", re.IGNORECASE)
 
 
-@dataclass
 class ASTViolation:
     """A single AST-based code quality violation.
 
+    A slotted record: checks on large files produce one violation per
+    offending node, so instances carry no ``__dict__``, ``pattern`` and
+    ``severity`` are interned, and the snippet is resolved from the shared
+    ``source_lines`` only when ``code_snippet`` is first read.
+
     Attributes:
         pattern: The pattern type that was violated (e.g., "hardcoded_secret").
         line_number: The line number where the violation occurred.
@@ -53,14 +60,80 @@ class ASTViolation:
         code_snippet: The offending line of code (optional).
     """
 
-    pattern: str
-    line_number: int
-    message: str
-    severity: str
-    code_snippet: str = ""
-
-
-@dataclass
+    __slots__ = ("_snippet", "_source_lines", "line_number", "message", "pattern", "severity")
+
+    def __init__(
+        self,
+        pattern: str,
+        line_number: int,
+        message: str,
+        severity: str,
+        code_snippet: str = "",
+        *,
+        source_lines: Sequence[str] | None = None,
+    ) -> None:
+        """Create a violation.
+
+        Args:
+            pattern: The pattern type that was violated.
+            line_number: 1-based line number of the violation.
+            message: Human-readable description of the violation.
+            severity: Either "error" or "warning".
+            code_snippet: Explicit snippet; takes precedence over source_lines.
+            source_lines: Source of the checked file, used to resolve the
+                snippet for ``line_number`` lazily.
+        """
+        self.pattern = sys.intern(pattern)
+        self.line_number = line_number
+        self.message = message
+        self.severity = sys.intern(severity)
+        self._snippet: str | None = code_snippet or (None if source_lines else "")
+        self._source_lines = source_lines if self._snippet is None else None
+
+    @property
+    def code_snippet(self) -> str:
+        """The offending line of code, stripped (resolved on first access)."""
+        if self._snippet is None:
+            lines = self._source_lines or ()
+            lineno = self.line_number
+            self._snippet = lines[lineno - 1].strip() if 0 < lineno <= len(lines) else ""
+            self._source_lines = None
+        return self._snippet
+
+    @code_snippet.setter
+    def code_snippet(self, value: str) -> None:
+        self._snippet = value
+        self._source_lines = None
+
+    def to_issue(self) -> dict[str, Any]:
+        """Return the violation as an issue dict for stage prompts."""
+        return {
+            "pattern": self.pattern,
+            "line_number": self.line_number,
+            "message": self.message,
+            "severity": self.severity,
+            "code_snippet": self.code_snippet,
+        }
+
+    def _key(self) -> tuple[str, int, str, str, str]:
+        return (self.pattern, self.line_number, self.message, self.severity, self.code_snippet)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ASTViolation):
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"ASTViolation(pattern={self.pattern!r}, line_number={self.line_number!r}, "
+            f"message={self.message!r}, severity={self.severity!r}, "
+            f"code_snippet={self.code_snippet!r})"
+        )
+
+
+@dataclass(slots=True)
 class ASTCheckResult:
     """Result from running AST quality checks on a file.
 
@@ -120,30 +120,16 @@ class SecretDetector(ast.NodeVisitor):
             lineno: Line number of the violation.
             message: Description of the violation.
         """
-        snippet = self._get_snippet(lineno)
         self.violations.append(
             ASTViolation(
                 pattern="hardcoded_secret",
                 line_number=lineno,
                 message=message,
                 severity="error",
-                code_snippet=snippet,
+                source_lines=self.source_lines,
             )
         )
 
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number.
-
-        Args:
-            lineno: 1-based line number.
-
-        Returns:
-            The source code line, stripped.
-        """
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
-
 
 class BareExceptDetector(ast.NodeVisitor):
     """AST visitor that detects bare except clauses."""
@@ -167,17 +153,11 @@ class BareExceptDetector(ast.NodeVisitor):
                     line_number=node.lineno,
                     message="Bare except clause - specify exception type",
                     severity="error",
-                    code_snippet=self._get_snippet(node.lineno),
+                    source_lines=self.source_lines,
                 )
             )
         self.generic_visit(node)
 
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number."""
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
-
 
 class PrintDetector(ast.NodeVisitor):
     """AST visitor that detects print statements in production code."""
@@ -215,7 +195,7 @@ class PrintDetector(ast.NodeVisitor):
                     line_number=node.lineno,
                     message="Use logger instead of print()",
                     severity="warning",
-                    code_snippet=self._get_snippet(node.lineno),
+                    source_lines=self.source_lines,
                 )
             )
         self.generic_visit(node)
@@ -233,12 +213,6 @@ class PrintDetector(ast.NodeVisitor):
                 return True
         return False
 
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number."""
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
-
 
 class DocstringChecker(ast.NodeVisitor):
     """AST visitor that checks for missing docstrings on public entities."""
@@ -288,12 +262,6 @@ class DocstringChecker(ast.NodeVisitor):
                     line_number=node.lineno,
                     message=f"Missing docstring for public {kind} '{node.name}'",
                     severity="warning",
-                    code_snippet=self._get_snippet(node.lineno),
+                    source_lines=self.source_lines,
                 )
             )
-
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number."""
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
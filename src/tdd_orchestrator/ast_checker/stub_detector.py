@@ -216,15 +216,12 @@ class StubDetector(ast.NodeVisitor):
         self, node: ast.FunctionDef | ast.AsyncFunctionDef, message: str
     ) -> None:
         """Record a stub violation."""
-        snippet = ""
-        if 0 < node.lineno <= len(self.source_lines):
-            snippet = self.source_lines[node.lineno - 1].strip()
         self.violations.append(
             ASTViolation(
                 pattern="stub_detected",
                 line_number=node.lineno,
                 message=f"{message} in '{node.name}'",
                 severity="error",
-                code_snippet=snippet,
+                source_lines=self.source_lines,
             )
         )
@@ -37,7 +37,7 @@ class MissingAssertionCheck(ast.NodeVisitor):
                         line_number=node.lineno,
                         message=f"Test function '{node.name}' has no assertions",
                         severity="error",
-                        code_snippet=self._get_snippet(node.lineno),
+                        source_lines=self.source_lines,
                     )
                 )
         self.generic_visit(node)
@@ -61,12 +61,6 @@ class MissingAssertionCheck(ast.NodeVisitor):
                             return True
         return False
 
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number."""
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
-
 
 class EmptyAssertionCheck(ast.NodeVisitor):
     """AST visitor that detects meaningless assertions."""
@@ -90,7 +84,7 @@ class EmptyAssertionCheck(ast.NodeVisitor):
                     line_number=node.lineno,
                     message="Assertion is always true (assert True/constant)",
                     severity="warning",
-                    code_snippet=self._get_snippet(node.lineno),
+                    source_lines=self.source_lines,
                 )
             )
         # Check for: assert x (just a variable, no comparison)
@@ -101,17 +95,11 @@ class EmptyAssertionCheck(ast.NodeVisitor):
                     line_number=node.lineno,
                     message=f"Consider 'assert {node.test.id} == expected_value' instead of truthiness check",
                     severity="warning",
-                    code_snippet=self._get_snippet(node.lineno),
+                    source_lines=self.source_lines,
                 )
             )
         self.generic_visit(node)
 
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number."""
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
-
 
 class LambdaIterationCheck(ast.NodeVisitor):
     """AST visitor that detects unguarded iteration over lambda parameters.
@@ -176,16 +164,10 @@ class LambdaIterationCheck(ast.NodeVisitor):
                                 f"Use '{iter_name} or []' or add 'if {iter_name}' condition."
                             ),
                             severity="warning",
-                            code_snippet=self._get_snippet(lambda_lineno),
+                            source_lines=self.source_lines,
                         )
                     )
 
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number."""
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
-
 
 class UnguardedMethodCheck(ast.NodeVisitor):
     """AST visitor that detects unguarded string method calls on potentially None values.
@@ -277,7 +259,7 @@ class UnguardedMethodCheck(ast.NodeVisitor):
                                     f"Add None check: 'if {var_name} is not None:'"
                                 ),
                                 severity="warning",
-                                code_snippet=self._get_snippet(node.lineno),
+                                source_lines=self.source_lines,
                             )
                         )
                     elif var_name in self._current_params:
@@ -290,17 +272,11 @@ class UnguardedMethodCheck(ast.NodeVisitor):
                                     f"Add None check: 'if {var_name} is not None:'"
                                 ),
                                 severity="warning",
-                                code_snippet=self._get_snippet(node.lineno),
+                                source_lines=self.source_lines,
                             )
                         )
         self.generic_visit(node)
 
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number."""
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
-
 
 class SemanticContradictionCheck(ast.NodeVisitor):
     """Detect test functions with contradictory assertions on identical inputs.
@@ -494,19 +470,6 @@ class SemanticContradictionCheck(ast.NodeVisitor):
                             f"Same function call cannot return both True and False."
                         ),
                         severity="warning",
-                        code_snippet=self._get_snippet(first_line),
+                        source_lines=self.source_lines,
                     )
                 )
-
-    def _get_snippet(self, lineno: int) -> str:
-        """Get source code snippet for a line number.
-
-        Args:
-            lineno: 1-based line number.
-
-        Returns:
-            The source code line, stripped.
-        """
-        if 0 < lineno <= len(self.source_lines):
-            return self.source_lines[lineno - 1].strip()
-        return ""
@@ -19,6 +19,7 @@ from ..circuit_breaker_config import (
     CircuitState,
     DEFAULT_CONFIG,
 )
+from ..database.events import CircuitStateChanged, publish_event
 
 if TYPE_CHECKING:
     from ..database import OrchestratorDB
@@ -470,7 +471,7 @@ class StageCircuitBreaker:
         to_state: str | None = None,
         error_context: dict[str, Any] | None = None,
     ) -> None:
-        """Record a circuit breaker event for audit trail."""
+        """Record a circuit breaker event for audit trail (transitions are also published)."""
         if self._circuit_id is None:
             return
 
@@ -494,3 +495,16 @@ class StageCircuitBreaker:
             ),
         )
         await self._db._conn.commit()
+
+        if to_state is not None and to_state != from_state:
+            publish_event(
+                self._db,
+                CircuitStateChanged(
+                    level=CircuitLevel.STAGE.value,
+                    identifier=self._identifier,
+                    from_state=from_state,
+                    to_state=to_state,
+                    reason=event_type,
+                    failure_count=self._failure_count,
+                ),
+            )
@@ -18,6 +18,7 @@ from ..circuit_breaker_config import (
     CircuitState,
     DEFAULT_CONFIG,
 )
+from ..database.events import CircuitStateChanged, publish_event
 
 if TYPE_CHECKING:
     from ..database import OrchestratorDB
@@ -553,7 +554,7 @@ class WorkerCircuitBreaker:
         to_state: str | None = None,
         error_context: dict[str, Any] | None = None,
     ) -> None:
-        """Record a circuit breaker event."""
+        """Record a circuit breaker event (transitions are also published)."""
         if self._circuit_id is None:
             return
 
@@ -577,3 +578,16 @@ class WorkerCircuitBreaker:
             ),
         )
         await self._db._conn.commit()
+
+        if to_state is not None and to_state != from_state:
+            publish_event(
+                self._db,
+                CircuitStateChanged(
+                    level=CircuitLevel.WORKER.value,
+                    identifier=self._identifier,
+                    from_state=from_state,
+                    to_state=to_state,
+                    reason=event_type,
+                    failure_count=self._failure_count,
+                ),
+            )
@@ -12,6 +12,8 @@ from pathlib import Path
 
 import click
 
+from .cli_analytics import backfill_analytics_command
+from .cli_archive import archive_command
 from .cli_circuits import circuits
 from .cli_decompose import decompose_command
 from .cli_ingest import ingest_command
@@ -20,6 +22,7 @@ from .cli_init_prd import init_prd_command
 from .cli_run_prd import run_prd_command
 from .cli_validate import validate
 from .database import OrchestratorDB
+from .metrics import start_metrics_server
 from .project_config import resolve_db_for_cli
 from .worker_pool import PoolResult, WorkerConfig, WorkerPool
 
@@ -41,6 +44,8 @@ def cli(verbose: bool) -> None:
 
 
 # Register subcommand groups from separate modules
+cli.add_command(archive_command)
+cli.add_command(backfill_analytics_command)
 cli.add_command(circuits)
 cli.add_command(decompose_command)
 cli.add_command(ingest_command)
@@ -79,6 +84,12 @@ cli.add_command(validate)
     is_flag=True,
     help="Resume from previous run (recover stale tasks before starting)",
 )
+@click.option(
+    "--metrics-port",
+    type=int,
+    default=None,
+    help="Serve Prometheus metrics on 127.0.0.1:PORT/metrics while running",
+)
 def run(
     parallel: bool,
     workers: int | None,
@@ -91,6 +102,7 @@ def run(
     multi_branch: bool,
     no_phase_gates: bool,
     resume: bool,
+    metrics_port: int | None,
 ) -> None:
     """Run the TDD orchestrator."""
     if all_phases and phase is not None:
@@ -114,7 +126,7 @@ def run(
         _run_async(
             parallel, resolved_workers, phase, all_phases, resolved_db_path,
             slack_webhook, max_invocations, local, single_branch, no_phase_gates,
-            resume,
+            resume, metrics_port=metrics_port,
         )
     )
 
@@ -131,10 +143,15 @@ async def _run_async(
     single_branch: bool,
     no_phase_gates: bool = False,
     resume: bool = False,
+    *,
+    metrics_port: int | None = None,
 ) -> None:
     """Async implementation of run command."""
     _validate_workers(workers)
 
+    # The API runs in its own process; serve this process's metrics directly
+    metrics_server = await start_metrics_server(metrics_port) if metrics_port else None
+
     db = OrchestratorDB(db_path)
     await db.connect()
 
@@ -151,6 +168,9 @@ async def _run_async(
             sys.exit(1)
     finally:
         await db.close()
+        if metrics_server is not None:
+            metrics_server.close()
+            await metrics_server.wait_closed()
 
 
 def _validate_workers(workers: int) -> None:
@@ -0,0 +1,44 @@
+"""CLI command for rebuilding the analytics rollups.
+
+Thin wrapper exposing OrchestratorDB.rebuild_analytics_rollups() via
+``tdd-orchestrator backfill-analytics``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import click
+
+from .database import OrchestratorDB
+from .project_config import resolve_db_for_cli
+
+
+@click.command("backfill-analytics")
+@click.option("--db", type=click.Path(), default=None, help="Database path")
+def backfill_analytics_command(db: str | None) -> None:
+    """Recompute the analytics rollup tables from the full history.
+
+    The rollups behind the /analytics endpoints are maintained by triggers
+    as rows are written, and are backfilled once when a database is
+    upgraded. Run this after importing rows with triggers disabled or
+    editing the database with an older version of the orchestrator.
+    """
+    try:
+        resolved_db_path, _ = resolve_db_for_cli(db)
+    except (FileNotFoundError, ValueError) as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(1)
+
+    asyncio.run(_backfill_async(resolved_db_path))
+
+
+async def _backfill_async(db_path: Path) -> None:
+    """Async implementation of the backfill-analytics command."""
+    async with OrchestratorDB(db_path) as db:
+        counts = await db.rebuild_analytics_rollups()
+
+    for table, count in counts.items():
+        click.echo(f"{table}: {count} row(s)")
@@ -0,0 +1,84 @@
+"""CLI command for run archival and retention.
+
+Thin wrapper exposing OrchestratorDB.archive_runs() via
+``tdd-orchestrator archive``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import click
+
+from .database import OrchestratorDB
+from .project_config import resolve_db_for_cli
+
+
+@click.command("archive")
+@click.option("--db", type=click.Path(), default=None, help="Database path")
+@click.option(
+    "--retention-days",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Days of history to keep (default: retention_days config, 30)",
+)
+@click.option(
+    "--archive-db",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Database to move old rows into (default: <db>-archive.db next to the database)",
+)
+@click.option("--discard", is_flag=True, help="Keep only run summaries, do not copy old rows")
+@click.option("--no-vacuum", is_flag=True, help="Skip reclaiming freed pages")
+def archive_command(
+    db: str | None,
+    retention_days: int | None,
+    archive_db: str | None,
+    discard: bool,
+    no_vacuum: bool,
+) -> None:
+    """Move finished runs and old history out of the hot database.
+
+    Runs that finished before the retention window are reduced to a
+    run_summaries row; their invocations, circuit events and review
+    findings, plus older heartbeats, stash log entries and attempts of
+    completed tasks, are copied to the archive database and removed.
+    """
+    try:
+        resolved_db_path, _ = resolve_db_for_cli(db)
+    except (FileNotFoundError, ValueError) as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(1)
+
+    archive_path: Path | None = None
+    if not discard:
+        archive_path = (
+            Path(archive_db)
+            if archive_db
+            else resolved_db_path.with_name(f"{resolved_db_path.stem}-archive.db")
+        )
+    asyncio.run(_archive_async(resolved_db_path, retention_days, archive_path, not no_vacuum))
+
+
+async def _archive_async(
+    db_path: Path,
+    retention_days: int | None,
+    archive_path: Path | None,
+    vacuum: bool,
+) -> None:
+    """Async implementation of the archive command."""
+    async with OrchestratorDB(db_path) as db:
+        result = await db.archive_runs(retention_days, archive_path, vacuum=vacuum)
+
+    click.echo(f"Retention cutoff: {result.cutoff}")
+    click.echo(f"Runs summarized: {len(result.run_ids)}")
+    for table, count in result.rows.items():
+        if count:
+            click.echo(f"  {table}: {count}")
+    click.echo(f"Rows removed: {result.total_rows}")
+    if result.archive_path is not None:
+        click.echo(f"Archive: {result.archive_path}")
+    if vacuum:
+        click.echo(f"Pages freed: {result.pages_freed}")
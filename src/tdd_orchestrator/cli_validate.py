@@ -13,7 +13,7 @@ from pathlib import Path
 import click
 
 from .database import OrchestratorDB
-from .dep_graph import validate_dependencies
+from .dep_graph import find_dependency_cycles, validate_dependencies
 from .project_config import resolve_db_for_cli
 from .worker_pool.phase_gate import PhaseGateValidator
 from .worker_pool.run_validator import RunValidator
@@ -166,7 +166,7 @@ async def _validate_all_async(db_path: Path) -> None:
 @validate.command("dependencies")
 @click.option("--db", type=click.Path(), default=None, help="Database path")
 def validate_deps(db: str | None) -> None:
-    """Check for dangling dependency references in tasks."""
+    """Check for dangling dependency references and cycles in tasks."""
     try:
         resolved_db_path, _ = resolve_db_for_cli(db)
     except (FileNotFoundError, ValueError) as exc:
@@ -182,14 +182,20 @@ async def _validate_deps_async(db_path: Path) -> None:
 
     try:
         issues = await validate_dependencies(db)
-        if not issues:
+        cycles = await find_dependency_cycles(db)
+        if not issues and not cycles:
             click.echo("All dependency references are valid.")
             return
 
-        click.echo(f"Found {len(issues)} task(s) with dangling dependency references:")
-        for issue in issues:
-            refs = ", ".join(issue["dangling_refs"])
-            click.echo(f"  {issue['task_key']} -> [{refs}]")
+        if issues:
+            click.echo(f"Found {len(issues)} task(s) with dangling dependency references:")
+            for issue in issues:
+                refs = ", ".join(issue["dangling_refs"])
+                click.echo(f"  {issue['task_key']} -> [{refs}]")
+        if cycles:
+            click.echo(f"Found {len(cycles)} circular dependency chain(s):")
+            for cycle in cycles:
+                click.echo(f"  {cycle}")
         sys.exit(1)
     finally:
         await db.close()
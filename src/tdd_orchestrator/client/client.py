@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -138,6 +139,8 @@ class TDDOrchestratorClient:
         complexity: str | None = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
+        exact_total: bool = True,
     ) -> dict[str, Any]:
         """List tasks with optional filtering and pagination.
 
@@ -147,9 +150,13 @@ class TDDOrchestratorClient:
             complexity: Filter by complexity (low, medium, high).
             limit: Maximum number of tasks to return.
             offset: Number of tasks to skip.
+            cursor: ``next_cursor`` of the previous page, to continue after it.
+            exact_total: Recount the total on cursor pages (otherwise the
+                first page's total is reported).
 
         Returns:
-            Dictionary with ``tasks``, ``total``, ``limit``, and ``offset``.
+            Dictionary with ``tasks``, ``total``, ``limit``, ``offset``,
+            ``next_cursor`` (None on the last page) and ``total_exact``.
         """
         params: dict[str, str | int] = {"limit": limit, "offset": offset}
         if status is not None:
@@ -158,8 +165,74 @@ class TDDOrchestratorClient:
             params["phase"] = phase
         if complexity is not None:
             params["complexity"] = complexity
+        if cursor is not None:
+            params["cursor"] = cursor
+        if not exact_total:
+            params["exact_total"] = "false"
         return await self._request("GET", "/tasks", params=params)
 
+    async def iter_task_pages(
+        self,
+        *,
+        status: str | None = None,
+        phase: str | None = None,
+        complexity: str | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every matching task, one page at a time.
+
+        Pages are fetched lazily by cursor, so consumers that stop early
+        never request the rest. Only the first page counts the total.
+
+        Usage::
+
+            async for page in client.iter_task_pages(status="pending"):
+                for task in page["tasks"]:
+                    ...
+
+        Args:
+            status: Filter by task status (pending, running, completed, failed).
+            phase: Filter by task phase (decomposition, red, green, verify, refactor).
+            complexity: Filter by complexity (low, medium, high).
+            page_size: Tasks requested per page.
+
+        Yields:
+            Each page, as returned by list_tasks().
+        """
+        cursor: str | None = None
+        while True:
+            page = await self.list_tasks(
+                status=status,
+                phase=phase,
+                complexity=complexity,
+                limit=page_size,
+                cursor=cursor,
+                exact_total=False,
+            )
+            yield page
+            cursor = page.get("next_cursor")
+            if not cursor:
+                return
+
+    async def iter_tasks(
+        self,
+        *,
+        status: str | None = None,
+        phase: str | None = None,
+        complexity: str | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every matching task across pages (see iter_task_pages()).
+
+        Yields:
+            Each task summary.
+        """
+        async for page in self.iter_task_pages(
+            status=status, phase=phase, complexity=complexity, page_size=page_size
+        ):
+            for task in page["tasks"]:
+                yield task
+
     async def get_task(self, task_key: str) -> dict[str, Any]:
         """Get full detail for a single task.
 
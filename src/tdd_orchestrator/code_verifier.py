@@ -15,11 +15,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from pathlib import Path
 
 from .ast_checker import ASTCheckConfig, ASTCheckResult, ASTQualityChecker, ASTViolation
 from .models import VerifyResult
-from .subprocess_utils import resolve_tool
+from .pipeline_metrics import get_pipeline_metrics
+from .subprocess_utils import resolve_tool, spawn_subprocess
 
 logger = logging.getLogger(__name__)
 
@@ -133,7 +135,13 @@ class CodeVerifier:
         impl_path = self._resolve_path(impl_file)
         logger.debug("Running AST checks on %s", impl_path)
 
-        return await self.ast_checker.check_file(impl_path)
+        started = time.perf_counter()
+        try:
+            return await self.ast_checker.check_file(impl_path)
+        finally:
+            get_pipeline_metrics().verify_tool_duration.labels("ast").observe(
+                time.perf_counter() - started
+            )
 
     async def run_pytest_on_files(self, test_files: list[str]) -> tuple[bool, str]:
         """Run pytest on a list of specific test files.
@@ -228,8 +236,10 @@ class CodeVerifier:
         Raises:
             asyncio.TimeoutError: If command exceeds timeout.
         """
+        process: asyncio.subprocess.Process | None = None
+        started = time.perf_counter()
         try:
-            process = await asyncio.create_subprocess_exec(
+            process = await spawn_subprocess(
                 *args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
@@ -250,6 +260,10 @@ class CodeVerifier:
 
         except asyncio.TimeoutError:
             logger.warning("Command %s timed out after %ds", args[0], self.timeout)
+            if process is not None and process.returncode is None:
+                # Reap the child so its transport is not left for the GC
+                process.kill()
+                await process.wait()
             return False, f"Command timed out after {self.timeout} seconds"
 
         except FileNotFoundError:
@@ -260,6 +274,11 @@ class CodeVerifier:
             logger.exception("Unexpected error running command %s", args[0])
             return False, f"Unexpected error: {e}"
 
+        finally:
+            get_pipeline_metrics().verify_tool_duration.labels(Path(args[0]).name).observe(
+                time.perf_counter() - started
+            )
+
     def _resolve_path(self, file_path: str) -> Path:
         """Resolve a file path relative to base_dir.
 
@@ -0,0 +1,298 @@
+"""Run archival and retention for the append-only tables.
+
+Provides the ArchiveMixin, which moves history older than the retention
+window out of the hot database:
+
+- finished runs past the window get a compact run_summaries row, and
+  their invocations, circuit breaker events and static review findings
+  are removed
+- heartbeats, git stash log entries, task events and the attempts of
+  completed tasks older than the window are removed by timestamp, along
+  with tool output blobs no remaining attempt refers to
+
+When an archive database is given, every removed row is first copied
+into it (ATTACHed as ``archive``, one table per source table, keyed on
+the original id so repeated passes are idempotent). Freed pages are then
+returned to the filesystem with an incremental vacuum.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiosqlite
+
+from .blobs import OUTPUT_BLOB_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Used when the retention_days config key is missing
+DEFAULT_RETENTION_DAYS = 30
+
+# Only attempts of completed tasks: the history of unfinished tasks drives
+# retries and resume
+_ARCHIVED_ATTEMPTS = (
+    "started_at < :cutoff"
+    " AND task_id IN (SELECT id FROM tasks WHERE status IN ('complete', 'passing'))"
+)
+
+# Rows eligible for archival, per table. :runs is a JSON array of the runs
+# being archived and :cutoff the start of the retention window.
+ARCHIVED_TABLES: tuple[tuple[str, str], ...] = (
+    ("invocations", "run_id IN (SELECT value FROM json_each(:runs))"),
+    (
+        "circuit_breaker_events",
+        (
+            "run_id IN (SELECT value FROM json_each(:runs))"
+            " OR (run_id IS NULL AND created_at < :cutoff)"
+        ),
+    ),
+    (
+        "static_review_metrics",
+        (
+            "run_id IN (SELECT value FROM json_each(:runs))"
+            " OR (run_id IS NULL AND detected_at < :cutoff)"
+        ),
+    ),
+    ("worker_heartbeats", "timestamp < :cutoff"),
+    ("git_stash_log", "created_at < :cutoff"),
+    # Normally pruned by DBObserver; this catches databases nobody observes
+    ("task_events", "datetime(created_at) < :cutoff"),
+    ("attempts", _ARCHIVED_ATTEMPTS),
+)
+
+# Tool output referenced by the archived attempts (copied to the archive)
+_ARCHIVED_BLOBS = "id IN ({})".format(
+    " UNION ".join(
+        f"SELECT {column} FROM attempts WHERE {_ARCHIVED_ATTEMPTS}"
+        for column in OUTPUT_BLOB_COLUMNS.values()
+    )
+)
+
+# Tool output no attempt refers to any more (removed after the attempts)
+_UNREFERENCED_BLOBS = "id NOT IN ({})".format(
+    " UNION ".join(
+        f"SELECT {column} FROM attempts WHERE {column} IS NOT NULL"
+        for column in OUTPUT_BLOB_COLUMNS.values()
+    )
+)
+
+_SUMMARIZE_RUNS_SQL = """
+INSERT INTO run_summaries (
+    run_id, invocations, invocation_tokens, invocation_duration_ms,
+    circuit_events, review_findings
+)
+SELECT
+    r.value,
+    (SELECT COUNT(*) FROM invocations i WHERE i.run_id = r.value),
+    (SELECT COALESCE(SUM(i.token_count), 0) FROM invocations i WHERE i.run_id = r.value),
+    (SELECT COALESCE(SUM(i.duration_ms), 0) FROM invocations i WHERE i.run_id = r.value),
+    (SELECT COUNT(*) FROM circuit_breaker_events e WHERE e.run_id = r.value),
+    (SELECT COUNT(*) FROM static_review_metrics m WHERE m.run_id = r.value)
+FROM json_each(:runs) r
+"""
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of one archive pass.
+
+    Attributes:
+        cutoff: Start of the retention window (UTC, SQLite timestamp format).
+        run_ids: Runs summarized in this pass.
+        rows: Rows removed from the hot database, per table.
+        archive_path: Database the rows were copied to, if any.
+        pages_freed: Free pages reclaimed by vacuuming.
+    """
+
+    cutoff: str
+    run_ids: list[int] = field(default_factory=list)
+    rows: dict[str, int] = field(default_factory=dict)
+    archive_path: Path | None = None
+    pages_freed: int = 0
+
+    @property
+    def total_rows(self) -> int:
+        """Total rows removed from the hot database."""
+        return sum(self.rows.values())
+
+
+class ArchiveMixin:
+    """Mixin providing run archival and retention."""
+
+    _conn: aiosqlite.Connection | None
+    _write_lock: asyncio.Lock
+
+    async def _ensure_connected(self) -> None: ...
+
+    if TYPE_CHECKING:
+        # Provided by ConnectionMixin / RunsMixin
+        async def flush_writes(self) -> int: ...
+
+        async def get_config_int(self, key: str, default: int) -> int: ...
+
+    async def archive_runs(
+        self,
+        retention_days: int | None = None,
+        archive_path: str | Path | None = None,
+        *,
+        vacuum: bool = True,
+    ) -> ArchiveResult:
+        """Move history older than the retention window out of the hot tables.
+
+        Args:
+            retention_days: Days of history to keep (defaults to the
+                retention_days config value).
+            archive_path: Database to copy removed rows into. When omitted
+                only the run summaries are kept.
+            vacuum: Reclaim freed pages afterwards.
+
+        Returns:
+            ArchiveResult describing what was moved.
+        """
+        await self._ensure_connected()
+        if not self._conn:
+            return ArchiveResult(cutoff="")
+        if retention_days is None:
+            retention_days = await self.get_config_int("retention_days", DEFAULT_RETENTION_DAYS)
+
+        # Keep program order with queued appends before a synchronous commit
+        await self.flush_writes()
+
+        async with self._write_lock:
+            async with self._conn.execute(
+                "SELECT datetime('now', ?)", (f"-{int(retention_days)} days",)
+            ) as cursor:
+                row = await cursor.fetchone()
+            cutoff = str(row[0]) if row else ""
+
+            async with self._conn.execute(
+                """
+                SELECT id FROM execution_runs r
+                WHERE status != 'running'
+                  AND COALESCE(completed_at, started_at) < ?
+                  AND NOT EXISTS (SELECT 1 FROM run_summaries s WHERE s.run_id = r.id)
+                ORDER BY id
+                """,
+                (cutoff,),
+            ) as cursor:
+                run_ids = [int(r[0]) for r in await cursor.fetchall()]
+
+            params: dict[str, Any] = {"runs": json.dumps(run_ids), "cutoff": cutoff}
+            result = ArchiveResult(cutoff=cutoff, run_ids=run_ids)
+
+            if archive_path is not None:
+                result.archive_path = Path(archive_path)
+                await self._copy_to_archive(result.archive_path, params)
+
+            try:
+                await self._conn.execute(_SUMMARIZE_RUNS_SQL, params)
+                for table, where in ARCHIVED_TABLES:
+                    cursor = await self._conn.execute(f"DELETE FROM {table} WHERE {where}", params)
+                    result.rows[table] = cursor.rowcount
+                cursor = await self._conn.execute(
+                    f"DELETE FROM output_blobs WHERE {_UNREFERENCED_BLOBS}"
+                )
+                result.rows["output_blobs"] = cursor.rowcount
+                await self._conn.commit()
+            except Exception:
+                await self._conn.rollback()
+                raise
+
+            if vacuum:
+                result.pages_freed = await self._reclaim_space()
+
+        logger.info(
+            "Archived %d run(s) and %d row(s) older than %s (%d pages freed)",
+            len(result.run_ids),
+            result.total_rows,
+            cutoff,
+            result.pages_freed,
+        )
+        return result
+
+    async def _copy_to_archive(self, path: Path, params: dict[str, Any]) -> None:
+        """Copy the rows about to be removed into the archive database.
+
+        Committed on its own before the hot rows are deleted: with WAL a
+        transaction spanning ATTACHed databases is not atomic across them,
+        and a copy without a delete is harmless (it is repeated as a no-op).
+        """
+        assert self._conn is not None
+        # ATTACH/DETACH are not allowed inside a transaction
+        await self._conn.commit()
+        await self._conn.execute("ATTACH DATABASE ? AS archive", (str(path),))
+        try:
+            copied = (
+                ("execution_runs", "id IN (SELECT value FROM json_each(:runs))"),
+                *ARCHIVED_TABLES,
+                ("output_blobs", _ARCHIVED_BLOBS),
+            )
+            for table, where in copied:
+                columns = ", ".join(await self._sync_archive_table(table))
+                await self._conn.execute(
+                    f"INSERT OR IGNORE INTO archive.{table} ({columns})"
+                    f" SELECT {columns} FROM main.{table} WHERE {where}",
+                    params,
+                )
+            await self._conn.commit()
+        except Exception:
+            await self._conn.rollback()
+            raise
+        finally:
+            await self._conn.execute("DETACH DATABASE archive")
+
+    async def _sync_archive_table(self, table: str) -> list[str]:
+        """Create or extend ``archive.<table>`` to match the hot table's columns.
+
+        Archive tables carry no constraints beyond the id primary key, so
+        they accept rows from any schema version.
+
+        Returns:
+            The hot table's column names.
+        """
+        assert self._conn is not None
+        async with self._conn.execute(f"PRAGMA main.table_info({table})") as cursor:
+            columns = [(str(r[1]), str(r[2])) for r in await cursor.fetchall()]
+        async with self._conn.execute(f"PRAGMA archive.table_info({table})") as cursor:
+            existing = {str(r[1]) for r in await cursor.fetchall()}
+        if not existing:
+            await self._conn.execute(f"CREATE TABLE archive.{table} (id INTEGER PRIMARY KEY)")
+            existing = {"id"}
+        for name, declared_type in columns:
+            if name not in existing:
+                await self._conn.execute(
+                    f"ALTER TABLE archive.{table} ADD COLUMN {name} {declared_type}"
+                )
+        return [name for name, _ in columns]
+
+    async def _reclaim_space(self) -> int:
+        """Return free pages to the filesystem.
+
+        Databases created before incremental auto-vacuum was enabled are
+        converted with a one-off full VACUUM.
+
+        Returns:
+            Number of free pages before vacuuming.
+        """
+        assert self._conn is not None
+        async with self._conn.execute("PRAGMA freelist_count") as cursor:
+            row = await cursor.fetchone()
+        free_pages = int(row[0]) if row else 0
+        async with self._conn.execute("PRAGMA auto_vacuum") as cursor:
+            row = await cursor.fetchone()
+
+        if row and int(row[0]) == 0:
+            logger.info("Converting database to incremental auto-vacuum")
+            await self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            await self._conn.execute("VACUUM")
+        elif free_pages:
+            # Frees one page per step, so drain the cursor
+            async with self._conn.execute("PRAGMA incremental_vacuum") as cursor:
+                await cursor.fetchall()
+        return free_pages
@@ -0,0 +1,96 @@
+"""Content-addressed, compressed storage for large tool outputs.
+
+pytest/mypy/ruff output is kept out of the attempts rows: each distinct
+text is stored once in output_blobs (keyed on its SHA-256) and attempts
+hold the blob id. Identical outputs, such as "Success: no issues found",
+share one row. Text is decompressed only when a caller asks for it.
+
+Blobs are zlib-compressed unless that does not make them smaller, in
+which case they are stored raw. The codec is recorded per row so other
+codecs can be added without rewriting existing data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+
+import aiosqlite
+
+# Output columns of the attempts table and their blob reference columns
+OUTPUT_BLOB_COLUMNS: dict[str, str] = {
+    "pytest": "pytest_output_blob",
+    "mypy": "mypy_output_blob",
+    "ruff": "ruff_output_blob",
+}
+
+_ZLIB_LEVEL = 6
+
+
+def encode_blob(text: str) -> tuple[str, str, int, bytes]:
+    """Hash and compress text for storage.
+
+    Args:
+        text: Output text.
+
+    Returns:
+        (hash, codec, uncompressed size in bytes, stored bytes).
+    """
+    raw = text.encode("utf-8")
+    digest = hashlib.sha256(raw).hexdigest()
+    compressed = zlib.compress(raw, _ZLIB_LEVEL)
+    if len(compressed) < len(raw):
+        return digest, "zlib", len(raw), compressed
+    return digest, "raw", len(raw), raw
+
+
+def decode_blob(codec: str, data: bytes) -> str:
+    """Inverse of encode_blob().
+
+    Raises:
+        ValueError: If the codec is unknown.
+    """
+    if codec == "zlib":
+        return zlib.decompress(data).decode("utf-8")
+    if codec == "raw":
+        return bytes(data).decode("utf-8")
+    msg = f"Unknown output blob codec: {codec}"
+    raise ValueError(msg)
+
+
+async def store_blob(conn: aiosqlite.Connection, text: str | None) -> int | None:
+    """Store text (deduplicated) and return its blob id.
+
+    Runs on the caller's transaction; the caller holds the write lock.
+
+    Args:
+        conn: Writer connection.
+        text: Output text, or None.
+
+    Returns:
+        The output_blobs id, or None when text is None.
+    """
+    if text is None:
+        return None
+    digest, codec, size, data = encode_blob(text)
+    async with conn.execute("SELECT id FROM output_blobs WHERE hash = ?", (digest,)) as cursor:
+        row = await cursor.fetchone()
+    if row:
+        return int(row[0])
+    async with conn.execute(
+        "INSERT INTO output_blobs (hash, codec, size, data) VALUES (?, ?, ?, ?) RETURNING id",
+        (digest, codec, size, data),
+    ) as cursor:
+        row = await cursor.fetchone()
+    return int(row[0]) if row else None
+
+
+async def load_blob(conn: aiosqlite.Connection, blob_id: int | None) -> str | None:
+    """Return the text stored under a blob id (None if absent)."""
+    if blob_id is None:
+        return None
+    async with conn.execute(
+        "SELECT codec, data FROM output_blobs WHERE id = ?", (blob_id,)
+    ) as cursor:
+        row = await cursor.fetchone()
+    return decode_blob(str(row[0]), row[1]) if row else None
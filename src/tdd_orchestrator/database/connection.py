@@ -8,11 +8,26 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import aiosqlite
 
+from ..pipeline_metrics import get_pipeline_metrics
+from .events import DBEvent, EventBus
+from .migrations import SCHEMA_VERSION, apply_migrations, get_user_version, set_user_version
+from .read_pool import BUSY_TIMEOUT_MS, ReadConnectionPool
+from .write_queue import (
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_MAX_BATCH,
+    Statement,
+    WriteBatchStats,
+    WriteBehindQueue,
+)
+
 logger = logging.getLogger(__name__)
 
 # Path to schema file: database/connection.py -> database/ -> tdd_orchestrator/ -> src/ -> project root
@@ -24,12 +39,23 @@ CONFIG_BOUNDS: dict[str, tuple[int, int]] = {
     "green_retry_delay_ms": (0, 10000),
     "max_green_retry_time_seconds": (60, 7200),  # 1 min to 2 hours
     "verify_timeout_seconds": (10, 600),  # 10s min, 10min max
+    "retention_days": (1, 3650),
 }
 
 # Default database path
 DEFAULT_DB_PATH = Path.cwd() / "orchestrator.db"
 
 
+class _TimedWriteLock(asyncio.Lock):
+    """The database write lock, recording how long each acquisition waited."""
+
+    async def acquire(self) -> Literal[True]:
+        started = time.perf_counter()
+        acquired = await super().acquire()
+        get_pipeline_metrics().write_lock_wait.observe(time.perf_counter() - started)
+        return acquired
+
+
 class ConnectionMixin:
     """Base mixin providing database connection management.
 
@@ -51,8 +77,17 @@ class ConnectionMixin:
         else:
             self.db_path = db_path
         self._conn: aiosqlite.Connection | None = None
+        self._read_pool: ReadConnectionPool | None = None
+        self._write_queue: WriteBehindQueue | None = None
         self._initialized = False
-        self._write_lock = asyncio.Lock()
+        self._write_lock: asyncio.Lock = _TimedWriteLock()
+        # Caches owned by RunsMixin (config values and per-run invocation counts)
+        self._config_cache: dict[str, str | None] = {}
+        self._invocation_counts: dict[int, int] = {}
+        # Owned by WorkerMixin (workers.worker_id -> workers.id)
+        self._worker_db_ids: dict[int, int] = {}
+        # Committed mutations, for in-process subscribers (see events.py)
+        self.events = EventBus()
 
     async def __aenter__(self) -> ConnectionMixin:
         """Async context manager entry."""
@@ -70,6 +105,10 @@ class ConnectionMixin:
 
     async def connect(self) -> None:
         """Open database connection and initialize schema."""
+        start = time.perf_counter()
+        self._config_cache.clear()
+        self._invocation_counts.clear()
+        self._worker_db_ids.clear()
         db_path = str(self.db_path) if isinstance(self.db_path, Path) else self.db_path
         # Resolve to absolute path if it's a file path
         if db_path != ":memory:":
@@ -78,21 +117,205 @@ class ConnectionMixin:
             logger.info("Database: %s (exists: %s)", resolved_path, db_exists)
         self._conn = await aiosqlite.connect(db_path)
         self._conn.row_factory = aiosqlite.Row
-        await self._initialize_schema()
+        await self._configure_connection()
+        schema_state = await self._initialize_schema()
+        if db_path != ":memory:":
+            self._read_pool = ReadConnectionPool(db_path)
+            await self._read_pool.open()
+        logger.info(
+            "Connected to %s in %.1fms (%s start, schema %s at v%d)",
+            db_path,
+            (time.perf_counter() - start) * 1000,
+            "warm" if schema_state == "current" else "cold",
+            schema_state,
+            SCHEMA_VERSION,
+        )
 
     async def close(self) -> None:
         """Close database connection."""
+        await self.disable_write_batching()
+        if self._read_pool:
+            await self._read_pool.close()
+            self._read_pool = None
         if self._conn:
             await self._conn.close()
             self._conn = None
 
+    async def _configure_connection(self) -> None:
+        """Apply the writer connection's journaling and locking profile.
+
+        WAL lets the read pool query committed data while a write is in
+        progress; synchronous=NORMAL is durable across application crashes
+        in WAL mode and only fsyncs at checkpoints.
+
+        auto_vacuum=INCREMENTAL only takes effect on a new database, and
+        must be set before WAL writes the header. Older databases are
+        converted by the first archive pass (see archive.py).
+        """
+        if not self._conn:
+            return
+        await self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        async with self._conn.execute("PRAGMA journal_mode = WAL") as cursor:
+            row = await cursor.fetchone()
+        # In-memory databases report "memory" and have no WAL
+        if row and str(row[0]).lower() not in ("wal", "memory"):
+            logger.warning("Could not enable WAL journaling (mode: %s)", row[0])
+        await self._conn.execute("PRAGMA synchronous = NORMAL")
+        await self._conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+
+    def _reader(self) -> aiosqlite.Connection | None:
+        """Return a connection for committed-data reads.
+
+        A pooled read-only connection when available, otherwise the writer.
+        Never use this inside a write transaction: pooled readers do not see
+        uncommitted changes.
+        """
+        if self._read_pool and self._read_pool.is_open:
+            return self._read_pool.connection()
+        return self._conn
+
+    @property
+    def local_changes(self) -> int:
+        """Rows changed through the writer connection since it was opened.
+
+        Read without touching the database, so callers can cheaply tell
+        whether this process has written anything since they last looked.
+        """
+        return self._conn.total_changes if self._conn else 0
+
+    async def data_version(self) -> int:
+        """Return a counter that changes when another connection commits.
+
+        Covers writes from other processes (and this process's writer, as
+        seen by the read pool). In-memory databases have no other
+        connections and always return 0.
+        """
+        if self._read_pool and self._read_pool.is_open:
+            return await self._read_pool.data_version()
+        return 0
+
     async def _ensure_connected(self) -> None:
         """Ensure database is connected."""
         if self._conn is None:
             await self.connect()
 
-    async def _initialize_schema(self) -> None:
-        """Initialize database schema from SQL file.
+    # =========================================================================
+    # Group Commit (write-behind batching)
+    # =========================================================================
+
+    async def enable_write_batching(
+        self,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Start coalescing high-frequency appends into group commits.
+
+        While enabled, heartbeats, invocations, stage attempts, static
+        review metrics and stash log rows are queued and committed together.
+        Idempotent.
+
+        Args:
+            flush_interval: Seconds between background flushes.
+            max_batch: Pending operations that trigger an early flush.
+        """
+        await self._ensure_connected()
+        if not self._conn or self._write_queue is not None:
+            return
+        self._write_queue = WriteBehindQueue(
+            self._conn, self._write_lock, flush_interval=flush_interval, max_batch=max_batch
+        )
+        self._write_queue.start()
+        logger.info(
+            "Write batching enabled (interval %.0fms, batch %d)",
+            flush_interval * 1000,
+            max_batch,
+        )
+
+    async def disable_write_batching(self) -> None:
+        """Flush pending appends and return to per-call commits."""
+        queue, self._write_queue = self._write_queue, None
+        if queue is None:
+            return
+        await queue.stop()
+        stats = queue.stats
+        logger.info(
+            "Write batching disabled: %d ops in %d batches "
+            "(avg %.1f/batch, max %d, avg flush %.1fms, failed %d)",
+            stats.operations,
+            stats.batches,
+            stats.avg_batch_size,
+            stats.max_batch_size,
+            stats.avg_flush_ms,
+            stats.failed_operations,
+        )
+
+    async def flush_writes(self) -> int:
+        """Commit any queued appends now.
+
+        Returns:
+            Number of operations committed.
+        """
+        if self._write_queue is None:
+            return 0
+        return await self._write_queue.flush()
+
+    def write_batch_stats(self) -> WriteBatchStats | None:
+        """Return group-commit counters, or None when batching is off."""
+        return self._write_queue.stats if self._write_queue else None
+
+    async def _append(
+        self,
+        *statements: Statement,
+        event: DBEvent | None = None,
+        on_commit: Callable[[], None] | None = None,
+    ) -> int:
+        """Write an append-only operation, batched when enabled.
+
+        Args:
+            *statements: (sql, params) pairs that commit together.
+            event: Published on the event bus once the write has committed.
+            on_commit: Called once the write has committed (not called if
+                it is dropped).
+
+        Returns:
+            lastrowid of the first statement when written immediately,
+            0 when queued for a group commit.
+        """
+        await self._ensure_connected()
+        if not self._conn:
+            return 0
+        if self._write_queue is not None:
+            self._write_queue.submit(
+                *statements, on_commit=partial(self._committed, event, on_commit)
+            )
+            return 0
+        async with self._write_lock:
+            row_id = 0
+            for i, (sql, params) in enumerate(statements):
+                cursor = await self._conn.execute(sql, params)
+                if i == 0:
+                    row_id = cursor.lastrowid or 0
+            await self._conn.commit()
+        self._committed(event, on_commit)
+        return row_id
+
+    def _committed(self, event: DBEvent | None, on_commit: Callable[[], None] | None) -> None:
+        """Run the post-commit side effects of an append."""
+        if on_commit is not None:
+            on_commit()
+        if event is not None:
+            self.events.publish(event)
+
+    async def _initialize_schema(self) -> str:
+        """Bring the database schema up to SCHEMA_VERSION.
+
+        A database already at SCHEMA_VERSION is left untouched. A new one is
+        created from schema.sql; an older one re-runs schema.sql and then
+        the pending migrations (see migrations.py).
+
+        Returns:
+            How the schema was brought up to date: "current", "created" or
+            "migrated".
 
         Raises:
             RuntimeError: If schema initialization fails due to migration issues.
@@ -103,16 +326,29 @@ class ConnectionMixin:
             raise RuntimeError(msg)
 
         if self._initialized:
-            return
+            return "current"
+
+        version = await get_user_version(self._conn)
+        if version >= SCHEMA_VERSION:
+            if version > SCHEMA_VERSION:
+                logger.warning(
+                    "Database schema v%d is newer than this version of the code (v%d)",
+                    version,
+                    SCHEMA_VERSION,
+                )
+            self._initialized = True
+            return "current"
 
         # Check if tasks table exists and has expected columns
         # If schema mismatch, provide clear error before executescript hangs
+        is_new = True
         try:
             async with self._conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='tasks'"
             ) as cursor:
                 row = await cursor.fetchone()
                 if row:
+                    is_new = False
                     # Table exists - verify it has expected columns
                     async with self._conn.execute("PRAGMA table_info(tasks)") as pragma_cursor:
                         columns = {col[1] for col in await pragma_cursor.fetchall()}
@@ -138,8 +374,9 @@ class ConnectionMixin:
         async with self._write_lock:
             try:
                 await self._conn.executescript(schema_sql)
+                if is_new:
+                    await set_user_version(self._conn, SCHEMA_VERSION)
                 await self._conn.commit()
-                self._initialized = True
                 logger.info("Database schema initialized")
             except Exception as e:
                 msg = (
@@ -149,111 +386,11 @@ class ConnectionMixin:
                 )
                 raise RuntimeError(msg) from e
 
-        # PLAN9: Check for module_exports column migration
-        await self._migrate_module_exports()
-
-        # Overlap detection: Check for task_type column migration
-        await self._migrate_task_type()
-
-        # End-of-run validation columns on execution_runs
-        await self._migrate_run_validation()
-
-        # Checkpoint & resume columns on execution_runs
-        await self._migrate_pipeline_type()
-
-    async def _migrate_module_exports(self) -> None:
-        """Migrate database to add PLAN9 module_exports column if missing.
-
-        This method handles schema migration for existing databases that
-        don't have the module_exports column. It's idempotent and safe
-        to run multiple times.
-        """
-        if not self._conn:
-            return
-
-        try:
-            # Check if column exists by attempting a query
-            await self._conn.execute("SELECT module_exports FROM tasks LIMIT 1")
-            logger.debug("PLAN9: module_exports column already exists")
-        except Exception:
-            # Column doesn't exist, add it
-            logger.info("PLAN9: Adding module_exports column to tasks table")
-            async with self._write_lock:
-                await self._conn.execute(
-                    "ALTER TABLE tasks ADD COLUMN module_exports TEXT DEFAULT '[]'"
-                )
-                await self._conn.commit()
-                logger.info("PLAN9: module_exports column added successfully")
-
-    async def _migrate_task_type(self) -> None:
-        """Migrate database to add task_type column if missing.
-
-        This method handles schema migration for existing databases that
-        don't have the task_type column. It's idempotent and safe
-        to run multiple times.
-        """
-        if not self._conn:
-            return
-
-        try:
-            await self._conn.execute("SELECT task_type FROM tasks LIMIT 1")
-            logger.debug("task_type column already exists")
-        except Exception:
-            logger.info("Adding task_type column to tasks table")
-            async with self._write_lock:
-                await self._conn.execute(
-                    "ALTER TABLE tasks ADD COLUMN task_type TEXT DEFAULT 'implement'"
-                )
-                await self._conn.commit()
-                logger.info("task_type column added successfully")
-
-    async def _migrate_run_validation(self) -> None:
-        """Migrate execution_runs to add validation columns if missing.
-
-        Adds validation_status and validation_details for end-of-run
-        validation results. Idempotent and safe to run multiple times.
-        """
-        if not self._conn:
-            return
-
-        try:
-            await self._conn.execute("SELECT validation_status FROM execution_runs LIMIT 1")
-            logger.debug("validation_status column already exists")
-        except Exception:
-            logger.info("Adding validation columns to execution_runs table")
-            async with self._write_lock:
-                await self._conn.execute(
-                    "ALTER TABLE execution_runs ADD COLUMN validation_status TEXT"
-                )
-                await self._conn.execute(
-                    "ALTER TABLE execution_runs ADD COLUMN validation_details TEXT"
-                )
-                await self._conn.commit()
-                logger.info("validation columns added successfully")
-
-    async def _migrate_pipeline_type(self) -> None:
-        """Migrate execution_runs to add checkpoint & resume columns.
-
-        Adds pipeline_type and pipeline_state for run-level checkpoint
-        tracking. Idempotent and safe to run multiple times.
-        """
-        if not self._conn:
-            return
+            if not is_new:
+                await apply_migrations(self._conn, version)
 
-        try:
-            await self._conn.execute("SELECT pipeline_type FROM execution_runs LIMIT 1")
-            logger.debug("pipeline_type column already exists")
-        except Exception:
-            logger.info("Adding checkpoint columns to execution_runs table")
-            async with self._write_lock:
-                await self._conn.execute(
-                    "ALTER TABLE execution_runs ADD COLUMN pipeline_type TEXT DEFAULT 'run'"
-                )
-                await self._conn.execute(
-                    "ALTER TABLE execution_runs ADD COLUMN pipeline_state TEXT"
-                )
-                await self._conn.commit()
-                logger.info("checkpoint columns added successfully")
+        self._initialized = True
+        return "created" if is_new else "migrated"
 
     # =========================================================================
     # Generic Query/Update Helpers (for testing)
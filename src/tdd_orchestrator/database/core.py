@@ -9,6 +9,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+from .archive import ArchiveMixin
 from .checkpoint import CheckpointMixin
 from .connection import ConnectionMixin
 from .runs import RunsMixin
@@ -16,7 +17,9 @@ from .tasks import TaskMixin
 from .workers import WorkerMixin
 
 
-class OrchestratorDB(ConnectionMixin, TaskMixin, WorkerMixin, RunsMixin, CheckpointMixin):
+class OrchestratorDB(
+    ConnectionMixin, TaskMixin, WorkerMixin, RunsMixin, CheckpointMixin, ArchiveMixin
+):
     """Async SQLite database for TDD task orchestration.
 
     This class manages all database operations for the orchestrator,
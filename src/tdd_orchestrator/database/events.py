@@ -0,0 +1,224 @@
+"""In-process event bus for committed database mutations.
+
+OrchestratorDB publishes a typed event on its ``events`` bus after each
+state mutation commits: task status changes, claims and releases,
+recorded invocations and circuit breaker transitions. Consumers in the
+same process (the API's SSE bridge, the worker pool) subscribe instead
+of polling, so they see a change as soon as it is durable.
+
+Each subscriber gets its own bounded queue. publish() never blocks the
+writer: when a subscriber falls behind, its oldest undelivered event is
+dropped (and counted) to make room, so a slow consumer loses history but
+always sees the latest state.
+
+Events only cover mutations made through this process's OrchestratorDB.
+Deployments where the worker pool and API run in different processes
+still rely on DBObserver polling the task_events change log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Events buffered per subscriber before the oldest are dropped
+DEFAULT_QUEUE_SIZE = 1024
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass(frozen=True)
+class TaskStatusChanged:
+    """A task moved from one status to another."""
+
+    task_key: str
+    old_status: str | None
+    new_status: str
+    timestamp: str = field(default_factory=_now)
+
+
+@dataclass(frozen=True)
+class TaskClaimed:
+    """A worker claimed a task (its status is now in_progress)."""
+
+    task_id: int
+    task_key: str
+    worker_id: int
+    timestamp: str = field(default_factory=_now)
+
+
+@dataclass(frozen=True)
+class TaskReleased:
+    """A worker released its claim on a task."""
+
+    task_id: int
+    worker_id: int
+    outcome: str
+    timestamp: str = field(default_factory=_now)
+
+
+@dataclass(frozen=True)
+class InvocationRecorded:
+    """An API invocation was recorded against a run."""
+
+    run_id: int
+    stage: str
+    worker_id: int | None = None
+    task_id: int | None = None
+    token_count: int | None = None
+    duration_ms: int | None = None
+    timestamp: str = field(default_factory=_now)
+
+
+@dataclass(frozen=True)
+class CircuitStateChanged:
+    """A circuit breaker changed state."""
+
+    level: str
+    identifier: str
+    from_state: str | None
+    to_state: str
+    reason: str
+    failure_count: int = 0
+    timestamp: str = field(default_factory=_now)
+
+
+DBEvent = TaskStatusChanged | TaskClaimed | TaskReleased | InvocationRecorded | CircuitStateChanged
+
+
+class EventSubscription:
+    """One consumer's bounded view of an EventBus.
+
+    Iterate with ``async for`` (ends after close()) or call get().
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        maxsize: int,
+        kinds: tuple[type[DBEvent], ...],
+    ) -> None:
+        """Initialize the subscription (use EventBus.subscribe()).
+
+        Args:
+            bus: The bus this subscription belongs to.
+            maxsize: Events buffered before the oldest are dropped.
+            kinds: Event types to receive (all when empty).
+        """
+        self._bus = bus
+        self._kinds = kinds
+        self._queue: asyncio.Queue[DBEvent | None] = asyncio.Queue(maxsize=max(1, maxsize))
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Events waiting to be consumed."""
+        return self._queue.qsize()
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the subscription has been closed."""
+        return self._closed
+
+    def offer(self, event: DBEvent) -> None:
+        """Enqueue an event without blocking, dropping the oldest if full."""
+        if self._closed or (self._kinds and not isinstance(event, self._kinds)):
+            return
+        self._put(event)
+
+    def _put(self, item: DBEvent | None) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.warning("Event subscriber fell behind, dropping oldest events")
+            self._queue.put_nowait(item)
+
+    async def get(self) -> DBEvent | None:
+        """Wait for the next event (None once the subscription is closed)."""
+        if self._closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def close(self) -> None:
+        """Stop receiving events; pending ones can still be drained."""
+        if self._closed:
+            return
+        self._closed = True
+        self._bus.unsubscribe(self)
+        self._put(None)
+
+    def __aiter__(self) -> EventSubscription:
+        """Return self as async iterator."""
+        return self
+
+    async def __anext__(self) -> DBEvent:
+        """Return the next event, stopping once the subscription is closed."""
+        event = await self.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+class EventBus:
+    """Fan-out of committed mutation events to bounded subscriber queues."""
+
+    def __init__(self) -> None:
+        """Initialize an empty bus."""
+        self._subscriptions: list[EventSubscription] = []
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of open subscriptions."""
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        *kinds: type[DBEvent],
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+    ) -> EventSubscription:
+        """Open a subscription.
+
+        Args:
+            *kinds: Event types to receive (all when omitted).
+            maxsize: Events buffered before the oldest are dropped.
+
+        Returns:
+            The new subscription.
+        """
+        subscription = EventSubscription(self, maxsize, kinds)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscription (no-op if already removed)."""
+        try:
+            self._subscriptions.remove(subscription)
+        except ValueError:
+            pass
+
+    def publish(self, event: DBEvent) -> None:
+        """Deliver an event to every subscriber without blocking."""
+        for subscription in self._subscriptions:
+            subscription.offer(event)
+
+
+def publish_event(db: Any, event: DBEvent) -> None:
+    """Publish on a database's bus, if it has one.
+
+    For callers holding a loosely typed database handle (circuit breakers
+    are often given test doubles).
+    """
+    bus = getattr(db, "events", None)
+    if isinstance(bus, EventBus):
+        bus.publish(event)
@@ -0,0 +1,283 @@
+"""Versioned schema migrations keyed on ``PRAGMA user_version``.
+
+schema.sql always describes the latest schema, and a fresh database is
+created from it and stamped with SCHEMA_VERSION. An existing database
+records the last migration it has applied in ``user_version``:
+
+- equal to SCHEMA_VERSION: nothing to do (the fast path on every connect)
+- lower: schema.sql is re-run to create any new tables, indexes, triggers
+  and views, then each pending migration runs in order and the version is
+  bumped after it commits
+
+Databases created before versioning report version 0, even though some
+of the early migrations may already have been applied by the probe-based
+checks that preceded this runner. Every migration therefore checks the
+current state (via PRAGMA table_info / sqlite_master) before changing it.
+
+To change the schema: update schema.sql, then append a Migration with
+the next version number that brings an existing database to the same
+state. Additive CREATE ... IF NOT EXISTS changes only need a migration
+entry (it may do nothing) so that existing databases re-run schema.sql.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import aiosqlite
+
+from .blobs import OUTPUT_BLOB_COLUMNS, store_blob
+
+logger = logging.getLogger(__name__)
+
+# Repopulate task_dependencies from tasks.depends_on (see schema.sql)
+REBUILD_TASK_DEPENDENCIES_SQL = """
+DELETE FROM task_dependencies;
+INSERT OR IGNORE INTO task_dependencies (task_id, depends_on_key, depends_on_id, position)
+SELECT t.id, dep.value, (SELECT b.id FROM tasks b WHERE b.task_key = dep.value), dep.key
+FROM tasks t, json_each(CASE WHEN json_valid(t.depends_on) THEN t.depends_on END) AS dep
+WHERE dep.type = 'text' AND typeof(dep.key) = 'integer';
+"""
+
+# Repopulate the materialized ready queue from task_dependencies
+REBUILD_READY_QUEUE_SQL = """
+DELETE FROM task_ready_queue;
+INSERT INTO task_ready_queue (task_id, phase, sequence, unresolved_deps)
+SELECT t.id, t.phase, t.sequence, (
+    SELECT COUNT(*)
+    FROM task_dependencies e
+    JOIN tasks b ON b.id = e.depends_on_id
+    WHERE e.task_id = t.id AND b.status NOT IN ('complete', 'passing')
+)
+FROM tasks t
+WHERE t.status = 'pending';
+"""
+
+# Recompute the analytics rollups from their source tables (see schema.sql)
+REBUILD_ANALYTICS_ROLLUPS_SQL = """
+DELETE FROM attempt_stage_rollup;
+INSERT INTO attempt_stage_rollup
+    (stage, attempts, successes, duration_ms, timed, success_duration_ms, success_timed)
+SELECT stage, COUNT(*), SUM(success IS 1),
+       COALESCE(SUM(duration_ms), 0), COUNT(duration_ms),
+       COALESCE(SUM(CASE WHEN success IS 1 THEN duration_ms END), 0),
+       COUNT(CASE WHEN success IS 1 THEN duration_ms END)
+FROM attempts GROUP BY stage;
+DELETE FROM invocation_stage_rollup;
+INSERT INTO invocation_stage_rollup (stage, invocations, tokens, duration_ms, timed)
+SELECT stage, COUNT(*), COALESCE(SUM(token_count), 0),
+       COALESCE(SUM(duration_ms), 0), COUNT(duration_ms)
+FROM invocations GROUP BY stage;
+DELETE FROM task_completion_rollup;
+INSERT INTO task_completion_rollup (day, completed)
+SELECT DATE(updated_at), COUNT(*)
+FROM tasks
+WHERE status IN ('complete', 'passing') AND DATE(updated_at) IS NOT NULL
+GROUP BY DATE(updated_at);
+"""
+
+# Ready queue triggers that scanned depends_on JSON, replaced by trg_task_deps_*
+_LEGACY_READY_QUEUE_TRIGGERS = (
+    "trg_ready_queue_insert",
+    "trg_ready_queue_status",
+    "trg_ready_queue_depends_on",
+    "trg_ready_queue_rename",
+    "trg_ready_queue_delete",
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema step.
+
+    Attributes:
+        version: user_version after this migration has been applied.
+        description: Short summary used in logs.
+        apply: Coroutine that performs the (idempotent) change.
+    """
+
+    version: int
+    description: str
+    apply: Callable[[aiosqlite.Connection], Awaitable[None]]
+
+
+async def _columns(conn: aiosqlite.Connection, table: str) -> set[str]:
+    async with conn.execute(f"PRAGMA table_info({table})") as cursor:
+        return {row[1] for row in await cursor.fetchall()}
+
+
+async def _add_columns(conn: aiosqlite.Connection, table: str, columns: dict[str, str]) -> None:
+    existing = await _columns(conn, table)
+    for name, definition in columns.items():
+        if name not in existing:
+            logger.info("Adding %s.%s column", table, name)
+            await conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+
+async def _add_module_exports(conn: aiosqlite.Connection) -> None:
+    await _add_columns(conn, "tasks", {"module_exports": "TEXT DEFAULT '[]'"})
+
+
+async def _add_task_type(conn: aiosqlite.Connection) -> None:
+    await _add_columns(conn, "tasks", {"task_type": "TEXT DEFAULT 'implement'"})
+
+
+async def _add_run_validation(conn: aiosqlite.Connection) -> None:
+    await _add_columns(
+        conn,
+        "execution_runs",
+        {"validation_status": "TEXT", "validation_details": "TEXT"},
+    )
+
+
+async def _add_pipeline_type(conn: aiosqlite.Connection) -> None:
+    await _add_columns(
+        conn,
+        "execution_runs",
+        {"pipeline_type": "TEXT DEFAULT 'run'", "pipeline_state": "TEXT"},
+    )
+
+
+async def _build_task_dependencies(conn: aiosqlite.Connection) -> None:
+    """Move readiness onto task_dependencies and the materialized ready queue.
+
+    Older databases keep the JSON-scanning readiness views (CREATE VIEW IF
+    NOT EXISTS does not replace them) or the first generation of ready
+    queue triggers. Drops those, recreates the views, and backfills both
+    tables from tasks.depends_on.
+    """
+    for name in _LEGACY_READY_QUEUE_TRIGGERS:
+        await conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    await conn.execute("DROP INDEX IF EXISTS idx_ready_queue_missing")
+    await conn.execute("DROP VIEW IF EXISTS v_ready_tasks")
+    await conn.execute("DROP VIEW IF EXISTS v_claimable_tasks")
+    # Same definitions as schema.sql
+    await conn.executescript(
+        """
+        CREATE VIEW v_ready_tasks AS
+        SELECT t.*
+        FROM task_ready_queue q
+        JOIN tasks t ON t.id = q.task_id
+        WHERE q.unresolved_deps = 0
+        ORDER BY q.phase, q.sequence;
+
+        CREATE VIEW v_claimable_tasks AS
+        SELECT t.*
+        FROM task_ready_queue q
+        JOIN tasks t ON t.id = q.task_id
+        WHERE q.unresolved_deps = 0
+          AND (t.claimed_by IS NULL OR t.claim_expires_at < CURRENT_TIMESTAMP)
+        ORDER BY q.phase, q.sequence;
+        """
+    )
+    await conn.executescript(REBUILD_TASK_DEPENDENCIES_SQL)
+    await conn.executescript(REBUILD_READY_QUEUE_SQL)
+
+
+async def _schema_only(conn: aiosqlite.Connection) -> None:
+    """Additive change already applied by re-running schema.sql."""
+
+
+async def _move_outputs_to_blobs(conn: aiosqlite.Connection) -> None:
+    """Move inline attempts.*_output text into output_blobs."""
+    await _add_columns(
+        conn, "attempts", {column: "INTEGER" for column in OUTPUT_BLOB_COLUMNS.values()}
+    )
+    existing = await _columns(conn, "attempts")
+    inline = {
+        tool: f"{tool}_output" for tool in OUTPUT_BLOB_COLUMNS if f"{tool}_output" in existing
+    }
+    if not inline:
+        return
+
+    selected = ", ".join(inline.values())
+    has_output = " OR ".join(f"{column} IS NOT NULL" for column in inline.values())
+    async with conn.execute(f"SELECT id, {selected} FROM attempts WHERE {has_output}") as cursor:
+        rows = list(await cursor.fetchall())
+    for row in rows:
+        refs = [await store_blob(conn, row[i + 1]) for i in range(len(inline))]
+        assignments = ", ".join(f"{OUTPUT_BLOB_COLUMNS[tool]} = ?" for tool in inline)
+        await conn.execute(f"UPDATE attempts SET {assignments} WHERE id = ?", (*refs, row[0]))
+    logger.info("Moved tool output of %d attempt(s) to output_blobs", len(rows))
+
+    for column in inline.values():
+        await conn.execute(f"ALTER TABLE attempts DROP COLUMN {column}")
+
+
+async def _replace_phase_seq_index(conn: aiosqlite.Connection) -> None:
+    """Drop idx_tasks_phase_seq, a prefix of the new idx_tasks_page."""
+    await conn.execute("DROP INDEX IF EXISTS idx_tasks_phase_seq")
+
+
+async def _backfill_analytics_rollups(conn: aiosqlite.Connection) -> None:
+    """Populate the analytics rollups from the existing history."""
+    await conn.executescript(REBUILD_ANALYTICS_ROLLUPS_SQL)
+
+
+# Ordered by version; never renumber or remove an entry
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "tasks.module_exports column", _add_module_exports),
+    Migration(2, "tasks.task_type column", _add_task_type),
+    Migration(3, "execution_runs validation columns", _add_run_validation),
+    Migration(4, "execution_runs checkpoint columns", _add_pipeline_type),
+    Migration(5, "task_dependencies edges and ready queue", _build_task_dependencies),
+    Migration(6, "run_summaries table, retention config and run_id indexes", _schema_only),
+    Migration(7, "attempt tool output moved to output_blobs", _move_outputs_to_blobs),
+    Migration(8, "task_events change log", _schema_only),
+    Migration(9, "task list pagination indexes", _replace_phase_seq_index),
+    Migration(10, "analytics rollup tables", _backfill_analytics_rollups),
+)
+
+# Version of the schema described by schema.sql
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+async def get_user_version(conn: aiosqlite.Connection) -> int:
+    """Return the database's PRAGMA user_version."""
+    async with conn.execute("PRAGMA user_version") as cursor:
+        row = await cursor.fetchone()
+    return int(row[0]) if row else 0
+
+
+async def set_user_version(conn: aiosqlite.Connection, version: int) -> None:
+    """Set the database's PRAGMA user_version (not parameterizable)."""
+    await conn.execute(f"PRAGMA user_version = {int(version)}")
+
+
+async def apply_migrations(conn: aiosqlite.Connection, from_version: int) -> list[Migration]:
+    """Apply every migration newer than ``from_version``, in order.
+
+    The version is bumped as soon as each migration commits, so an
+    interrupted upgrade resumes from the last completed step (migrations
+    are idempotent, so repeating a half-applied one is safe).
+
+    Args:
+        conn: Writer connection (the caller holds the write lock).
+        from_version: The database's current user_version.
+
+    Returns:
+        The migrations that were applied.
+    """
+    applied: list[Migration] = []
+    for migration in MIGRATIONS:
+        if migration.version <= from_version:
+            continue
+        start = time.perf_counter()
+        try:
+            await migration.apply(conn)
+            await set_user_version(conn, migration.version)
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
+        applied.append(migration)
+        logger.info(
+            "Applied schema migration %d (%s) in %.1fms",
+            migration.version,
+            migration.description,
+            (time.perf_counter() - start) * 1000,
+        )
+    return applied
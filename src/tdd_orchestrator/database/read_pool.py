@@ -0,0 +1,126 @@
+"""Read-only SQLite connection pool for WAL-mode databases.
+
+Each aiosqlite connection runs its statements on a dedicated thread, one
+at a time. With a single shared connection, an API read or an observer
+poll queues behind whatever worker write is in flight. In WAL mode,
+readers on separate connections see the last committed snapshot without
+waiting for the writer, so the pool hands out read-only connections
+round-robin for queries that do not need to see uncommitted writes.
+
+In-memory databases cannot be shared across connections. For those,
+read_connection() falls back to the writer connection.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+# Number of read-only connections opened per database
+READ_POOL_SIZE = 4
+
+# Milliseconds a connection waits on a lock before raising SQLITE_BUSY
+BUSY_TIMEOUT_MS = 5000
+
+
+class ReadConnectionPool:
+    """A fixed-size pool of read-only aiosqlite connections.
+
+    Connections are shared rather than checked out: aiosqlite already
+    serializes statements per connection, so callers simply take the next
+    connection in rotation.
+    """
+
+    def __init__(self, db_path: str | Path, size: int = READ_POOL_SIZE) -> None:
+        """Initialize the pool (connections are opened by open()).
+
+        Args:
+            db_path: Path to an existing SQLite database file.
+            size: Number of read-only connections to open.
+        """
+        self.db_path = Path(db_path)
+        self.size = max(1, size)
+        self._conns: list[aiosqlite.Connection] = []
+        self._cycle: Iterator[aiosqlite.Connection] | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the pool has open connections."""
+        return bool(self._conns)
+
+    async def open(self) -> None:
+        """Open the read-only connections."""
+        if self._conns:
+            return
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        for _ in range(self.size):
+            conn = await aiosqlite.connect(uri, uri=True)
+            conn.row_factory = aiosqlite.Row
+            await conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+            await conn.execute("PRAGMA query_only = ON")
+            self._conns.append(conn)
+        self._cycle = itertools.cycle(self._conns)
+        logger.debug("Opened %d read connections for %s", self.size, self.db_path)
+
+    def connection(self) -> aiosqlite.Connection:
+        """Return the next read-only connection in rotation.
+
+        Raises:
+            RuntimeError: If the pool is not open.
+        """
+        if self._cycle is None:
+            msg = "Read connection pool is not open"
+            raise RuntimeError(msg)
+        return next(self._cycle)
+
+    async def data_version(self) -> int:
+        """Return ``PRAGMA data_version`` as seen by the first connection.
+
+        The value changes whenever another connection, in this process or
+        another, commits to the database. It is per connection, so it is
+        always read from the same one.
+
+        Raises:
+            RuntimeError: If the pool is not open.
+        """
+        if not self._conns:
+            msg = "Read connection pool is not open"
+            raise RuntimeError(msg)
+        async with self._conns[0].execute("PRAGMA data_version") as cursor:
+            row = await cursor.fetchone()
+        return int(row[0]) if row else 0
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        conns, self._conns, self._cycle = self._conns, [], None
+        for conn in conns:
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning("Error closing read connection: %s", e)
+
+
+def read_connection(db: Any) -> Any:
+    """Return a connection for read-only queries against ``db``.
+
+    Uses the database's read pool when one is open, and falls back to the
+    writer connection otherwise (in-memory databases, or test doubles
+    that only provide ``_conn``).
+
+    Args:
+        db: An OrchestratorDB (typed loosely to avoid circular imports).
+
+    Returns:
+        An aiosqlite connection, or None if ``db`` is not connected.
+    """
+    pool = getattr(db, "_read_pool", None)
+    if isinstance(pool, ReadConnectionPool) and pool.is_open:
+        return pool.connection()
+    return getattr(db, "_conn", None)
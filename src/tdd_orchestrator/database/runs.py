@@ -1,18 +1,33 @@
 """Execution runs, invocations, configuration, and metrics operations.
 
 Provides the RunsMixin with execution tracking, config management,
-git stash logging, and static review metrics.
+git stash logging, static review metrics, and the analytics rollups.
+
+Config values and per-run invocation counts are read before every stage,
+so both are cached in process. The config cache is write-through from
+set_config(); invocation counts are incremented alongside each
+record_invocation() and reconciled with execution_runs.total_invocations
+when a run is loaded or completed. Both caches are per OrchestratorDB
+instance: config changed by another process is picked up on reconnect.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 import aiosqlite
 
 from .connection import CONFIG_BOUNDS
+from .events import DBEvent, EventBus, InvocationRecorded
+from .migrations import REBUILD_ANALYTICS_ROLLUPS_SQL
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .write_queue import Statement
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +37,23 @@ class RunsMixin:
 
     _conn: aiosqlite.Connection | None
     _write_lock: asyncio.Lock
+    events: EventBus
+    _config_cache: dict[str, str | None]
+    _invocation_counts: dict[int, int]
 
     async def _ensure_connected(self) -> None: ...
 
+    if TYPE_CHECKING:
+        # Provided by ConnectionMixin
+        async def _append(
+            self,
+            *statements: Statement,
+            event: DBEvent | None = None,
+            on_commit: Callable[[], None] | None = None,
+        ) -> int: ...
+
+        async def flush_writes(self) -> int: ...
+
     # =========================================================================
     # Configuration
     # =========================================================================
@@ -39,15 +68,20 @@ class RunsMixin:
         Returns:
             Configuration value or default.
         """
+        if key in self._config_cache:
+            cached = self._config_cache[key]
+            return default if cached is None else cached
+
         await self._ensure_connected()
         if not self._conn:
             return default
 
         async with self._conn.execute("SELECT value FROM config WHERE key = ?", (key,)) as cursor:
             row = await cursor.fetchone()
-            if row:
-                return str(row["value"])
-        return default
+        # Absent keys are cached too, so repeated default lookups stay free
+        value = str(row["value"]) if row else None
+        self._config_cache[key] = value
+        return default if value is None else value
 
     async def get_config_int(self, key: str, default: int) -> int:
         """Get config value as int with bounds validation.
@@ -108,6 +142,7 @@ class RunsMixin:
                 (key, value),
             )
             await self._conn.commit()
+            self._config_cache[key] = value
 
     # =========================================================================
     # Execution Runs & Invocation Tracking
@@ -138,7 +173,9 @@ class RunsMixin:
                 (max_workers, pipeline_type),
             )
             await self._conn.commit()
-            return cursor.lastrowid or 0
+            run_id = cursor.lastrowid or 0
+            self._invocation_counts[run_id] = 0
+            return run_id
 
     async def complete_execution_run(self, run_id: int, status: str = "completed") -> None:
         """Mark execution run as complete.
@@ -161,6 +198,8 @@ class RunsMixin:
                 (status, run_id),
             )
             await self._conn.commit()
+        if run_id in self._invocation_counts:
+            await self._reconcile_invocation_count(run_id)
 
     async def update_run_validation(
         self, run_id: int, validation_status: str, validation_details: str
@@ -223,43 +262,64 @@ class RunsMixin:
             duration_ms: Duration in milliseconds.
 
         Returns:
-            Invocation ID.
+            Invocation ID, or 0 if the write was queued for a group commit.
         """
-        await self._ensure_connected()
-        if not self._conn:
-            return 0
-
-        async with self._write_lock:
-            cursor = await self._conn.execute(
+        return await self._append(
+            (
                 """
                 INSERT INTO invocations (run_id, worker_id, task_id, stage, token_count, duration_ms)
                 VALUES (?, ?, ?, ?, ?, ?)
                 """,
                 (run_id, worker_id, task_id, stage, token_count, duration_ms),
-            )
-
+            ),
             # Update run total
-            await self._conn.execute(
+            (
                 """
                 UPDATE execution_runs
                 SET total_invocations = total_invocations + 1
                 WHERE id = ?
                 """,
                 (run_id,),
-            )
+            ),
+            event=InvocationRecorded(run_id, stage, worker_id, task_id, token_count, duration_ms),
+            on_commit=partial(self._count_invocation, run_id),
+        )
 
-            await self._conn.commit()
-            return cursor.lastrowid or 0
+    def _count_invocation(self, run_id: int) -> None:
+        """Bump the in-process counter once an invocation has committed."""
+        if run_id in self._invocation_counts:
+            self._invocation_counts[run_id] += 1
 
     async def get_invocation_count(self, run_id: int) -> int:
         """Get total invocations for a run.
 
+        Served from the in-process counter once the run is known; the
+        first call for a run loads it from execution_runs.
+
         Args:
             run_id: Execution run ID.
 
         Returns:
             Number of invocations.
         """
+        # The counter only moves on commit, so commit queued invocations first
+        await self.flush_writes()
+        count = self._invocation_counts.get(run_id)
+        if count is not None:
+            return count
+        return await self._reconcile_invocation_count(run_id)
+
+    async def _reconcile_invocation_count(self, run_id: int) -> int:
+        """Reload a run's invocation count from execution_runs.
+
+        Args:
+            run_id: Execution run ID.
+
+        Returns:
+            The persisted number of invocations.
+        """
+        # Queued invocations must be committed before counting
+        await self.flush_writes()
         await self._ensure_connected()
         if not self._conn:
             return 0
@@ -269,11 +329,28 @@ class RunsMixin:
             (run_id,),
         ) as cursor:
             row = await cursor.fetchone()
-            return row[0] if row else 0
+        if row is None:
+            self._invocation_counts.pop(run_id, None)
+            return 0
+
+        persisted = int(row[0] or 0)
+        cached = self._invocation_counts.get(run_id)
+        if cached is not None and cached != persisted:
+            logger.warning(
+                "Run %d invocation counter drifted (cached %d, stored %d); using stored",
+                run_id,
+                cached,
+                persisted,
+            )
+        self._invocation_counts[run_id] = persisted
+        return persisted
 
     async def check_invocation_budget(self, run_id: int) -> tuple[int, int, bool]:
         """Check invocation budget status.
 
+        Uses the in-process invocation counter and cached config, so after
+        the first call for a run this does not touch the database.
+
         Args:
             run_id: Execution run ID.
 
@@ -312,22 +389,18 @@ class RunsMixin:
             error_message: Error details if failed.
 
         Returns:
-            The ID of the inserted log record.
+            The ID of the inserted log record, or 0 if the write was queued
+            for a group commit.
         """
-        await self._ensure_connected()
-        if not self._conn:
-            return 0
-
-        async with self._write_lock:
-            cursor = await self._conn.execute(
+        return await self._append(
+            (
                 """
                 INSERT INTO git_stash_log (task_id, stash_id, operation, success, error_message)
                 VALUES (?, ?, ?, ?, ?)
                 """,
                 (task_id, stash_id, operation, 1 if success else 0, error_message),
             )
-            await self._conn.commit()
-            return cursor.lastrowid or 0
+        )
 
     # =========================================================================
     # Static Review Metrics (PLAN12 Phase 1B Shadow Mode)
@@ -359,14 +432,11 @@ class RunsMixin:
             run_id: Current execution run ID (optional).
 
         Returns:
-            The ID of the inserted record, or 0 on failure.
+            The ID of the inserted record, or 0 on failure or if the write
+            was queued for a group commit.
         """
-        await self._ensure_connected()
-        if not self._conn:
-            return 0
-
-        async with self._write_lock:
-            cursor = await self._conn.execute(
+        return await self._append(
+            (
                 """
                 INSERT INTO static_review_metrics (
                     task_id, task_key, run_id, check_name, severity,
@@ -385,8 +455,7 @@ class RunsMixin:
                     fix_guidance,
                 ),
             )
-            await self._conn.commit()
-            return cursor.lastrowid or 0
+        )
 
     async def get_shadow_mode_stats(self) -> list[dict[str, Any]]:
         """Get shadow mode metrics summary for promotion decisions.
@@ -396,6 +465,7 @@ class RunsMixin:
             false_positive_count, true_positive_count, fp_rate_percent,
             first_detected, last_detected.
         """
+        await self.flush_writes()
         await self._ensure_connected()
         if not self._conn:
             return []
@@ -403,3 +473,36 @@ class RunsMixin:
         async with self._conn.execute("SELECT * FROM v_shadow_mode_summary") as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
+
+    # =========================================================================
+    # Analytics Rollups
+    # =========================================================================
+
+    async def rebuild_analytics_rollups(self) -> dict[str, int]:
+        """Recompute the analytics rollup tables from their source tables.
+
+        The rollups are kept current by triggers; this is the backfill for
+        data written before they existed or by tools that bypassed them.
+
+        Returns:
+            Row count of each rollup table after the rebuild.
+        """
+        await self.flush_writes()
+        await self._ensure_connected()
+        if not self._conn:
+            return {}
+
+        tables = ("attempt_stage_rollup", "invocation_stage_rollup", "task_completion_rollup")
+        async with self._write_lock:
+            try:
+                # One transaction, so readers never see a half-built rollup
+                await self._conn.executescript(f"BEGIN; {REBUILD_ANALYTICS_ROLLUPS_SQL} COMMIT;")
+            except Exception:
+                await self._conn.rollback()
+                raise
+            counts: dict[str, int] = {}
+            for table in tables:
+                async with self._conn.execute(f"SELECT COUNT(*) FROM {table}") as cursor:
+                    row = await cursor.fetchone()
+                counts[table] = int(row[0]) if row else 0
+        return counts
@@ -8,10 +8,18 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiosqlite
 
+from .blobs import OUTPUT_BLOB_COLUMNS, load_blob, store_blob
+from .events import DBEvent, EventBus, TaskStatusChanged
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .write_queue import Statement
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,9 +28,23 @@ class TaskMixin:
 
     _conn: aiosqlite.Connection | None
     _write_lock: asyncio.Lock
+    events: EventBus
 
     async def _ensure_connected(self) -> None: ...
 
+    if TYPE_CHECKING:
+        # Provided by ConnectionMixin
+        async def _append(
+            self,
+            *statements: Statement,
+            event: DBEvent | None = None,
+            on_commit: Callable[[], None] | None = None,
+        ) -> int: ...
+
+        async def flush_writes(self) -> int: ...
+
+        def _reader(self) -> aiosqlite.Connection | None: ...
+
     # =========================================================================
     # Task Queries
     # =========================================================================
@@ -204,15 +226,22 @@ class TaskMixin:
             return False
 
         async with self._write_lock:
-            cursor = await self._conn.execute(
+            async with self._conn.execute(
+                "SELECT status FROM tasks WHERE task_key = ?", (task_key,)
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                return False
+            await self._conn.execute(
                 "UPDATE tasks SET status = ? WHERE task_key = ?",
                 (status, task_key),
             )
             await self._conn.commit()
-            updated = cursor.rowcount > 0
-            if updated:
-                logger.info("Task %s status updated to %s", task_key, status)
-            return updated
+
+        logger.info("Task %s status updated to %s", task_key, status)
+        if row[0] != status:
+            self.events.publish(TaskStatusChanged(task_key, row[0], status))
+        return True
 
     async def mark_task_passing(self, task_key: str) -> bool:
         """Mark a task as passing all tests.
@@ -382,7 +411,8 @@ class TaskMixin:
             "blocked": 0,
         }
 
-        async with self._conn.execute(
+        conn = self._reader() or self._conn
+        async with conn.execute(
             "SELECT status, COUNT(*) as count FROM tasks GROUP BY status"
         ) as cursor:
             async for row in cursor:
@@ -442,14 +472,11 @@ class TaskMixin:
             ruff_exit_code: Exit code from ruff (0 = pass).
 
         Returns:
-            The ID of the inserted attempt record.
+            The ID of the inserted attempt record, or 0 if the write was
+            queued for a group commit.
         """
-        await self._ensure_connected()
-        if not self._conn:
-            return 0
-
-        async with self._write_lock:
-            cursor = await self._conn.execute(
+        return await self._append(
+            (
                 """
                 INSERT INTO attempts (
                     task_id, stage, attempt_number, success,
@@ -468,8 +495,7 @@ class TaskMixin:
                     ruff_exit_code,
                 ),
             )
-            await self._conn.commit()
-            return cursor.lastrowid or 0
+        )
 
     async def get_stage_attempts(self, task_id: int) -> list[dict[str, Any]]:
         """Get all stage attempts for a task.
@@ -480,11 +506,13 @@ class TaskMixin:
         Returns:
             List of attempt records as dictionaries.
         """
+        await self.flush_writes()
         await self._ensure_connected()
         if not self._conn:
             return []
 
-        async with self._conn.execute(
+        conn = self._reader() or self._conn
+        async with conn.execute(
             """
             SELECT id, task_id, stage, attempt_number, success,
                    error_message, pytest_exit_code, mypy_exit_code, ruff_exit_code,
@@ -541,6 +569,9 @@ class TaskMixin:
     ) -> int:
         """Record an attempt for a task stage.
 
+        Tool output is stored compressed and deduplicated in output_blobs;
+        read it back with get_attempt_outputs().
+
         Args:
             task_id: The task's database ID.
             stage: Stage name (red, green, review, fix, verify, commit).
@@ -573,33 +604,65 @@ class TaskMixin:
                 row = await cursor.fetchone()
                 attempt_number = row[0] if row else 1
 
-            cursor = await self._conn.execute(
-                """
-                INSERT INTO attempts (
-                    task_id, stage, attempt_number, success, error_message,
-                    pytest_exit_code, pytest_output,
-                    mypy_exit_code, mypy_output,
-                    ruff_exit_code, ruff_output,
-                    completed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                (
-                    task_id,
-                    stage,
-                    attempt_number,
-                    1 if success else 0,
-                    error_message,
-                    pytest_exit_code,
-                    pytest_output,
-                    mypy_exit_code,
-                    mypy_output,
-                    ruff_exit_code,
-                    ruff_output,
-                ),
-            )
-            await self._conn.commit()
+            try:
+                cursor = await self._conn.execute(
+                    """
+                    INSERT INTO attempts (
+                        task_id, stage, attempt_number, success, error_message,
+                        pytest_exit_code, pytest_output_blob,
+                        mypy_exit_code, mypy_output_blob,
+                        ruff_exit_code, ruff_output_blob,
+                        completed_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    """,
+                    (
+                        task_id,
+                        stage,
+                        attempt_number,
+                        1 if success else 0,
+                        error_message,
+                        pytest_exit_code,
+                        await store_blob(self._conn, pytest_output),
+                        mypy_exit_code,
+                        await store_blob(self._conn, mypy_output),
+                        ruff_exit_code,
+                        await store_blob(self._conn, ruff_output),
+                    ),
+                )
+                await self._conn.commit()
+            except Exception:
+                await self._conn.rollback()
+                raise
             return cursor.lastrowid or 0
 
+    async def get_attempt_outputs(self, attempt_id: int) -> dict[str, str | None] | None:
+        """Load and decompress the tool output recorded with an attempt.
+
+        Args:
+            attempt_id: The attempt's database ID.
+
+        Returns:
+            Mapping of tool name (pytest, mypy, ruff) to output text (None
+            when not recorded), or None if the attempt does not exist.
+        """
+        await self.flush_writes()
+        await self._ensure_connected()
+        if not self._conn:
+            return None
+
+        conn = self._reader() or self._conn
+        columns = ", ".join(OUTPUT_BLOB_COLUMNS.values())
+        async with conn.execute(
+            f"SELECT {columns} FROM attempts WHERE id = ?", (attempt_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        return {
+            tool: await load_blob(conn, row[column])
+            for tool, column in OUTPUT_BLOB_COLUMNS.items()
+        }
+
     async def update_task_test_file(self, task_id: int, test_file: str) -> bool:
         """Update the test_file path for a task.
 
@@ -693,7 +756,7 @@ class TaskMixin:
             return 0
 
         async with self._write_lock:
-            cursor = await self._conn.execute(
+            async with self._conn.execute(
                 """
                 UPDATE tasks
                 SET claimed_by = NULL,
@@ -702,12 +765,14 @@ class TaskMixin:
                     status = 'pending'
                 WHERE claim_expires_at < datetime('now')
                   AND status = 'in_progress'
+                RETURNING task_key
                 """
-            )
-            count = cursor.rowcount
+            ) as cursor:
+                released = [str(row[0]) for row in await cursor.fetchall()]
             await self._conn.commit()
 
-            if count > 0:
-                logger.info("Released %d stale task claims", count)
-
-            return count
+        if released:
+            logger.info("Released %d stale task claims", len(released))
+        for task_key in released:
+            self.events.publish(TaskStatusChanged(task_key, "in_progress", "pending"))
+        return len(released)
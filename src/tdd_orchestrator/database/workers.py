@@ -8,10 +8,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiosqlite
 
+from .events import DBEvent, EventBus, TaskClaimed, TaskReleased, TaskStatusChanged
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .write_queue import Statement
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,9 +27,22 @@ class WorkerMixin:
 
     _conn: aiosqlite.Connection | None
     _write_lock: asyncio.Lock
+    events: EventBus
+    _worker_db_ids: dict[int, int]
 
     async def _ensure_connected(self) -> None: ...
 
+    if TYPE_CHECKING:
+        # Provided by ConnectionMixin
+        async def _append(
+            self,
+            *statements: Statement,
+            event: DBEvent | None = None,
+            on_commit: Callable[[], None] | None = None,
+        ) -> int: ...
+
+        async def flush_writes(self) -> int: ...
+
     # =========================================================================
     # Worker Management
     # =========================================================================
@@ -55,7 +75,30 @@ class WorkerMixin:
             row = await cursor.fetchone()
             await self._conn.commit()
             logger.info("Registered worker %d", worker_id)
-            return row[0] if row else 0
+            if not row:
+                return 0
+            self._worker_db_ids[worker_id] = row[0]
+            return int(row[0])
+
+    async def _worker_db_id(self, worker_id: int) -> int:
+        """Resolve a worker identifier to its workers.id (caller holds the write lock).
+
+        Worker rows are never deleted, so the mapping is cached for the
+        lifetime of the connection. Unregistered workers fall back to the
+        identifier itself, as the claim audit log always has.
+        """
+        cached = self._worker_db_ids.get(worker_id)
+        if cached is not None:
+            return cached
+        assert self._conn is not None
+        async with self._conn.execute(
+            "SELECT id FROM workers WHERE worker_id = ?", (worker_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row:
+            return worker_id
+        self._worker_db_ids[worker_id] = row[0]
+        return int(row[0])
 
     async def unregister_worker(self, worker_id: int) -> bool:
         """Mark worker as idle.
@@ -89,36 +132,32 @@ class WorkerMixin:
     ) -> None:
         """Update worker heartbeat timestamp.
 
+        Batched into a group commit when write batching is enabled.
+
         Args:
             worker_id: Worker identifier.
             task_id: Current task being processed (if any).
         """
-        await self._ensure_connected()
-        if not self._conn:
-            return
-
-        async with self._write_lock:
+        await self._append(
             # Update workers table
-            await self._conn.execute(
+            (
                 """
                 UPDATE workers
                 SET last_heartbeat = CURRENT_TIMESTAMP, current_task_id = ?
                 WHERE worker_id = ?
                 """,
                 (task_id, worker_id),
-            )
-
+            ),
             # Append to heartbeat log
-            await self._conn.execute(
+            (
                 """
                 INSERT INTO worker_heartbeats (worker_id, status, task_id)
                 SELECT id, status, ?
                 FROM workers WHERE worker_id = ?
                 """,
                 (task_id, worker_id),
-            )
-
-            await self._conn.commit()
+            ),
+        )
 
     # =========================================================================
     # Task Claiming (Atomic Operations)
@@ -146,10 +185,13 @@ class WorkerMixin:
         if not self._conn:
             return False
 
+        # Keep program order with queued heartbeats before a synchronous commit
+        await self.flush_writes()
+
         async with self._write_lock:
             try:
                 # Attempt atomic claim with version check
-                cursor = await self._conn.execute(
+                async with self._conn.execute(
                     f"""
                     UPDATE tasks
                     SET claimed_by = ?,
@@ -160,19 +202,17 @@ class WorkerMixin:
                     WHERE id = ?
                       AND status = 'pending'
                       AND (claimed_by IS NULL OR claim_expires_at < datetime('now'))
+                    RETURNING task_key
                     """,
                     (worker_id, task_id),
-                )
+                ) as cursor:
+                    row = await cursor.fetchone()
 
-                if cursor.rowcount == 0:
+                if row is None:
+                    await self._conn.commit()
                     return False
 
-                # Get worker db ID
-                async with self._conn.execute(
-                    "SELECT id FROM workers WHERE worker_id = ?", (worker_id,)
-                ) as wcursor:
-                    wrow = await wcursor.fetchone()
-                    worker_db_id = wrow[0] if wrow else worker_id
+                worker_db_id = await self._worker_db_id(worker_id)
 
                 # Log claim in audit table
                 await self._conn.execute(
@@ -184,14 +224,97 @@ class WorkerMixin:
                 )
 
                 await self._conn.commit()
-                logger.info("Worker %d claimed task %d", worker_id, task_id)
-                return True
 
             except Exception as e:
                 await self._conn.rollback()
                 logger.error("Failed to claim task %d: %s", task_id, e)
                 return False
 
+        logger.info("Worker %d claimed task %d", worker_id, task_id)
+        task_key = str(row[0])
+        self.events.publish(TaskStatusChanged(task_key, "pending", "in_progress"))
+        self.events.publish(TaskClaimed(task_id, task_key, worker_id))
+        return True
+
+    async def claim_tasks(
+        self,
+        worker_id: int,
+        limit: int,
+        phase: int | None = None,
+        timeout_seconds: int = 300,
+    ) -> list[dict[str, Any]]:
+        """Atomically claim up to ``limit`` ready tasks for a worker.
+
+        One UPDATE ... RETURNING picks the next claimable tasks (same order
+        as v_claimable_tasks) and claims them, followed by a single batched
+        audit insert, all in one transaction. Tasks claimed concurrently by
+        another process are simply not returned.
+
+        Args:
+            worker_id: Worker claiming the tasks.
+            limit: Maximum number of tasks to claim.
+            phase: Optional phase filter.
+            timeout_seconds: Claim expiration timeout.
+
+        Returns:
+            The claimed task dicts in phase/sequence order (empty if none).
+        """
+        await self._ensure_connected()
+        if not self._conn or limit <= 0:
+            return []
+
+        phase_filter = "WHERE phase = ?" if phase is not None else ""
+        params: tuple[Any, ...] = (worker_id,) + ((phase,) if phase is not None else ()) + (limit,)
+
+        # Keep program order with queued heartbeats before a synchronous commit
+        await self.flush_writes()
+
+        async with self._write_lock:
+            try:
+                async with self._conn.execute(
+                    f"""
+                    UPDATE tasks
+                    SET claimed_by = ?,
+                        claimed_at = CURRENT_TIMESTAMP,
+                        claim_expires_at = datetime('now', '+{timeout_seconds} seconds'),
+                        version = version + 1,
+                        status = 'in_progress'
+                    WHERE id IN (
+                        SELECT id FROM v_claimable_tasks {phase_filter}
+                        ORDER BY phase, sequence, id LIMIT ?
+                    )
+                      AND status = 'pending'
+                      AND (claimed_by IS NULL OR claim_expires_at < datetime('now'))
+                    RETURNING *
+                    """,
+                    params,
+                ) as cursor:
+                    rows = [dict(row) for row in await cursor.fetchall()]
+
+                if not rows:
+                    await self._conn.commit()
+                    return []
+
+                # RETURNING order is unspecified
+                rows.sort(key=lambda row: (row["phase"], row["sequence"]))
+                worker_db_id = await self._worker_db_id(worker_id)
+                await self._conn.executemany(
+                    "INSERT INTO task_claims (task_id, worker_id) VALUES (?, ?)",
+                    [(row["id"], worker_db_id) for row in rows],
+                )
+                await self._conn.commit()
+
+            except Exception as e:
+                await self._conn.rollback()
+                logger.error("Failed to claim tasks for worker %d: %s", worker_id, e)
+                return []
+
+        logger.info("Worker %d claimed %d task(s)", worker_id, len(rows))
+        for row in rows:
+            self.events.publish(TaskStatusChanged(row["task_key"], "pending", "in_progress"))
+            self.events.publish(TaskClaimed(row["id"], row["task_key"], worker_id))
+        return rows
+
     async def release_task(
         self,
         task_id: int,
@@ -212,6 +335,9 @@ class WorkerMixin:
         if not self._conn:
             return False
 
+        # Keep program order with queued heartbeats before a synchronous commit
+        await self.flush_writes()
+
         async with self._write_lock:
             # Clear claim from tasks table
             cursor = await self._conn.execute(
@@ -225,12 +351,7 @@ class WorkerMixin:
                 (task_id, worker_id),
             )
 
-            # Get worker db ID
-            async with self._conn.execute(
-                "SELECT id FROM workers WHERE worker_id = ?", (worker_id,)
-            ) as wcursor:
-                wrow = await wcursor.fetchone()
-                worker_db_id = wrow[0] if wrow else worker_id
+            worker_db_id = await self._worker_db_id(worker_id)
 
             # Update claim audit log
             await self._conn.execute(
@@ -243,7 +364,11 @@ class WorkerMixin:
             )
 
             await self._conn.commit()
-            return cursor.rowcount > 0
+
+        released = cursor.rowcount > 0
+        if released:
+            self.events.publish(TaskReleased(task_id, worker_id, outcome))
+        return released
 
     async def get_claimable_tasks(self, phase: int | None = None) -> list[dict[str, Any]]:
         """Get tasks available for claiming.
@@ -260,7 +385,7 @@ class WorkerMixin:
 
         if phase is not None:
             async with self._conn.execute(
-                "SELECT * FROM v_claimable_tasks WHERE phase = ? ORDER BY sequence",
+                "SELECT * FROM v_claimable_tasks WHERE phase = ? ORDER BY phase, sequence",
                 (phase,),
             ) as cursor:
                 rows = await cursor.fetchall()
@@ -0,0 +1,271 @@
+"""Group-commit write-behind queue for high-frequency appends.
+
+Heartbeats, invocation records, stage attempts, static review metrics and
+stash audit rows are written many times per task, one row at a time. With
+a commit per row, every append pays for its own transaction (and fsync).
+
+WriteBehindQueue collects these appends and writes everything pending in
+a single transaction, either every ``flush_interval`` seconds or as soon
+as ``max_batch`` operations are waiting. Callers return immediately;
+flush() forces pending writes out (used before reads that must see them
+and before correctness-critical writes), and stop() flushes on shutdown
+so queued rows are never lost on a clean exit.
+
+A batch that cannot commit because another connection holds the database
+(SQLITE_BUSY/SQLITE_LOCKED) is put back at the front of the queue for the
+next flush. Any other failure replays the batch one operation at a time,
+each in its own savepoint, so only the operations that fail are dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background flushes
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+# Pending operations that trigger an immediate flush
+DEFAULT_MAX_BATCH = 256
+
+# One logical write: the statements that must commit together
+Statement = tuple[str, Sequence[Any]]
+
+# A queued write and the callback to run once it has committed
+_Operation = tuple[tuple[Statement, ...], Callable[[], None] | None]
+
+# Primary result codes meaning another connection holds the database
+_CONTENTION_CODES = (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+
+@dataclass
+class WriteBatchStats:
+    """Counters describing group-commit behaviour.
+
+    Attributes:
+        batches: Number of committed batches.
+        operations: Total operations committed across all batches.
+        failed_operations: Operations dropped because they failed to apply.
+        requeued_batches: Batches put back after hitting a locked database.
+        last_batch_size: Operations in the most recent batch.
+        max_batch_size: Largest batch committed so far.
+        last_flush_ms: Duration of the most recent flush.
+        total_flush_ms: Cumulative flush duration.
+    """
+
+    batches: int = 0
+    operations: int = 0
+    failed_operations: int = 0
+    requeued_batches: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
+
+    @property
+    def avg_batch_size(self) -> float:
+        """Mean operations per committed batch."""
+        return self.operations / self.batches if self.batches else 0.0
+
+    @property
+    def avg_flush_ms(self) -> float:
+        """Mean flush duration in milliseconds."""
+        return self.total_flush_ms / self.batches if self.batches else 0.0
+
+
+class WriteBehindQueue:
+    """Coalesces append-only writes into periodic group commits."""
+
+    def __init__(
+        self,
+        conn: aiosqlite.Connection,
+        lock: asyncio.Lock,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Initialize the queue (the flusher starts with start()).
+
+        Args:
+            conn: Writer connection the batches are committed on.
+            lock: The database write lock, held for each flush.
+            flush_interval: Seconds between background flushes.
+            max_batch: Pending operations that trigger an early flush.
+        """
+        self._conn = conn
+        self._lock = lock
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, max_batch)
+        self.stats = WriteBatchStats()
+        self._pending: list[_Operation] = []
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Return whether the background flusher is active."""
+        return self._task is not None
+
+    @property
+    def pending(self) -> int:
+        """Number of operations waiting to be committed."""
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def submit(
+        self,
+        *statements: Statement,
+        on_commit: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue one logical write for the next group commit.
+
+        Args:
+            *statements: (sql, params) pairs that commit together.
+            on_commit: Called once this write has committed (not called
+                if it fails).
+        """
+        self._pending.append((statements, on_commit))
+        if len(self._pending) >= self.max_batch:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        """Commit all pending operations now.
+
+        Returns:
+            Number of operations committed.
+        """
+        if not self._pending:
+            return 0
+        async with self._lock:
+            return await self._flush_locked()
+
+    async def stop(self) -> None:
+        """Stop the flusher and commit anything still pending."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+
+    async def _flush_locked(self) -> int:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        start = time.perf_counter()
+        try:
+            for statements, _ in batch:
+                for sql, params in statements:
+                    await self._conn.execute(sql, params)
+            await self._conn.commit()
+            committed = batch
+        except Exception as e:
+            await self._conn.rollback()
+            if _is_contention(e):
+                # Retry the whole batch, ahead of anything queued since
+                self._pending[:0] = batch
+                self.stats.requeued_batches += 1
+                logger.warning("Group commit of %d operations deferred: %s", len(batch), e)
+                return 0
+            logger.error(
+                "Group commit of %d operations failed (%s), replaying individually",
+                len(batch),
+                e,
+            )
+            replayed = await self._replay(batch)
+            if not replayed:
+                return 0
+            committed = replayed
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        stats = self.stats
+        stats.batches += 1
+        stats.operations += len(committed)
+        stats.last_batch_size = len(committed)
+        stats.max_batch_size = max(stats.max_batch_size, len(committed))
+        stats.last_flush_ms = elapsed_ms
+        stats.total_flush_ms += elapsed_ms
+        logger.debug("Group commit: %d operations in %.1fms", len(committed), elapsed_ms)
+        for _, callback in committed:
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as e:
+                logger.error("Group commit callback failed: %s", e)
+        return len(committed)
+
+    async def _replay(self, batch: list[_Operation]) -> list[_Operation] | None:
+        """Apply each operation in its own savepoint; commit the survivors at once.
+
+        Returns:
+            The operations that committed, or None if the batch was requeued
+            because the database became locked.
+        """
+        applied: list[_Operation] = []
+        dropped: set[int] = set()  # id() of operations rolled back
+        try:
+            # Without an enclosing transaction, releasing each savepoint
+            # would commit its operation on its own
+            await self._conn.execute("BEGIN")
+            for operation in batch:
+                await self._conn.execute("SAVEPOINT write_behind_op")
+                try:
+                    for sql, params in operation[0]:
+                        await self._conn.execute(sql, params)
+                except Exception as e:
+                    if _is_contention(e):
+                        raise
+                    await self._conn.execute("ROLLBACK TO write_behind_op")
+                    self.stats.failed_operations += 1
+                    dropped.add(id(operation))
+                    logger.error("Dropped queued write %r: %s", operation[0][0][0], e)
+                else:
+                    applied.append(operation)
+                finally:
+                    await self._conn.execute("RELEASE write_behind_op")
+            await self._conn.commit()
+        except Exception as e:
+            await self._conn.rollback()
+            if not _is_contention(e):
+                raise
+            retry = [op for op in batch if id(op) not in dropped]
+            self._pending[:0] = retry
+            self.stats.requeued_batches += 1
+            logger.warning("Group commit of %d operations deferred: %s", len(retry), e)
+            return None
+        return applied
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # Keep flushing; a dead flusher would let appends pile up
+                logger.exception("Write-behind flush failed")
+
+
+def _is_contention(error: BaseException) -> bool:
+    """Return whether ``error`` means another connection holds the database."""
+    code = getattr(error, "sqlite_errorcode", None)
+    return (
+        isinstance(error, sqlite3.OperationalError)
+        and code is not None
+        and code & 0xFF in _CONTENTION_CODES
+    )
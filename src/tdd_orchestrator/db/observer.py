@@ -1,16 +1,27 @@
 """Observer pattern for task status change callbacks.
 
 Provides a simple callback registry that dispatches task status change
-events to registered observers.
+events to registered observers, and two ways of feeding it:
+
+- EventBusObserver consumes the OrchestratorDB's in-process event bus,
+  so callbacks see a change as soon as it commits. Use it when the
+  mutations happen in this process.
+- DBObserver polls the task_events change log, which also sees changes
+  made by other processes. It is the fallback for deployments where the
+  worker pool and API run separately.
+
+Run one or the other for a given database, not both.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timezone
 from typing import Any, Callable
 
+from ..database.events import DEFAULT_QUEUE_SIZE, EventSubscription, TaskStatusChanged
+from ..database.read_pool import read_connection
+
 logger = logging.getLogger(__name__)
 
 # Module-level callback registry
@@ -78,29 +89,44 @@ def dispatch_task_callbacks(event: dict[str, Any]) -> None:
             )
 
 
+# Acknowledged task_events rows are deleted once this many have accumulated
+PRUNE_THRESHOLD = 256
+
+
 class DBObserver:
-    """Database observer that polls for task status changes.
+    """Database observer that polls the task_events change log.
 
-    Monitors the tasks table for status changes and dispatches events to
-    registered callbacks via the dispatch_task_callbacks mechanism.
+    A trigger on tasks.status appends every transition to task_events.
+    Each poll reads only the rows past the last id this observer has seen,
+    so an idle poll is a single primary-key probe regardless of how many
+    tasks exist, and transitions that happen between polls are each
+    dispatched with their exact old and new status.
+
+    Acknowledged rows are pruned in batches (and on stop), so run at most
+    one observer per database.
     """
 
     def __init__(
         self,
         db: Any,  # OrchestratorDB, avoid circular import
         poll_interval: float = 1.0,
+        prune_threshold: int = PRUNE_THRESHOLD,
     ) -> None:
         """Initialize the DB observer.
 
         Args:
             db: The OrchestratorDB instance to observe.
             poll_interval: How frequently to poll for changes (seconds).
+            prune_threshold: Acknowledged events to accumulate before
+                deleting them.
         """
         self._db = db
         self._poll_interval = poll_interval
+        self._prune_threshold = prune_threshold
         self._task: asyncio.Task[None] | None = None
         self._running = False
-        self._task_states: dict[str, str] = {}  # task_key -> status
+        self._last_event_id = 0  # Watermark: highest task_events.id dispatched
+        self._pruned_through = 0
 
     @property
     def is_running(self) -> bool:
@@ -113,8 +139,8 @@ class DBObserver:
             return
 
         self._running = True
-        # Initialize task states from current database state
-        await self._refresh_task_states()
+        # Only transitions after start are reported
+        await self._load_watermark()
         # Start the polling task
         self._task = asyncio.create_task(self._poll_loop())
 
@@ -133,18 +159,22 @@ class DBObserver:
                 pass
             self._task = None
 
-    async def _refresh_task_states(self) -> None:
-        """Refresh the internal cache of task states from the database."""
-        # Query all tasks and their current status
+        # Do not reopen a database that was closed underneath us
+        if self._db._conn is not None:
+            await self._prune()
+
+    async def _load_watermark(self) -> None:
+        """Set the watermark to the newest event in the change log."""
         await self._db._ensure_connected()
         if not self._db._conn:
             return
 
-        async with self._db._conn.execute(
-            "SELECT task_key, status FROM tasks"
+        async with read_connection(self._db).execute(
+            "SELECT COALESCE(MAX(id), 0) FROM task_events"
         ) as cursor:
-            rows = await cursor.fetchall()
-            self._task_states = {str(row[0]): str(row[1]) for row in rows}
+            row = await cursor.fetchone()
+        self._last_event_id = int(row[0]) if row else 0
+        self._pruned_through = max(self._pruned_through, self._last_event_id)
 
     async def _poll_loop(self) -> None:
         """Main polling loop that checks for status changes."""
@@ -161,31 +191,100 @@ class DBObserver:
                 await asyncio.sleep(self._poll_interval)
 
     async def _poll(self) -> None:
-        """Single poll cycle - check for task status changes and dispatch events."""
-        # Get current state from database
+        """Single poll cycle - dispatch events logged since the last poll."""
         await self._db._ensure_connected()
         if not self._db._conn:
             return
 
-        async with self._db._conn.execute(
-            "SELECT task_key, status FROM tasks"
+        async with read_connection(self._db).execute(
+            """
+            SELECT id, task_key, old_status, new_status, created_at
+            FROM task_events
+            WHERE id > ?
+            ORDER BY id
+            """,
+            (self._last_event_id,),
         ) as cursor:
             rows = await cursor.fetchall()
-            current_states = {str(row[0]): str(row[1]) for row in rows}
-
-        # Detect changes
-        for task_key, new_status in current_states.items():
-            old_status = self._task_states.get(task_key)
-
-            # If status changed, dispatch event
-            if old_status is not None and old_status != new_status:
-                event = {
-                    "task_id": task_key,
-                    "old_status": old_status,
-                    "new_status": new_status,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-                dispatch_task_callbacks(event)
 
-        # Update our cached state
-        self._task_states = current_states
+        for row in rows:
+            event = {
+                "task_id": str(row[1]),
+                "old_status": str(row[2]) if row[2] is not None else None,
+                "new_status": str(row[3]),
+                "timestamp": str(row[4]),
+            }
+            dispatch_task_callbacks(event)
+            self._last_event_id = int(row[0])
+
+        if self._last_event_id - self._pruned_through >= self._prune_threshold:
+            await self._prune()
+
+    async def _prune(self) -> None:
+        """Delete the events this observer has already dispatched."""
+        if self._last_event_id <= self._pruned_through:
+            return
+        await self._db.execute_update(
+            "DELETE FROM task_events WHERE id <= ?", (self._last_event_id,)
+        )
+        self._pruned_through = self._last_event_id
+
+
+class EventBusObserver:
+    """Dispatches task status changes pushed on an OrchestratorDB's event bus.
+
+    Callbacks run in the observer's own task, never inside the mutation
+    that published the event, and the subscription queue is bounded: if
+    the callbacks fall behind, the oldest undelivered changes are dropped.
+    """
+
+    def __init__(
+        self,
+        db: Any,  # OrchestratorDB, avoid circular import
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        """Initialize the observer.
+
+        Args:
+            db: The OrchestratorDB instance whose events to dispatch.
+            maxsize: Status changes buffered before the oldest are dropped.
+        """
+        self._db = db
+        self._maxsize = maxsize
+        self._subscription: EventSubscription | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Return whether the observer is currently running."""
+        return self._task is not None
+
+    async def start(self) -> None:
+        """Subscribe to the bus and start dispatching."""
+        if self._task is not None:
+            return
+        self._subscription = self._db.events.subscribe(TaskStatusChanged, maxsize=self._maxsize)
+        self._task = asyncio.create_task(self._dispatch_loop(self._subscription))
+
+    async def stop(self) -> None:
+        """Unsubscribe and wait for already queued changes to be dispatched."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+        await task
+
+    async def _dispatch_loop(self, subscription: EventSubscription) -> None:
+        async for event in subscription:
+            if not isinstance(event, TaskStatusChanged):
+                continue
+            dispatch_task_callbacks(
+                {
+                    "task_id": event.task_key,
+                    "old_status": event.old_status,
+                    "new_status": event.new_status,
+                    "timestamp": event.timestamp,
+                }
+            )
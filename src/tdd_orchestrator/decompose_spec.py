@@ -61,8 +61,9 @@ from .decomposition.spec_validator import SpecConformanceValidator
 from .task_loader import (
     get_existing_prefixes,
     load_tdd_tasks,
+    update_acceptance_criteria_bulk,
+    update_depends_on_bulk,
     update_task_acceptance_criteria,
-    update_task_depends_on,
     write_tasks_incremental,
 )
 
@@ -483,24 +484,28 @@ async def run_decomposition(
     # and load any new tasks from validation/splitting
     logger.info("Updating acceptance criteria and loading final tasks...")
 
-    ac_updated = 0
-    deps_updated = 0
-    new_tasks_loaded = 0
+    # Update AC for tasks that exist from incremental writes, in one batch
+    updated_keys = set(
+        await update_acceptance_criteria_bulk(
+            {t.task_key: t.acceptance_criteria for t in final_tasks if t.acceptance_criteria}
+        )
+    )
+    ac_updated = len(updated_keys)
 
-    for task in final_tasks:
-        # Try to update AC for existing task (from incremental writes)
-        if task.acceptance_criteria:
-            updated = await update_task_acceptance_criteria(task.task_key, task.acceptance_criteria)
-            if updated:
-                ac_updated += 1
-                # Also persist depends_on (calculated in Step 5)
-                if task.depends_on:
-                    await update_task_depends_on(task.task_key, task.depends_on)
-                    deps_updated += 1
-                continue
-
-        # Task doesn't exist yet (from validation splits) - create it
-        task_dict = {
+    # Also persist depends_on (calculated in Step 5) for those tasks
+    deps_updated = len(
+        await update_depends_on_bulk(
+            {
+                t.task_key: t.depends_on
+                for t in final_tasks
+                if t.task_key in updated_keys and t.depends_on
+            }
+        )
+    )
+
+    # Tasks that don't exist yet (from validation splits) - create them together
+    new_task_dicts = [
+        {
             "task_key": task.task_key,
             "title": task.title,
             "goal": task.goal,
@@ -513,13 +518,17 @@ async def run_decomposition(
             "phase": task.phase,
             "sequence": task.sequence,
         }
-
+        for task in final_tasks
+        if task.task_key not in updated_keys
+    ]
+    new_tasks_loaded = 0
+    if new_task_dicts:
         load_result = await load_tdd_tasks(
-            [task_dict],
+            new_task_dicts,
             clear_existing=False,  # Already cleared at start if requested
             skip_duplicates=True,
         )
-        new_tasks_loaded += load_result["loaded"]
+        new_tasks_loaded = load_result["loaded"]
 
     print("\nDatabase operations complete:")
     print(f"  Incremental writes (Pass 2): {incremental_tasks_written}")
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import logging
 from collections import deque
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -23,32 +24,45 @@ logger = logging.getLogger(__name__)
 def validate_no_cycles(tasks: list["DecomposedTask"]) -> list[str]:
     """Validate that the task dependency graph has no circular dependencies.
 
+    Args:
+        tasks: List of DecomposedTask objects with depends_on populated.
+
+    Returns:
+        List of error strings describing detected cycles. Empty if no cycles.
+    """
+    graph: dict[str, list[str]] = {}
+    for task in tasks:
+        graph.setdefault(task.task_key, []).extend(task.depends_on)
+    return find_cycles(graph)
+
+
+def find_cycles(graph: Mapping[str, Sequence[str]]) -> list[str]:
+    """Find circular dependencies in a ``task_key -> [dependency_keys]`` graph.
+
     Uses Kahn's algorithm (BFS topological sort). If any nodes remain after
-    processing all zero-in-degree nodes, cycles exist.
+    processing all zero-in-degree nodes, cycles exist. Dependencies that
+    are not themselves keys of the graph are ignored.
 
     Args:
-        tasks: List of DecomposedTask objects with depends_on populated.
+        graph: Mapping of each task key to the keys it depends on.
 
     Returns:
         List of error strings describing detected cycles. Empty if no cycles.
     """
-    if not tasks:
+    if not graph:
         return []
 
-    # Build lookup of valid task keys
-    task_keys = {t.task_key for t in tasks}
-
     # Build adjacency list and in-degree map
-    adj: dict[str, list[str]] = {t.task_key: [] for t in tasks}
-    in_degree: dict[str, int] = {t.task_key: 0 for t in tasks}
+    adj: dict[str, list[str]] = {key: [] for key in graph}
+    in_degree: dict[str, int] = {key: 0 for key in graph}
 
-    for task in tasks:
-        for dep in task.depends_on:
-            if dep not in task_keys:
+    for task_key, depends_on in graph.items():
+        for dep in depends_on:
+            if dep not in adj:
                 continue  # Skip external refs gracefully
-            # Edge: dep -> task.task_key (dep must complete before task)
-            adj[dep].append(task.task_key)
-            in_degree[task.task_key] += 1
+            # Edge: dep -> task_key (dep must complete before task)
+            adj[dep].append(task_key)
+            in_degree[task_key] += 1
 
     # BFS: start with all zero-in-degree nodes
     queue: deque[str] = deque()
@@ -66,11 +80,20 @@ def validate_no_cycles(tasks: list["DecomposedTask"]) -> list[str]:
                 queue.append(neighbor)
 
     # If all nodes visited, no cycles
-    if visited_count == len(task_keys):
+    if visited_count == len(adj):
         return []
 
     # Nodes with remaining in-degree are in cycles
     remaining = {k for k, d in in_degree.items() if d > 0}
+
+    # Nodes that merely depend on a cycle have no successor left in
+    # remaining; drop them so the DFS only walks real cycle members
+    pruned = True
+    while pruned:
+        dead_ends = {k for k in remaining if not any(n in remaining for n in adj[k])}
+        remaining -= dead_ends
+        pruned = bool(dead_ends)
+
     return _find_cycle_members(adj, remaining)
 
 
@@ -1,16 +1,19 @@
 """Runtime dependency checker for TDD Orchestrator tasks.
 
 Validates task dependency references in the database, detects dangling
-references, builds dependency graphs, and checks whether a task's
-dependencies are satisfied.
+references and cycles, builds dependency graphs, and checks whether a
+task's dependencies are satisfied. All queries read the normalized
+``task_dependencies`` edge table, which triggers keep in sync with the
+``tasks.depends_on`` JSON column.
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING, Any
 
+from .decomposition.dependency_validator import find_cycles
+
 if TYPE_CHECKING:
     from .database import OrchestratorDB
 
@@ -20,40 +23,14 @@ logger = logging.getLogger(__name__)
 _TERMINAL_STATUSES = ("complete", "passing")
 
 
-def _parse_depends_on(raw: Any) -> list[str]:
-    """Parse a depends_on column value into a list of task keys.
-
-    Handles NULL, empty string, ``"null"``, ``"[]"``, and valid JSON
-    arrays.  Returns an empty list for any value that does not represent
-    real dependencies.
-
-    Args:
-        raw: The raw value from the ``depends_on`` column.
-
-    Returns:
-        List of dependency task-key strings.
-    """
-    if raw is None:
-        return []
-    text = str(raw).strip()
-    if not text or text in ("null", "[]"):
-        return []
-    try:
-        parsed = json.loads(text)
-    except (json.JSONDecodeError, TypeError):
-        return []
-    if not isinstance(parsed, list):
-        return []
-    return [str(item) for item in parsed]
-
-
 async def validate_dependencies(
     db: OrchestratorDB,
 ) -> list[dict[str, Any]]:
     """Detect dangling dependency references across all tasks.
 
     A *dangling reference* is a ``depends_on`` entry whose value does not
-    match any ``task_key`` in the database.
+    match any ``task_key`` in the database. These are the
+    ``task_dependencies`` edges with no resolved ``depends_on_id``.
 
     Args:
         db: OrchestratorDB instance with an active connection.
@@ -65,27 +42,22 @@ async def validate_dependencies(
     """
     assert db._conn is not None, "Database connection required"
 
-    # Fetch all task_keys for the existence check.
-    async with db._conn.execute("SELECT task_key FROM tasks") as cursor:
-        rows = await cursor.fetchall()
-
-    all_keys: set[str] = {str(row[0]) for row in rows}
-
-    # Fetch task_key + depends_on for every task.
     async with db._conn.execute(
-        "SELECT task_key, depends_on FROM tasks"
+        """
+        SELECT t.task_key, e.depends_on_key
+        FROM task_dependencies e
+        JOIN tasks t ON t.id = e.task_id
+        WHERE e.depends_on_id IS NULL
+        ORDER BY t.id, e.position
+        """
     ) as cursor:
-        dep_rows = await cursor.fetchall()
+        rows = await cursor.fetchall()
 
-    issues: list[dict[str, Any]] = []
-    for row in dep_rows:
-        task_key = str(row[0])
-        deps = _parse_depends_on(row[1])
-        dangling = [d for d in deps if d not in all_keys]
-        if dangling:
-            issues.append({"task_key": task_key, "dangling_refs": dangling})
+    dangling: dict[str, list[str]] = {}
+    for row in rows:
+        dangling.setdefault(str(row[0]), []).append(str(row[1]))
 
-    return issues
+    return [{"task_key": key, "dangling_refs": refs} for key, refs in dangling.items()]
 
 
 async def get_dependency_graph(
@@ -106,19 +78,56 @@ async def get_dependency_graph(
     assert db._conn is not None, "Database connection required"
 
     async with db._conn.execute(
-        "SELECT task_key, depends_on FROM tasks"
+        """
+        SELECT t.task_key, e.depends_on_key
+        FROM tasks t
+        LEFT JOIN task_dependencies e ON e.task_id = t.id
+        ORDER BY t.id, e.position
+        """
     ) as cursor:
         rows = await cursor.fetchall()
 
     graph: dict[str, list[str]] = {}
     for row in rows:
-        task_key = str(row[0])
-        deps = _parse_depends_on(row[1])
-        graph[task_key] = deps
+        deps = graph.setdefault(str(row[0]), [])
+        if row[1] is not None:
+            deps.append(str(row[1]))
 
     return graph
 
 
+async def find_dependency_cycles(db: OrchestratorDB) -> list[str]:
+    """Detect circular dependencies between existing tasks.
+
+    Only resolved edges are considered; dangling references are reported
+    by validate_dependencies() instead.
+
+    Args:
+        db: OrchestratorDB instance with an active connection.
+
+    Returns:
+        List of cycle descriptions (``"A -> B -> A"``). Empty if acyclic.
+    """
+    assert db._conn is not None, "Database connection required"
+
+    async with db._conn.execute(
+        """
+        SELECT t.task_key, b.task_key
+        FROM task_dependencies e
+        JOIN tasks t ON t.id = e.task_id
+        JOIN tasks b ON b.id = e.depends_on_id
+        """
+    ) as cursor:
+        rows = await cursor.fetchall()
+
+    graph: dict[str, list[str]] = {}
+    for row in rows:
+        graph.setdefault(str(row[0]), []).append(str(row[1]))
+        graph.setdefault(str(row[1]), [])
+
+    return find_cycles(graph)
+
+
 async def are_dependencies_met(
     db: OrchestratorDB,
     task_key: str,
@@ -133,35 +142,23 @@ async def are_dependencies_met(
 
     Returns:
         ``True`` if every dependency is in a terminal status (or if the
-        task has no dependencies).  ``False`` otherwise.
+        task has no dependencies or does not exist).  ``False`` if any
+        dependency is unfinished or does not exist.
     """
     assert db._conn is not None, "Database connection required"
 
-    # Fetch depends_on for the target task.
+    placeholders = ", ".join("?" * len(_TERMINAL_STATUSES))
     async with db._conn.execute(
-        "SELECT depends_on FROM tasks WHERE task_key = ?", (task_key,)
+        f"""
+        SELECT COUNT(*)
+        FROM tasks t
+        JOIN task_dependencies e ON e.task_id = t.id
+        LEFT JOIN tasks b ON b.id = e.depends_on_id
+        WHERE t.task_key = ?
+          AND (b.id IS NULL OR b.status NOT IN ({placeholders}))
+        """,
+        (task_key, *_TERMINAL_STATUSES),
     ) as cursor:
         row = await cursor.fetchone()
 
-    if row is None:
-        # Task not found — treat as met (caller should verify existence).
-        return True
-
-    deps = _parse_depends_on(row[0])
-    if not deps:
-        return True
-
-    # Check each dependency's status.
-    for dep_key in deps:
-        async with db._conn.execute(
-            "SELECT status FROM tasks WHERE task_key = ?", (dep_key,)
-        ) as cursor:
-            dep_row = await cursor.fetchone()
-
-        if dep_row is None:
-            # Dependency doesn't exist — cannot be met.
-            return False
-        if str(dep_row[0]) not in _TERMINAL_STATUSES:
-            return False
-
-    return True
+    return row is None or row[0] == 0
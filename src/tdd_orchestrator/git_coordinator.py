@@ -11,6 +11,8 @@ import logging
 import subprocess
 from pathlib import Path
 
+from .subprocess_utils import spawn_subprocess
+
 logger = logging.getLogger(__name__)
 
 
@@ -203,7 +205,7 @@ class GitCoordinator:
         """
         cmd = ["git", *args]
 
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             *cmd,
             cwd=self.base_dir,
             stdout=subprocess.PIPE,
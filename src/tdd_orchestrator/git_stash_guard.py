@@ -6,7 +6,6 @@ to prevent working tree corruption when tasks fail.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import subprocess
 from dataclasses import dataclass, field
@@ -14,6 +13,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .subprocess_utils import spawn_subprocess
+
 if TYPE_CHECKING:
     from .database import OrchestratorDB
 
@@ -186,7 +187,7 @@ class GitStashGuard:
         """
         cmd = ["git", *args]
 
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             *cmd,
             cwd=self.base_dir,
             stdout=subprocess.PIPE,
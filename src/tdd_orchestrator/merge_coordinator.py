@@ -16,6 +16,7 @@ from pathlib import Path
 import httpx
 
 from .git_coordinator import GitCoordinator
+from .subprocess_utils import spawn_subprocess
 
 logger = logging.getLogger(__name__)
 
@@ -217,7 +218,7 @@ class MergeCoordinator:
             # Attempt merge with --no-ff
             merge_msg = f"Merge {branch_name}: Phase {phase} task {task_key}"
 
-            proc = await asyncio.create_subprocess_exec(
+            proc = await spawn_subprocess(
                 "git",
                 "merge",
                 "--no-ff",
@@ -233,7 +234,7 @@ class MergeCoordinator:
 
             if proc.returncode == 0:
                 # Get merge commit hash
-                hash_proc = await asyncio.create_subprocess_exec(
+                hash_proc = await spawn_subprocess(
                     "git",
                     "rev-parse",
                     "HEAD",
@@ -258,7 +259,7 @@ class MergeCoordinator:
 
             if conflict_files:
                 # Abort the merge
-                await asyncio.create_subprocess_exec(
+                await spawn_subprocess(
                     "git",
                     "merge",
                     "--abort",
@@ -298,7 +299,7 @@ class MergeCoordinator:
         Returns:
             List of file paths with conflicts.
         """
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "git",
             "diff",
             "--name-only",
@@ -321,7 +322,7 @@ class MergeCoordinator:
         Returns:
             List of matching branch names.
         """
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "git",
             "branch",
             "--list",
@@ -1,20 +1,79 @@
-"""Metrics collection for circuit breaker monitoring.
+"""Metrics collection and Prometheus export.
 
-Provides hooks for collecting and exporting metrics from circuit breakers.
+Provides the MetricsCollector, a registry of metric families in the
+Prometheus data model, with hooks for circuit breaker monitoring.
 Designed for integration with Prometheus, Grafana, or custom dashboards.
+
+A family (counter, gauge or histogram) is registered once with its label
+names; ``family.labels(...)`` returns a handle bound to one set of label
+values. Handles are created on first use and reused afterwards, so code
+on a hot path can look a handle up once and then only pay for an
+increment or a bucket search per observation:
+
+    retries = collector.counter("retries_total", "Retries", ("stage",))
+    green_retries = retries.labels("green")
+    green_retries.inc()
+
+- counters only go up (``inc``)
+- gauges hold the last value set (``set``/``inc``/``dec``)
+- histograms count observations into fixed cumulative buckets and keep
+  their sum and count, exported as ``_bucket``/``_sum``/``_count``
+
+The API serves the global collector on GET /metrics. Processes that do
+not run the API (the worker pool) can serve it themselves with
+start_metrics_server().
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import time
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Callable
+from typing import Any, Generic, TypeVar, cast
 
 logger = logging.getLogger(__name__)
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds (in seconds) for latency histograms
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Circuit check latency is recorded in milliseconds
+CHECK_LATENCY_MS_BUCKETS: tuple[float, ...] = (
+    0.1,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    1000.0,
+)
+
+# Circuit recovery takes minutes (seconds)
+RECOVERY_BUCKETS: tuple[float, ...] = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
 
 class MetricType(Enum):
     """Types of metrics collected."""
@@ -24,9 +83,35 @@ class MetricType(Enum):
     HISTOGRAM = "histogram"  # Distribution of values
 
 
+def _format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render_labels(pairs: Sequence[tuple[str, str]]) -> str:
+    """Render ``{name="value",...}`` (empty when there are no labels)."""
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
 @dataclass
 class MetricValue:
-    """A single metric value with metadata."""
+    """A snapshot of one labelled series.
+
+    For histograms ``value`` is the sum of the observations, ``count`` the
+    number of observations and ``buckets`` the cumulative count at each
+    upper bound (the last bound is +Inf).
+    """
 
     name: str
     value: float
@@ -34,14 +119,22 @@ class MetricValue:
     labels: dict[str, str] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
     description: str = ""
+    count: int = 0
+    buckets: tuple[tuple[float, int], ...] = ()
 
     def to_prometheus(self) -> str:
         """Format as Prometheus exposition format."""
-        label_str = ""
-        if self.labels:
-            pairs = [f'{k}="{v}"' for k, v in self.labels.items()]
-            label_str = "{" + ",".join(pairs) + "}"
-        return f"{self.name}{label_str} {self.value}"
+        pairs = list(self.labels.items())
+        if self.metric_type is not MetricType.HISTOGRAM:
+            return f"{self.name}{_render_labels(pairs)} {_format_value(self.value)}"
+        label_str = _render_labels(pairs)
+        lines = [
+            f"{self.name}_bucket{_render_labels([*pairs, ('le', _format_value(bound))])} {n}"
+            for bound, n in self.buckets
+        ]
+        lines.append(f"{self.name}_sum{label_str} {_format_value(self.value)}")
+        lines.append(f"{self.name}_count{label_str} {self.count}")
+        return "\n".join(lines)
 
 
 @dataclass
@@ -61,26 +154,351 @@ class CircuitMetrics:
     extensions_count: int
 
 
+class _Series:
+    """One labelled series of a family (base for the handle types)."""
+
+    __slots__ = ("_family", "_label_str", "_label_values")
+
+    def __init__(self, family: MetricFamily[Any], label_values: tuple[str, ...]) -> None:
+        self._family = family
+        self._label_values = label_values
+        # Rendered once; export reuses it for every scrape
+        self._label_str = _render_labels(list(zip(family.label_names, label_values)))
+
+    @property
+    def labels(self) -> dict[str, str]:
+        """Label names mapped to this series' values."""
+        return dict(zip(self._family.label_names, self._label_values))
+
+    def _notify(self) -> None:
+        if self._family._callbacks:
+            self._family._notify(self.snapshot())
+
+    def snapshot(self) -> MetricValue:
+        """Return the series' current value."""
+        raise NotImplementedError
+
+    def _render(self, lines: list[str]) -> None:
+        raise NotImplementedError
+
+
+class CounterHandle(_Series):
+    """A monotonically increasing count."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, family: MetricFamily[Any], label_values: tuple[str, ...]) -> None:
+        super().__init__(family, label_values)
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add ``amount`` (must not be negative)."""
+        if amount < 0:
+            raise ValueError(f"Counter {self._family.name} cannot decrease")
+        self.value += amount
+        self._notify()
+
+    def snapshot(self) -> MetricValue:
+        """Return the counter's current total."""
+        return self._family._value(self.labels, self.value)
+
+    def _render(self, lines: list[str]) -> None:
+        lines.append(f"{self._family.name}{self._label_str} {_format_value(self.value)}")
+
+
+class GaugeHandle(_Series):
+    """A value that can go up and down."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, family: MetricFamily[Any], label_values: tuple[str, ...]) -> None:
+        super().__init__(family, label_values)
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge to ``value``."""
+        self.value = value
+        self._notify()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add ``amount`` to the gauge."""
+        self.value += amount
+        self._notify()
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Subtract ``amount`` from the gauge."""
+        self.value -= amount
+        self._notify()
+
+    def snapshot(self) -> MetricValue:
+        """Return the gauge's current value."""
+        return self._family._value(self.labels, self.value)
+
+    def _render(self, lines: list[str]) -> None:
+        lines.append(f"{self._family.name}{self._label_str} {_format_value(self.value)}")
+
+
+class HistogramHandle(_Series):
+    """Observations counted into fixed buckets, with their sum and count."""
+
+    __slots__ = ("_bounds", "_counts", "count", "sum")
+
+    def __init__(self, family: MetricFamily[Any], label_values: tuple[str, ...]) -> None:
+        super().__init__(family, label_values)
+        self._bounds = family.buckets
+        # One slot per bound plus the +Inf overflow; made cumulative on export
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        self._notify()
+
+    def cumulative_buckets(self) -> tuple[tuple[float, int], ...]:
+        """Return (upper bound, observations <= bound) pairs, ending at +Inf."""
+        total = 0
+        result: list[tuple[float, int]] = []
+        for bound, n in zip((*self._bounds, math.inf), self._counts):
+            total += n
+            result.append((bound, total))
+        return tuple(result)
+
+    def snapshot(self) -> MetricValue:
+        """Return the histogram's buckets, sum and count."""
+        value = self._family._value(self.labels, self.sum)
+        value.count = self.count
+        value.buckets = self.cumulative_buckets()
+        return value
+
+    def _render(self, lines: list[str]) -> None:
+        name = self._family.name
+        prefix = self._label_str[:-1] + "," if self._label_str else "{"
+        for bound, n in self.cumulative_buckets():
+            lines.append(f'{name}_bucket{prefix}le="{_format_value(bound)}"}} {n}')
+        lines.append(f"{name}_sum{self._label_str} {_format_value(self.sum)}")
+        lines.append(f"{name}_count{self._label_str} {self.count}")
+
+
+H = TypeVar("H", bound=_Series)
+
+
+class MetricFamily(Generic[H]):
+    """A named metric and its labelled series."""
+
+    def __init__(
+        self,
+        name: str,
+        metric_type: MetricType,
+        handle_type: type[H],
+        description: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...],
+        callbacks: list[Callable[[MetricValue], None]],
+    ) -> None:
+        self.name = name
+        self.metric_type = metric_type
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        self._callbacks = callbacks
+        self._handle_type = handle_type
+        self._series: dict[tuple[str, ...], H] = {}
+        if not label_names:
+            # Unlabelled series exist (at zero) from registration
+            self.labels()
+
+    def labels(self, *values: str, **labels: str) -> H:
+        """Return the handle for one set of label values.
+
+        Values are given positionally in ``label_names`` order (the fast
+        path) or by name.
+
+        Raises:
+            ValueError: If the label names or count do not match.
+        """
+        if labels:
+            if values or set(labels) != set(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}")
+            values = tuple(labels[name] for name in self.label_names)
+        handle = self._series.get(values)
+        if handle is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}")
+            handle = self._handle_type(self, values)
+            self._series[values] = handle
+        return handle
+
+    def series(self) -> list[H]:
+        """Return every series, in creation order."""
+        return list(self._series.values())
+
+    def _value(self, labels: dict[str, str], value: float) -> MetricValue:
+        return MetricValue(
+            name=self.name,
+            value=value,
+            metric_type=self.metric_type,
+            labels=labels,
+            description=self.description,
+        )
+
+    def _notify(self, metric: MetricValue) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(metric)
+            except Exception as e:
+                logger.error("Metrics callback error: %s", e)
+
+    def _render(self, lines: list[str]) -> None:
+        if not self._series:
+            return
+        if self.description:
+            lines.append(f"# HELP {self.name} {self.description}")
+        lines.append(f"# TYPE {self.name} {self.metric_type.value}")
+        for handle in self._series.values():
+            handle._render(lines)
+
+
 class MetricsCollector:
     """
-    Collects metrics from circuit breakers for monitoring.
+    Collects metrics for monitoring and exports them for Prometheus.
 
     Provides hooks for:
     - State change events
     - Failure/success counts
     - Recovery timing
     - Aggregated health status
+
+    Other components register their own families with counter(),
+    gauge() and histogram().
     """
 
     def __init__(self) -> None:
-        self._metrics: dict[str, MetricValue] = {}
+        self._families: dict[str, MetricFamily[Any]] = {}
         self._callbacks: list[Callable[[MetricValue], None]] = []
         self._state_timers: dict[str, dict[str, float]] = {}  # circuit_id -> state -> timestamp
 
+        self._state_duration = self.gauge(
+            "circuit_breaker_state_duration_seconds",
+            "Time spent in the previous state",
+            ("level", "identifier", "state"),
+        )
+        self._state_changes = self.counter(
+            "circuit_breaker_state_changes_total",
+            "Total state changes",
+            ("level", "identifier", "from", "to"),
+        )
+        self._state = self.gauge(
+            "circuit_breaker_state",
+            "Current state (0=closed, 1=open, 2=half_open)",
+            ("level", "identifier"),
+        )
+        self._failures = self.counter(
+            "circuit_breaker_failures_total",
+            "Total failures recorded",
+            ("level", "identifier", "error_type"),
+        )
+        self._successes = self.counter(
+            "circuit_breaker_successes_total",
+            "Total successes recorded",
+            ("level", "identifier"),
+        )
+        self._recovery_duration = self.histogram(
+            "circuit_breaker_recovery_duration_seconds",
+            "Time to recover from open state",
+            ("level", "identifier"),
+            buckets=RECOVERY_BUCKETS,
+        )
+        self._recoveries = self.counter(
+            "circuit_breaker_recoveries_total",
+            "Total recoveries",
+            ("level", "identifier"),
+        )
+        self._check_latency = self.histogram(
+            "circuit_breaker_check_latency_ms",
+            "Latency of check_and_allow calls",
+            ("level", "identifier"),
+            buckets=CHECK_LATENCY_MS_BUCKETS,
+        )
+
+    # =========================================================================
+    # Registration
+    # =========================================================================
+
+    def counter(
+        self, name: str, description: str = "", labels: Sequence[str] = ()
+    ) -> MetricFamily[CounterHandle]:
+        """Register (or return the existing) counter family."""
+        return self._register(name, MetricType.COUNTER, CounterHandle, description, labels, ())
+
+    def gauge(
+        self, name: str, description: str = "", labels: Sequence[str] = ()
+    ) -> MetricFamily[GaugeHandle]:
+        """Register (or return the existing) gauge family."""
+        return self._register(name, MetricType.GAUGE, GaugeHandle, description, labels, ())
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> MetricFamily[HistogramHandle]:
+        """Register (or return the existing) histogram family.
+
+        Args:
+            name: Metric name (without the _bucket/_sum/_count suffixes).
+            description: HELP text.
+            labels: Label names.
+            buckets: Increasing upper bounds; +Inf is implied.
+        """
+        bounds = tuple(float(b) for b in buckets if not math.isinf(b))
+        if list(bounds) != sorted(set(bounds)):
+            raise ValueError(f"Histogram {name} buckets must be strictly increasing")
+        return self._register(
+            name, MetricType.HISTOGRAM, HistogramHandle, description, labels, bounds
+        )
+
+    def _register(
+        self,
+        name: str,
+        metric_type: MetricType,
+        handle_type: type[H],
+        description: str,
+        labels: Sequence[str],
+        buckets: tuple[float, ...],
+    ) -> MetricFamily[H]:
+        label_names = tuple(labels)
+        family = self._families.get(name)
+        if family is not None:
+            if family.metric_type is not metric_type or family.label_names != label_names:
+                raise ValueError(
+                    f"Metric {name} already registered as {family.metric_type.value} "
+                    f"with labels {family.label_names}"
+                )
+            return cast(MetricFamily[H], family)
+        created = MetricFamily(
+            name, metric_type, handle_type, description, label_names, buckets, self._callbacks
+        )
+        self._families[name] = created
+        return created
+
     def register_callback(self, callback: Callable[[MetricValue], None]) -> None:
-        """Register a callback for metric updates."""
+        """Register a callback for metric updates.
+
+        Callbacks receive a snapshot of the updated series after every
+        update. Hot paths pay for building it only while a callback is
+        registered.
+        """
         self._callbacks.append(callback)
 
+    # =========================================================================
+    # Circuit breaker hooks
+    # =========================================================================
+
     def record_state_change(
         self,
         level: str,
@@ -95,131 +513,52 @@ class MetricsCollector:
         # Track time in previous state
         if circuit_id in self._state_timers and from_state in self._state_timers[circuit_id]:
             duration = now - self._state_timers[circuit_id][from_state]
-            self._emit_metric(
-                name="circuit_breaker_state_duration_seconds",
-                value=duration,
-                metric_type=MetricType.GAUGE,
-                labels={"level": level, "identifier": identifier, "state": from_state},
-                description=f"Time spent in {from_state} state",
-            )
+            self._state_duration.labels(level, identifier, from_state).set(duration)
 
         # Start timer for new state
         if circuit_id not in self._state_timers:
             self._state_timers[circuit_id] = {}
         self._state_timers[circuit_id][to_state] = now
 
-        # Emit state change counter
-        self._emit_metric(
-            name="circuit_breaker_state_changes_total",
-            value=1,
-            metric_type=MetricType.COUNTER,
-            labels={
-                "level": level,
-                "identifier": identifier,
-                "from": from_state,
-                "to": to_state,
-            },
-            description="Total state changes",
-        )
+        self._state_changes.labels(level, identifier, from_state, to_state).inc()
 
         # Update current state gauge
         state_values = {"closed": 0, "open": 1, "half_open": 2}
-        self._emit_metric(
-            name="circuit_breaker_state",
-            value=state_values.get(to_state, -1),
-            metric_type=MetricType.GAUGE,
-            labels={"level": level, "identifier": identifier},
-            description="Current state (0=closed, 1=open, 2=half_open)",
-        )
+        self._state.labels(level, identifier).set(state_values.get(to_state, -1))
 
     def record_failure(self, level: str, identifier: str, error_type: str = "unknown") -> None:
         """Record a failure event."""
-        self._emit_metric(
-            name="circuit_breaker_failures_total",
-            value=1,
-            metric_type=MetricType.COUNTER,
-            labels={"level": level, "identifier": identifier, "error_type": error_type},
-            description="Total failures recorded",
-        )
+        self._failures.labels(level, identifier, error_type).inc()
 
     def record_success(self, level: str, identifier: str) -> None:
         """Record a success event."""
-        self._emit_metric(
-            name="circuit_breaker_successes_total",
-            value=1,
-            metric_type=MetricType.COUNTER,
-            labels={"level": level, "identifier": identifier},
-            description="Total successes recorded",
-        )
+        self._successes.labels(level, identifier).inc()
 
     def record_recovery(self, level: str, identifier: str, duration_seconds: float) -> None:
         """Record a successful recovery (open -> closed)."""
-        self._emit_metric(
-            name="circuit_breaker_recovery_duration_seconds",
-            value=duration_seconds,
-            metric_type=MetricType.HISTOGRAM,
-            labels={"level": level, "identifier": identifier},
-            description="Time to recover from open state",
-        )
-        self._emit_metric(
-            name="circuit_breaker_recoveries_total",
-            value=1,
-            metric_type=MetricType.COUNTER,
-            labels={"level": level, "identifier": identifier},
-            description="Total recoveries",
-        )
+        self._recovery_duration.labels(level, identifier).observe(duration_seconds)
+        self._recoveries.labels(level, identifier).inc()
 
     def record_check_latency(self, level: str, identifier: str, latency_ms: float) -> None:
         """Record circuit check latency."""
-        self._emit_metric(
-            name="circuit_breaker_check_latency_ms",
-            value=latency_ms,
-            metric_type=MetricType.HISTOGRAM,
-            labels={"level": level, "identifier": identifier},
-            description="Latency of check_and_allow calls",
-        )
+        self._check_latency.labels(level, identifier).observe(latency_ms)
+
+    # =========================================================================
+    # Export
+    # =========================================================================
 
     def get_all_metrics(self) -> list[MetricValue]:
-        """Get all current metrics."""
-        return list(self._metrics.values())
+        """Get a snapshot of every series."""
+        return [
+            handle.snapshot() for family in self._families.values() for handle in family.series()
+        ]
 
     def export_prometheus(self) -> str:
-        """Export all metrics in Prometheus format."""
-        lines = []
-        for metric in self._metrics.values():
-            if metric.description:
-                lines.append(f"# HELP {metric.name} {metric.description}")
-            lines.append(f"# TYPE {metric.name} {metric.metric_type.value}")
-            lines.append(metric.to_prometheus())
-        return "\n".join(lines)
-
-    def _emit_metric(
-        self,
-        name: str,
-        value: float,
-        metric_type: MetricType,
-        labels: dict[str, str],
-        description: str = "",
-    ) -> None:
-        """Emit a metric and notify callbacks."""
-        metric = MetricValue(
-            name=name,
-            value=value,
-            metric_type=metric_type,
-            labels=labels,
-            description=description,
-        )
-
-        # Store with unique key
-        key = f"{name}:{':'.join(f'{k}={v}' for k, v in sorted(labels.items()))}"
-        self._metrics[key] = metric
-
-        # Notify callbacks
-        for callback in self._callbacks:
-            try:
-                callback(metric)
-            except Exception as e:
-                logger.error("Metrics callback error: %s", e)
+        """Export all metrics in Prometheus text exposition format."""
+        lines: list[str] = []
+        for family in self._families.values():
+            family._render(lines)
+        return "\n".join(lines) + "\n" if lines else ""
 
 
 # Global metrics collector instance
@@ -238,3 +577,57 @@ def reset_metrics_collector() -> None:
     """Reset the global metrics collector (for testing)."""
     global _collector
     _collector = None
+
+
+async def start_metrics_server(
+    port: int,
+    host: str = "127.0.0.1",
+    collector: MetricsCollector | None = None,
+) -> asyncio.Server:
+    """Serve ``GET /metrics`` in Prometheus text format on host:port.
+
+    A minimal HTTP/1.0 responder for scraping a process that does not
+    run the API. Without ``collector`` it serves whatever the global
+    collector is at request time. Any other request gets a 404.
+
+    Args:
+        port: TCP port to listen on (0 picks a free port).
+        host: Interface to bind.
+        collector: Collector to export instead of the global one.
+
+    Returns:
+        The listening server; close() and wait_closed() it to stop.
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            # Drain the headers; the request has no body
+            while (await asyncio.wait_for(reader.readline(), timeout=5.0)).strip():
+                pass
+            method, _, rest = request_line.decode("latin-1").partition(" ")
+            path = rest.split(" ", 1)[0].split("?", 1)[0]
+            if method in ("GET", "HEAD") and path == "/metrics":
+                status = "200 OK"
+                content_type = PROMETHEUS_CONTENT_TYPE
+                body = (collector or get_metrics_collector()).export_prometheus().encode()
+            else:
+                status = "404 Not Found"
+                content_type = "text/plain; charset=utf-8"
+                body = b"Not Found\n"
+            head = (
+                f"HTTP/1.0 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+            )
+            writer.write(head.encode("latin-1") + (b"" if method == "HEAD" else body))
+            await writer.drain()
+        except (TimeoutError, ConnectionError, UnicodeDecodeError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info(
+        "Serving metrics on http://%s:%d/metrics", host, server.sockets[0].getsockname()[1]
+    )
+    return server
@@ -42,7 +42,7 @@ class Stage(Enum):
     RE_VERIFY = "re_verify"
 
 
-@dataclass
+@dataclass(slots=True)
 class StageResult:
     """Result from executing a TDD pipeline stage.
 
@@ -83,7 +83,7 @@ class RefactorResult:
         return self.files_refactored > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifyResult:
     """Result from code verification checks.
 
@@ -0,0 +1,122 @@
+"""Built-in instrumentation for the TDD pipeline hot paths.
+
+Registers these families on the global MetricsCollector, so they are
+exported wherever it is (GET /metrics on the API, or the exporter that
+``tdd-orchestrator run --metrics-port`` starts inside the worker process):
+
+- ``tdd_stage_duration_seconds{stage,model}``: wall time of each pipeline
+  stage, from the SDK call through result verification
+- ``tdd_verify_tool_duration_seconds{tool}``: pytest, ruff, mypy, AST
+  checks and task verify commands
+- ``tdd_task_queue_wait_seconds``: time from a worker claiming a task to
+  its pipeline starting (branch setup, heartbeat, stash guard)
+- ``tdd_db_write_lock_wait_seconds``: time spent waiting for the
+  database write lock, per acquisition
+- ``tdd_subprocess_spawns_total{program}``: subprocesses started
+- ``tdd_green_retries_total{model}``: GREEN attempts after the first
+- ``tdd_green_attempts{outcome}``: GREEN attempts used per task
+
+Handles are bound to one collector. get_pipeline_metrics() rebinds them
+when the global collector is replaced (reset_metrics_collector()).
+"""
+
+from __future__ import annotations
+
+from .metrics import MetricsCollector, get_metrics_collector
+
+# Stages are LLM sessions: seconds to tens of minutes
+STAGE_BUCKETS: tuple[float, ...] = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0)
+
+# Verification tools: sub-second lint runs to minute-long test suites
+TOOL_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+QUEUE_WAIT_BUCKETS: tuple[float, ...] = (
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# An uncontended acquisition lands in the first bucket
+LOCK_WAIT_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    5.0,
+)
+
+# max_green_attempts is bounded to 1-10 (see CONFIG_BOUNDS)
+GREEN_ATTEMPT_BUCKETS: tuple[float, ...] = (1.0, 2.0, 3.0, 4.0, 5.0, 10.0)
+
+
+class PipelineMetrics:
+    """Pipeline metric families registered on one collector."""
+
+    def __init__(self, collector: MetricsCollector) -> None:
+        """Register the pipeline families on ``collector``."""
+        self.collector = collector
+        self.stage_duration = collector.histogram(
+            "tdd_stage_duration_seconds",
+            "Wall time of a pipeline stage (SDK call and verification)",
+            ("stage", "model"),
+            buckets=STAGE_BUCKETS,
+        )
+        self.verify_tool_duration = collector.histogram(
+            "tdd_verify_tool_duration_seconds",
+            "Wall time of a verification tool run",
+            ("tool",),
+            buckets=TOOL_BUCKETS,
+        )
+        self.queue_wait = collector.histogram(
+            "tdd_task_queue_wait_seconds",
+            "Time from claiming a task to starting its pipeline",
+            buckets=QUEUE_WAIT_BUCKETS,
+        ).labels()
+        self.write_lock_wait = collector.histogram(
+            "tdd_db_write_lock_wait_seconds",
+            "Time spent waiting for the database write lock",
+            buckets=LOCK_WAIT_BUCKETS,
+        ).labels()
+        self.subprocess_spawns = collector.counter(
+            "tdd_subprocess_spawns_total",
+            "Subprocesses started",
+            ("program",),
+        )
+        self.green_retries = collector.counter(
+            "tdd_green_retries_total",
+            "GREEN attempts after the first",
+            ("model",),
+        )
+        self.green_attempts = collector.histogram(
+            "tdd_green_attempts",
+            "GREEN attempts used per task",
+            ("outcome",),
+            buckets=GREEN_ATTEMPT_BUCKETS,
+        )
+
+
+_pipeline_metrics: PipelineMetrics | None = None
+
+
+def get_pipeline_metrics() -> PipelineMetrics:
+    """Get the pipeline metrics bound to the global collector."""
+    global _pipeline_metrics
+    collector = get_metrics_collector()
+    if _pipeline_metrics is None or _pipeline_metrics.collector is not collector:
+        _pipeline_metrics = PipelineMetrics(collector)
+    return _pipeline_metrics
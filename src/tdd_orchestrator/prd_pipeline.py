@@ -10,7 +10,6 @@ with optional GitHub PR creation. Chains existing components:
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import logging
 import re
@@ -22,6 +21,7 @@ from .database import OrchestratorDB, get_db, reset_db
 from .decompose_spec import run_decomposition
 from .git_coordinator import GitCoordinator
 from .project_config import setup_project_context
+from .subprocess_utils import spawn_subprocess
 from .worker_pool import PoolResult, WorkerConfig, WorkerPool
 
 logger = logging.getLogger(__name__)
@@ -112,7 +112,7 @@ async def _check_gh_available() -> bool:
         True if gh is installed and runnable.
     """
     try:
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "gh", "--version",
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -154,7 +154,7 @@ async def _create_pull_request(
         "--head", branch,
     ]
     try:
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             *cmd,
             cwd=base_dir,
             stdout=subprocess.PIPE,
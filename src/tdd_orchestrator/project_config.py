@@ -20,6 +20,7 @@ _DB_FILE = "orchestrator.db"
 
 _GITIGNORE_CONTENT = """\
 orchestrator.db
+symbols.db
 *.db-journal
 *.db-wal
 *.db-shm
@@ -0,0 +1,169 @@
+"""Token-aware prompt assembly for TDD pipeline stages.
+
+PromptBuilder stage methods fill a template with a dozen sections (test and
+impl source, sibling tests, conftest, test output, issue lists). Each
+section is individually capped in characters, but nothing bounds the total,
+so prompts on large repos grow well past what a stage needs.
+
+fit_prompt() renders a template under a per-stage/model token budget. When
+the rendered prompt is over budget, optional context is degraded in the
+fixed DEGRADATION_ORDER: nice-to-have sections are dropped first, then the
+bulky required sections are shrunk (never dropped). Token counts before and
+after budgeting are logged for every budgeted invocation.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from .decomposition.utils import estimate_token_count
+
+if TYPE_CHECKING:
+    from .models import Stage
+
+logger = logging.getLogger(__name__)
+
+# Default token budget per stage (prompt only, excluding tool turns)
+STAGE_TOKEN_BUDGETS: dict[str, int] = {
+    "red": 12000,
+    "red_fix": 8000,
+    "green": 16000,
+    "verify": 4000,
+    "fix": 12000,
+    "re_verify": 4000,
+    "refactor": 12000,
+}
+
+DEFAULT_TOKEN_BUDGET = 12000
+
+# Budget multiplier by model family (matched as a substring of the model ID)
+MODEL_BUDGET_SCALE: dict[str, float] = {
+    "haiku": 0.75,
+    "sonnet": 1.0,
+    "opus": 1.25,
+}
+
+# Sections degraded in this order when a prompt exceeds its budget.
+# (section name, droppable): droppable sections are removed outright,
+# the rest are shrunk down to MIN_SHRUNK_SECTION_CHARS at most.
+DEGRADATION_ORDER: tuple[tuple[str, bool], ...] = (
+    ("sibling_tests_section", True),
+    ("conftest_section", True),
+    ("hints_section", True),
+    ("existing_api_section", True),
+    ("truncated_test_output", False),
+    ("truncated_output", False),
+    ("truncated_failure", False),
+    ("existing_impl_section", False),
+    ("impl_content_section", False),
+    ("test_content_section", False),
+    ("test_contract_section", False),
+    ("issues_text", False),
+)
+
+# Shrunk sections keep at least this many characters
+MIN_SHRUNK_SECTION_CHARS = 400
+
+_TRUNCATION_MARKER = "# ... (truncated to fit prompt budget)"
+
+# estimate_token_count() uses ~4 characters per token
+_CHARS_PER_TOKEN = 4
+
+
+def resolve_token_budget(stage: Stage | str, model: str | None = None) -> int:
+    """Return the prompt token budget for a stage and model.
+
+    Args:
+        stage: Pipeline stage (enum or its string value).
+        model: Model ID; its family scales the stage budget.
+
+    Returns:
+        Token budget for the assembled prompt.
+    """
+    stage_name = stage if isinstance(stage, str) else stage.value
+    budget = STAGE_TOKEN_BUDGETS.get(stage_name, DEFAULT_TOKEN_BUDGET)
+    if model:
+        for family, scale in MODEL_BUDGET_SCALE.items():
+            if family in model:
+                return int(budget * scale)
+    return budget
+
+
+def shrink_section(text: str, max_chars: int) -> str:
+    """Truncate a section to about ``max_chars``, keeping code fences balanced.
+
+    Cuts at a line boundary, appends a truncation marker, and closes any
+    markdown code fence left open by the cut.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars)
+    head = text[: cut if cut > 0 else max_chars]
+    shrunk = f"{head}\n{_TRUNCATION_MARKER}\n"
+    if shrunk.count("```") % 2 == 1:
+        shrunk += "```\n"
+    return shrunk
+
+
+def fit_prompt(
+    template: str,
+    stage: str,
+    token_budget: int | None,
+    **sections: str | int,
+) -> str:
+    """Render ``template`` with ``sections``, degrading sections to fit a budget.
+
+    Args:
+        template: A ``str.format`` prompt template.
+        stage: Stage name used in log messages.
+        token_budget: Maximum estimated tokens, or None to render unbudgeted.
+        **sections: Template fields. Only names listed in DEGRADATION_ORDER
+            are ever modified.
+
+    Returns:
+        The rendered prompt.
+    """
+    prompt = template.format(**sections)
+    if token_budget is None:
+        return prompt
+
+    before = estimate_token_count(prompt)
+    tokens = before
+    degraded: list[str] = []
+
+    for name, droppable in DEGRADATION_ORDER:
+        if tokens <= token_budget:
+            break
+        value = sections.get(name)
+        if not isinstance(value, str) or not value:
+            continue
+        if droppable:
+            sections[name] = ""
+        else:
+            overflow_chars = (tokens - token_budget) * _CHARS_PER_TOKEN
+            target = max(len(value) - overflow_chars, MIN_SHRUNK_SECTION_CHARS)
+            shrunk = shrink_section(value, target)
+            if len(shrunk) >= len(value):
+                continue
+            sections[name] = shrunk
+        degraded.append(name)
+        prompt = template.format(**sections)
+        tokens = estimate_token_count(prompt)
+
+    logger.info(
+        "Prompt budget for %s: %d -> %d tokens (budget %d%s)",
+        stage,
+        before,
+        tokens,
+        token_budget,
+        f", degraded: {', '.join(degraded)}" if degraded else "",
+    )
+    if tokens > token_budget:
+        logger.warning(
+            "Prompt for %s still over budget after degradation (%d > %d tokens)",
+            stage,
+            tokens,
+            token_budget,
+        )
+    return prompt
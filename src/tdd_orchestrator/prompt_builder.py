@@ -18,6 +18,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from .prompt_budget import fit_prompt, resolve_token_budget
 from .prompt_enrichment import (
     MAX_HINTS_CONTENT,
     MAX_IMPL_FILE_CONTENT,
@@ -83,7 +84,11 @@ class PromptBuilder:
     _extract_impl_signatures = staticmethod(extract_impl_signatures)
 
     @staticmethod
-    def red(task: dict[str, Any], base_dir: Path | None = None) -> str:
+    def red(
+        task: dict[str, Any],
+        base_dir: Path | None = None,
+        token_budget: int | None = None,
+    ) -> str:
         """Generate prompt for RED phase (write failing tests)."""
         criteria = parse_criteria(task.get("acceptance_criteria"))
         criteria_text = (
@@ -134,7 +139,10 @@ class PromptBuilder:
                 f"{escape_braces(hints_text)}\n"
             )
 
-        return RED_PROMPT_TEMPLATE.format(
+        return fit_prompt(
+            RED_PROMPT_TEMPLATE,
+            "red",
+            token_budget,
             goal=escape_braces(task.get("goal", "No goal specified")),
             criteria_text=escape_braces(criteria_text),
             module_exports_section=module_exports_section,
@@ -151,7 +159,12 @@ class PromptBuilder:
         )
 
     @staticmethod
-    def green(task: dict[str, Any], test_output: str, base_dir: Path | None = None) -> str:
+    def green(
+        task: dict[str, Any],
+        test_output: str,
+        base_dir: Path | None = None,
+        token_budget: int | None = None,
+    ) -> str:
         """Generate prompt for GREEN phase (write implementation)."""
         truncated_output = test_output[:MAX_TEST_OUTPUT] if test_output else "No test output available"
 
@@ -228,7 +241,10 @@ class PromptBuilder:
         sibling_tests_section = discover_sibling_tests(base_dir, test_file)
         conftest_section = read_conftest(base_dir, test_file)
 
-        return GREEN_PROMPT_TEMPLATE.format(
+        return fit_prompt(
+            GREEN_PROMPT_TEMPLATE,
+            "green",
+            token_budget,
             goal=escape_braces(task.get("goal", "No goal specified")),
             test_file=escape_braces(test_file),
             truncated_output=escape_braces(truncated_output),
@@ -251,6 +267,7 @@ class PromptBuilder:
         attempt: int,
         previous_failure: str,
         base_dir: Path | None = None,
+        token_budget: int | None = None,
     ) -> str:
         """Build GREEN prompt for retry attempt with failure context."""
         impl_file = task.get("impl_file", "")
@@ -299,7 +316,10 @@ class PromptBuilder:
         sibling_tests_section = discover_sibling_tests(base_dir, test_file)
         conftest_section = read_conftest(base_dir, test_file)
 
-        return GREEN_RETRY_TEMPLATE.format(
+        return fit_prompt(
+            GREEN_RETRY_TEMPLATE,
+            "green",
+            token_budget,
             attempt=attempt,
             prev_attempt=attempt - 1,
             truncated_failure=escape_braces(truncated_failure),
@@ -329,6 +349,7 @@ class PromptBuilder:
         task: dict[str, Any],
         issues: list[dict[str, Any]],
         base_dir: Path | None = None,
+        token_budget: int | None = None,
     ) -> str:
         """Generate prompt for FIX phase (address issues)."""
         issues_parts = []
@@ -384,7 +405,10 @@ class PromptBuilder:
         # Conftest
         conftest_section = read_conftest(base_dir, test_file)
 
-        return FIX_PROMPT_TEMPLATE.format(
+        return fit_prompt(
+            FIX_PROMPT_TEMPLATE,
+            "fix",
+            token_budget,
             goal=escape_braces(task.get("goal", "No goal specified")),
             impl_file=escape_braces(impl_file),
             issues_text=escape_braces(issues_text),
@@ -401,6 +425,7 @@ class PromptBuilder:
         task: dict[str, Any],
         issues: list[dict[str, Any]],
         base_dir: Path | None = None,
+        token_budget: int | None = None,
     ) -> str:
         """Generate prompt for RED_FIX phase (fix static review issues in tests)."""
         issues_text = "\n".join(
@@ -429,7 +454,10 @@ class PromptBuilder:
         )
         existing_api_section = extract_impl_signatures(base_dir, impl_file)
 
-        return RED_FIX_PROMPT_TEMPLATE.format(
+        return fit_prompt(
+            RED_FIX_PROMPT_TEMPLATE,
+            "red_fix",
+            token_budget,
             task_key=escape_braces(task.get("task_key", "UNKNOWN")),
             test_file=escape_braces(task.get("test_file", "test_file.py")),
             issues_text=escape_braces(issues_text),
@@ -446,6 +474,7 @@ class PromptBuilder:
         task: dict[str, Any],
         refactor_reasons: list[str],
         base_dir: Path | None = None,
+        token_budget: int | None = None,
     ) -> str:
         """Generate prompt for REFACTOR phase (code quality cleanup)."""
         reasons_text = (
@@ -494,7 +523,10 @@ class PromptBuilder:
                 "\nRefactoring must not change behavior observed by these tests.\n"
             )
 
-        return REFACTOR_PROMPT_TEMPLATE.format(
+        return fit_prompt(
+            REFACTOR_PROMPT_TEMPLATE,
+            "refactor",
+            token_budget,
             title=escape_braces(task.get("title", "Unknown task")),
             task_key=escape_braces(task.get("task_key", "UNKNOWN")),
             impl_file=escape_braces(impl_file),
@@ -509,13 +541,22 @@ class PromptBuilder:
 
     @staticmethod
     def build(stage: Stage, task: dict[str, Any], **kwargs: Any) -> str:
-        """Dispatcher method to build prompts for any stage."""
+        """Dispatcher method to build prompts for any stage.
+
+        Prompts are assembled under the token budget for the stage and the
+        ``model`` kwarg (see prompt_budget.resolve_token_budget). Pass an
+        explicit ``token_budget`` to override it.
+        """
         from .models import Stage as StageEnum
 
         base_dir: Path | None = kwargs.pop("base_dir", None)
+        model: str | None = kwargs.pop("model", None)
+        token_budget: int = kwargs.pop("token_budget", None) or resolve_token_budget(
+            stage, model
+        )
 
         if stage == StageEnum.RED:
-            return PromptBuilder.red(task, base_dir=base_dir)
+            return PromptBuilder.red(task, base_dir=base_dir, token_budget=token_budget)
 
         if stage == StageEnum.GREEN:
             test_output = kwargs.get("test_output")
@@ -527,9 +568,12 @@ class PromptBuilder:
             if attempt > 1:
                 previous_failure = kwargs.get("previous_failure", "")
                 return PromptBuilder.build_green_retry(
-                    task, test_output, attempt, previous_failure, base_dir=base_dir,
+                    task, test_output, attempt, previous_failure,
+                    base_dir=base_dir, token_budget=token_budget,
                 )
-            return PromptBuilder.green(task, test_output, base_dir=base_dir)
+            return PromptBuilder.green(
+                task, test_output, base_dir=base_dir, token_budget=token_budget,
+            )
 
         if stage == StageEnum.VERIFY or stage == StageEnum.RE_VERIFY:
             return PromptBuilder.verify(task)
@@ -539,21 +583,25 @@ class PromptBuilder:
             if issues is None:
                 msg = "FIX stage requires 'issues' argument"
                 raise ValueError(msg)
-            return PromptBuilder.fix(task, issues, base_dir=base_dir)
+            return PromptBuilder.fix(task, issues, base_dir=base_dir, token_budget=token_budget)
 
         if stage == StageEnum.REFACTOR:
             refactor_reasons = kwargs.get("refactor_reasons")
             if refactor_reasons is None:
                 msg = "REFACTOR stage requires 'refactor_reasons' argument"
                 raise ValueError(msg)
-            return PromptBuilder.refactor(task, refactor_reasons, base_dir=base_dir)
+            return PromptBuilder.refactor(
+                task, refactor_reasons, base_dir=base_dir, token_budget=token_budget,
+            )
 
         if stage == StageEnum.RED_FIX:
             issues = kwargs.get("issues")
             if issues is None:
                 msg = "RED_FIX stage requires 'issues' argument"
                 raise ValueError(msg)
-            return PromptBuilder.red_fix(task, issues, base_dir=base_dir)
+            return PromptBuilder.red_fix(
+                task, issues, base_dir=base_dir, token_budget=token_budget,
+            )
 
         msg = f"Unsupported stage: {stage}"
         raise ValueError(msg)
@@ -0,0 +1,172 @@
+"""Stat-keyed snapshot cache for prompt enrichment file I/O.
+
+Every stage prompt re-reads the same handful of files: the task's test and
+impl files, up to MAX_SIBLING_FILES sibling tests, and conftest.py files up
+the tree. On GREEN retries and FIX stages nothing has usually changed since
+the previous prompt, so the reads (and the hint extraction run over them)
+are wasted work.
+
+EnrichmentCache memoizes three things, each keyed on an ``os.stat``
+fingerprint (mtime_ns, size, inode) so a modified file is always re-read:
+
+- File contents (``read_text``)
+- Directory listings filtered by a glob pattern (``list_dir``)
+- Values derived from a file's contents (``derive``), e.g. sibling hints
+
+Stat fingerprints catch almost every change, but a file rewritten within the
+filesystem's timestamp granularity with identical size could be missed. The
+pipeline therefore calls ``invalidate_enrichment_cache()`` after each
+``commit_stage`` so the next stage always starts from a fresh snapshot.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Maximum number of entries kept per cache table (LRU eviction)
+DEFAULT_MAX_ENTRIES = 512
+
+_StatKey = tuple[int, int, int]
+
+
+def _stat_key(path: Path) -> _StatKey:
+    """Return a (mtime_ns, size, inode) fingerprint for ``path``.
+
+    Raises:
+        OSError: If the path cannot be stat'ed (missing, broken symlink, ...).
+    """
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class EnrichmentCache:
+    """LRU cache of file contents, directory listings and derived values.
+
+    All lookups re-stat the target, so a hit costs a single ``stat`` call
+    instead of a read (or a directory scan plus N reads for siblings).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._files: OrderedDict[Path, tuple[_StatKey, str]] = OrderedDict()
+        self._dirs: OrderedDict[tuple[Path, str], tuple[_StatKey, list[Path]]] = OrderedDict()
+        self._derived: OrderedDict[tuple[Path, str], tuple[_StatKey, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, table: OrderedDict[Any, Any], key: Any, value: Any) -> None:
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > self._max_entries:
+            table.popitem(last=False)
+
+    def read_text(self, path: Path) -> str:
+        """Return the UTF-8 contents of ``path``, reading only if it changed.
+
+        Raises:
+            OSError: If the file does not exist or cannot be read.
+        """
+        key = _stat_key(path)
+        cached = self._files.get(path)
+        if cached is not None and cached[0] == key:
+            self.hits += 1
+            self._files.move_to_end(path)
+            return cached[1]
+        self.misses += 1
+        content = path.read_text(encoding="utf-8")
+        self._remember(self._files, path, (key, content))
+        return content
+
+    def list_dir(self, directory: Path, pattern: str) -> list[Path]:
+        """Return sorted paths in ``directory`` matching ``pattern``.
+
+        The listing is reused while the directory's own mtime is unchanged
+        (adding, removing or renaming an entry bumps it).
+
+        Raises:
+            OSError: If the directory cannot be stat'ed.
+        """
+        key = _stat_key(directory)
+        table_key = (directory, pattern)
+        cached = self._dirs.get(table_key)
+        if cached is not None and cached[0] == key:
+            self.hits += 1
+            self._dirs.move_to_end(table_key)
+            return list(cached[1])
+        self.misses += 1
+        entries = sorted(directory.glob(pattern))
+        self._remember(self._dirs, table_key, (key, entries))
+        return list(entries)
+
+    def derive(self, path: Path, kind: str, compute: Callable[[str], T]) -> T:
+        """Return ``compute(contents)`` for ``path``, memoized per file version.
+
+        Args:
+            path: File whose contents feed ``compute``.
+            kind: Namespace for the derived value (e.g. ``"sibling_hints"``).
+            compute: Pure function of the file contents.
+
+        Raises:
+            OSError: If the file does not exist or cannot be read.
+        """
+        key = _stat_key(path)
+        table_key = (path, kind)
+        cached = self._derived.get(table_key)
+        if cached is not None and cached[0] == key:
+            self.hits += 1
+            self._derived.move_to_end(table_key)
+            value: T = cached[1]
+            return value
+        value = compute(self.read_text(path))
+        self._remember(self._derived, table_key, (key, value))
+        return value
+
+    def invalidate(self, base_dir: Path | None = None) -> None:
+        """Drop cached entries, optionally only those under ``base_dir``."""
+        if base_dir is None:
+            self._files.clear()
+            self._dirs.clear()
+            self._derived.clear()
+            return
+        roots = {base_dir, base_dir.resolve()}
+
+        def _under(path: Path) -> bool:
+            return any(path == root or root in path.parents for root in roots)
+
+        for path in [p for p in self._files if _under(p)]:
+            del self._files[path]
+        for dir_key in [k for k in self._dirs if _under(k[0])]:
+            del self._dirs[dir_key]
+        for derived_key in [k for k in self._derived if _under(k[0])]:
+            del self._derived[derived_key]
+
+    def __len__(self) -> int:
+        return len(self._files) + len(self._dirs) + len(self._derived)
+
+
+# Process-wide instance shared by all prompt enrichment helpers
+_cache = EnrichmentCache()
+
+
+def get_enrichment_cache() -> EnrichmentCache:
+    """Return the process-wide enrichment cache."""
+    return _cache
+
+
+def invalidate_enrichment_cache(base_dir: Path | None = None) -> None:
+    """Invalidate the shared enrichment cache.
+
+    Args:
+        base_dir: If given, only entries under this directory are dropped.
+    """
+    _cache.invalidate(base_dir)
+    logger.debug("Prompt enrichment cache invalidated (base_dir=%s)", base_dir)
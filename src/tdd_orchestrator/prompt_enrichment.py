@@ -8,6 +8,9 @@ prompt assembly. This module contains:
 - Sibling test discovery and conftest reading
 - Signature extraction from implementation files
 - Parsing helpers for criteria and module exports
+
+All file reads go through the stat-keyed EnrichmentCache (prompt_cache.py),
+so rebuilding a prompt for an unchanged tree costs only stat calls.
 """
 
 from __future__ import annotations
@@ -16,6 +19,9 @@ import json
 from pathlib import Path
 from typing import Literal
 
+from .prompt_cache import get_enrichment_cache
+from .symbol_index import get_symbol_index
+
 # =============================================================================
 # Named constants (replaces magic numbers across stage methods)
 # =============================================================================
@@ -99,10 +105,8 @@ def read_file_safe(
         file_path.relative_to(base_dir.resolve())
     except (ValueError, OSError):
         return fallback
-    if not file_path.exists():
-        return fallback
     try:
-        raw = file_path.read_text(encoding="utf-8")
+        raw = get_enrichment_cache().read_text(file_path)
         if len(raw) > max_chars:
             return raw[:max_chars] + "\n# ... (truncated)"
         return raw
@@ -151,6 +155,39 @@ def build_code_section(
 # =============================================================================
 
 
+def _extract_sibling_hints(content: str) -> list[str]:
+    """Extract behavioral contract hint lines from a sibling test's source.
+
+    Prioritized extraction: status codes > response assertions > await >
+    imports, capped at MAX_SIBLING_HINT_LINES. Returned lines are already
+    brace-escaped.
+    """
+    status_lines: list[str] = []
+    response_lines: list[str] = []
+    await_lines: list[str] = []
+    import_lines: list[str] = []
+    for line in content.splitlines():
+        stripped = line.strip()
+        if "status_code" in stripped and "==" in stripped:
+            status_lines.append(f"    {stripped}")
+        elif stripped.startswith("assert") and "response." in stripped:
+            response_lines.append(f"    {stripped}")
+        elif "await " in stripped:
+            await_lines.append(f"    {stripped}")
+        elif stripped.startswith(("from ", "import ")):
+            import_lines.append(f"    {stripped}")
+
+    hints: list[str] = []
+    for bucket in (status_lines, response_lines, await_lines, import_lines):
+        if len(hints) >= MAX_SIBLING_HINT_LINES:
+            break
+        for item in bucket:
+            if len(hints) >= MAX_SIBLING_HINT_LINES:
+                break
+            hints.append(escape_braces(item))
+    return hints
+
+
 def discover_sibling_tests(
     base_dir: Path | None,
     test_file: str,
@@ -178,13 +215,13 @@ def discover_sibling_tests(
 
     test_path = base_dir / test_file
     parent = test_path.parent
-    if not parent.exists():
+    cache = get_enrichment_cache()
+    try:
+        listing = cache.list_dir(parent, "test_*.py")
+    except OSError:
         return ""
 
-    siblings = sorted(
-        p for p in parent.glob("test_*.py")
-        if p.name != test_path.name
-    )
+    siblings = [p for p in listing if p.name != test_path.name]
     if not siblings:
         return ""
 
@@ -194,32 +231,8 @@ def discover_sibling_tests(
             rel = str(sib.relative_to(base_dir))
         except ValueError:
             continue
-        hints: list[str] = []
         try:
-            lines = sib.read_text(encoding="utf-8").splitlines()
-            # Prioritized extraction: status codes > response assertions > await > imports
-            status_lines: list[str] = []
-            response_lines: list[str] = []
-            await_lines: list[str] = []
-            import_lines: list[str] = []
-            for line in lines:
-                stripped = line.strip()
-                if "status_code" in stripped and "==" in stripped:
-                    status_lines.append(f"    {stripped}")
-                elif stripped.startswith("assert") and "response." in stripped:
-                    response_lines.append(f"    {stripped}")
-                elif "await " in stripped:
-                    await_lines.append(f"    {stripped}")
-                elif stripped.startswith(("from ", "import ")):
-                    import_lines.append(f"    {stripped}")
-            # Merge in priority order, capped at MAX_SIBLING_HINT_LINES
-            for bucket in (status_lines, response_lines, await_lines, import_lines):
-                if len(hints) >= MAX_SIBLING_HINT_LINES:
-                    break
-                for item in bucket:
-                    if len(hints) >= MAX_SIBLING_HINT_LINES:
-                        break
-                    hints.append(escape_braces(item))
+            hints = cache.derive(sib, "sibling_hints", _extract_sibling_hints)
         except OSError:
             continue
 
@@ -283,19 +296,18 @@ def read_conftest(base_dir: Path | None, test_file: str) -> str:
             conftest.resolve().relative_to(base_dir.resolve())
         except (ValueError, OSError):
             continue
-        if conftest.exists():
-            try:
-                content = conftest.read_text(encoding="utf-8")
-                if len(content) > MAX_CONFTEST_CONTENT:
-                    content = content[:MAX_CONFTEST_CONTENT] + "\n# ... (truncated)"
-                escaped = escape_braces(content)
-                return (
-                    "\n## SHARED FIXTURES (conftest.py)\n"
-                    "Reuse these fixtures rather than duplicating setup logic.\n"
-                    f"```python\n{escaped}\n```\n"
-                )
-            except OSError:
-                continue
+        try:
+            content = get_enrichment_cache().read_text(conftest)
+        except OSError:
+            continue
+        if len(content) > MAX_CONFTEST_CONTENT:
+            content = content[:MAX_CONFTEST_CONTENT] + "\n# ... (truncated)"
+        escaped = escape_braces(content)
+        return (
+            "\n## SHARED FIXTURES (conftest.py)\n"
+            "Reuse these fixtures rather than duplicating setup logic.\n"
+            f"```python\n{escaped}\n```\n"
+        )
 
     return ""
 
@@ -305,31 +317,16 @@ def read_conftest(base_dir: Path | None, test_file: str) -> str:
 # =============================================================================
 
 
-def extract_impl_signatures(base_dir: Path | None, impl_file: str) -> str:
-    """Extract function/class signatures from an existing implementation file.
+def _scan_signature_lines(raw: str) -> list[str]:
+    """Line-scan fallback for files that do not parse as Python.
 
-    Reads the implementation file and extracts lines starting with ``def ``,
-    ``async def ``, or ``class `` (plus preceding decorator lines).  The
-    result is wrapped in a prompt section that instructs the LLM to match
-    these exact signatures.
-
-    Args:
-        base_dir: Project root for resolving paths.
-        impl_file: Relative path to the implementation file.
-
-    Returns:
-        Formatted prompt section, or empty string if file doesn't exist
-        or contains no signatures.
+    Extracts lines starting with ``def ``, ``async def ``, or ``class ``
+    (plus preceding decorator lines), capped at MAX_IMPL_SIGNATURES.
     """
-    raw = read_file_safe(base_dir, impl_file, MAX_IMPL_FILE_CONTENT, "")
-    if not raw:
-        return ""
-
-    lines = raw.splitlines()
     signatures: list[str] = []
     decorator_buffer: list[str] = []
     in_decorator = False
-    for line in lines:
+    for line in raw.splitlines():
         stripped = line.strip()
         if stripped.startswith("@"):
             in_decorator = True
@@ -350,6 +347,42 @@ def extract_impl_signatures(base_dir: Path | None, impl_file: str) -> str:
                 signatures.append(line)
                 if len(signatures) >= MAX_IMPL_SIGNATURES:
                     break
+    return signatures
+
+
+def extract_impl_signatures(base_dir: Path | None, impl_file: str) -> str:
+    """Extract function/class signatures from an existing implementation file.
+
+    Signatures come from the project SymbolIndex (symbol_index.py), which
+    renders def/class headers with their decorators from the AST and only
+    re-parses the file when it changed. Files that don't parse (e.g. mid-edit)
+    fall back to a line scan. The result is wrapped in a prompt section that
+    instructs the LLM to match these exact signatures.
+
+    Args:
+        base_dir: Project root for resolving paths.
+        impl_file: Relative path to the implementation file.
+
+    Returns:
+        Formatted prompt section, or empty string if file doesn't exist
+        or contains no signatures.
+    """
+    if not base_dir or not impl_file:
+        return ""
+
+    info = get_symbol_index(base_dir).file_symbols(impl_file)
+    if not info.exists:
+        return ""
+
+    signatures: list[str] = []
+    if info.parses:
+        for sig in info.signatures:
+            signatures.extend(sig.splitlines())
+            if len(signatures) >= MAX_IMPL_SIGNATURES:
+                break
+    else:
+        raw = read_file_safe(base_dir, impl_file, MAX_IMPL_FILE_CONTENT, "")
+        signatures = _scan_signature_lines(raw)
 
     if not signatures:
         return ""
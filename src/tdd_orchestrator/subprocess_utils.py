@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import sys
 from pathlib import Path
+from typing import Any
+
+from .pipeline_metrics import get_pipeline_metrics
 
 
 def resolve_tool(tool_name: str) -> str:
@@ -23,3 +28,22 @@ def resolve_tool(tool_name: str) -> str:
     if tool_path.exists():
         return str(tool_path)
     return tool_name
+
+
+async def spawn_subprocess(
+    program: str | os.PathLike[str], *args: str | os.PathLike[str], **kwargs: Any
+) -> asyncio.subprocess.Process:
+    """Start a subprocess, counting it in tdd_subprocess_spawns_total.
+
+    A drop-in for asyncio.create_subprocess_exec (no shell).
+
+    Args:
+        program: Executable to run.
+        *args: Its arguments.
+        **kwargs: Passed to asyncio.create_subprocess_exec.
+
+    Returns:
+        The started process.
+    """
+    get_pipeline_metrics().subprocess_spawns.labels(Path(program).name).inc()
+    return await asyncio.create_subprocess_exec(program, *args, **kwargs)
@@ -0,0 +1,423 @@
+"""Persistent AST-based symbol index of the target project.
+
+Prompt enrichment and post-run AC validation repeatedly ask the same
+questions about project files: which functions and classes does this impl
+file define, what does it export, does it even parse, and which tests
+import it. Answering those by re-reading and re-scanning files on every
+call scales with file size; this module answers them from a SQLite index
+instead.
+
+The index is built with ``ast`` and updated incrementally: every lookup
+stats the file and re-parses it only when (mtime_ns, size) changed, so
+results always reflect the tree on disk. Tables:
+
+- ``files``: one row per indexed file (module name, stat, parse status)
+- ``symbols``: functions, classes and methods with rendered signatures
+- ``imports``: imported modules/names per file, indexed in both directions
+  so test-to-module edges are a single indexed query
+
+The database lives at ``.tdd/symbols.db`` when the project has a ``.tdd/``
+directory, otherwise in memory for the lifetime of the process.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_TDD_DIR = ".tdd"
+_INDEX_FILE = "symbols.db"
+
+# Directories never worth indexing during a full refresh
+_SKIP_DIRS = frozenset({
+    "__pycache__", "node_modules", "venv", ".venv", "build", "dist", ".git", ".tdd",
+})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    module TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    is_test INTEGER NOT NULL,
+    parses INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_module ON files(module);
+
+CREATE TABLE IF NOT EXISTS symbols (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    lineno INTEGER NOT NULL,
+    top_level INTEGER NOT NULL,
+    exported INTEGER NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols(path, lineno);
+CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name);
+
+CREATE TABLE IF NOT EXISTS imports (
+    path TEXT NOT NULL,
+    module TEXT NOT NULL,
+    target TEXT NOT NULL,
+    lineno INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_imports_path ON imports(path);
+CREATE INDEX IF NOT EXISTS idx_imports_module ON imports(module);
+CREATE INDEX IF NOT EXISTS idx_imports_target ON imports(target);
+"""
+
+
+@dataclass(frozen=True)
+class FileSymbols:
+    """Indexed view of a single file.
+
+    Attributes:
+        path: Path relative to the project root.
+        exists: Whether the file exists on disk.
+        parses: Whether the file parsed as valid Python.
+        defined_names: Top-level function and class names.
+        exports: Public names (``__all__`` when present, else non-underscore
+            top-level definitions and assignments).
+        signatures: Rendered def/class signatures in source order.
+    """
+
+    path: str
+    exists: bool
+    parses: bool
+    defined_names: frozenset[str]
+    exports: frozenset[str]
+    signatures: tuple[str, ...]
+
+
+def module_name_for(rel_path: str) -> str:
+    """Return the dotted import name for a project-relative ``.py`` path."""
+    parts = list(Path(rel_path).with_suffix("").parts)
+    if parts and parts[0] == "src":
+        parts = parts[1:]
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def _render_signature(node: ast.AST, depth: int) -> str:
+    """Render decorators plus the def/class header line for ``node``."""
+    indent = "    " * depth
+    lines = [f"{indent}@{ast.unparse(d)}" for d in getattr(node, "decorator_list", [])]
+    if isinstance(node, ast.ClassDef):
+        bases = [ast.unparse(b) for b in node.bases]
+        bases.extend(ast.unparse(k) for k in node.keywords)
+        suffix = f"({', '.join(bases)})" if bases else ""
+        lines.append(f"{indent}class {node.name}{suffix}:")
+    elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+        returns = f" -> {ast.unparse(node.returns)}" if node.returns is not None else ""
+        lines.append(f"{indent}{prefix} {node.name}({ast.unparse(node.args)}){returns}:")
+    return "\n".join(lines)
+
+
+def _dunder_all(tree: ast.Module) -> list[str] | None:
+    """Return the literal ``__all__`` list of a module, if declared."""
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        is_all = any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets)
+        if is_all and isinstance(node.value, (ast.List, ast.Tuple)):
+            return [
+                str(elt.value) for elt in node.value.elts
+                if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+            ]
+    return None
+
+
+def _resolve_relative(module: str, is_package: bool, level: int, target: str | None) -> str:
+    """Resolve a relative ``from ... import`` to an absolute module name."""
+    parts = module.split(".") if module else []
+    if not is_package:
+        parts = parts[:-1]
+    if level > 1:
+        parts = parts[: max(len(parts) - (level - 1), 0)]
+    if target:
+        parts.append(target)
+    return ".".join(parts)
+
+
+class SymbolIndex:
+    """Incrementally maintained SQLite index of project symbols and imports.
+
+    Usage:
+        index = get_symbol_index(base_dir)
+        info = index.file_symbols("src/pkg/module.py")
+        tests = index.tests_for_module("src/pkg/module.py")
+    """
+
+    def __init__(self, base_dir: Path, db_path: Path | str | None = None) -> None:
+        self.base_dir = base_dir.resolve()
+        if db_path is None:
+            tdd_dir = self.base_dir / _TDD_DIR
+            db_path = tdd_dir / _INDEX_FILE if tdd_dir.is_dir() else ":memory:"
+        self.db_path = db_path
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _resolve(self, rel_path: str) -> Path | None:
+        """Resolve a project-relative path, rejecting traversal outside base_dir."""
+        try:
+            resolved = (self.base_dir / rel_path).resolve()
+            resolved.relative_to(self.base_dir)
+        except (ValueError, OSError):
+            return None
+        return resolved
+
+    def _forget(self, rel_path: str) -> None:
+        self._conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+        self._conn.execute("DELETE FROM symbols WHERE path = ?", (rel_path,))
+        self._conn.execute("DELETE FROM imports WHERE path = ?", (rel_path,))
+
+    def _index_file(self, rel_path: str, abs_path: Path, st: os.stat_result) -> None:
+        """(Re)index one file inside the caller's transaction."""
+        self._forget(rel_path)
+        module = module_name_for(rel_path)
+        is_test = Path(rel_path).name.startswith("test_")
+        try:
+            tree = ast.parse(abs_path.read_bytes(), filename=str(abs_path))
+        except (SyntaxError, ValueError, OSError):
+            tree = None
+
+        self._conn.execute(
+            "INSERT INTO files (path, module, mtime_ns, size, is_test, parses) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (rel_path, module, st.st_mtime_ns, st.st_size, int(is_test), int(tree is not None)),
+        )
+        if tree is None:
+            return
+
+        dunder_all = _dunder_all(tree)
+        symbol_rows: list[tuple[str, str, str, int, int, int, str]] = []
+
+        def visit(body: list[ast.stmt], depth: int) -> None:
+            for node in body:
+                if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    continue
+                top = depth == 0
+                public = (
+                    node.name in dunder_all if dunder_all is not None
+                    else not node.name.startswith("_")
+                )
+                kind = type(node).__name__
+                symbol_rows.append((
+                    rel_path, node.name, kind, node.lineno,
+                    int(top), int(top and public), _render_signature(node, depth),
+                ))
+                if isinstance(node, ast.ClassDef):
+                    visit(node.body, depth + 1)
+
+        visit(tree.body, 0)
+
+        # Module-level assignments count as exports (constants, aliases)
+        for stmt in tree.body:
+            targets: list[ast.expr] = []
+            if isinstance(stmt, ast.Assign):
+                targets = list(stmt.targets)
+            elif isinstance(stmt, ast.AnnAssign):
+                targets = [stmt.target]
+            for name_node in targets:
+                if not isinstance(name_node, ast.Name) or name_node.id == "__all__":
+                    continue
+                public = (
+                    name_node.id in dunder_all if dunder_all is not None
+                    else not name_node.id.startswith("_")
+                )
+                if public:
+                    symbol_rows.append(
+                        (rel_path, name_node.id, "Assign", stmt.lineno, 1, 1, "")
+                    )
+
+        self._conn.executemany(
+            "INSERT INTO symbols (path, name, kind, lineno, top_level, exported, signature) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            symbol_rows,
+        )
+
+        is_package = Path(rel_path).name == "__init__.py"
+        import_rows: list[tuple[str, str, str, int]] = []
+        for any_node in ast.walk(tree):
+            if isinstance(any_node, ast.Import):
+                for alias in any_node.names:
+                    import_rows.append((rel_path, alias.name, alias.name, any_node.lineno))
+            elif isinstance(any_node, ast.ImportFrom):
+                base = any_node.module or ""
+                if any_node.level:
+                    base = _resolve_relative(
+                        module, is_package, any_node.level, any_node.module
+                    )
+                for alias in any_node.names:
+                    imported = f"{base}.{alias.name}" if base else alias.name
+                    import_rows.append((rel_path, base, imported, any_node.lineno))
+        self._conn.executemany(
+            "INSERT INTO imports (path, module, target, lineno) VALUES (?, ?, ?, ?)",
+            import_rows,
+        )
+
+    def ensure_fresh(self, rel_path: str) -> bool:
+        """Bring a single file's index entry up to date.
+
+        Returns:
+            True if the file exists and is indexed, False otherwise.
+        """
+        abs_path = self._resolve(rel_path)
+        if abs_path is None:
+            return False
+        try:
+            st = abs_path.stat()
+        except OSError:
+            with self._conn:
+                self._forget(rel_path)
+            return False
+
+        row = self._conn.execute(
+            "SELECT mtime_ns, size FROM files WHERE path = ?", (rel_path,)
+        ).fetchone()
+        if row is not None and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+            return True
+        with self._conn:
+            self._index_file(rel_path, abs_path, st)
+        return True
+
+    def refresh(self) -> int:
+        """Incrementally re-index every ``.py`` file under base_dir.
+
+        Unchanged files are skipped by stat comparison and deleted files
+        are dropped from the index.
+
+        Returns:
+            Number of files (re)parsed.
+        """
+        known = {
+            str(path): (int(mtime), int(size))
+            for path, mtime, size in self._conn.execute(
+                "SELECT path, mtime_ns, size FROM files"
+            )
+        }
+        seen: set[str] = set()
+        parsed = 0
+        with self._conn:
+            for root, dirs, files in os.walk(self.base_dir):
+                dirs[:] = [d for d in dirs if d not in _SKIP_DIRS and not d.startswith(".")]
+                for name in files:
+                    if not name.endswith(".py"):
+                        continue
+                    abs_path = Path(root) / name
+                    rel_path = abs_path.relative_to(self.base_dir).as_posix()
+                    seen.add(rel_path)
+                    try:
+                        st = abs_path.stat()
+                    except OSError:
+                        continue
+                    if known.get(rel_path) == (st.st_mtime_ns, st.st_size):
+                        continue
+                    self._index_file(rel_path, abs_path, st)
+                    parsed += 1
+            for rel_path in known.keys() - seen:
+                self._forget(rel_path)
+        logger.debug("Symbol index refresh: %d files parsed under %s", parsed, self.base_dir)
+        return parsed
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def file_symbols(self, rel_path: str) -> FileSymbols:
+        """Return the indexed view of ``rel_path``, refreshing it if stale."""
+        if not self.ensure_fresh(rel_path):
+            return FileSymbols(rel_path, False, False, frozenset(), frozenset(), ())
+
+        parses_row = self._conn.execute(
+            "SELECT parses FROM files WHERE path = ?", (rel_path,)
+        ).fetchone()
+        rows = self._conn.execute(
+            "SELECT name, kind, top_level, exported, signature FROM symbols "
+            "WHERE path = ? ORDER BY lineno",
+            (rel_path,),
+        ).fetchall()
+        defined = frozenset(
+            str(name) for name, kind, top, _, _ in rows if top and kind != "Assign"
+        )
+        exports = frozenset(str(name) for name, _, _, exported, _ in rows if exported)
+        signatures = tuple(str(sig) for *_, sig in rows if sig)
+        return FileSymbols(
+            path=rel_path,
+            exists=True,
+            parses=bool(parses_row and parses_row[0]),
+            defined_names=defined,
+            exports=exports,
+            signatures=signatures,
+        )
+
+    def defines(self, rel_path: str, name: str) -> bool:
+        """Return True if ``rel_path`` defines top-level function/class ``name``."""
+        if not self.ensure_fresh(rel_path):
+            return False
+        row = self._conn.execute(
+            "SELECT 1 FROM symbols WHERE path = ? AND name = ? AND top_level = 1 "
+            "AND kind != 'Assign' LIMIT 1",
+            (rel_path, name),
+        ).fetchone()
+        return row is not None
+
+    def modules_defining(self, name: str) -> list[str]:
+        """Return indexed files that export ``name`` (uses the last refresh)."""
+        rows = self._conn.execute(
+            "SELECT DISTINCT path FROM symbols WHERE name = ? AND exported = 1 ORDER BY path",
+            (name,),
+        ).fetchall()
+        return [str(r[0]) for r in rows]
+
+    def tests_for_module(self, rel_path: str) -> list[str]:
+        """Return indexed test files that import the module at ``rel_path``.
+
+        Matches both ``import pkg.mod`` / ``from pkg.mod import x`` and
+        ``from pkg import mod`` forms. Reflects the last ``refresh()``.
+        """
+        module = module_name_for(rel_path)
+        rows = self._conn.execute(
+            "SELECT DISTINCT i.path FROM imports i JOIN files f ON f.path = i.path "
+            "WHERE f.is_test = 1 AND (i.module = ? OR i.target = ?) ORDER BY i.path",
+            (module, module),
+        ).fetchall()
+        return [str(r[0]) for r in rows]
+
+
+# Per-project index instances, keyed by resolved project root
+_indexes: dict[Path, SymbolIndex] = {}
+
+
+def get_symbol_index(base_dir: Path) -> SymbolIndex:
+    """Return the shared SymbolIndex for ``base_dir``, creating it if needed."""
+    key = base_dir.resolve()
+    index = _indexes.get(key)
+    if index is None:
+        index = SymbolIndex(key)
+        _indexes[key] = index
+    return index
+
+
+def close_symbol_indexes() -> None:
+    """Close and forget all shared SymbolIndex instances."""
+    for index in _indexes.values():
+        index.close()
+    _indexes.clear()
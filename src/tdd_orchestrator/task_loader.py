@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import logging
+import sqlite3
 from typing import TYPE_CHECKING, Any, TypedDict
 
 if TYPE_CHECKING:
@@ -28,6 +29,18 @@ class LoadResult(TypedDict):
 
 REQUIRED_FIELDS = {"task_key", "title"}
 
+# Max bound parameters per IN (...) lookup (SQLite's default limit is 999)
+_KEY_CHUNK_SIZE = 500
+
+_INSERT_TASK_SQL = """
+    INSERT INTO tasks (
+        task_key, title, goal, spec_id, acceptance_criteria,
+        test_file, impl_file, verify_command, done_criteria,
+        depends_on, phase, sequence, module_exports, task_type
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(task_key) DO NOTHING
+"""
+
 
 def _validate_task(task: dict[str, Any], index: int) -> list[str]:
     """Validate a single task dictionary.
@@ -71,6 +84,128 @@ def _validate_task(task: dict[str, Any], index: int) -> list[str]:
     return errors
 
 
+def _task_row(
+    task: dict[str, Any], default_phase: int, default_title: str | None
+) -> tuple[Any, ...]:
+    """Build INSERT parameters for a task dict (same encoding as create_task)."""
+    acceptance_criteria = task.get("acceptance_criteria")
+    depends_on = task.get("depends_on")
+    module_exports = task.get("module_exports")
+    return (
+        task["task_key"],
+        task["title"] if default_title is None else task.get("title", default_title),
+        task.get("goal"),
+        task.get("spec_id"),
+        json.dumps(acceptance_criteria) if acceptance_criteria else None,
+        task.get("test_file"),
+        task.get("impl_file"),
+        task.get("verify_command"),
+        task.get("done_criteria"),
+        json.dumps(depends_on) if depends_on else "[]",
+        task.get("phase", default_phase),
+        task.get("sequence", 0),
+        json.dumps(module_exports) if module_exports else "[]",
+        task.get("task_type", "implement"),
+    )
+
+
+async def _existing_task_keys(db: OrchestratorDB, task_keys: list[str]) -> set[str]:
+    """Return which of ``task_keys`` already exist (caller holds the write lock)."""
+    assert db._conn is not None
+    existing: set[str] = set()
+    for start in range(0, len(task_keys), _KEY_CHUNK_SIZE):
+        chunk = task_keys[start : start + _KEY_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        async with db._conn.execute(
+            f"SELECT task_key FROM tasks WHERE task_key IN ({placeholders})", chunk
+        ) as cursor:
+            existing.update(str(row[0]) for row in await cursor.fetchall())
+    return existing
+
+
+async def _insert_tasks_bulk(
+    db: OrchestratorDB,
+    tasks: list[dict[str, Any]],
+    *,
+    default_phase: int = 0,
+    default_title: str | None = None,
+) -> tuple[list[str], list[str], list[tuple[str, str]]]:
+    """Insert tasks in one transaction, skipping keys that already exist.
+
+    Duplicate keys within ``tasks`` keep their first occurrence. If the
+    batch insert fails, the rows are replayed one at a time, each in its
+    own savepoint, so a bad row is reported and skipped instead of
+    failing the whole load.
+
+    Args:
+        db: Database instance.
+        tasks: Task dicts, each with a task_key.
+        default_phase: Phase for tasks that do not specify one.
+        default_title: Title for tasks without one (None: title is required).
+
+    Returns:
+        Tuple of (inserted task keys, skipped duplicate task keys,
+        (task key, error) for rows that failed to insert), in input order.
+    """
+    await db._ensure_connected()
+    if not db._conn or not tasks:
+        return [], [], []
+
+    async with db._write_lock:
+        existing = await _existing_task_keys(db, [t["task_key"] for t in tasks])
+        inserted: list[str] = []
+        skipped: list[str] = []
+        failed: list[tuple[str, str]] = []
+        rows: list[tuple[Any, ...]] = []
+        for task in tasks:
+            task_key = task["task_key"]
+            if task_key in existing:
+                skipped.append(task_key)
+                continue
+            existing.add(task_key)
+            inserted.append(task_key)
+            rows.append(_task_row(task, default_phase, default_title))
+        try:
+            try:
+                await db._conn.executemany(_INSERT_TASK_SQL, rows)
+            except sqlite3.Error:
+                await db._conn.rollback()
+                failed = await _insert_rows_individually(db, inserted, rows)
+                failed_keys = {task_key for task_key, _ in failed}
+                inserted = [key for key in inserted if key not in failed_keys]
+            await db._conn.commit()
+        except Exception:
+            await db._conn.rollback()
+            raise
+    return inserted, skipped, failed
+
+
+async def _insert_rows_individually(
+    db: OrchestratorDB, task_keys: list[str], rows: list[tuple[Any, ...]]
+) -> list[tuple[str, str]]:
+    """Insert rows one savepoint at a time in a new transaction.
+
+    The caller holds the write lock and commits (or rolls back) the
+    transaction, so the surviving rows land together.
+
+    Returns:
+        (task key, error) for each row that could not be inserted.
+    """
+    assert db._conn is not None
+    failed: list[tuple[str, str]] = []
+    # Without an enclosing transaction, each RELEASE would commit its row
+    await db._conn.execute("BEGIN")
+    for task_key, row in zip(task_keys, rows):
+        await db._conn.execute("SAVEPOINT load_task")
+        try:
+            await db._conn.execute(_INSERT_TASK_SQL, row)
+        except sqlite3.Error as e:
+            await db._conn.execute("ROLLBACK TO load_task")
+            failed.append((task_key, str(e)))
+        await db._conn.execute("RELEASE load_task")
+    return failed
+
+
 async def load_tdd_tasks(
     tasks: list[dict[str, Any]],
     db: OrchestratorDB | None = None,
@@ -137,44 +272,31 @@ async def load_tdd_tasks(
         await _clear_all_tasks(db)
         logger.info("Cleared all existing tasks")
 
-    # Load tasks one by one
-    for task in tasks:
-        task_key = task["task_key"]
-
-        # Check for duplicates
+    # Insert all tasks in a single transaction
+    try:
+        inserted, duplicates, failed = await _insert_tasks_bulk(db, tasks)
+    except Exception as e:
+        error_msg = f"Failed to load {len(tasks)} tasks: {e}"
+        result["errors"].append(error_msg)
+        result["skipped"] += len(tasks)
+        logger.error(error_msg)
+        return result
+
+    result["loaded"] = len(inserted)
+    result["task_keys"] = inserted
+    result["skipped"] = len(duplicates) + len(failed)
+    for task_key, error in failed:
+        error_msg = f"Failed to create task {task_key}: {error}"
+        result["errors"].append(error_msg)
+        logger.error(error_msg)
+    if duplicates:
         if skip_duplicates:
-            existing = await db.get_task_by_key(task_key)
-            if existing:
-                result["skipped"] += 1
-                logger.debug("Skipping duplicate task: %s", task_key)
-                continue
-
-        # Create the task
-        try:
-            await db.create_task(
-                task_key=task_key,
-                title=task["title"],
-                goal=task.get("goal"),
-                spec_id=task.get("spec_id"),
-                acceptance_criteria=task.get("acceptance_criteria"),
-                test_file=task.get("test_file"),
-                impl_file=task.get("impl_file"),
-                verify_command=task.get("verify_command"),
-                done_criteria=task.get("done_criteria"),
-                depends_on=task.get("depends_on"),
-                phase=task.get("phase", 0),
-                sequence=task.get("sequence", 0),
-                module_exports=task.get("module_exports"),
-                task_type=task.get("task_type", "implement"),
-            )
-            result["loaded"] += 1
-            result["task_keys"].append(task_key)
-            logger.info("Loaded task: %s - %s", task_key, task["title"])
-        except Exception as e:
-            error_msg = f"Failed to create task {task_key}: {e}"
-            result["errors"].append(error_msg)
-            result["skipped"] += 1
-            logger.error(error_msg)
+            logger.debug("Skipped %d duplicate tasks: %s", len(duplicates), duplicates)
+        else:
+            for task_key in duplicates:
+                error_msg = f"Failed to create task {task_key}: task_key already exists"
+                result["errors"].append(error_msg)
+                logger.error(error_msg)
 
     logger.info(
         "Task loading complete: %d loaded, %d skipped, %d errors",
@@ -228,7 +350,7 @@ async def _clear_all_tasks(db: OrchestratorDB, prefix: str | None = None) -> int
 async def write_tasks_incremental(
     tasks: list[dict[str, Any]],
     cycle_number: int,
-    db: "OrchestratorDB | None" = None,
+    db: OrchestratorDB | None = None,
 ) -> int:
     """Write tasks incrementally after a cycle completes in Pass 2.
 
@@ -250,49 +372,62 @@ async def write_tasks_incremental(
     if db is None:
         db = await get_db()
 
-    written = 0
+    keyed: list[dict[str, Any]] = []
     for task in tasks:
-        task_key = task.get("task_key", "")
-        if not task_key:
+        if not task.get("task_key"):
             logger.warning(f"Skipping task without task_key in cycle {cycle_number}")
             continue
+        keyed.append(task)
 
-        # Check if task already exists (idempotent writes)
-        existing = await db.get_task_by_key(task_key)
-        if existing:
-            logger.debug(f"Task {task_key} already exists, skipping")
-            continue
-
-        try:
-            await db.create_task(
-                task_key=task_key,
-                title=task.get("title", "Unnamed Task"),
-                goal=task.get("goal"),
-                spec_id=task.get("spec_id"),
-                acceptance_criteria=task.get("acceptance_criteria"),  # May be empty
-                test_file=task.get("test_file"),
-                impl_file=task.get("impl_file"),
-                verify_command=task.get("verify_command"),
-                done_criteria=task.get("done_criteria"),
-                depends_on=task.get("depends_on"),
-                phase=task.get("phase", cycle_number),
-                sequence=task.get("sequence", 0),
-                module_exports=task.get("module_exports"),
-                task_type=task.get("task_type", "implement"),
-            )
-            written += 1
-            logger.debug(f"Wrote task {task_key} from cycle {cycle_number}")
-        except Exception as e:
-            logger.error(f"Failed to write task {task_key}: {e}")
+    # Existing tasks are skipped (idempotent writes); AC may still be empty
+    try:
+        inserted, _, failed = await _insert_tasks_bulk(
+            db, keyed, default_phase=cycle_number, default_title="Unnamed Task"
+        )
+    except Exception as e:
+        logger.error(f"Failed to write tasks from cycle {cycle_number}: {e}")
+        return 0
+    for task_key, error in failed:
+        logger.error(f"Failed to write task {task_key} from cycle {cycle_number}: {error}")
+    written = len(inserted)
 
     logger.info(f"Cycle {cycle_number}: wrote {written} tasks incrementally")
     return written
 
 
+async def _update_json_column_bulk(
+    db: OrchestratorDB,
+    column: str,
+    values: dict[str, list[str]],
+) -> list[str]:
+    """Set a JSON list column for many tasks in one transaction.
+
+    Args:
+        db: Database instance.
+        column: Column to update ("acceptance_criteria" or "depends_on").
+        values: Mapping of task_key to the list to store.
+
+    Returns:
+        Task keys that existed and were updated.
+    """
+    await db._ensure_connected()
+    if not db._conn or not values:
+        return []
+
+    async with db._write_lock:
+        existing = await _existing_task_keys(db, list(values))
+        await db._conn.executemany(
+            f"UPDATE tasks SET {column} = ? WHERE task_key = ?",
+            [(json.dumps(v), key) for key, v in values.items() if key in existing],
+        )
+        await db._conn.commit()
+    return [key for key in values if key in existing]
+
+
 async def update_task_acceptance_criteria(
     task_key: str,
     acceptance_criteria: list[str],
-    db: "OrchestratorDB | None" = None,
+    db: OrchestratorDB | None = None,
 ) -> bool:
     """Update acceptance criteria for an existing task (Pass 3).
 
@@ -307,31 +442,36 @@ async def update_task_acceptance_criteria(
     Returns:
         True if task was updated, False if task not found.
     """
+    updated = await update_acceptance_criteria_bulk({task_key: acceptance_criteria}, db)
+    if updated:
+        logger.debug(f"Updated AC for task {task_key}: {len(acceptance_criteria)} criteria")
+    return bool(updated)
+
+
+async def update_acceptance_criteria_bulk(
+    criteria: dict[str, list[str]],
+    db: OrchestratorDB | None = None,
+) -> list[str]:
+    """Update acceptance criteria for many tasks in one transaction.
+
+    Args:
+        criteria: Mapping of task_key to acceptance criteria strings.
+        db: Database instance. If None, uses singleton via get_db().
+
+    Returns:
+        Task keys that were updated (missing tasks are ignored).
+    """
     from .database import get_db
 
     if db is None:
         db = await get_db()
-
-    await db._ensure_connected()
-    if not db._conn:
-        return False
-
-    async with db._write_lock:
-        cursor = await db._conn.execute(
-            "UPDATE tasks SET acceptance_criteria = ? WHERE task_key = ?",
-            (json.dumps(acceptance_criteria), task_key),
-        )
-        await db._conn.commit()
-        updated = cursor.rowcount > 0
-        if updated:
-            logger.debug(f"Updated AC for task {task_key}: {len(acceptance_criteria)} criteria")
-        return updated
+    return await _update_json_column_bulk(db, "acceptance_criteria", criteria)
 
 
 async def update_task_depends_on(
     task_key: str,
     depends_on: list[str],
-    db: "OrchestratorDB | None" = None,
+    db: OrchestratorDB | None = None,
 ) -> bool:
     """Update depends_on for an existing task.
 
@@ -346,28 +486,33 @@ async def update_task_depends_on(
     Returns:
         True if task was updated, False if task not found.
     """
+    updated = await update_depends_on_bulk({task_key: depends_on}, db)
+    if updated:
+        logger.debug(f"Updated depends_on for task {task_key}: {len(depends_on)} dependencies")
+    return bool(updated)
+
+
+async def update_depends_on_bulk(
+    depends_on: dict[str, list[str]],
+    db: OrchestratorDB | None = None,
+) -> list[str]:
+    """Update depends_on for many tasks in one transaction.
+
+    Args:
+        depends_on: Mapping of task_key to the task keys it depends on.
+        db: Database instance. If None, uses singleton via get_db().
+
+    Returns:
+        Task keys that were updated (missing tasks are ignored).
+    """
     from .database import get_db
 
     if db is None:
         db = await get_db()
-
-    await db._ensure_connected()
-    if not db._conn:
-        return False
-
-    async with db._write_lock:
-        cursor = await db._conn.execute(
-            "UPDATE tasks SET depends_on = ? WHERE task_key = ?",
-            (json.dumps(depends_on), task_key),
-        )
-        await db._conn.commit()
-        updated = cursor.rowcount > 0
-        if updated:
-            logger.debug(f"Updated depends_on for task {task_key}: {len(depends_on)} dependencies")
-        return updated
+    return await _update_json_column_bulk(db, "depends_on", depends_on)
 
 
-async def get_existing_prefixes(db: "OrchestratorDB | None" = None) -> list[str]:
+async def get_existing_prefixes(db: OrchestratorDB | None = None) -> list[str]:
     """Get unique task_key prefixes from existing tasks.
 
     Prefixes are determined by splitting task_key on '-' and taking the first part.
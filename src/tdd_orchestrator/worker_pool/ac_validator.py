@@ -6,6 +6,10 @@ Results are informational (non-blocking), reported as coverage metrics.
 
 Follows the done_criteria_checker.py pattern: module-level functions
 with frozen dataclasses for results.
+
+Export and import matchers answer from the project SymbolIndex; full ASTs
+are only parsed when a criterion needs them (error handling, endpoints,
+GIVEN/WHEN/THEN).
 """
 
 from __future__ import annotations
@@ -15,9 +19,12 @@ import json
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+from ..symbol_index import FileSymbols, get_symbol_index
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -123,15 +130,6 @@ def _safe_parse_file(file_path: Path) -> ast.Module | None:
         return None
 
 
-def _get_defined_names(tree: ast.Module) -> set[str]:
-    """Extract top-level function and class names from an AST."""
-    names: set[str] = set()
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            names.add(node.name)
-    return names
-
-
 def _has_raise(tree: ast.Module, exception_name: str) -> bool:
     """Check if the AST contains a `raise ExceptionName(...)` statement."""
     for node in ast.walk(tree):
@@ -265,7 +263,7 @@ def _match_error_handling(
 
 def _match_export(
     criterion: str,
-    impl_tree: ast.Module | None,
+    impl_symbols: FileSymbols,
 ) -> ACResult | None:
     """Match export/define criteria: function/class definition in impl."""
     match = _EXPORT_RE.search(criterion)
@@ -273,11 +271,10 @@ def _match_export(
         return None
 
     symbol = match.group(1)
-    if impl_tree is None:
+    if not impl_symbols.parses:
         return ACResult(criterion, "not_satisfied", "export", "impl file not parseable")
 
-    names = _get_defined_names(impl_tree)
-    if symbol in names:
+    if symbol in impl_symbols.defined_names:
         return ACResult(criterion, "satisfied", "export", f"{symbol} defined in impl")
 
     return ACResult(criterion, "not_satisfied", "export", f"{symbol} not found in impl")
@@ -285,17 +282,16 @@ def _match_export(
 
 def _match_import(
     criterion: str,
-    impl_path: Path,
-    impl_tree: ast.Module | None,
+    impl_symbols: FileSymbols,
 ) -> ACResult | None:
     """Match import/importable criteria: file exists and parses."""
     if not _IMPORT_TRIGGER_RE.search(criterion):
         return None
 
-    if not impl_path.exists():
+    if not impl_symbols.exists:
         return ACResult(criterion, "not_satisfied", "import", "impl file does not exist")
 
-    if impl_tree is not None:
+    if impl_symbols.parses:
         return ACResult(criterion, "satisfied", "import", "file exists and parses")
 
     return ACResult(criterion, "not_satisfied", "import", "file exists but cannot be parsed")
@@ -368,6 +364,25 @@ def _match_given_when_then(
 # ---------------------------------------------------------------------------
 
 
+class _TaskArtifacts:
+    """Code artifacts for one task, with ASTs parsed on first use."""
+
+    def __init__(self, impl_path: Path, test_path: Path, impl_symbols: FileSymbols) -> None:
+        self.impl_path = impl_path
+        self.test_path = test_path
+        self.impl_symbols = impl_symbols
+
+    @cached_property
+    def impl_tree(self) -> ast.Module | None:
+        if not self.impl_symbols.parses:
+            return None
+        return _safe_parse_file(self.impl_path)
+
+    @cached_property
+    def test_tree(self) -> ast.Module | None:
+        return _safe_parse_file(self.test_path) if self.test_path.exists() else None
+
+
 async def validate_task_ac(
     task_key: str,
     acceptance_criteria: str,
@@ -382,51 +397,50 @@ async def validate_task_ac(
     if not criteria:
         return result
 
-    impl_path = base_dir / impl_file
-    test_path = base_dir / test_file
-
-    # Parse files once, reuse across matchers
-    impl_tree = _safe_parse_file(impl_path) if impl_path.exists() else None
-    test_tree = _safe_parse_file(test_path) if test_path.exists() else None
+    # Symbol lookups come from the index; full ASTs are parsed at most once,
+    # and only if a matcher needs them
+    artifacts = _TaskArtifacts(
+        impl_path=base_dir / impl_file,
+        test_path=base_dir / test_file,
+        impl_symbols=get_symbol_index(base_dir).file_symbols(impl_file),
+    )
 
     for criterion in criteria:
-        ac_result = _match_criterion(criterion, impl_tree, test_tree, impl_path)
+        ac_result = _match_criterion(criterion, artifacts)
         result.results.append(ac_result)
 
     return result
 
 
-def _match_criterion(
-    criterion: str,
-    impl_tree: ast.Module | None,
-    test_tree: ast.Module | None,
-    impl_path: Path,
-) -> ACResult:
+def _match_criterion(criterion: str, artifacts: _TaskArtifacts) -> ACResult:
     """Run matchers in priority order, return first match or fallback."""
     # Priority 1: Error handling
-    r = _match_error_handling(criterion, impl_tree, test_tree)
-    if r is not None:
-        return r
+    if _ERROR_RE.search(criterion):
+        r = _match_error_handling(criterion, artifacts.impl_tree, artifacts.test_tree)
+        if r is not None:
+            return r
 
     # Priority 2: Export/define
-    r = _match_export(criterion, impl_tree)
+    r = _match_export(criterion, artifacts.impl_symbols)
     if r is not None:
         return r
 
     # Priority 3: Import
-    r = _match_import(criterion, impl_path, impl_tree)
+    r = _match_import(criterion, artifacts.impl_symbols)
     if r is not None:
         return r
 
     # Priority 4: Endpoint
-    r = _match_endpoint(criterion, impl_tree)
-    if r is not None:
-        return r
+    if _ENDPOINT_RE.search(criterion):
+        r = _match_endpoint(criterion, artifacts.impl_tree)
+        if r is not None:
+            return r
 
     # Priority 5: GIVEN/WHEN/THEN
-    r = _match_given_when_then(criterion, test_tree)
-    if r is not None:
-        return r
+    if _GWT_CRITERION_RE.search(criterion):
+        r = _match_given_when_then(criterion, artifacts.test_tree)
+        if r is not None:
+            return r
 
     # Fallback: unverifiable
     return ACResult(criterion, "unverifiable", "none", "no heuristic matcher available")
@@ -14,6 +14,8 @@ import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from ..subprocess_utils import spawn_subprocess
+
 logger = logging.getLogger(__name__)
 
 # Patterns for heuristic matching
@@ -154,7 +156,7 @@ async def _check_importable(
     """
     python = str(Path(sys.executable))
     try:
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             python, "-c", f"import {module_name}",
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
@@ -10,6 +10,9 @@ import asyncio
 import logging
 from pathlib import Path
 
+from ..prompt_cache import invalidate_enrichment_cache
+from ..subprocess_utils import spawn_subprocess
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +31,7 @@ async def run_ruff_fix(impl_file: str, task_key: str, base_dir: Path) -> bool:
         return True
 
     try:
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "uv",
             "run",
             "ruff",
@@ -62,7 +65,7 @@ async def squash_wip_commits(task_key: str, base_dir: Path) -> bool:
     """
     try:
         # Count WIP commits for this task
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "git",
             "log",
             "--oneline",
@@ -81,7 +84,7 @@ async def squash_wip_commits(task_key: str, base_dir: Path) -> bool:
             return True
 
         # Soft reset to before first WIP commit
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "git",
             "reset",
             "--soft",
@@ -101,7 +104,7 @@ async def squash_wip_commits(task_key: str, base_dir: Path) -> bool:
             f"feat({task_key}): complete (squashed from {wip_count} WIP commits)"
             "\n\nCo-Authored-By: Claude <noreply@anthropic.com>"
         )
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "git",
             "commit",
             "--no-verify",
@@ -131,6 +134,10 @@ async def commit_stage(task_key: str, stage: str, message: str, base_dir: Path)
     Creates a WIP commit after each successful stage to preserve work
     incrementally, preventing loss of progress if later stages fail.
 
+    The stage that just finished has rewritten files under ``base_dir``, so
+    the prompt enrichment cache for that tree is invalidated afterwards
+    regardless of the commit outcome.
+
     Args:
         task_key: JIRA task key (e.g., 'VEA-123').
         stage: Stage name for logging (e.g., 'RED', 'GREEN').
@@ -142,7 +149,7 @@ async def commit_stage(task_key: str, stage: str, message: str, base_dir: Path)
     """
     try:
         # Stage all changes
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "git",
             "add",
             "-A",
@@ -158,7 +165,7 @@ async def commit_stage(task_key: str, stage: str, message: str, base_dir: Path)
         # 2. RED stage has failing tests by design
         # 3. Actual verification happens in VERIFY stage
         full_message = f"{message}\n\nCo-Authored-By: Claude <noreply@anthropic.com>"
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             "git",
             "commit",
             "--no-verify",
@@ -189,3 +196,5 @@ async def commit_stage(task_key: str, stage: str, message: str, base_dir: Path)
     except Exception as e:
         logger.warning("[%s] Failed to commit %s stage: %s", task_key, stage, e)
         return False
+    finally:
+        invalidate_enrichment_cache(base_dir)
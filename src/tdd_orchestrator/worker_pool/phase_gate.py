@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from ..subprocess_utils import resolve_tool
+from ..subprocess_utils import resolve_tool, spawn_subprocess
 
 if TYPE_CHECKING:
     from ..database import OrchestratorDB
@@ -222,7 +222,7 @@ class PhaseGateValidator:
             Tuple of (success, output) where success is True if exit code is 0.
         """
         try:
-            process = await asyncio.create_subprocess_exec(
+            process = await spawn_subprocess(
                 *args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
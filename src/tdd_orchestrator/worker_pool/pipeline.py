@@ -14,6 +14,7 @@ from typing import Any
 
 from ..database import OrchestratorDB
 from ..models import Stage, StageResult
+from ..pipeline_metrics import get_pipeline_metrics
 from ..refactor_checker import check_needs_refactor
 from .circuit_breakers import RedFixAttemptTracker, StaticReviewCircuitBreaker
 from .config import (
@@ -184,13 +185,7 @@ async def run_tdd_pipeline(
 
             # Convert violations to issue dicts for prompt
             issues = [
-                {
-                    "pattern": v.pattern,
-                    "line_number": v.line_number,
-                    "message": v.message,
-                    "severity": v.severity,
-                    "code_snippet": v.code_snippet,
-                }
+                v.to_issue()
                 for v in review_result.violations
                 if v.severity == "error"  # Only fix errors, not warnings
             ]
@@ -395,6 +390,8 @@ async def _run_green_with_retry(
     start_time = asyncio.get_event_loop().time()
     last_result: StageResult | None = None
     last_failure_output: str = ""
+    attempts_used = 0
+    metrics = get_pipeline_metrics()
 
     for attempt in range(1, max_attempts + 1):
         # Check aggregate timeout
@@ -432,6 +429,7 @@ async def _run_green_with_retry(
                 ESCALATION_MODEL,
                 attempt,
             )
+            metrics.green_retries.labels(ESCALATION_MODEL).inc()
 
         # Run the stage (with skip_recording since we handle it)
         result = await ctx.run_stage(
@@ -441,6 +439,7 @@ async def _run_green_with_retry(
             model_override=model_override,
             **stage_kwargs,
         )
+        attempts_used = attempt
 
         # Record this attempt with actual attempt number
         await ctx.db.record_stage_attempt(
@@ -462,6 +461,7 @@ async def _run_green_with_retry(
                 task_key,
                 escalation_note,
             )
+            metrics.green_attempts.labels("success").observe(attempts_used)
             return result
 
         # Capture failure output for next iteration
@@ -479,6 +479,7 @@ async def _run_green_with_retry(
         max_attempts,
         task_key,
     )
+    metrics.green_attempts.labels("failure").observe(attempts_used)
 
     return last_result or StageResult(
         stage=Stage.GREEN,
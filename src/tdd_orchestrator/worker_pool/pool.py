@@ -85,6 +85,9 @@ class WorkerPool:
         )
 
         try:
+            # Coalesce heartbeat/invocation/attempt appends while workers run
+            await self.db.enable_write_batching()
+
             # Get claimable tasks for this phase
             tasks = await self.db.get_claimable_tasks(phase)
             if not tasks:
@@ -203,6 +206,9 @@ class WorkerPool:
                 await worker.stop()
                 result.worker_stats.append(worker.stats)
 
+            # Commit any queued appends before the run is finalized
+            await self.db.disable_write_batching()
+
             # Complete execution run
             status = "completed" if result.stopped_reason is None else "failed"
             await self.db.complete_execution_run(self.run_id, status)
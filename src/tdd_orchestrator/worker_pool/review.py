@@ -13,7 +13,7 @@ from pathlib import Path
 from typing import Any
 
 from ..ast_checker import ASTCheckResult, ASTQualityChecker, ASTViolation
-from ..subprocess_utils import resolve_tool
+from ..subprocess_utils import resolve_tool, spawn_subprocess
 from ..database import OrchestratorDB
 from .circuit_breakers import StaticReviewCircuitBreaker
 
@@ -173,7 +173,7 @@ async def verify_pytest_collection(test_file: str, base_dir: Path) -> tuple[bool
     """
     try:
         pytest_path = resolve_tool("pytest")
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             pytest_path,
             "--collect-only",
             "-q",
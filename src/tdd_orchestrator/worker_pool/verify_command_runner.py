@@ -11,10 +11,12 @@ import asyncio
 import logging
 import re
 import shlex
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
-from ..subprocess_utils import resolve_tool
+from ..pipeline_metrics import get_pipeline_metrics
+from ..subprocess_utils import resolve_tool, spawn_subprocess
 
 logger = logging.getLogger(__name__)
 
@@ -110,8 +112,9 @@ async def run_verify_command(
 
     resolved = resolve_tool(tool)
 
+    started = time.perf_counter()
     try:
-        proc = await asyncio.create_subprocess_exec(
+        proc = await spawn_subprocess(
             resolved, *args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
@@ -141,3 +144,7 @@ async def run_verify_command(
             stdout="", stderr=f"Tool not found: {e}",
             skipped=False, skip_reason="",
         )
+    finally:
+        get_pipeline_metrics().verify_tool_duration.labels(tool).observe(
+            time.perf_counter() - started
+        )
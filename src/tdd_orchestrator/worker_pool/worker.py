@@ -18,6 +18,7 @@ from ..database import OrchestratorDB
 from ..git_coordinator import GitCoordinator
 from ..git_stash_guard import GitStashGuard
 from ..models import Stage, StageResult
+from ..pipeline_metrics import get_pipeline_metrics
 from ..prompt_builder import PromptBuilder
 from .circuit_breakers import StaticReviewCircuitBreaker
 from .config import (
@@ -41,6 +42,9 @@ logger = logging.getLogger(__name__)
 class Worker:
     """Individual worker that processes tasks."""
 
+    # perf_counter() at the last successful claim, for queue wait metrics
+    _claimed_at: float | None = None
+
     def __init__(
         self,
         worker_id: int,
@@ -121,6 +125,7 @@ class Worker:
         if not claimed:
             logger.warning("Worker %d failed to claim task %s", self.worker_id, task_key)
             return False
+        self._claimed_at = time.perf_counter()
 
         try:
             # Create worker branch (skip in single branch mode)
@@ -230,6 +235,10 @@ class Worker:
 
     async def _run_tdd_pipeline(self, task: dict[str, Any]) -> bool:
         """Run TDD pipeline. Delegates to pipeline.run_tdd_pipeline()."""
+        if self._claimed_at is not None:
+            get_pipeline_metrics().queue_wait.observe(time.perf_counter() - self._claimed_at)
+            self._claimed_at = None
+
         # Check for resumable stage from prior attempts
         resume_from_stage: str | None = None
         task_id = task.get("id")
@@ -278,9 +287,6 @@ class Worker:
         Returns:
             StageResult with success status and output.
         """
-        # Build prompt for this stage
-        prompt = PromptBuilder.build(stage, task, base_dir=self.base_dir, **kwargs)
-
         # Verify SDK is available
         if not HAS_AGENT_SDK or sdk_query is None or ClaudeAgentOptions is None:
             logger.error("Agent SDK not available - cannot run stage %s", stage.value)
@@ -312,6 +318,11 @@ class Worker:
             complexity,
         )
 
+        # Build prompt for this stage (token budget depends on stage + model)
+        prompt = PromptBuilder.build(
+            stage, task, base_dir=self.base_dir, model=model, **kwargs
+        )
+
         # Configure Agent SDK
         options = ClaudeAgentOptions(
             allowed_tools=["Bash", "Read", "Write", "Edit", "Glob", "Grep"],
@@ -335,6 +346,7 @@ class Worker:
         # Track duration of SDK call
         start_time = time.time()
         duration_ms: int = 0
+        stage_started = time.perf_counter()
 
         try:
             # Wrap SDK call with timeout to prevent indefinite hangs
@@ -377,6 +389,9 @@ class Worker:
             return StageResult(stage=stage, success=False, output="", error=str(e))
 
         finally:
+            get_pipeline_metrics().stage_duration.labels(stage.value, model).observe(
+                time.perf_counter() - stage_started
+            )
             # Record invocation AFTER the SDK call with duration
             await self.db.record_invocation(
                 run_id=self.run_id,
@@ -195,3 +195,34 @@ class TestTaskResponseModel:
                 assert "id" in task
         finally:
             await db.close()
+
+
+class TestAttemptDetailResponse:
+    """Tests for GET /tasks/{task_key}/attempts/{attempt_id}."""
+
+    @pytest.mark.asyncio
+    async def test_attempt_detail_includes_tool_output(self) -> None:
+        """GIVEN an attempt recorded with pytest output
+        WHEN its detail is requested
+        THEN the output text is returned, and unknown attempts are 404.
+        """
+        app, db = await _create_seeded_test_app()
+        try:
+            task = await db.get_task_by_key("TDD-T01")
+            attempt_id = await db.record_attempt(
+                task["id"], "green", pytest_exit_code=1, pytest_output="1 failed"
+            )
+            async with AsyncClient(
+                transport=ASGITransport(app=app),
+                base_url="http://test",
+            ) as client:
+                response = await client.get(f"/tasks/TDD-T01/attempts/{attempt_id}")
+                missing = await client.get(f"/tasks/TDD-T02/attempts/{attempt_id}")
+
+            assert response.status_code == 200
+            json_body = response.json()
+            assert json_body["exit_codes"]["pytest"] == 1
+            assert json_body["outputs"] == {"pytest": "1 failed", "mypy": None, "ruff": None}
+            assert missing.status_code == 404
+        finally:
+            await db.close()
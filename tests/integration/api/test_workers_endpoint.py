@@ -90,3 +90,31 @@ class TestWorkersEndpoint:
         # Accept either format from the API
         workers = json_body.get("workers", json_body.get("items", []))
         assert isinstance(workers, list)
+
+
+class TestClaimTasksEndpoint:
+    """Tests for POST /workers/{worker_id}/claims endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_claims_ready_tasks_once(self) -> None:
+        """GIVEN a seeded database with one pending task
+        WHEN an external worker claims twice
+        THEN the first call returns the task and the second returns nothing.
+        """
+        app, db = await _create_seeded_test_app()
+
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=app),
+                base_url="http://test",
+            ) as client:
+                first = await client.post("/workers/1/claims", params={"limit": 5})
+                second = await client.post("/workers/2/claims", params={"limit": 5})
+
+            assert first.status_code == 200
+            assert [t["task_key"] for t in first.json()["items"]] == ["TDD-T01"]
+            assert second.json() == {"items": [], "total": 0}
+            task = await db.get_task_by_key("TDD-T01")
+            assert task is not None and task["claimed_by"] == 1
+        finally:
+            await db.close()
@@ -7,12 +7,15 @@ which import path the test file used to obtain ``ASGITransport``.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 import pytest
 from asgi_lifespan import LifespanManager
 from httpx import ASGITransport
 
+from tdd_orchestrator.database import OrchestratorDB
+
 _original_aexit = ASGITransport.__aexit__
 
 
@@ -37,3 +40,12 @@ def patch_asgi_transport(monkeypatch: pytest.MonkeyPatch) -> None:
     """Patch ASGITransport class methods for proper lifespan handling."""
     monkeypatch.setattr(ASGITransport, "__aenter__", _lifespan_aenter)
     monkeypatch.setattr(ASGITransport, "__aexit__", _lifespan_aexit)
+
+
+@pytest.fixture
+async def db() -> AsyncIterator[OrchestratorDB]:
+    """A connected in-memory database."""
+    database = OrchestratorDB(":memory:")
+    await database.connect()
+    yield database
+    await database.close()
@@ -0,0 +1,138 @@
+"""Tests for the versioned response cache and conditional GET support."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from tdd_orchestrator.api import dependencies
+from tdd_orchestrator.api.middleware.response_cache import (
+    ResponseCache,
+    ResponseCacheMiddleware,
+    etag_matches,
+    is_cached_path,
+)
+from tdd_orchestrator.api.routes import register_routes
+from tdd_orchestrator.database import OrchestratorDB
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncIterator[OrchestratorDB]:
+    database = OrchestratorDB(tmp_path / "cache.db")
+    await database.connect()
+    await database.create_task("T1", "Task", phase=0, sequence=1)
+    dependencies.init_dependencies(database, None)
+    yield database
+    dependencies.shutdown_dependencies()
+    await database.close()
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    return ResponseCache(probe_interval=0)
+
+
+@pytest.fixture
+async def client(cache: ResponseCache) -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+    register_routes(app)
+    app.add_middleware(ResponseCacheMiddleware, cache=cache)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+class TestConditionalGet:
+    async def test_repeat_request_served_from_cache(
+        self, db: OrchestratorDB, client: AsyncClient, cache: ResponseCache
+    ) -> None:
+        first = await client.get("/tasks/stats")
+        second = await client.get("/tasks/stats")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "no-cache"
+        assert (cache.stats().misses, cache.stats().hits) == (1, 1)
+
+    async def test_matching_etag_gets_empty_304(
+        self, db: OrchestratorDB, client: AsyncClient, cache: ResponseCache
+    ) -> None:
+        etag = (await client.get("/tasks")).headers["etag"]
+        response = await client.get("/tasks", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert cache.stats().not_modified == 1
+
+    async def test_write_through_this_process_invalidates(
+        self, db: OrchestratorDB, client: AsyncClient
+    ) -> None:
+        etag = (await client.get("/tasks/stats")).headers["etag"]
+        await db.update_task_status("T1", "in_progress")
+
+        response = await client.get("/tasks/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["running"] == 1
+        assert response.headers["etag"] != etag
+
+    async def test_commit_from_another_process_invalidates(
+        self, db: OrchestratorDB, client: AsyncClient
+    ) -> None:
+        assert (await client.get("/tasks/stats")).json()["pending"] == 1
+        other = sqlite3.connect(str(db.db_path))
+        with other:
+            other.execute("UPDATE tasks SET status = 'complete' WHERE task_key = 'T1'")
+        other.close()
+
+        assert (await client.get("/tasks/stats")).json()["passed"] == 1
+
+    async def test_other_processes_probed_at_most_once_per_interval(
+        self, db: OrchestratorDB, client: AsyncClient, cache: ResponseCache
+    ) -> None:
+        cache.probe_interval = 3600
+        await client.get("/tasks/stats")
+        other = sqlite3.connect(str(db.db_path))
+        with other:
+            other.execute("UPDATE tasks SET status = 'complete' WHERE task_key = 'T1'")
+        other.close()
+
+        assert (await client.get("/tasks/stats")).json()["pending"] == 1
+        cache.probe_interval = 0
+        assert (await client.get("/tasks/stats")).json()["passed"] == 1
+
+
+class TestCacheKeys:
+    async def test_query_order_does_not_matter(
+        self, db: OrchestratorDB, client: AsyncClient, cache: ResponseCache
+    ) -> None:
+        await client.get("/tasks?limit=5&offset=0")
+        await client.get("/tasks?offset=0&limit=5")
+        await client.get("/tasks?offset=1&limit=5")
+
+        assert (cache.stats().hits, cache.stats().entries) == (1, 2)
+
+    async def test_uncached_routes_and_errors_pass_through(
+        self, client: AsyncClient, cache: ResponseCache
+    ) -> None:
+        # No database: the route answers 503 and nothing is cached
+        response = await client.get("/tasks/stats")
+        assert response.status_code == 503
+        assert "etag" not in response.headers
+        assert cache.stats().entries == 0
+
+    def test_cached_paths(self) -> None:
+        assert is_cached_path("/tasks/")
+        assert is_cached_path("/analytics/attempts-by-stage")
+        assert not is_cached_path("/tasks/T1")
+        assert not is_cached_path("/events")
+
+    def test_etag_matching(self) -> None:
+        assert etag_matches('"a", W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
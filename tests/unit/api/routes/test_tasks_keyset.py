@@ -0,0 +1,112 @@
+"""Tests for keyset (cursor) pagination of GET /tasks against a real database."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from tdd_orchestrator.api.dependencies import get_db_dep
+from tdd_orchestrator.api.routes.tasks import decode_cursor, encode_cursor, router
+from tdd_orchestrator.database import OrchestratorDB
+
+
+@pytest.fixture
+async def db(db: OrchestratorDB) -> OrchestratorDB:
+    """The shared in-memory database, seeded with tasks."""
+    # Inserted out of order; two tasks share (phase, sequence)
+    for key, phase, sequence in [
+        ("T5", 1, 2),
+        ("T1", 0, 1),
+        ("T3", 0, 3),
+        ("T2", 0, 2),
+        ("T4", 1, 1),
+        ("T6", 1, 2),
+        ("T7", 2, 0),
+    ]:
+        await db.create_task(key, key, phase=phase, sequence=sequence)
+    await db.update_task_status("T3", "in_progress")
+    return db
+
+
+@pytest.fixture
+async def client(db: OrchestratorDB) -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+    app.include_router(router, prefix="/tasks")
+
+    async def override() -> AsyncIterator[Any]:
+        yield db
+
+    app.dependency_overrides[get_db_dep] = override
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+async def _all_pages(client: AsyncClient, **params: Any) -> list[dict[str, Any]]:
+    pages: list[dict[str, Any]] = []
+    cursor: str | None = None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/tasks", params=query)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = pages[-1]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+class TestKeysetPagination:
+    async def test_cursor_pages_cover_every_task_once_in_order(self, client: AsyncClient) -> None:
+        pages = await _all_pages(client, limit=3)
+
+        keys = [task["id"] for page in pages for task in page["tasks"]]
+        assert keys == ["T1", "T2", "T3", "T4", "T5", "T6", "T7"]
+        assert [len(page["tasks"]) for page in pages] == [3, 3, 1]
+        assert all(page["total"] == 7 and page["total_exact"] for page in pages)
+
+    async def test_exact_page_boundary_has_no_empty_trailing_page(
+        self, client: AsyncClient
+    ) -> None:
+        pages = await _all_pages(client, limit=7)
+        assert len(pages) == 1 and pages[0]["next_cursor"] is None
+
+    async def test_cursor_pages_can_reuse_first_total(
+        self, client: AsyncClient, db: OrchestratorDB
+    ) -> None:
+        first = (await client.get("/tasks", params={"limit": 2})).json()
+        await db.create_task("T8", "T8", phase=3, sequence=0)
+
+        params = {"limit": 2, "cursor": first["next_cursor"]}
+        carried = (await client.get("/tasks", params={**params, "exact_total": "false"})).json()
+        recounted = (await client.get("/tasks", params=params)).json()
+
+        assert (carried["total"], carried["total_exact"]) == (7, False)
+        assert (recounted["total"], recounted["total_exact"]) == (8, True)
+
+    async def test_filters_apply_to_pages_and_total(self, client: AsyncClient) -> None:
+        pages = await _all_pages(client, status="pending", limit=2)
+
+        keys = [task["id"] for page in pages for task in page["tasks"]]
+        assert keys == ["T1", "T2", "T4", "T5", "T6", "T7"]
+        assert pages[0]["total"] == 6
+
+    async def test_empty_page_still_reports_total(self, client: AsyncClient) -> None:
+        body = (await client.get("/tasks", params={"limit": 5, "offset": 50})).json()
+        assert (body["tasks"], body["total"], body["next_cursor"]) == ([], 7, None)
+
+    async def test_invalid_cursor_is_rejected(self, client: AsyncClient) -> None:
+        response = await client.get("/tasks", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+
+class TestCursorEncoding:
+    def test_round_trip(self) -> None:
+        assert decode_cursor(encode_cursor(1, 2, 3, 40)) == (1, 2, 3, 40)
+
+    def test_malformed(self) -> None:
+        for bad in ("", "e30", encode_cursor(1, 2, 3, 4)[:-3]):
+            with pytest.raises(ValueError):
+                decode_cursor(bad)
@@ -59,6 +59,21 @@ def _make_task_row(**overrides: Any) -> _MockRow:
     return _MockRow(defaults)
 
 
+def _make_page_cursor(task_rows: list[_MockRow], total: int) -> AsyncMock:
+    """Create a cursor for the single page-and-count query.
+
+    An empty page is a single row holding only the total (from the LEFT JOIN).
+    """
+    rows = [_MockRow({**row, "total": total}) for row in task_rows] or [
+        _MockRow({"total": total, "id": None})
+    ]
+    cursor = AsyncMock()
+    cursor.fetchall = AsyncMock(return_value=rows)
+    cursor.__aenter__ = AsyncMock(return_value=cursor)
+    cursor.__aexit__ = AsyncMock(return_value=False)
+    return cursor
+
+
 def _make_mock_db_with_conn() -> MagicMock:
     """Create a mock db object with a _conn attribute that supports execute."""
     mock_db = MagicMock()
@@ -91,20 +106,8 @@ class TestGetTasksDefaultParams:
                 id=2, task_key="TDD-01-02", title="Task two", status="in_progress"
             ),
         ]
-        count_row = _MockRow({"cnt": 2})
-
-        # Two sequential execute calls: main query then count query
-        main_cursor = AsyncMock()
-        main_cursor.fetchall = AsyncMock(return_value=task_rows)
-        main_cursor.__aenter__ = AsyncMock(return_value=main_cursor)
-        main_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        count_cursor = AsyncMock()
-        count_cursor.fetchone = AsyncMock(return_value=count_row)
-        count_cursor.__aenter__ = AsyncMock(return_value=count_cursor)
-        count_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        db._conn.execute = MagicMock(side_effect=[main_cursor, count_cursor])
+        # One query returns the page rows, each carrying the filtered total
+        db._conn.execute = MagicMock(return_value=_make_page_cursor(task_rows, total=2))
         return db
 
     @pytest.fixture
@@ -151,19 +154,8 @@ class TestGetTasksStatusFilter:
         task_rows = [
             _make_task_row(task_key="TDD-02-01", status="blocked"),
         ]
-        count_row = _MockRow({"cnt": 1})
-
-        main_cursor = AsyncMock()
-        main_cursor.fetchall = AsyncMock(return_value=task_rows)
-        main_cursor.__aenter__ = AsyncMock(return_value=main_cursor)
-        main_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        count_cursor = AsyncMock()
-        count_cursor.fetchone = AsyncMock(return_value=count_row)
-        count_cursor.__aenter__ = AsyncMock(return_value=count_cursor)
-        count_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        db._conn.execute = MagicMock(side_effect=[main_cursor, count_cursor])
+        # One query returns the page rows, each carrying the filtered total
+        db._conn.execute = MagicMock(return_value=_make_page_cursor(task_rows, total=1))
         return db
 
     @pytest.fixture
@@ -190,19 +182,8 @@ class TestGetTasksPhaseAndComplexityFilters:
         """Create a mock db returning filtered results."""
         db = _make_mock_db_with_conn()
         task_rows = [_make_task_row(complexity="high", phase=1)]
-        count_row = _MockRow({"cnt": 1})
-
-        main_cursor = AsyncMock()
-        main_cursor.fetchall = AsyncMock(return_value=task_rows)
-        main_cursor.__aenter__ = AsyncMock(return_value=main_cursor)
-        main_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        count_cursor = AsyncMock()
-        count_cursor.fetchone = AsyncMock(return_value=count_row)
-        count_cursor.__aenter__ = AsyncMock(return_value=count_cursor)
-        count_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        db._conn.execute = MagicMock(side_effect=[main_cursor, count_cursor])
+        # One query returns the page rows, each carrying the filtered total
+        db._conn.execute = MagicMock(return_value=_make_page_cursor(task_rows, total=1))
         return db
 
     @pytest.fixture
@@ -229,19 +210,8 @@ class TestGetTasksPagination:
         """Create a mock db returning one task with total=5."""
         db = _make_mock_db_with_conn()
         task_rows = [_make_task_row()]
-        count_row = _MockRow({"cnt": 5})
-
-        main_cursor = AsyncMock()
-        main_cursor.fetchall = AsyncMock(return_value=task_rows)
-        main_cursor.__aenter__ = AsyncMock(return_value=main_cursor)
-        main_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        count_cursor = AsyncMock()
-        count_cursor.fetchone = AsyncMock(return_value=count_row)
-        count_cursor.__aenter__ = AsyncMock(return_value=count_cursor)
-        count_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        db._conn.execute = MagicMock(side_effect=[main_cursor, count_cursor])
+        # One query returns the page rows, each carrying the filtered total
+        db._conn.execute = MagicMock(return_value=_make_page_cursor(task_rows, total=5))
         return db
 
     @pytest.fixture
@@ -272,19 +242,8 @@ class TestGetTasksEmptyResult:
     def mock_db(self) -> MagicMock:
         """Create a mock db returning empty results."""
         db = _make_mock_db_with_conn()
-        count_row = _MockRow({"cnt": 0})
-
-        main_cursor = AsyncMock()
-        main_cursor.fetchall = AsyncMock(return_value=[])
-        main_cursor.__aenter__ = AsyncMock(return_value=main_cursor)
-        main_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        count_cursor = AsyncMock()
-        count_cursor.fetchone = AsyncMock(return_value=count_row)
-        count_cursor.__aenter__ = AsyncMock(return_value=count_cursor)
-        count_cursor.__aexit__ = AsyncMock(return_value=False)
-
-        db._conn.execute = MagicMock(side_effect=[main_cursor, count_cursor])
+        # One query returns the page rows, each carrying the filtered total
+        db._conn.execute = MagicMock(return_value=_make_page_cursor([], total=0))
         return db
 
     @pytest.fixture
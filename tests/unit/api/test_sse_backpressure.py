@@ -0,0 +1,139 @@
+"""Tests for bounded SSE subscriber queues and their overflow policies."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import patch
+
+from tdd_orchestrator.api.routes.events import event_stream
+from tdd_orchestrator.api.sse import (
+    SNAPSHOT_REQUIRED_EVENT,
+    TASK_STATUS_EVENT,
+    OverflowPolicy,
+    SSEBroadcaster,
+    SSEEvent,
+)
+
+
+def _drain(queue: asyncio.Queue[SSEEvent | None]) -> list[SSEEvent | None]:
+    items: list[SSEEvent | None] = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def _status(task_id: str, status: str) -> SSEEvent:
+    return SSEEvent(
+        event=TASK_STATUS_EVENT, data=json.dumps({"task_id": task_id, "new_status": status})
+    )
+
+
+class TestOverflowPolicies:
+    async def test_drop_oldest_keeps_newest(self) -> None:
+        broadcaster = SSEBroadcaster(queue_size=2)
+        queue = await broadcaster.subscribe_async()
+        for name in "abcd":
+            await broadcaster.publish(SSEEvent(data=name))
+
+        assert [e.data for e in _drain(queue) if e] == ["c", "d"]
+        stats = broadcaster.stats()
+        assert (stats.published, stats.dropped, stats.disconnected) == (4, 2, 0)
+        assert broadcaster.subscriber_count == 1
+
+    async def test_disconnect_ends_slow_stream(self) -> None:
+        broadcaster = SSEBroadcaster(queue_size=2, overflow="disconnect")
+        slow = await broadcaster.subscribe_async()
+        fast = await broadcaster.subscribe_async()
+        await broadcaster.publish(SSEEvent(data="a"))
+        fast.get_nowait()
+        await broadcaster.publish(SSEEvent(data="b"))
+        fast.get_nowait()
+        await broadcaster.publish(SSEEvent(data="c"))
+
+        assert _drain(slow) == [None]
+        assert [e.data for e in _drain(fast) if e] == ["c"]
+        assert broadcaster.stats().disconnected == 1
+        assert broadcaster.subscriber_count == 1
+
+    async def test_coalesce_keeps_latest_status_per_task(self) -> None:
+        broadcaster = SSEBroadcaster(overflow=OverflowPolicy.COALESCE)
+        queue = await broadcaster.subscribe_async()
+        await broadcaster.publish(_status("T1", "in_progress"))
+        await broadcaster.publish(_status("T2", "in_progress"))
+        await broadcaster.publish(SSEEvent(event="other", data="{}"))
+        await broadcaster.publish(_status("T1", "complete"))
+
+        received = [json.loads(e.data) for e in _drain(queue) if e]
+        assert received == [
+            {"task_id": "T2", "new_status": "in_progress"},
+            {},
+            {"task_id": "T1", "new_status": "complete"},
+        ]
+        assert broadcaster.stats().coalesced == 1
+
+    async def test_delivered_status_is_not_coalesced(self) -> None:
+        broadcaster = SSEBroadcaster(overflow=OverflowPolicy.COALESCE)
+        queue = await broadcaster.subscribe_async()
+        await broadcaster.publish(_status("T1", "in_progress"))
+        await queue.get()
+        await broadcaster.publish(_status("T1", "complete"))
+
+        assert len(_drain(queue)) == 1
+        assert broadcaster.stats().coalesced == 0
+
+    async def test_replay_larger_than_queue_requires_snapshot(self) -> None:
+        broadcaster = SSEBroadcaster(queue_size=2)
+        first = SSEEvent(data="a")
+        await broadcaster.publish(first)
+        for name in "bcd":
+            await broadcaster.publish(SSEEvent(data=name))
+        assert first.id is not None
+
+        queue = await broadcaster.subscribe_async(last_event_id=first.id)
+        (signal,) = _drain(queue)
+        assert signal is not None and signal.event == SNAPSHOT_REQUIRED_EVENT
+
+
+class TestStats:
+    async def test_queue_depth(self) -> None:
+        broadcaster = SSEBroadcaster()
+        first = await broadcaster.subscribe_async()
+        await broadcaster.subscribe_async()
+        await broadcaster.publish(SSEEvent(data="a"))
+        await broadcaster.publish(SSEEvent(data="b"))
+        first.get_nowait()
+
+        stats = broadcaster.stats()
+        assert (stats.queue_depth, stats.max_queue_depth) == (3, 2)
+
+
+class TestSharedEncoding:
+    async def test_event_serialized_once_for_all_subscribers(self) -> None:
+        broadcaster = SSEBroadcaster()
+        streams = [event_stream(broadcaster, encoded=True) for _ in range(3)]
+        pending = [asyncio.ensure_future(anext(stream)) for stream in streams]
+        while broadcaster.subscriber_count < 3:
+            await asyncio.sleep(0)
+
+        event = SSEEvent(event="update", data="x")
+        await broadcaster.publish(event)
+        chunks = await asyncio.gather(*pending)
+        for stream in streams:
+            await stream.aclose()
+
+        assert chunks[0] == event.serialize().encode()
+        assert all(chunk is chunks[0] for chunk in chunks)
+
+
+class TestStatusCallback:
+    async def test_observer_callback_delivers_to_subscribers(self) -> None:
+        from tdd_orchestrator.api import app as app_module
+
+        broadcaster = SSEBroadcaster()
+        queue = await broadcaster.subscribe_async()
+        with patch.object(app_module, "_broadcaster", broadcaster):
+            app_module._create_task_status_callback()({"task_id": "T1"})
+            event = await asyncio.wait_for(queue.get(), timeout=1.0)
+
+        assert event is not None and event.event == TASK_STATUS_EVENT
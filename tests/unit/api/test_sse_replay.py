@@ -0,0 +1,149 @@
+"""Tests for SSE event ids and Last-Event-ID replay."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from tdd_orchestrator.api.routes.events import event_stream, router
+from tdd_orchestrator.api.sse import SNAPSHOT_REQUIRED_EVENT, SSEBroadcaster, SSEEvent
+
+
+def _drain(queue: asyncio.Queue[SSEEvent | None]) -> list[SSEEvent]:
+    events: list[SSEEvent] = []
+    while not queue.empty():
+        event = queue.get_nowait()
+        assert event is not None
+        events.append(event)
+    return events
+
+
+async def _publish(broadcaster: SSEBroadcaster, *names: str) -> list[SSEEvent]:
+    events = [SSEEvent(event=name, data=name) for name in names]
+    for event in events:
+        await broadcaster.publish(event)
+    return events
+
+
+class TestEventIds:
+    async def test_ids_increase_monotonically(self) -> None:
+        broadcaster = SSEBroadcaster()
+        events = await _publish(broadcaster, "a", "b", "c")
+
+        ids = [int(e.id) for e in events if e.id is not None]
+        assert len(ids) == 3
+        assert ids == sorted(ids) and len(set(ids)) == 3
+        assert broadcaster.last_event_id == ids[-1]
+
+    async def test_explicit_ids_kept_and_not_replayed(self) -> None:
+        broadcaster = SSEBroadcaster()
+        (first,) = await _publish(broadcaster, "a")
+        await broadcaster.publish(SSEEvent(data="x", id="custom"))
+        assert first.id is not None
+
+        assert broadcaster.replay_since(first.id) == []
+
+    async def test_publish_async_assigns_ids(self) -> None:
+        broadcaster = SSEBroadcaster()
+        event = SSEEvent(data="x")
+        await broadcaster.publish_async(event)
+        assert event.id == str(broadcaster.last_event_id)
+
+
+class TestReplay:
+    async def test_reconnect_receives_missed_events_then_live(self) -> None:
+        broadcaster = SSEBroadcaster()
+        seen, *missed = await _publish(broadcaster, "a", "b", "c")
+        assert seen.id is not None
+
+        queue = await broadcaster.subscribe_async(last_event_id=seen.id)
+        (live,) = await _publish(broadcaster, "d")
+
+        assert _drain(queue) == [*missed, live]
+
+    async def test_up_to_date_client_gets_no_replay(self) -> None:
+        broadcaster = SSEBroadcaster()
+        (last,) = await _publish(broadcaster, "a")
+        assert last.id is not None
+
+        queue = await broadcaster.subscribe_async(last_event_id=last.id)
+        assert queue.empty()
+
+    async def test_gap_older_than_buffer_requires_snapshot(self) -> None:
+        broadcaster = SSEBroadcaster(replay_size=2)
+        first, *_ = await _publish(broadcaster, "a", "b", "c", "d")
+        assert first.id is not None
+
+        queue = await broadcaster.subscribe_async(last_event_id=first.id)
+        (signal,) = _drain(queue)
+        assert signal.event == SNAPSHOT_REQUIRED_EVENT
+        assert json.loads(signal.data) == {"last_event_id": first.id}
+        # The client resumes from the newest event once it has re-fetched
+        assert signal.id == str(broadcaster.last_event_id)
+
+    async def test_unknown_or_future_ids_require_snapshot(self) -> None:
+        broadcaster = SSEBroadcaster()
+        await _publish(broadcaster, "a")
+
+        assert broadcaster.replay_since("not-a-number") is None
+        assert broadcaster.replay_since(str(broadcaster.last_event_id + 10)) is None
+        # An id from a previous process predates this one's buffer
+        assert broadcaster.replay_since("1") is None
+
+    async def test_heartbeats_are_not_replayed(self) -> None:
+        broadcaster = SSEBroadcaster(heartbeat_interval=0.01)
+        try:
+            (seen,) = await _publish(broadcaster, "a")
+            assert seen.id is not None
+            await asyncio.sleep(0.05)
+            assert broadcaster.replay_since(seen.id) == []
+        finally:
+            await broadcaster.shutdown()
+
+
+class TestEndpointResume:
+    async def test_event_stream_yields_ids_and_replays(self) -> None:
+        broadcaster = SSEBroadcaster()
+        seen, missed = await _publish(broadcaster, "a", "b")
+        assert seen.id is not None
+
+        stream = event_stream(broadcaster, seen.id)
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert first == {"event": "b", "data": "b", "id": missed.id}
+
+    async def test_last_event_id_header_is_forwarded(self) -> None:
+        app = FastAPI()
+        app.include_router(router)
+        broadcaster = SSEBroadcaster()
+        seen, _ = await _publish(broadcaster, "a", "b")
+        assert seen.id is not None
+        await broadcaster.shutdown()  # ends the stream after the replay
+
+        received: list[str | None] = []
+        original = broadcaster.subscribe_async
+
+        async def spy(last_event_id: str | None = None) -> asyncio.Queue[SSEEvent | None]:
+            received.append(last_event_id)
+            return await original(last_event_id=last_event_id)
+
+        with (
+            patch.object(broadcaster, "subscribe_async", spy),
+            patch(
+                "tdd_orchestrator.api.routes.events.get_broadcaster_dep",
+                return_value=broadcaster,
+            ),
+        ):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await asyncio.wait_for(
+                    client.get("/events", headers={"Last-Event-ID": seen.id}), timeout=5.0
+                )
+
+        assert response.status_code == 200
+        assert received == [seen.id]
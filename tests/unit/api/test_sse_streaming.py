@@ -0,0 +1,70 @@
+"""Tests for the SSE streaming loop, keep-alive and fan-out benchmark."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from tdd_orchestrator.api.routes.events import KEEPALIVE_INTERVAL, event_stream, get_events
+from tdd_orchestrator.api.sse import SSEBroadcaster, SSEEvent
+from tdd_orchestrator.api.sse_benchmark import run_fanout_benchmark
+
+
+class TestStreamLoop:
+    async def test_idle_stream_blocks_on_queue(self) -> None:
+        broadcaster = SSEBroadcaster()
+        stream = event_stream(broadcaster)
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.05)
+        queue = next(iter(broadcaster._subscribers))
+
+        # Blocked in queue.get(), not a timed poll
+        assert not pending.done()
+        assert queue._getters  # type: ignore[attr-defined]
+
+        await broadcaster.publish(SSEEvent(data="x"))
+        message = await pending
+        assert isinstance(message, dict) and message["data"] == "x"
+        await stream.aclose()
+
+    async def test_cancelled_stream_unsubscribes(self) -> None:
+        broadcaster = SSEBroadcaster()
+
+        async def consume() -> None:
+            async for _ in event_stream(broadcaster):
+                pass
+
+        task = asyncio.create_task(consume())
+        while broadcaster.subscriber_count == 0:
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert broadcaster.subscriber_count == 0
+
+
+class TestKeepAlive:
+    async def test_route_sends_keepalive_comments(self) -> None:
+        request = type("Request", (), {"headers": {}})()
+        with patch(
+            "tdd_orchestrator.api.routes.events.get_broadcaster_dep",
+            return_value=SSEBroadcaster(),
+        ):
+            response = await get_events(request)
+
+        assert response.ping_interval == KEEPALIVE_INTERVAL
+        assert response.ping_message_factory is not None
+        assert response.ping_message_factory().encode() == b": keep-alive\r\n\r\n"
+
+
+class TestFanoutBenchmark:
+    async def test_every_subscriber_receives_every_event(self) -> None:
+        results = await run_fanout_benchmark(
+            subscribers=20, events=5, interval=0.0, idle_seconds=0.05
+        )
+
+        assert results["latency_ms"]["deliveries"] == 100
+        assert results["completed_subscribers"] == 20
+        assert results["dropped"] == 0
+        assert results["latency_ms"]["p50"] <= results["latency_ms"]["max"]
+        assert {"idle", "fanout", "latency_ms"} <= results.keys()
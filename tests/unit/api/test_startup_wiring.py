@@ -931,3 +931,125 @@ class TestEdgeCases:
                 assert len(registration_time) >= 1
             # Request should complete
             assert len(request_time) == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_task_is_held_until_it_completes(self) -> None:
+        """GIVEN a real broadcaster with one subscriber
+        WHEN the status callback fires outside of any awaiting code
+        THEN the publish task is referenced until it has delivered the event.
+        """
+        import asyncio
+
+        from tdd_orchestrator.api import app as app_module
+        from tdd_orchestrator.api.sse import SSEBroadcaster
+
+        broadcaster = SSEBroadcaster()
+        queue = await broadcaster.subscribe_async()
+        with patch.object(app_module, "_broadcaster", broadcaster):
+            app_module._create_task_status_callback()(
+                {"task_id": "T1", "old_status": "pending", "new_status": "running"}
+            )
+            assert len(app_module._publish_tasks) == 1
+            event = await asyncio.wait_for(queue.get(), timeout=1.0)
+            await asyncio.sleep(0)
+
+        assert event is not None and event.event == "task_status_changed"
+        assert not app_module._publish_tasks
+        await broadcaster.shutdown()
+
+
+
+@pytest.fixture
+def status_changes() -> Any:
+    """Collect the task status changes dispatched to observer callbacks."""
+    from tdd_orchestrator.db.observer import register_task_callback, unregister_task_callback
+
+    received: list[dict[str, Any]] = []
+    register_task_callback(received.append)
+    yield received
+    unregister_task_callback(received.append)
+
+
+class TestTaskObserverMode:
+    """TDD_TASK_OBSERVER selects how status changes reach the callbacks."""
+
+    @staticmethod
+    async def _start(monkeypatch: pytest.MonkeyPatch, tmp_path: Any, mode: str | None) -> Any:
+        from tdd_orchestrator.api import app as app_module
+        from tdd_orchestrator.database import OrchestratorDB
+
+        db_path = tmp_path / "observer.db"
+        async with OrchestratorDB(db_path) as seed:
+            await seed.create_task("T1", "Task", phase=0, sequence=1)
+        monkeypatch.setenv("TDD_ORCHESTRATOR_DB_PATH", str(db_path))
+        monkeypatch.setenv("TDD_TASK_OBSERVER_POLL_INTERVAL", "0.02")
+        if mode is None:
+            monkeypatch.delenv("TDD_TASK_OBSERVER", raising=False)
+        else:
+            monkeypatch.setenv("TDD_TASK_OBSERVER", mode)
+        try:
+            await app_module.init_dependencies()
+        except Exception:
+            await app_module.shutdown_dependencies()
+            raise
+        return app_module
+
+    @staticmethod
+    async def _wait_for(received: list[dict[str, Any]]) -> None:
+        import asyncio
+
+        for _ in range(100):
+            if received:
+                return
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_poll_is_default_and_sees_other_processes(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Any,
+        status_changes: list[dict[str, Any]],
+    ) -> None:
+        from tdd_orchestrator.database import OrchestratorDB
+        from tdd_orchestrator.db.observer import DBObserver
+
+        app_module = await self._start(monkeypatch, tmp_path, None)
+        try:
+            assert isinstance(app_module._observer, DBObserver)
+            # A worker pool writing through its own connection
+            async with OrchestratorDB(tmp_path / "observer.db") as worker_db:
+                await worker_db.update_task_status("T1", "in_progress")
+            await self._wait_for(status_changes)
+        finally:
+            await app_module.shutdown_dependencies()
+
+        assert [(e["task_id"], e["new_status"]) for e in status_changes] == [
+            ("T1", "in_progress")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bus_mode_pushes_changes_made_in_process(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Any,
+        status_changes: list[dict[str, Any]],
+    ) -> None:
+        from tdd_orchestrator.api.dependencies import get_db_instance
+        from tdd_orchestrator.db.observer import EventBusObserver
+
+        app_module = await self._start(monkeypatch, tmp_path, "bus")
+        try:
+            assert isinstance(app_module._observer, EventBusObserver)
+            await get_db_instance().update_task_status("T1", "complete")
+            await self._wait_for(status_changes)
+        finally:
+            await app_module.shutdown_dependencies()
+
+        assert [(e["task_id"], e["new_status"]) for e in status_changes] == [("T1", "complete")]
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode_fails_startup(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+    ) -> None:
+        with pytest.raises(ValueError, match="TDD_TASK_OBSERVER"):
+            await self._start(monkeypatch, tmp_path, "inotify")
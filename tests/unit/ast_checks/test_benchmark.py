@@ -0,0 +1,86 @@
+"""Unit tests for the AST checker benchmark harness."""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+from typing import Any
+
+from tdd_orchestrator.ast_checker.benchmark import (
+    DETECTORS,
+    STATIC_REVIEW_TIMEOUT_MS,
+    compare_to_baseline,
+    generate_pathological_module,
+    generate_test_module,
+    load_real_corpus,
+    run_benchmarks,
+)
+
+
+def _result(median_ms: float, peak_kib: float = 100.0, within: bool = True) -> dict[str, Any]:
+    return {
+        "corpora": {
+            "small": {
+                "lines": 150,
+                "check_file": {
+                    "median_ms": median_ms,
+                    "peak_kib": peak_kib,
+                    "within_static_review_timeout": within,
+                },
+                "detectors": {"PrintDetector": {"median_ms": median_ms / 10, "peak_kib": 5.0}},
+            }
+        }
+    }
+
+
+class TestCorpora:
+    def test_generated_module_hits_target_size_and_parses(self) -> None:
+        source = generate_test_module(2_000)
+        assert 2_000 <= len(source.splitlines()) < 2_100
+        ast.parse(source)
+
+    def test_pathological_module_parses(self) -> None:
+        ast.parse(generate_pathological_module())
+
+    def test_load_real_corpus_prefers_largest_files(self, tmp_path: Path) -> None:
+        (tmp_path / "big.py").write_text("x = 1\n" * 50)
+        (tmp_path / "small.py").write_text("y = 2\n")
+        assert list(load_real_corpus(tmp_path, limit=1)) == ["real:big.py"]
+
+
+class TestCompareToBaseline:
+    def test_no_regression_within_tolerance(self) -> None:
+        assert compare_to_baseline(_result(11.0), _result(10.0), tolerance=0.25) == []
+
+    def test_timing_regression_reported(self) -> None:
+        regressions = compare_to_baseline(_result(20.0), _result(10.0))
+        assert "small/check_file: median_ms 10.0 -> 20.0 (+100%)" in regressions
+
+    def test_sub_millisecond_noise_ignored(self) -> None:
+        assert compare_to_baseline(_result(1.5), _result(1.0)) == []
+
+    def test_memory_regression_reported(self) -> None:
+        regressions = compare_to_baseline(_result(10.0, peak_kib=200.0), _result(10.0))
+        assert regressions == ["small/check_file: peak_kib 100.0 -> 200.0 (+100%)"]
+
+    def test_timeout_breach_always_reported(self) -> None:
+        regressions = compare_to_baseline(_result(600.0, within=False), {})
+        assert len(regressions) == 1
+        assert f"exceeds {STATIC_REVIEW_TIMEOUT_MS}ms static review timeout" in regressions[0]
+
+
+def test_run_benchmarks_covers_every_detector() -> None:
+    results = run_benchmarks(iterations=1, corpora={"tiny": generate_test_module(40)})
+
+    corpus = results["corpora"]["tiny"]
+    assert set(corpus["detectors"]) == set(DETECTORS)
+    assert corpus["check_file"]["median_ms"] > 0
+    assert corpus["check_file"]["within_static_review_timeout"] is True
+    assert compare_to_baseline(results, results) == []
+
+
+def test_pathological_corpus_has_no_recursion_errors() -> None:
+    """Deep nesting must not blow the recursive NodeVisitor traversal."""
+    results = run_benchmarks(iterations=1, corpora={"nesting": generate_pathological_module()})
+    detectors = results["corpora"]["nesting"]["detectors"]
+    assert not [name for name, stats in detectors.items() if "error" in stats]
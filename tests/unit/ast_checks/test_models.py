@@ -0,0 +1,66 @@
+"""Unit tests for the compact ASTViolation and ASTCheckResult records."""
+
+from __future__ import annotations
+
+import pytest
+
+from tdd_orchestrator.ast_checker.models import ASTCheckResult, ASTViolation
+
+SOURCE_LINES = ["import os", "    password = 'hunter22'  ", "print(x)"]
+
+
+class TestASTViolation:
+    """Slotted violation records with lazily resolved snippets."""
+
+    def test_has_no_instance_dict(self) -> None:
+        violation = ASTViolation("print_statement", 3, "msg", "warning")
+        assert not hasattr(violation, "__dict__")
+        with pytest.raises(AttributeError):
+            violation.extra = 1  # type: ignore[attr-defined]
+
+    def test_snippet_resolved_lazily_from_source_lines(self) -> None:
+        violation = ASTViolation("hardcoded_secret", 2, "msg", "error", source_lines=SOURCE_LINES)
+        assert violation._snippet is None
+        assert violation.code_snippet == "password = 'hunter22'"
+        # Resolved once; the source reference is released
+        assert violation._source_lines is None
+
+    def test_out_of_range_line_gives_empty_snippet(self) -> None:
+        violation = ASTViolation("x", 99, "msg", "error", source_lines=SOURCE_LINES)
+        assert violation.code_snippet == ""
+
+    def test_explicit_snippet_wins(self) -> None:
+        violation = ASTViolation(
+            "x", 2, "msg", "error", code_snippet="given", source_lines=SOURCE_LINES
+        )
+        assert violation.code_snippet == "given"
+
+    def test_pattern_and_severity_interned(self) -> None:
+        parts = ["stub_", "detected", "err", "or"]
+        # Build the strings at runtime so they are not compile-time constants
+        a = ASTViolation(parts[0] + parts[1], 1, "m", parts[2] + parts[3])
+        b = ASTViolation("stub_detected", 2, "m", "error")
+        assert a.pattern is b.pattern
+        assert a.severity is b.severity
+
+    def test_equality_uses_resolved_snippet(self) -> None:
+        lazy = ASTViolation("p", 3, "m", "warning", source_lines=SOURCE_LINES)
+        eager = ASTViolation("p", 3, "m", "warning", code_snippet="print(x)")
+        assert lazy == eager
+        assert "code_snippet='print(x)'" in repr(lazy)
+
+    def test_to_issue(self) -> None:
+        violation = ASTViolation("p", 1, "m", "error", source_lines=SOURCE_LINES)
+        assert violation.to_issue() == {
+            "pattern": "p",
+            "line_number": 1,
+            "message": "m",
+            "severity": "error",
+            "code_snippet": "import os",
+        }
+
+
+def test_check_result_blocking_and_slotted() -> None:
+    result = ASTCheckResult(violations=[ASTViolation("p", 1, "m", "error")])
+    assert result.is_blocking is True
+    assert not hasattr(result, "__dict__")
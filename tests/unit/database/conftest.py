@@ -1,15 +1,28 @@
 """Shared fixtures for database unit tests.
 
-Sets up an in-memory database via the singleton for testing mixins.
+Sets up an in-memory database via the singleton for testing mixins, and
+provides a standalone in-memory ``db`` for tests that take one.
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 import pytest
 
+from tdd_orchestrator.database import OrchestratorDB
 from tdd_orchestrator.database.singleton import get_db, reset_db, set_db_path
 
 
+@pytest.fixture
+async def db() -> AsyncIterator[OrchestratorDB]:
+    """A connected in-memory database, separate from the singleton."""
+    database = OrchestratorDB(":memory:")
+    await database.connect()
+    yield database
+    await database.close()
+
+
 @pytest.fixture(autouse=True)
 async def reset_database_singleton(request: pytest.FixtureRequest) -> None:
     """Reset database singleton before each test to ensure isolation.
@@ -0,0 +1,198 @@
+"""Tests for the trigger-maintained analytics rollup tables."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from tdd_orchestrator.api.dependencies import get_db_dep
+from tdd_orchestrator.api.routes.analytics import router
+from tdd_orchestrator.database import OrchestratorDB
+
+ROLLUP_TABLES = ("attempt_stage_rollup", "invocation_stage_rollup", "task_completion_rollup")
+
+# The aggregates the rollups replace, computed over the source tables
+ATTEMPTS_BY_STAGE = """
+SELECT stage, COUNT(*), SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END), AVG(duration_ms)
+FROM attempts GROUP BY stage ORDER BY stage
+"""
+ATTEMPTS_ROLLUP = """
+SELECT stage, attempts, successes, CAST(duration_ms AS REAL) / NULLIF(timed, 0)
+FROM attempt_stage_rollup WHERE attempts > 0 ORDER BY stage
+"""
+INVOCATIONS_BY_STAGE = """
+SELECT stage, COUNT(*), COALESCE(SUM(token_count), 0), AVG(duration_ms)
+FROM invocations GROUP BY stage ORDER BY stage
+"""
+INVOCATIONS_ROLLUP = """
+SELECT stage, invocations, tokens, CAST(duration_ms AS REAL) / NULLIF(timed, 0)
+FROM invocation_stage_rollup WHERE invocations > 0 ORDER BY stage
+"""
+COMPLETIONS_BY_DAY = """
+SELECT DATE(updated_at), COUNT(*) FROM tasks
+WHERE status IN ('complete', 'passing') GROUP BY DATE(updated_at) ORDER BY 1
+"""
+COMPLETIONS_ROLLUP = """
+SELECT day, completed FROM task_completion_rollup WHERE completed > 0 ORDER BY day
+"""
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncIterator[OrchestratorDB]:
+    async with OrchestratorDB(tmp_path / "rollups.db") as database:
+        yield database
+
+
+async def _rows(db: OrchestratorDB, sql: str) -> list[tuple[Any, ...]]:
+    await db.flush_writes()
+    assert db._conn is not None
+    async with db._conn.execute(sql) as cursor:
+        return [tuple(row) for row in await cursor.fetchall()]
+
+
+async def _assert_consistent(db: OrchestratorDB) -> None:
+    assert await _rows(db, ATTEMPTS_ROLLUP) == await _rows(db, ATTEMPTS_BY_STAGE)
+    assert await _rows(db, INVOCATIONS_ROLLUP) == await _rows(db, INVOCATIONS_BY_STAGE)
+    assert await _rows(db, COMPLETIONS_ROLLUP) == await _rows(db, COMPLETIONS_BY_DAY)
+
+
+async def _seed(db: OrchestratorDB) -> None:
+    for i in range(4):
+        await db.create_task(f"T{i}", f"Task {i}", phase=0, sequence=i)
+    task_id = int((await db.get_task_by_key("T0") or {})["id"])
+    for stage, success, duration in [
+        ("red", 1, 100),
+        ("red", 0, None),
+        ("green", 1, 300),
+        ("green", 1, 500),
+        ("green", 0, 50),
+    ]:
+        await db.execute_update(
+            "INSERT INTO attempts (task_id, stage, attempt_number, success, duration_ms) "
+            "VALUES (?, ?, 1, ?, ?)",
+            (task_id, stage, success, duration),
+        )
+    run_id = await db.start_execution_run(1)
+    await db.record_invocation(run_id, "red", token_count=10, duration_ms=20)
+    await db.record_invocation(run_id, "red", token_count=None, duration_ms=None)
+    await db.record_invocation(run_id, "green", token_count=5, duration_ms=40)
+    await db.mark_task_complete("T0")
+    await db.update_task_status("T1", "passing")
+
+
+class TestTriggers:
+    async def test_inserts_match_full_aggregates(self, db: OrchestratorDB) -> None:
+        await _seed(db)
+        await _assert_consistent(db)
+        assert (await _rows(db, ATTEMPTS_ROLLUP))[0] == ("green", 3, 2, pytest.approx(850 / 3))
+
+    async def test_updates_and_deletes_stay_consistent(self, db: OrchestratorDB) -> None:
+        await _seed(db)
+        await db.execute_update(
+            "UPDATE attempts SET stage = 'review', success = 1, duration_ms = 7 "
+            "WHERE stage = 'red' AND success = 0"
+        )
+        await db.execute_update("DELETE FROM attempts WHERE stage = 'green' AND success = 0")
+        await db.execute_update("UPDATE invocations SET token_count = 99 WHERE stage = 'green'")
+        await db.execute_update("DELETE FROM invocations WHERE stage = 'red'")
+        await db.update_task_status("T0", "in_progress")
+        await db.execute_update(
+            "UPDATE tasks SET updated_at = '2024-01-02 10:00:00' WHERE task_key = 'T1'"
+        )
+        await db.execute_update(
+            "INSERT INTO tasks (task_key, title, status, updated_at) "
+            "VALUES ('T9', 'Done', 'complete', '2024-01-02 11:00:00')"
+        )
+        await db.execute_update("DELETE FROM tasks WHERE task_key = 'T2'")
+
+        await _assert_consistent(db)
+        assert await _rows(db, INVOCATIONS_ROLLUP) == [("green", 1, 99, 40.0)]
+        assert await _rows(db, COMPLETIONS_ROLLUP) == [("2024-01-02", 2)]
+
+    async def test_completion_counted_on_day_of_status_change(self, db: OrchestratorDB) -> None:
+        await db.create_task("T1", "Task", phase=0, sequence=1)
+        await db.execute_update(
+            "UPDATE tasks SET updated_at = '2020-05-05 00:00:00' WHERE task_key = 'T1'"
+        )
+        await db.mark_task_complete("T1")
+
+        rows = await _rows(db, COMPLETIONS_ROLLUP)
+        assert len(rows) == 1 and rows[0][0] != "2020-05-05"
+        await _assert_consistent(db)
+
+    async def test_archival_removes_archived_rows(self, db: OrchestratorDB) -> None:
+        await _seed(db)
+        run_id = await db.get_latest_run_id()
+        await db.complete_execution_run(int(run_id or 0))
+        await db.execute_update("UPDATE execution_runs SET completed_at = '2020-01-01 00:00:00'")
+        await db.archive_runs(7, vacuum=False)
+
+        assert await _rows(db, INVOCATIONS_ROLLUP) == []
+        await _assert_consistent(db)
+
+
+class TestRebuild:
+    async def test_rebuild_restores_rollups(self, db: OrchestratorDB) -> None:
+        await _seed(db)
+        await db.execute_update("DELETE FROM attempt_stage_rollup")
+        await db.execute_update("UPDATE task_completion_rollup SET completed = 42")
+
+        counts = await db.rebuild_analytics_rollups()
+
+        assert counts == {
+            "attempt_stage_rollup": 2,
+            "invocation_stage_rollup": 2,
+            "task_completion_rollup": 1,
+        }
+        await _assert_consistent(db)
+
+    async def test_upgrade_backfills_existing_history(self, tmp_path: Path) -> None:
+        path = tmp_path / "legacy.db"
+        async with OrchestratorDB(path) as database:
+            await _seed(database)
+        conn = sqlite3.connect(str(path))
+        with conn:
+            for table in ROLLUP_TABLES:
+                conn.execute(f"DROP TABLE {table}")
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%rollup%'"
+            ).fetchall():
+                conn.execute(f"DROP TRIGGER {name}")
+            conn.execute("PRAGMA user_version = 9")
+        conn.close()
+
+        async with OrchestratorDB(path) as database:
+            await _assert_consistent(database)
+            assert await _rows(database, COMPLETIONS_ROLLUP)
+
+
+class TestEndpoints:
+    async def test_endpoints_read_rollups(self, db: OrchestratorDB) -> None:
+        await _seed(db)
+        app = FastAPI()
+        app.include_router(router, prefix="/analytics")
+        app.dependency_overrides[get_db_dep] = lambda: db
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            stages = (await c.get("/analytics/attempts-by-stage")).json()["stages"]
+            invocations = (await c.get("/analytics/invocation-stats")).json()["invocations"]
+            timeline = (await c.get("/analytics/task-completion-timeline")).json()["timeline"]
+
+        assert stages[1] == {
+            "stage": "red",
+            "total": 2,
+            "successes": 1,
+            "avg_duration_ms": 100.0,
+        }
+        assert invocations[1] == {
+            "stage": "red",
+            "count": 2,
+            "total_tokens": 10,
+            "avg_duration_ms": 20.0,
+        }
+        assert [point["completed"] for point in timeline] == [2]
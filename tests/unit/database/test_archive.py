@@ -0,0 +1,134 @@
+"""Tests for run archival and retention."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.database.blobs import decode_blob
+
+OLD = "2020-01-01 00:00:00"
+
+
+async def _seed(db: OrchestratorDB) -> tuple[int, int]:
+    """Create an old finished run and a recent one, each with history."""
+    done = await db.create_task("TDD-1", "Done")
+    open_task = await db.create_task("TDD-2", "Open")
+    await db.update_task_status("TDD-1", "complete")
+    worker = await db.register_worker(1)
+
+    old_run = await db.start_execution_run(1)
+    await db.record_invocation(old_run, "red", worker_id=worker, task_id=done, token_count=10)
+    await db.record_invocation(old_run, "green", worker_id=worker, task_id=done, token_count=5)
+    await db.complete_execution_run(old_run)
+    new_run = await db.start_execution_run(1)
+    await db.record_invocation(new_run, "red", worker_id=worker, task_id=open_task)
+
+    for task_id in (done, open_task):
+        await db.record_attempt(task_id, "green", pytest_output=f"output of {task_id}")
+    await db.update_worker_heartbeat(1, done)
+    await db.execute_update(
+        "INSERT INTO static_review_metrics (task_id, task_key, run_id, check_name,"
+        " line_number, message) VALUES (?, 'TDD-1', ?, 'check', 1, 'msg')",
+        (done, old_run),
+    )
+
+    # Age everything except the recent run
+    await db.execute_update(
+        "UPDATE execution_runs SET started_at = ?, completed_at = ? WHERE id = ?",
+        (OLD, OLD, old_run),
+    )
+    await db.execute_update("UPDATE attempts SET started_at = ?", (OLD,))
+    await db.execute_update("UPDATE worker_heartbeats SET timestamp = ?", (OLD,))
+    return old_run, new_run
+
+
+async def _count(db: OrchestratorDB, table: str) -> int:
+    rows = await db.execute_query(f"SELECT COUNT(*) AS n FROM {table}")
+    return int(rows[0]["n"])
+
+
+async def test_old_runs_summarized_and_history_removed(tmp_path: Path) -> None:
+    async with OrchestratorDB(tmp_path / "orchestrator.db") as db:
+        old_run, new_run = await _seed(db)
+
+        result = await db.archive_runs()
+
+        assert result.run_ids == [old_run]
+        assert result.rows["invocations"] == 2
+        assert result.rows["attempts"] == 1  # the open task keeps its history
+        assert result.rows["worker_heartbeats"] == 1
+        assert result.rows["static_review_metrics"] == 1
+        assert result.rows["output_blobs"] == 1
+        assert result.archive_path is None
+
+        summary = await db.execute_query("SELECT * FROM run_summaries")
+        assert len(summary) == 1
+        assert summary[0]["run_id"] == old_run
+        assert summary[0]["invocations"] == 2
+        assert summary[0]["invocation_tokens"] == 15
+        assert summary[0]["review_findings"] == 1
+
+        assert await db.get_invocation_count(new_run) == 1
+        assert await _count(db, "execution_runs") == 2
+
+        # A second pass finds nothing new
+        again = await db.archive_runs()
+        assert again.run_ids == [] and again.total_rows == 0
+
+
+async def test_rows_copied_to_archive_database(tmp_path: Path) -> None:
+    archive = tmp_path / "archive.db"
+    async with OrchestratorDB(tmp_path / "orchestrator.db") as db:
+        old_run, _ = await _seed(db)
+        await db.archive_runs(archive_path=archive)
+        # Rows added to an archive table since the last pass are appended
+        await db.execute_update(
+            "INSERT INTO git_stash_log (task_id, operation, success, created_at)"
+            " VALUES (1, 'create', 1, ?)",
+            (OLD,),
+        )
+        result = await db.archive_runs(archive_path=archive)
+        assert result.rows["git_stash_log"] == 1
+
+    with sqlite3.connect(archive) as conn:
+        runs = conn.execute("SELECT id FROM execution_runs").fetchall()
+        invocations = conn.execute("SELECT run_id, stage FROM invocations ORDER BY id").fetchall()
+        blobs = conn.execute(
+            "SELECT b.codec, b.data FROM attempts a JOIN output_blobs b"
+            " ON b.id = a.pytest_output_blob"
+        ).fetchall()
+        stash = conn.execute("SELECT COUNT(*) FROM git_stash_log").fetchone()
+    assert runs == [(old_run,)]
+    assert invocations == [(old_run, "red"), (old_run, "green")]
+    assert [decode_blob(codec, data) for codec, data in blobs] == ["output of 1"]
+    assert stash == (1,)
+
+
+async def test_retention_window_from_config(tmp_path: Path) -> None:
+    async with OrchestratorDB(tmp_path / "orchestrator.db") as db:
+        await _seed(db)
+        await db.set_config("retention_days", "3650")
+
+        result = await db.archive_runs()
+        assert result.run_ids == []
+        assert result.total_rows == 0
+
+
+async def test_legacy_database_converted_to_incremental_vacuum(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA auto_vacuum = NONE")
+        conn.execute("CREATE TABLE placeholder (id INTEGER)")
+
+    async with OrchestratorDB(path) as db:
+        await db.archive_runs()
+        rows = await db.execute_query("PRAGMA auto_vacuum")
+        assert rows[0]["auto_vacuum"] == 2  # INCREMENTAL
+
+
+async def test_new_database_uses_incremental_vacuum(tmp_path: Path) -> None:
+    async with OrchestratorDB(tmp_path / "orchestrator.db") as db:
+        rows = await db.execute_query("PRAGMA auto_vacuum")
+        assert rows[0]["auto_vacuum"] == 2
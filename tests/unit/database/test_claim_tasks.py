@@ -0,0 +1,72 @@
+"""Tests for batch task claiming and the cached worker id."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from tdd_orchestrator.database import OrchestratorDB
+
+
+async def _claims(db: OrchestratorDB) -> list[tuple[str, int]]:
+    rows = await db.execute_query(
+        "SELECT t.task_key, c.worker_id FROM task_claims c"
+        " JOIN tasks t ON t.id = c.task_id ORDER BY c.id"
+    )
+    return [(row["task_key"], row["worker_id"]) for row in rows]
+
+
+async def test_claims_ready_tasks_in_order(db: OrchestratorDB) -> None:
+    worker_db_id = await db.register_worker(7)
+    await db.create_task("C", "C", phase=1, sequence=0)
+    await db.create_task("B", "B", phase=0, sequence=1)
+    await db.create_task("A", "A", phase=0, sequence=0)
+    await db.create_task("D", "D", phase=0, sequence=2, depends_on=["C"])
+
+    claimed = await db.claim_tasks(7, 2)
+    assert [t["task_key"] for t in claimed] == ["A", "B"]
+    assert all(t["status"] == "in_progress" and t["claimed_by"] == 7 for t in claimed)
+    assert await _claims(db) == [("A", worker_db_id), ("B", worker_db_id)]
+
+    # D stays blocked on C; only C is left
+    claimed = await db.claim_tasks(7, 5)
+    assert [t["task_key"] for t in claimed] == ["C"]
+    assert await db.claim_tasks(7, 5) == []
+
+
+async def test_phase_filter_and_zero_limit(db: OrchestratorDB) -> None:
+    await db.create_task("A", "A", phase=0)
+    await db.create_task("B", "B", phase=1)
+
+    assert await db.claim_tasks(1, 0) == []
+    claimed = await db.claim_tasks(1, 5, phase=1)
+    assert [t["task_key"] for t in claimed] == ["B"]
+
+
+async def test_concurrent_claims_never_overlap(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path) as first, OrchestratorDB(path) as second:
+        for i in range(30):
+            await first.create_task(f"T{i:02d}", f"T{i}", sequence=i)
+
+        batches = await asyncio.gather(
+            *[db.claim_tasks(w, 4) for w in range(1, 6) for db in (first, second)]
+        )
+    keys = [t["task_key"] for batch in batches for t in batch]
+    assert len(keys) == len(set(keys)) == 30
+
+
+async def test_worker_id_lookup_is_cached(db: OrchestratorDB) -> None:
+    await db.register_worker(3)
+    for i in range(3):
+        await db.create_task(f"T{i}", f"T{i}")
+    tasks = await db.get_claimable_tasks()
+
+    statements: list[str] = []
+    assert db._conn is not None
+    await db._conn.set_trace_callback(statements.append)
+    assert await db.claim_task(tasks[0]["id"], 3)
+    assert await db.release_task(tasks[0]["id"], 3, "completed")
+    assert len(await db.claim_tasks(3, 2)) == 2
+
+    assert not any("FROM workers" in sql for sql in statements)
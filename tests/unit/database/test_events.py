@@ -0,0 +1,202 @@
+"""Tests for the in-process event bus and the mutations publishing on it."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from dataclasses import astuple
+from typing import Any
+
+import pytest
+
+from tdd_orchestrator.circuit_breaker import StageCircuitBreaker
+from tdd_orchestrator.circuit_breaker_config import CircuitBreakerConfig, StageCircuitConfig
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.database.events import (
+    CircuitStateChanged,
+    DBEvent,
+    EventBus,
+    EventSubscription,
+    InvocationRecorded,
+    TaskClaimed,
+    TaskReleased,
+    TaskStatusChanged,
+)
+from tdd_orchestrator.db.observer import (
+    EventBusObserver,
+    register_task_callback,
+    unregister_task_callback,
+)
+
+
+@pytest.fixture
+def callbacks() -> Iterator[list[dict[str, Any]]]:
+    received: list[dict[str, Any]] = []
+    register_task_callback(received.append)
+    yield received
+    unregister_task_callback(received.append)
+
+
+async def _drain(subscription: EventSubscription) -> list[DBEvent]:
+    """Close the subscription and return everything it buffered."""
+    subscription.close()
+    return [event async for event in subscription]
+
+
+def _fields(event: DBEvent) -> tuple[Any, ...]:
+    """Event type and fields, without the timestamp."""
+    values = astuple(event)[:-1]
+    return (type(event).__name__, *values)
+
+
+def _statuses(events: list[DBEvent]) -> list[tuple[str, str | None, str]]:
+    return [
+        (e.task_key, e.old_status, e.new_status) for e in events if isinstance(e, TaskStatusChanged)
+    ]
+
+
+class TestEventBus:
+    async def test_fan_out_and_kind_filter(self) -> None:
+        bus = EventBus()
+        everything = bus.subscribe()
+        status_only = bus.subscribe(TaskStatusChanged)
+
+        bus.publish(TaskStatusChanged("T1", "pending", "in_progress"))
+        bus.publish(TaskReleased(1, 1, "completed"))
+
+        assert [type(e) for e in await _drain(everything)] == [TaskStatusChanged, TaskReleased]
+        assert [type(e) for e in await _drain(status_only)] == [TaskStatusChanged]
+        assert bus.subscriber_count == 0
+
+    async def test_full_queue_drops_oldest(self) -> None:
+        bus = EventBus()
+        subscription = bus.subscribe(maxsize=2)
+        for i in range(5):
+            bus.publish(TaskStatusChanged(f"T{i}", None, "pending"))
+
+        assert subscription.dropped == 3
+        assert subscription.pending == 2
+        first = await subscription.get()
+        assert isinstance(first, TaskStatusChanged) and first.task_key == "T3"
+
+    async def test_closed_subscription_ignores_later_events(self) -> None:
+        bus = EventBus()
+        subscription = bus.subscribe()
+        bus.publish(TaskReleased(1, 1, "completed"))
+        subscription.close()
+        bus.publish(TaskReleased(2, 1, "completed"))
+
+        assert [_fields(e) for e in await _drain(subscription)] == [
+            ("TaskReleased", 1, 1, "completed")
+        ]
+        assert await subscription.get() is None
+
+
+class TestPublishedMutations:
+    async def test_status_changes_carry_old_status(self, db: OrchestratorDB) -> None:
+        await db.create_task("T1", "Task")
+        subscription = db.events.subscribe()
+
+        await db.update_task_status("T1", "in_progress")
+        await db.update_task_status("T1", "in_progress")  # unchanged: not published
+        await db.update_task_status("T1", "passing")
+        assert not await db.update_task_status("MISSING", "passing")
+
+        assert _statuses(await _drain(subscription)) == [
+            ("T1", "pending", "in_progress"),
+            ("T1", "in_progress", "passing"),
+        ]
+
+    async def test_claims_and_releases(self, db: OrchestratorDB) -> None:
+        await db.register_worker(1)
+        first = await db.create_task("T1", "Task")
+        await db.create_task("T2", "Task")
+        subscription = db.events.subscribe(TaskClaimed, TaskReleased)
+
+        assert await db.claim_task(first, 1)
+        assert not await db.claim_task(first, 1)  # already claimed: nothing published
+        (second,) = await db.claim_tasks(1, 5)
+        assert await db.release_task(first, 1, "completed")
+
+        assert [_fields(e) for e in await _drain(subscription)] == [
+            ("TaskClaimed", first, "T1", 1),
+            ("TaskClaimed", second["id"], "T2", 1),
+            ("TaskReleased", first, 1, "completed"),
+        ]
+
+    async def test_claims_and_expiry_publish_status_changes(self, db: OrchestratorDB) -> None:
+        task_id = await db.create_task("T1", "Task")
+        subscription = db.events.subscribe(TaskStatusChanged)
+
+        assert await db.claim_task(task_id, 1)
+        await db.execute_update(
+            "UPDATE tasks SET claim_expires_at = datetime('now', '-1 minute') WHERE id = ?",
+            (task_id,),
+        )
+        assert await db.cleanup_stale_claims() == 1
+
+        assert _statuses(await _drain(subscription)) == [
+            ("T1", "pending", "in_progress"),
+            ("T1", "in_progress", "pending"),
+        ]
+
+    async def test_queued_invocation_published_after_group_commit(self, db: OrchestratorDB) -> None:
+        run_id = await db.start_execution_run(1)
+        subscription = db.events.subscribe(InvocationRecorded)
+        await db.enable_write_batching(flush_interval=60)
+
+        await db.record_invocation(run_id, "red", token_count=7)
+        assert subscription.pending == 0
+        await db.flush_writes()
+
+        (event,) = await _drain(subscription)
+        assert isinstance(event, InvocationRecorded)
+        assert (event.run_id, event.stage, event.token_count) == (run_id, "red", 7)
+
+    async def test_circuit_transitions(self, db: OrchestratorDB) -> None:
+        config = CircuitBreakerConfig(stage=StageCircuitConfig(max_failures=1))
+        circuit = StageCircuitBreaker(db, "T1:green", config)
+        await circuit.load_state()
+        subscription = db.events.subscribe(CircuitStateChanged)
+
+        await circuit.record_failure("boom")
+        await circuit.reset()
+
+        assert [_fields(e)[1:6] for e in await _drain(subscription)] == [
+            ("stage", "T1:green", "closed", "open", "threshold_reached"),
+            ("stage", "T1:green", "open", "closed", "manual_reset"),
+        ]
+
+
+class TestEventBusObserver:
+    async def test_dispatches_status_changes(
+        self, db: OrchestratorDB, callbacks: list[dict[str, Any]]
+    ) -> None:
+        await db.create_task("T1", "Task")
+        observer = EventBusObserver(db)
+        await observer.start()
+        assert observer.is_running
+
+        await db.update_task_status("T1", "in_progress")
+        await db.update_task_status("T1", "complete")
+        await observer.stop()  # drains what was already published
+
+        assert [(e["task_id"], e["old_status"], e["new_status"]) for e in callbacks] == [
+            ("T1", "pending", "in_progress"),
+            ("T1", "in_progress", "complete"),
+        ]
+        assert not observer.is_running
+        assert db.events.subscriber_count == 0
+
+    async def test_callbacks_run_outside_the_mutation(
+        self, db: OrchestratorDB, callbacks: list[dict[str, Any]]
+    ) -> None:
+        await db.create_task("T1", "Task")
+        observer = EventBusObserver(db)
+        await observer.start()
+
+        await db.update_task_status("T1", "in_progress")
+        assert callbacks == []
+        await asyncio.sleep(0)
+        assert len(callbacks) == 1
+        await observer.stop()
@@ -0,0 +1,103 @@
+"""Tests for the PRAGMA user_version migration runner."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.database.migrations import MIGRATIONS, SCHEMA_VERSION
+
+
+def _user_version(path: Path) -> int:
+    with sqlite3.connect(path) as conn:
+        return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def test_migration_versions_are_contiguous() -> None:
+    assert [m.version for m in MIGRATIONS] == list(range(1, SCHEMA_VERSION + 1))
+
+
+async def test_new_database_stamped_with_current_version(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path):
+        pass
+    assert _user_version(path) == SCHEMA_VERSION
+
+
+async def test_current_database_skips_schema_script(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path):
+        pass
+    # An object schema.sql would recreate if it ran again
+    with sqlite3.connect(path) as conn:
+        conn.execute("DROP INDEX idx_tasks_complexity")
+
+    with caplog.at_level(logging.INFO, logger="tdd_orchestrator.database"):
+        async with OrchestratorDB(path) as db:
+            rows = await db.execute_query(
+                "SELECT name FROM sqlite_master WHERE name = 'idx_tasks_complexity'"
+            )
+    assert rows == []
+    assert any("warm start, schema current" in r.getMessage() for r in caplog.records)
+
+
+async def test_legacy_database_migrated_in_order(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path) as db:
+        await db.create_task("TDD-1", "First")
+    # Roll back to a pre-versioning database without the later columns
+    with sqlite3.connect(path) as conn:
+        conn.execute("ALTER TABLE execution_runs DROP COLUMN pipeline_state")
+        conn.execute("ALTER TABLE execution_runs DROP COLUMN pipeline_type")
+        conn.execute("PRAGMA user_version = 0")
+
+    with caplog.at_level(logging.INFO, logger="tdd_orchestrator.database"):
+        async with OrchestratorDB(path) as db:
+            run_id = await db.start_execution_run(1)
+            rows = await db.execute_query(
+                "SELECT pipeline_type FROM execution_runs WHERE id = ?", (run_id,)
+            )
+            assert rows[0]["pipeline_type"] == "run"
+
+    applied = [
+        r.getMessage() for r in caplog.records if "Applied schema migration" in r.getMessage()
+    ]
+    assert [m.split()[3] for m in applied] == [str(m.version) for m in MIGRATIONS]
+    assert any("cold start, schema migrated" in r.getMessage() for r in caplog.records)
+    assert _user_version(path) == SCHEMA_VERSION
+
+
+async def test_partial_upgrade_resumes_from_recorded_version(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path):
+        pass
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+
+    async with OrchestratorDB(path):
+        pass
+    assert _user_version(path) == SCHEMA_VERSION
+
+
+async def test_phase_seq_index_replaced_by_page_index(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path):
+        pass
+    with sqlite3.connect(path) as conn:
+        conn.execute("DROP INDEX idx_tasks_page")
+        conn.execute("CREATE INDEX idx_tasks_phase_seq ON tasks(phase, sequence)")
+        conn.execute("PRAGMA user_version = 8")
+
+    async with OrchestratorDB(path) as db:
+        rows = await db.execute_query(
+            "SELECT name FROM sqlite_master WHERE name LIKE 'idx_tasks_p%' ORDER BY name"
+        )
+    assert [r["name"] for r in rows] == ["idx_tasks_page"]
@@ -0,0 +1,78 @@
+"""Tests for compressed, deduplicated tool output storage."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.database.blobs import decode_blob, encode_blob
+
+PYTEST_OUTPUT = "tests/test_x.py::test_case PASSED\n" * 200
+
+
+def test_encode_round_trip_and_codec_choice() -> None:
+    digest, codec, size, data = encode_blob(PYTEST_OUTPUT)
+    assert codec == "zlib" and len(data) < size == len(PYTEST_OUTPUT)
+    assert decode_blob(codec, data) == PYTEST_OUTPUT
+
+    _, codec, _, data = encode_blob("ok ✓")
+    assert codec == "raw"
+    assert decode_blob(codec, data) == "ok ✓"
+    assert encode_blob("a")[0] != digest
+
+    with pytest.raises(ValueError, match="codec"):
+        decode_blob("lz4", b"")
+
+
+async def test_outputs_stored_once_and_loaded_on_request(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    first = await db.record_attempt(
+        task_id, "green", pytest_output=PYTEST_OUTPUT, mypy_output="Success: no issues found"
+    )
+    second = await db.record_attempt(task_id, "green", pytest_output=PYTEST_OUTPUT, ruff_output="")
+
+    blobs = await db.execute_query("SELECT codec FROM output_blobs ORDER BY id")
+    assert [b["codec"] for b in blobs] == ["zlib", "raw", "raw"]
+
+    assert await db.get_attempt_outputs(first) == {
+        "pytest": PYTEST_OUTPUT,
+        "mypy": "Success: no issues found",
+        "ruff": None,
+    }
+    assert await db.get_attempt_outputs(second) == {
+        "pytest": PYTEST_OUTPUT,
+        "mypy": None,
+        "ruff": "",
+    }
+    assert await db.get_attempt_outputs(second + 1) is None
+
+
+async def test_migration_moves_inline_output(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path) as db:
+        task_id = await db.create_task("TDD-1", "First")
+    # Recreate the pre-blob layout with inline output
+    with sqlite3.connect(path) as conn:
+        conn.execute("ALTER TABLE attempts ADD COLUMN pytest_output TEXT")
+        conn.execute("ALTER TABLE attempts ADD COLUMN mypy_output TEXT")
+        conn.execute("ALTER TABLE attempts ADD COLUMN ruff_output TEXT")
+        conn.executemany(
+            "INSERT INTO attempts (task_id, stage, attempt_number, pytest_output, mypy_output)"
+            " VALUES (?, 'green', ?, ?, ?)",
+            [(task_id, 1, PYTEST_OUTPUT, None), (task_id, 2, PYTEST_OUTPUT, "error: x")],
+        )
+        conn.execute("PRAGMA user_version = 6")
+
+    async with OrchestratorDB(path) as db:
+        columns = await db.execute_query("SELECT name FROM pragma_table_info('attempts')")
+        assert "pytest_output" not in {c["name"] for c in columns}
+        assert await db.get_attempt_outputs(2) == {
+            "pytest": PYTEST_OUTPUT,
+            "mypy": "error: x",
+            "ruff": None,
+        }
+        blobs = await db.execute_query("SELECT COUNT(*) AS n FROM output_blobs")
+        assert blobs[0]["n"] == 2
@@ -0,0 +1,81 @@
+"""Tests for WAL journaling and the read-only connection pool."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.database.read_pool import READ_POOL_SIZE, read_connection
+
+
+@pytest.fixture
+async def file_db(tmp_path: Path) -> AsyncIterator[OrchestratorDB]:
+    db = OrchestratorDB(tmp_path / "orchestrator.db")
+    await db.connect()
+    yield db
+    await db.close()
+
+
+class TestConnectionProfile:
+    async def test_file_database_uses_wal(self, file_db: OrchestratorDB) -> None:
+        assert file_db._conn is not None
+        async with file_db._conn.execute("PRAGMA journal_mode") as cursor:
+            row = await cursor.fetchone()
+        assert row is not None and row[0] == "wal"
+
+    async def test_pool_opened_for_file_database(self, file_db: OrchestratorDB) -> None:
+        assert file_db._read_pool is not None
+        assert file_db._read_pool.is_open
+        assert len({id(read_connection(file_db)) for _ in range(READ_POOL_SIZE * 2)}) == (
+            READ_POOL_SIZE
+        )
+
+    async def test_memory_database_reads_use_writer(self) -> None:
+        async with OrchestratorDB(":memory:") as db:
+            assert db._read_pool is None
+            assert read_connection(db) is db._conn
+
+    async def test_close_releases_pool(self, tmp_path: Path) -> None:
+        db = OrchestratorDB(tmp_path / "o.db")
+        await db.connect()
+        await db.close()
+        assert db._read_pool is None
+        assert read_connection(db) is None
+
+
+class TestPooledReads:
+    async def test_reader_sees_committed_writes(self, file_db: OrchestratorDB) -> None:
+        await file_db.create_task("TDD-1", "First")
+        async with read_connection(file_db).execute("SELECT task_key FROM tasks") as cursor:
+            rows = await cursor.fetchall()
+        assert [row["task_key"] for row in rows] == ["TDD-1"]
+
+    async def test_readers_are_read_only(self, file_db: OrchestratorDB) -> None:
+        with pytest.raises(sqlite3.OperationalError):
+            await read_connection(file_db).execute("DELETE FROM tasks")
+
+    async def test_read_not_blocked_by_open_write_transaction(
+        self, file_db: OrchestratorDB
+    ) -> None:
+        await file_db.create_task("TDD-1", "First")
+        assert file_db._conn is not None
+        await file_db._conn.execute("BEGIN IMMEDIATE")
+        await file_db._conn.execute("UPDATE tasks SET status = 'in_progress'")
+        try:
+            stats = await asyncio.wait_for(file_db.get_stats(), timeout=1.0)
+        finally:
+            await file_db._conn.rollback()
+        # Snapshot isolation: the uncommitted update is invisible
+        assert stats["pending"] == 1
+        assert stats["in_progress"] == 0
+
+
+def test_read_connection_falls_back_for_test_doubles() -> None:
+    db = MagicMock()
+    assert read_connection(db) is db._conn
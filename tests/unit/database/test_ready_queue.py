@@ -0,0 +1,133 @@
+"""Tests for the trigger-maintained task ready queue."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.database.migrations import (
+    REBUILD_READY_QUEUE_SQL,
+    REBUILD_TASK_DEPENDENCIES_SQL,
+)
+
+# The original JSON-scanning readiness query, used as the reference
+REFERENCE_READY_SQL = """
+SELECT t.task_key
+FROM tasks t
+WHERE t.status = 'pending'
+AND NOT EXISTS (
+    SELECT 1
+    FROM json_each(t.depends_on) AS dep
+    JOIN tasks blocker ON blocker.task_key = dep.value
+    WHERE blocker.status NOT IN ('complete', 'passing')
+)
+"""
+
+
+async def _ready(db: OrchestratorDB) -> set[str]:
+    rows = await db.execute_query("SELECT task_key FROM v_ready_tasks")
+    return {row["task_key"] for row in rows}
+
+
+async def _reference(db: OrchestratorDB) -> set[str]:
+    rows = await db.execute_query(REFERENCE_READY_SQL)
+    return {row["task_key"] for row in rows}
+
+
+async def _set_status(db: OrchestratorDB, key: str, status: str) -> None:
+    await db.execute_update("UPDATE tasks SET status = ? WHERE task_key = ?", (status, key))
+
+
+async def test_completion_unblocks_dependents(db: OrchestratorDB) -> None:
+    await db.create_task("A", "A", sequence=0)
+    await db.create_task("B", "B", sequence=1, depends_on=["A"])
+    await db.create_task("C", "C", sequence=2, depends_on=["A", "B"])
+    assert await _ready(db) == {"A"}
+
+    await _set_status(db, "A", "complete")
+    assert await _ready(db) == {"B"}
+    await _set_status(db, "B", "passing")
+    assert await _ready(db) == {"C"}
+
+    # Reopening a prerequisite blocks its dependents again
+    await _set_status(db, "A", "pending")
+    assert await _ready(db) == {"A"}
+
+
+async def test_late_insert_of_missing_dependency_blocks(db: OrchestratorDB) -> None:
+    await db.create_task("B", "B", depends_on=["A"])
+    assert await _ready(db) == {"B"}
+
+    await db.create_task("A", "A")
+    assert await _ready(db) == {"A"}
+
+    await db.execute_update("DELETE FROM tasks WHERE task_key = 'A'")
+    assert await _ready(db) == {"B"}
+
+
+async def test_dependency_edits_and_ordering(db: OrchestratorDB) -> None:
+    await db.create_task("A", "A", phase=1, sequence=0)
+    await db.create_task("B", "B", phase=0, sequence=0)
+    await db.execute_update("UPDATE tasks SET depends_on = '[\"B\"]' WHERE task_key = 'A'")
+    assert await _ready(db) == {"B"}
+
+    await db.execute_update("UPDATE tasks SET depends_on = '[]' WHERE task_key = 'A'")
+    await db.execute_update("UPDATE tasks SET phase = 2 WHERE task_key = 'B'")
+    rows = await db.execute_query("SELECT task_key FROM v_ready_tasks")
+    assert [row["task_key"] for row in rows] == ["A", "B"]
+
+
+async def test_matches_reference_under_random_changes(db: OrchestratorDB) -> None:
+    rng = random.Random(1234)
+    keys = [f"T-{i:02d}" for i in range(30)]
+    # Random insertion order leaves forward references missing for a while
+    for i, key in enumerate(rng.sample(keys, k=len(keys))):
+        await db.create_task(key, key, sequence=i, depends_on=rng.sample(keys, k=rng.randint(0, 3)))
+        assert await _ready(db) == await _reference(db)
+
+    statuses = ["pending", "in_progress", "passing", "complete", "blocked"]
+    for step in range(300):
+        key = rng.choice(keys)
+        if step % 25 == 0:
+            deps = json.dumps(rng.sample(keys, k=rng.randint(0, 3)))
+            await db.execute_update(
+                "UPDATE tasks SET depends_on = ? WHERE task_key = ?", (deps, key)
+            )
+        elif step % 40 == 0:
+            await db.execute_update("DELETE FROM tasks WHERE task_key = ?", (key,))
+            await db.create_task(key, key, depends_on=rng.sample(keys, k=2))
+        else:
+            await _set_status(db, key, rng.choice(statuses))
+        assert await _ready(db) == await _reference(db)
+
+    # Incremental counters agree with a full rebuild
+    snapshot = "SELECT * FROM task_ready_queue ORDER BY task_id"
+    incremental = [dict(row) for row in await db.execute_query(snapshot)]
+    assert db._conn is not None
+    await db._conn.executescript(REBUILD_TASK_DEPENDENCIES_SQL + REBUILD_READY_QUEUE_SQL)
+    assert [dict(row) for row in await db.execute_query(snapshot)] == incremental
+
+
+async def test_migration_backfills_legacy_view(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path) as db:
+        await db.create_task("A", "A")
+        await db.create_task("B", "B", depends_on=["A"])
+        await db.create_task("C", "C", depends_on=["MISSING"])
+        # Simulate a database created before the ready queue existed
+        assert db._conn is not None
+        await db._conn.executescript(
+            "DROP VIEW v_ready_tasks;"
+            f"CREATE VIEW v_ready_tasks AS {REFERENCE_READY_SQL};"
+            "DELETE FROM task_ready_queue;"
+            "PRAGMA user_version = 0;"
+        )
+
+    async with OrchestratorDB(path) as reopened:
+        assert await _ready(reopened) == {"A", "C"}
+        rows = await reopened.execute_query(
+            "SELECT sql FROM sqlite_master WHERE name = 'v_ready_tasks'"
+        )
+        assert "task_ready_queue" in rows[0]["sql"]
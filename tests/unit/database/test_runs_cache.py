@@ -0,0 +1,93 @@
+"""Tests for the config cache and in-process invocation counter."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from tdd_orchestrator.database import OrchestratorDB
+
+
+async def _trace(db: OrchestratorDB) -> list[str]:
+    """Record every statement the writer connection executes from now on."""
+    statements: list[str] = []
+    assert db._conn is not None
+    await db._conn.set_trace_callback(statements.append)
+    return statements
+
+
+async def test_config_reads_are_cached_and_write_through(db: OrchestratorDB) -> None:
+    assert await db.get_config("max_green_attempts") is not None
+    statements = await _trace(db)
+
+    await db.get_config("max_green_attempts")
+    assert await db.get_config("no_such_key", "fallback") == "fallback"
+    assert await db.get_config("no_such_key", "other") == "other"
+    assert len(statements) == 1  # only the first miss on no_such_key
+
+    await db.set_config("no_such_key", "42")
+    assert await db.get_config("no_such_key") == "42"
+    assert await db.get_config_int("no_such_key", 0) == 42
+
+
+async def test_budget_check_is_query_free_after_warmup(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    run_id = await db.start_execution_run(1)
+    await db.check_invocation_budget(run_id)
+
+    await db.record_invocation(run_id, "red", task_id=task_id)
+    statements = await _trace(db)
+    await db.record_invocation(run_id, "green", task_id=task_id)
+    writes = len(statements)
+
+    count, limit, _ = await db.check_invocation_budget(run_id)
+    assert (count, limit) == (2, 100)
+    assert len(statements) == writes
+
+
+async def test_counter_counts_queued_invocations(db: OrchestratorDB) -> None:
+    run_id = await db.start_execution_run(1)
+    await db.enable_write_batching(flush_interval=60)
+    for _ in range(3):
+        await db.record_invocation(run_id, "red")
+
+    assert await db.get_invocation_count(run_id) == 3
+    await db.complete_execution_run(run_id)
+    rows = await db.execute_query(
+        "SELECT total_invocations FROM execution_runs WHERE id = ?", (run_id,)
+    )
+    assert rows[0]["total_invocations"] == 3
+
+
+async def test_counter_ignores_invocations_that_never_commit(db: OrchestratorDB) -> None:
+    run_id = await db.start_execution_run(1)
+    await db.execute_update(
+        "CREATE TRIGGER reject_boom BEFORE INSERT ON invocations WHEN NEW.stage = 'boom'"
+        " BEGIN SELECT RAISE(ABORT, 'boom'); END"
+    )
+    with pytest.raises(aiosqlite.IntegrityError):
+        await db.record_invocation(run_id, "boom")
+    assert await db.get_invocation_count(run_id) == 0
+
+    await db.enable_write_batching(flush_interval=60)
+    await db.record_invocation(run_id, "red")
+    await db.record_invocation(run_id, "boom")
+    assert await db.get_invocation_count(run_id) == 1
+    await db.complete_execution_run(run_id)
+    assert await db.get_invocation_count(run_id) == 1
+
+
+async def test_unknown_run_loaded_from_database(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path) as db:
+        run_id = await db.start_execution_run(1)
+        await db.record_invocation(run_id, "red")
+        await db.record_invocation(run_id, "green")
+
+    async with OrchestratorDB(path) as reopened:
+        assert await reopened.get_invocation_count(run_id) == 2
+        await reopened.record_invocation(run_id, "refactor")
+        assert await reopened.get_invocation_count(run_id) == 3
+        assert await reopened.get_invocation_count(run_id + 1) == 0
@@ -0,0 +1,99 @@
+"""Tests for the normalized task_dependencies edge table."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.database.migrations import REBUILD_TASK_DEPENDENCIES_SQL
+
+EDGES_SQL = """
+SELECT t.task_key, e.depends_on_key, b.task_key AS resolved
+FROM task_dependencies e
+JOIN tasks t ON t.id = e.task_id
+LEFT JOIN tasks b ON b.id = e.depends_on_id
+ORDER BY t.task_key, e.position
+"""
+
+
+async def _edges(db: OrchestratorDB) -> list[tuple[str, str, str | None]]:
+    rows = await db.execute_query(EDGES_SQL)
+    return [(row["task_key"], row["depends_on_key"], row["resolved"]) for row in rows]
+
+
+async def test_insert_mirrors_json_and_resolves_later(db: OrchestratorDB) -> None:
+    await db.create_task("B", "B", depends_on=["A", "A", "C"])
+    assert await _edges(db) == [("B", "A", None), ("B", "C", None)]
+
+    await db.create_task("A", "A")
+    assert await _edges(db) == [("B", "A", "A"), ("B", "C", None)]
+
+
+async def test_depends_on_update_rewrites_edges(db: OrchestratorDB) -> None:
+    await db.create_task("A", "A")
+    await db.create_task("B", "B", depends_on=["A"])
+    await db.update_task_status("B", "complete")
+
+    await db.execute_update("UPDATE tasks SET depends_on = '[\"X\"]' WHERE task_key = 'B'")
+    assert await _edges(db) == [("B", "X", None)]
+    await db.execute_update("UPDATE tasks SET depends_on = 'not json' WHERE task_key = 'B'")
+    assert await _edges(db) == []
+
+
+async def test_rename_and_delete_keep_edges_consistent(db: OrchestratorDB) -> None:
+    await db.create_task("A", "A")
+    await db.create_task("B", "B", depends_on=["A", "A2"])
+    assert await db.get_next_pending_task() is not None
+
+    await db.execute_update("UPDATE tasks SET task_key = 'A2' WHERE task_key = 'A'")
+    assert await _edges(db) == [("B", "A", None), ("B", "A2", "A2")]
+    ready = await db.execute_query("SELECT task_key FROM v_ready_tasks")
+    assert [row["task_key"] for row in ready] == ["A2"]
+
+    await db.execute_update("DELETE FROM tasks WHERE task_key = 'A2'")
+    assert await _edges(db) == [("B", "A", None), ("B", "A2", None)]
+    ready = await db.execute_query("SELECT task_key FROM v_ready_tasks")
+    assert [row["task_key"] for row in ready] == ["B"]
+
+
+async def test_reverse_lookup_uses_index(db: OrchestratorDB) -> None:
+    rows = await db.execute_query(
+        "EXPLAIN QUERY PLAN SELECT task_id FROM task_dependencies WHERE depends_on_id = 1"
+    )
+    assert any("idx_task_dependencies_reverse" in row["detail"] for row in rows)
+
+
+async def test_rebuild_matches_incremental(db: OrchestratorDB) -> None:
+    for i in range(20):
+        deps = [f"T{j}" for j in range(max(0, i - 3), i + 2) if j != i]
+        await db.create_task(f"T{i}", f"T{i}", depends_on=deps)
+    incremental = await _edges(db)
+
+    assert db._conn is not None
+    await db._conn.executescript(REBUILD_TASK_DEPENDENCIES_SQL)
+    assert await _edges(db) == incremental
+
+
+async def test_migration_backfills_edges(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path) as db:
+        await db.create_task("A", "A")
+        await db.create_task("B", "B", depends_on=["A", "GHOST"])
+        assert db._conn is not None
+        # Simulate a database from before the edge table: first-generation
+        # ready queue trigger present, no edges recorded
+        await db._conn.executescript(
+            "CREATE TRIGGER trg_ready_queue_delete AFTER DELETE ON tasks BEGIN SELECT 1; END;"
+            "DELETE FROM task_dependencies;"
+            "DELETE FROM task_ready_queue;"
+            "PRAGMA user_version = 4;"
+        )
+
+    async with OrchestratorDB(path) as reopened:
+        assert await _edges(reopened) == [("B", "A", "A"), ("B", "GHOST", None)]
+        task = await reopened.get_next_pending_task()
+        assert task is not None and task["task_key"] == "A"
+        triggers = await reopened.execute_query(
+            "SELECT name FROM sqlite_master WHERE name = 'trg_ready_queue_delete'"
+        )
+        assert triggers == []
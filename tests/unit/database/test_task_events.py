@@ -0,0 +1,99 @@
+"""Tests for the task_events change log and the observer reading it."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.db.observer import (
+    DBObserver,
+    register_task_callback,
+    unregister_task_callback,
+)
+
+
+@pytest.fixture
+def events() -> Iterator[list[dict[str, Any]]]:
+    received: list[dict[str, Any]] = []
+    register_task_callback(received.append)
+    yield received
+    unregister_task_callback(received.append)
+
+
+async def _logged(db: OrchestratorDB) -> list[tuple[str, str | None, str]]:
+    rows = await db.execute_query(
+        "SELECT task_key, old_status, new_status FROM task_events ORDER BY id"
+    )
+    return [(r["task_key"], r["old_status"], r["new_status"]) for r in rows]
+
+
+async def test_trigger_logs_only_real_transitions(db: OrchestratorDB) -> None:
+    await db.create_task("TDD-1", "First")
+    await db.update_task_status("TDD-1", "in_progress")
+    await db.update_task_status("TDD-1", "in_progress")
+    await db.execute_update("UPDATE tasks SET title = 'Renamed' WHERE task_key = 'TDD-1'")
+    await db.update_task_status("TDD-1", "complete")
+
+    assert await _logged(db) == [
+        ("TDD-1", "pending", "in_progress"),
+        ("TDD-1", "in_progress", "complete"),
+    ]
+
+
+async def test_every_transition_between_polls_is_dispatched(
+    db: OrchestratorDB, events: list[dict[str, Any]]
+) -> None:
+    await db.create_task("TDD-1", "First")
+    await db.update_task_status("TDD-1", "in_progress")  # before start: not reported
+    observer = DBObserver(db, poll_interval=60)
+    await observer._load_watermark()
+
+    await db.update_task_status("TDD-1", "passing")
+    await db.update_task_status("TDD-1", "complete")
+    await observer._poll()
+    await observer._poll()
+
+    assert [(e["task_id"], e["old_status"], e["new_status"]) for e in events] == [
+        ("TDD-1", "in_progress", "passing"),
+        ("TDD-1", "passing", "complete"),
+    ]
+    assert all("T" in e["timestamp"] for e in events)
+
+
+async def test_idle_poll_reads_past_watermark_only(db: OrchestratorDB) -> None:
+    await db.create_task("TDD-1", "First")
+    observer = DBObserver(db, poll_interval=60)
+    await observer._load_watermark()
+
+    statements: list[str] = []
+    assert db._conn is not None
+    await db._conn.set_trace_callback(statements.append)
+    await observer._poll()
+
+    assert len(statements) == 1
+    assert "FROM task_events" in statements[0]
+
+
+async def test_acknowledged_events_are_pruned(
+    db: OrchestratorDB, events: list[dict[str, Any]]
+) -> None:
+    for i in range(3):
+        await db.create_task(f"TDD-{i}", f"Task {i}")
+    observer = DBObserver(db, poll_interval=60, prune_threshold=2)
+    await observer._load_watermark()
+
+    await db.update_task_status("TDD-0", "in_progress")
+    await observer._poll()
+    assert len(await _logged(db)) == 1  # below the threshold
+
+    await db.update_task_status("TDD-1", "in_progress")
+    await observer._poll()
+    assert await _logged(db) == []
+
+    await db.update_task_status("TDD-2", "in_progress")
+    await observer._prune()
+    assert await _logged(db) == [("TDD-2", "pending", "in_progress")]  # not yet dispatched
+    assert [e["task_id"] for e in events] == ["TDD-0", "TDD-1"]
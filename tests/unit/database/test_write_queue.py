@@ -0,0 +1,227 @@
+"""Tests for group-commit write batching."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tdd_orchestrator.database import OrchestratorDB
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncIterator[OrchestratorDB]:
+    database = OrchestratorDB(tmp_path / "orchestrator.db")
+    await database.connect()
+    yield database
+    await database.close()
+
+
+async def _count(db: OrchestratorDB, table: str) -> int:
+    rows = await db.execute_query(f"SELECT COUNT(*) AS n FROM {table}")
+    return int(rows[0]["n"])
+
+
+async def test_unbatched_appends_commit_immediately(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    assert task_id
+    attempt_id = await db.record_stage_attempt(task_id, "red", 1, True)
+    assert attempt_id > 0
+    assert db.write_batch_stats() is None
+
+
+async def test_batched_appends_share_one_commit(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    run_id = await db.start_execution_run(2)
+    # Long interval so only explicit flushes commit
+    await db.enable_write_batching(flush_interval=60)
+
+    for i in range(5):
+        assert await db.record_stage_attempt(task_id, "red", i + 1, True) == 0
+    await db.log_stash_operation(task_id, "stash@{0}", "create", True)
+    await db.record_invocation(run_id, "red", task_id=task_id)
+    assert await _count(db, "attempts") == 0
+
+    assert await db.flush_writes() == 7
+    stats = db.write_batch_stats()
+    assert stats is not None
+    assert (stats.batches, stats.operations, stats.max_batch_size) == (1, 7, 7)
+    assert await _count(db, "attempts") == 5
+    assert await _count(db, "git_stash_log") == 1
+
+
+async def test_max_batch_triggers_early_flush(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    await db.enable_write_batching(flush_interval=60, max_batch=3)
+    for i in range(3):
+        await db.record_stage_attempt(task_id, "green", i + 1, False)
+
+    stats = db.write_batch_stats()
+    assert stats is not None
+    for _ in range(50):
+        if stats.batches:
+            break
+        await db.execute_query("SELECT 1")
+    assert stats.batches == 1
+    assert await _count(db, "attempts") == 3
+
+
+async def test_reads_that_depend_on_appends_flush_first(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    run_id = await db.start_execution_run(1)
+    await db.enable_write_batching(flush_interval=60)
+
+    await db.record_invocation(run_id, "red", task_id=task_id)
+    await db.record_invocation(run_id, "green", task_id=task_id)
+    await db.record_stage_attempt(task_id, "red", 1, True)
+
+    assert await db.get_invocation_count(run_id) == 2
+    assert len(await db.get_stage_attempts(task_id)) == 1
+
+
+async def test_close_flushes_pending_writes(tmp_path: Path) -> None:
+    path = tmp_path / "orchestrator.db"
+    async with OrchestratorDB(path) as db:
+        task_id = await db.create_task("TDD-1", "First")
+        await db.enable_write_batching(flush_interval=60)
+        await db.record_stage_attempt(task_id, "red", 1, True)
+
+    async with OrchestratorDB(path) as reopened:
+        assert await _count(reopened, "attempts") == 1
+
+
+async def test_failed_batch_is_rolled_back_and_counted(db: OrchestratorDB) -> None:
+    await db.enable_write_batching(flush_interval=60)
+    assert db._write_queue is not None
+    db._write_queue.submit(("INSERT INTO no_such_table VALUES (?)", (1,)))
+
+    assert await db.flush_writes() == 0
+    stats = db.write_batch_stats()
+    assert stats is not None
+    assert stats.failed_operations == 1
+    assert stats.batches == 0
+
+
+async def test_bad_operation_is_dropped_and_the_rest_commit(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    await db.enable_write_batching(flush_interval=60)
+    assert db._write_queue is not None
+    committed: list[str] = []
+
+    await db.record_stage_attempt(task_id, "red", 1, True)
+    db._write_queue.submit(
+        ("INSERT INTO no_such_table VALUES (?)", (1,)), on_commit=lambda: committed.append("bad")
+    )
+    db._write_queue.submit(
+        (
+            "INSERT INTO git_stash_log (task_id, stash_id, operation, success) VALUES (?, ?, ?, ?)",
+            (task_id, "stash@{0}", "create", 1),
+        ),
+        on_commit=lambda: committed.append("good"),
+    )
+
+    assert await db.flush_writes() == 2
+    stats = db.write_batch_stats()
+    assert stats is not None
+    assert (stats.failed_operations, stats.operations) == (1, 2)
+    assert committed == ["good"]
+    assert await _count(db, "attempts") == 1
+    assert await _count(db, "git_stash_log") == 1
+
+
+async def test_locked_database_requeues_the_batch(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    await db.enable_write_batching(flush_interval=60)
+    assert db._conn is not None
+    await db._conn.execute("PRAGMA busy_timeout = 0")
+    for i in range(3):
+        await db.record_stage_attempt(task_id, "red", i + 1, True)
+
+    other = sqlite3.connect(str(db.db_path))
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        assert await db.flush_writes() == 0
+    finally:
+        other.rollback()
+        other.close()
+
+    stats = db.write_batch_stats()
+    assert stats is not None
+    assert (stats.requeued_batches, stats.failed_operations) == (1, 0)
+    assert await db.flush_writes() == 3
+    assert await _count(db, "attempts") == 3
+
+
+async def test_flusher_survives_unexpected_errors(
+    db: OrchestratorDB, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    await db.enable_write_batching(flush_interval=0.01)
+    queue = db._write_queue
+    assert queue is not None
+    flush = queue.flush
+    calls = 0
+
+    async def flaky_flush() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("boom")
+        return await flush()
+
+    monkeypatch.setattr(queue, "flush", flaky_flush)
+    await db.record_stage_attempt(task_id, "red", 1, True)
+    for _ in range(100):
+        if queue.stats.operations:
+            break
+        await asyncio.sleep(0.01)
+
+    assert queue.is_running
+    assert queue.stats.operations == 1
+
+
+class _LockedOnce:
+    """Connection proxy that reports SQLITE_BUSY once for matching statements."""
+
+    def __init__(self, conn: Any, marker: str) -> None:
+        self._conn = conn
+        self._marker = marker
+        self.raised = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    async def execute(self, sql: str, params: Any = ()) -> Any:
+        if self._marker in sql and not self.raised:
+            self.raised = True
+            error = sqlite3.OperationalError("database is locked")
+            error.sqlite_errorcode = sqlite3.SQLITE_BUSY
+            raise error
+        return await self._conn.execute(sql, params)
+
+
+async def test_contention_during_replay_writes_nothing_twice(db: OrchestratorDB) -> None:
+    task_id = await db.create_task("TDD-1", "First")
+    await db.enable_write_batching(flush_interval=60)
+    queue = db._write_queue
+    assert queue is not None
+    proxy = _LockedOnce(queue._conn, "git_stash_log")
+    queue._conn = proxy  # type: ignore[assignment]
+
+    # The bad insert forces a replay; the stash insert then hits contention
+    await db.record_stage_attempt(task_id, "red", 1, True)
+    queue.submit(("INSERT INTO no_such_table VALUES (?)", (1,)))
+    await db.log_stash_operation(task_id, "stash@{0}", "create", True)
+
+    assert await db.flush_writes() == 0
+    assert proxy.raised
+    assert await _count(db, "attempts") == 0
+    assert queue.pending == 2
+
+    assert await db.flush_writes() == 2
+    assert await _count(db, "attempts") == 1
+    assert await _count(db, "git_stash_log") == 1
@@ -5,7 +5,7 @@ Creates DecomposedTask objects directly (pure function, no mocks needed).
 
 from __future__ import annotations
 
-from tdd_orchestrator.decomposition.dependency_validator import validate_no_cycles
+from tdd_orchestrator.decomposition.dependency_validator import find_cycles, validate_no_cycles
 from tdd_orchestrator.decomposition.task_model import DecomposedTask
 
 
@@ -164,3 +164,20 @@ def test_large_graph_performance() -> None:
     errors = validate_no_cycles(tasks)
 
     assert errors == []
+
+
+def test_dependents_of_cycle_not_reported() -> None:
+    """Tasks that only depend on a cycle are not cycles themselves."""
+    tasks = [
+        _make_task("A", depends_on=["C"]),
+        _make_task("B", depends_on=["A"]),
+        _make_task("C", depends_on=["B"]),
+        _make_task("D", depends_on=["A"]),
+    ]
+    assert validate_no_cycles(tasks) == ["A -> B -> C -> A"]
+
+
+def test_find_cycles_on_plain_graph() -> None:
+    """find_cycles works on a task_key -> depends_on mapping."""
+    assert find_cycles({"A": ["B"], "B": ["A"], "C": ["EXTERNAL"]}) == ["A -> B -> A"]
+    assert find_cycles({}) == []
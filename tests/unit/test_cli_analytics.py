@@ -0,0 +1,40 @@
+"""Tests for the backfill-analytics CLI command."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from tdd_orchestrator.cli import cli
+from tdd_orchestrator.database import OrchestratorDB
+
+
+async def _seed_without_rollups(path: Path) -> None:
+    async with OrchestratorDB(path) as db:
+        await db.create_task("T1", "Task", phase=0, sequence=1)
+        await db.mark_task_complete("T1")
+        run_id = await db.start_execution_run(1)
+        await db.record_invocation(run_id, "red", token_count=3)
+        await db.flush_writes()
+        await db.execute_update("DELETE FROM invocation_stage_rollup")
+        await db.execute_update("DELETE FROM task_completion_rollup")
+
+
+async def _rollup_rows(path: Path) -> list[tuple[str, int]]:
+    async with OrchestratorDB(path) as db:
+        rows = await db.execute_query("SELECT stage, tokens FROM invocation_stage_rollup")
+    return [(str(row["stage"]), int(row["tokens"])) for row in rows]
+
+
+def test_backfill_rebuilds_rollups(tmp_path: Path) -> None:
+    db_path = tmp_path / "orchestrator.db"
+    asyncio.run(_seed_without_rollups(db_path))
+
+    result = CliRunner().invoke(cli, ["backfill-analytics", "--db", str(db_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "invocation_stage_rollup: 1 row(s)" in result.output
+    assert "task_completion_rollup: 1 row(s)" in result.output
+    assert asyncio.run(_rollup_rows(db_path)) == [("red", 3)]
@@ -0,0 +1,61 @@
+"""Tests for the archive CLI command."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from tdd_orchestrator.cli import cli
+from tdd_orchestrator.database import OrchestratorDB
+
+
+async def _seed_old_run(path: Path) -> None:
+    async with OrchestratorDB(path) as db:
+        run_id = await db.start_execution_run(1)
+        await db.record_invocation(run_id, "red")
+        await db.complete_execution_run(run_id)
+        await db.execute_update(
+            "UPDATE execution_runs SET completed_at = '2020-01-01 00:00:00' WHERE id = ?",
+            (run_id,),
+        )
+
+
+def test_archive_help_lists_options() -> None:
+    result = CliRunner().invoke(cli, ["archive", "--help"])
+    assert result.exit_code == 0
+    for option in ("--retention-days", "--archive-db", "--discard", "--no-vacuum"):
+        assert option in result.output
+
+
+def test_archive_defaults_to_sibling_archive_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "orchestrator.db"
+    asyncio.run(_seed_old_run(db_path))
+
+    result = CliRunner().invoke(cli, ["archive", "--db", str(db_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "Runs summarized: 1" in result.output
+    assert "invocations: 1" in result.output
+    assert (tmp_path / "orchestrator-archive.db").exists()
+
+
+def test_archive_discard_skips_archive_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "orchestrator.db"
+    asyncio.run(_seed_old_run(db_path))
+
+    result = CliRunner().invoke(
+        cli, ["archive", "--db", str(db_path), "--discard", "--retention-days", "7"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Archive:" not in result.output
+    assert not (tmp_path / "orchestrator-archive.db").exists()
+
+
+def test_archive_rejects_zero_retention(tmp_path: Path) -> None:
+    result = CliRunner().invoke(
+        cli, ["archive", "--db", str(tmp_path / "x.db"), "--retention-days", "0"]
+    )
+    assert result.exit_code != 0
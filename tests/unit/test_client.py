@@ -104,6 +104,32 @@ async def test_list_tasks_with_filters() -> None:
     await client.close()
 
 
+async def test_iter_tasks_follows_cursors_lazily() -> None:
+    pages = {
+        None: {"tasks": [{"id": "T1"}, {"id": "T2"}], "next_cursor": "c1"},
+        "c1": {"tasks": [{"id": "T3"}], "next_cursor": None},
+    }
+    requested: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor")
+        requested.append(cursor)
+        assert request.url.params["limit"] == "2"
+        assert request.url.params["exact_total"] == "false"
+        return _json_response(200, pages[cursor])
+
+    client = _make_client(handler)
+    keys = [task["id"] async for task in client.iter_tasks(page_size=2)]
+    assert keys == ["T1", "T2", "T3"]
+    assert requested == [None, "c1"]
+
+    requested.clear()
+    async for _ in client.iter_task_pages(page_size=2):
+        break
+    assert requested == [None]
+    await client.close()
+
+
 # ---------------------------------------------------------------------------
 # get_task
 # ---------------------------------------------------------------------------
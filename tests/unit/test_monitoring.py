@@ -525,6 +525,94 @@ class TestMetricsCollector:
         assert len(duration_metrics) >= 1
 
 
+class TestCountersAndHistograms:
+    """Tests for accumulating counters, bucketed histograms and export."""
+
+    @pytest.fixture
+    def collector(self) -> MetricsCollector:
+        """Create fresh collector."""
+        return MetricsCollector()
+
+    def test_counters_accumulate(self, collector: MetricsCollector) -> None:
+        """Test counters keep a running total per label set."""
+        for _ in range(3):
+            collector.record_failure("worker", "w1", "timeout")
+        collector.record_failure("worker", "w2", "timeout")
+
+        output = collector.export_prometheus()
+        assert (
+            'circuit_breaker_failures_total{level="worker",identifier="w1",error_type="timeout"} 3.0'
+            in output
+        )
+        assert 'identifier="w2",error_type="timeout"} 1.0' in output
+
+    def test_counter_cannot_decrease(self, collector: MetricsCollector) -> None:
+        """Test a negative counter increment is rejected."""
+        with pytest.raises(ValueError):
+            collector.counter("jobs_total").labels().inc(-1)
+
+    def test_histogram_exports_buckets_sum_and_count(self, collector: MetricsCollector) -> None:
+        """Test histogram export follows the Prometheus histogram format."""
+        latency = collector.histogram("job_seconds", "Job time", ("kind",), buckets=(1, 5))
+        for value in (0.5, 1.0, 3.0, 10.0):
+            latency.labels("build").observe(value)
+
+        lines = collector.export_prometheus().splitlines()
+        assert lines[lines.index("# TYPE job_seconds histogram") + 1 :] == [
+            'job_seconds_bucket{kind="build",le="1.0"} 2',
+            'job_seconds_bucket{kind="build",le="5.0"} 3',
+            'job_seconds_bucket{kind="build",le="+Inf"} 4',
+            'job_seconds_sum{kind="build"} 14.5',
+            'job_seconds_count{kind="build"} 4',
+        ]
+        (snapshot,) = [m for m in collector.get_all_metrics() if m.name == "job_seconds"]
+        assert (snapshot.value, snapshot.count) == (14.5, 4)
+        assert snapshot.to_prometheus().splitlines() == lines[-5:]
+
+    def test_unlabelled_histogram_buckets(self, collector: MetricsCollector) -> None:
+        """Test bucket lines of a histogram without labels."""
+        collector.histogram("wait_seconds", buckets=(0.1,)).labels().observe(0.2)
+
+        output = collector.export_prometheus()
+        assert 'wait_seconds_bucket{le="0.1"} 0' in output
+        assert 'wait_seconds_bucket{le="+Inf"} 1' in output
+        assert "wait_seconds_count 1" in output
+
+    def test_help_and_type_once_per_family(self, collector: MetricsCollector) -> None:
+        """Test HELP/TYPE lines are written once, not per series."""
+        collector.record_success("worker", "w1")
+        collector.record_success("worker", "w2")
+
+        output = collector.export_prometheus()
+        assert output.count("# TYPE circuit_breaker_successes_total counter") == 1
+        assert output.endswith("\n")
+
+    def test_handles_are_reused(self, collector: MetricsCollector) -> None:
+        """Test a label set maps to one pre-bound handle."""
+        family = collector.counter("retries_total", "Retries", ("stage",))
+        handle = family.labels("green")
+
+        assert family.labels("green") is handle
+        assert family.labels(stage="green") is handle
+        assert collector.counter("retries_total", "Retries", ("stage",)) is family
+
+    def test_conflicting_registration_rejected(self, collector: MetricsCollector) -> None:
+        """Test a name cannot be re-registered with another type or labels."""
+        collector.counter("retries_total", labels=("stage",))
+        with pytest.raises(ValueError):
+            collector.gauge("retries_total", labels=("stage",))
+        with pytest.raises(ValueError):
+            collector.counter("retries_total", labels=("model",))
+        with pytest.raises(ValueError):
+            collector.counter("retries_total", labels=("stage",)).labels("a", "b")
+
+    def test_label_values_escaped(self, collector: MetricsCollector) -> None:
+        """Test quotes, backslashes and newlines in label values are escaped."""
+        collector.record_failure("worker", 'a"b\\c\nd')
+
+        assert 'identifier="a\\"b\\\\c\\nd"' in collector.export_prometheus()
+
+
 class TestGlobalMetricsCollector:
     """Tests for global metrics collector functions."""
 
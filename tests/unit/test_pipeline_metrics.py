@@ -0,0 +1,127 @@
+"""Tests for the pipeline hot-path instrumentation and the metrics exporter."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tdd_orchestrator.code_verifier import CodeVerifier
+from tdd_orchestrator.database import OrchestratorDB
+from tdd_orchestrator.metrics import (
+    MetricsCollector,
+    get_metrics_collector,
+    reset_metrics_collector,
+    start_metrics_server,
+)
+from tdd_orchestrator.models import Stage, StageResult
+from tdd_orchestrator.pipeline_metrics import PipelineMetrics, get_pipeline_metrics
+from tdd_orchestrator.subprocess_utils import spawn_subprocess
+from tdd_orchestrator.worker_pool.circuit_breakers import StaticReviewCircuitBreaker
+from tdd_orchestrator.worker_pool.config import ESCALATION_MODEL
+from tdd_orchestrator.worker_pool.pipeline import PipelineContext, _run_green_with_retry
+
+
+@pytest.fixture
+def metrics() -> Iterator[PipelineMetrics]:
+    reset_metrics_collector()
+    yield get_pipeline_metrics()
+    reset_metrics_collector()
+
+
+def _green_ctx(tmp_path: Path, results: list[bool]) -> PipelineContext:
+    db = AsyncMock()
+    config = {"max_green_attempts": 3, "green_retry_delay_ms": 0}
+    db.get_config_int = AsyncMock(side_effect=lambda key, default: config.get(key, default))
+    run_stage = AsyncMock(
+        side_effect=[StageResult(stage=Stage.GREEN, success=ok, output="") for ok in results]
+    )
+    return PipelineContext(
+        db=db,
+        base_dir=tmp_path,
+        worker_id=1,
+        run_id=1,
+        static_review_circuit_breaker=StaticReviewCircuitBreaker(),
+        run_stage=run_stage,
+    )
+
+
+async def _scrape(port: int, path: str) -> tuple[str, str]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = (await reader.read()).decode()
+    writer.close()
+    head, _, body = response.partition("\r\n\r\n")
+    return head, body
+
+
+class TestInstrumentation:
+    async def test_spawns_counted_per_program(self, metrics: PipelineMetrics) -> None:
+        for _ in range(2):
+            proc = await spawn_subprocess(sys.executable, "-c", "pass")
+            await proc.wait()
+
+        assert metrics.subprocess_spawns.labels(Path(sys.executable).name).value == 2
+
+    async def test_verifier_tool_latency(self, metrics: PipelineMetrics, tmp_path: Path) -> None:
+        verifier = CodeVerifier(tmp_path)
+        await verifier._run_command(sys.executable, "-c", "pass")
+        await verifier._run_command(str(tmp_path / "missing-tool"))
+
+        assert metrics.verify_tool_duration.labels(Path(sys.executable).name).count == 1
+        assert metrics.verify_tool_duration.labels("missing-tool").count == 1
+
+    async def test_write_lock_wait_recorded(self, metrics: PipelineMetrics, tmp_path: Path) -> None:
+        async with OrchestratorDB(tmp_path / "lock.db") as db:
+            before = metrics.write_lock_wait.count
+            await db.create_task("T1", "Task", phase=0, sequence=1)
+
+        assert metrics.write_lock_wait.count > before
+
+    async def test_green_retries_and_attempts(
+        self, metrics: PipelineMetrics, tmp_path: Path
+    ) -> None:
+        task: dict[str, Any] = {"id": 1, "task_key": "T1"}
+        result = await _run_green_with_retry(
+            _green_ctx(tmp_path, [False, True]), task, test_output=""
+        )
+        await _run_green_with_retry(_green_ctx(tmp_path, [False] * 3), task, test_output="")
+
+        assert result.success
+        assert metrics.green_retries.labels(ESCALATION_MODEL).value == 3
+        assert metrics.green_attempts.labels("success").sum == 2
+        assert metrics.green_attempts.labels("failure").sum == 3
+
+    def test_rebinds_after_collector_reset(self, metrics: PipelineMetrics) -> None:
+        reset_metrics_collector()
+        rebound = get_pipeline_metrics()
+
+        assert rebound is not metrics
+        assert rebound.collector is get_metrics_collector()
+        assert get_pipeline_metrics() is rebound
+
+
+class TestMetricsServer:
+    async def test_serves_prometheus_text(self) -> None:
+        collector = MetricsCollector()
+        collector.counter("jobs_total", "Jobs").labels().inc(3)
+        server = await start_metrics_server(0, collector=collector)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            head, body = await _scrape(port, "/metrics")
+            missing, _ = await _scrape(port, "/other")
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert head.startswith("HTTP/1.0 200")
+        assert "text/plain; version=0.0.4" in head
+        assert body == collector.export_prometheus()
+        assert "jobs_total 3" in body
+        assert missing.startswith("HTTP/1.0 404")
@@ -98,12 +98,12 @@ class TestCheckGhAvailable:
         mock_proc.returncode = 0
         mock_proc.communicate = AsyncMock(return_value=(b"gh version 2.0", b""))
 
-        with patch("tdd_orchestrator.prd_pipeline.asyncio.create_subprocess_exec",
+        with patch("tdd_orchestrator.prd_pipeline.spawn_subprocess",
                     return_value=mock_proc):
             assert await _check_gh_available() is True
 
     async def test_returns_false_on_file_not_found(self) -> None:
-        with patch("tdd_orchestrator.prd_pipeline.asyncio.create_subprocess_exec",
+        with patch("tdd_orchestrator.prd_pipeline.spawn_subprocess",
                     side_effect=FileNotFoundError):
             assert await _check_gh_available() is False
 
@@ -112,7 +112,7 @@ class TestCheckGhAvailable:
         mock_proc.returncode = 1
         mock_proc.communicate = AsyncMock(return_value=(b"", b"error"))
 
-        with patch("tdd_orchestrator.prd_pipeline.asyncio.create_subprocess_exec",
+        with patch("tdd_orchestrator.prd_pipeline.spawn_subprocess",
                     return_value=mock_proc):
             assert await _check_gh_available() is False
 
@@ -127,7 +127,7 @@ class TestCreatePullRequest:
             return_value=(b"https://github.com/org/repo/pull/42\n", b"")
         )
 
-        with patch("tdd_orchestrator.prd_pipeline.asyncio.create_subprocess_exec",
+        with patch("tdd_orchestrator.prd_pipeline.spawn_subprocess",
                     return_value=mock_proc) as mock_exec:
             success, url = await _create_pull_request(
                 Path("/repo"), "feat/test", "main", "My PR", "Body text"
@@ -148,7 +148,7 @@ class TestCreatePullRequest:
             return_value=(b"https://github.com/org/repo/pull/99\n", b"")
         )
 
-        with patch("tdd_orchestrator.prd_pipeline.asyncio.create_subprocess_exec",
+        with patch("tdd_orchestrator.prd_pipeline.spawn_subprocess",
                     return_value=mock_proc):
             success, url = await _create_pull_request(
                 Path("/repo"), "feat/x", "main", "Title", "Body"
@@ -158,7 +158,7 @@ class TestCreatePullRequest:
         assert url == "https://github.com/org/repo/pull/99"
 
     async def test_returns_false_when_gh_not_installed(self) -> None:
-        with patch("tdd_orchestrator.prd_pipeline.asyncio.create_subprocess_exec",
+        with patch("tdd_orchestrator.prd_pipeline.spawn_subprocess",
                     side_effect=FileNotFoundError):
             success, url = await _create_pull_request(
                 Path("/repo"), "feat/x", "main", "Title", "Body"
@@ -172,7 +172,7 @@ class TestCreatePullRequest:
         mock_proc.returncode = 1
         mock_proc.communicate = AsyncMock(return_value=(b"", b"auth required"))
 
-        with patch("tdd_orchestrator.prd_pipeline.asyncio.create_subprocess_exec",
+        with patch("tdd_orchestrator.prd_pipeline.spawn_subprocess",
                     return_value=mock_proc):
             success, url = await _create_pull_request(
                 Path("/repo"), "feat/x", "main", "Title", "Body"
@@ -0,0 +1,103 @@
+"""Unit tests for token-aware prompt assembly."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tdd_orchestrator.decomposition.utils import estimate_token_count
+from tdd_orchestrator.models import Stage
+from tdd_orchestrator.prompt_budget import (
+    STAGE_TOKEN_BUDGETS,
+    fit_prompt,
+    resolve_token_budget,
+    shrink_section,
+)
+from tdd_orchestrator.prompt_builder import PromptBuilder
+
+_TEMPLATE = "HEAD\n{sibling_tests_section}{conftest_section}{truncated_output}\n{issues_text}"
+
+
+def _sections(size: int) -> dict[str, Any]:
+    return {
+        "sibling_tests_section": "s" * size,
+        "conftest_section": "c" * size,
+        "truncated_output": "\n".join("o" * 79 for _ in range(size // 80)),
+        "issues_text": "ISSUES",
+    }
+
+
+class TestResolveTokenBudget:
+    def test_stage_default(self) -> None:
+        assert resolve_token_budget(Stage.GREEN) == STAGE_TOKEN_BUDGETS["green"]
+
+    def test_model_family_scales_budget(self) -> None:
+        base = resolve_token_budget("fix")
+        assert resolve_token_budget("fix", "claude-haiku-4-5-20251001") < base
+        assert resolve_token_budget("fix", "claude-opus-4-5-20251101") > base
+
+
+class TestShrinkSection:
+    def test_short_text_unchanged(self) -> None:
+        assert shrink_section("abc", 10) == "abc"
+
+    def test_closes_open_code_fence(self) -> None:
+        text = "```python\n" + "\n".join(f"line_{i} = {i}" for i in range(200)) + "\n```\n"
+        shrunk = shrink_section(text, 300)
+        assert len(shrunk) < len(text)
+        assert shrunk.count("```") % 2 == 0
+        assert "truncated to fit prompt budget" in shrunk
+
+
+class TestFitPrompt:
+    def test_no_budget_renders_verbatim(self) -> None:
+        sections = _sections(4000)
+        assert fit_prompt(_TEMPLATE, "fix", None, **sections) == _TEMPLATE.format(**sections)
+
+    def test_under_budget_untouched(self) -> None:
+        sections = _sections(100)
+        assert fit_prompt(_TEMPLATE, "fix", 10_000, **sections) == _TEMPLATE.format(**sections)
+
+    def test_drops_optional_sections_first(self) -> None:
+        result = fit_prompt(_TEMPLATE, "fix", 1500, **_sections(4000))
+        assert "sss" not in result
+        assert "ccc" not in result
+        assert "ooo" in result
+        assert estimate_token_count(result) <= 1500
+
+    def test_shrinks_required_sections_but_never_drops_them(self) -> None:
+        result = fit_prompt(_TEMPLATE, "fix", 200, **_sections(8000))
+        assert "ooo" in result
+        assert "ISSUES" in result
+        assert "truncated to fit prompt budget" in result
+
+    def test_logs_pre_and_post_token_counts(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.INFO, logger="tdd_orchestrator.prompt_budget"):
+            fit_prompt(_TEMPLATE, "green", 1500, **_sections(4000))
+        assert "Prompt budget for green" in caplog.text
+        assert "degraded: sibling_tests_section" in caplog.text
+
+
+def test_build_applies_stage_budget(tmp_path: Path) -> None:
+    """PromptBuilder.build drops sibling context when the budget is tight."""
+    test_dir = tmp_path / "tests"
+    test_dir.mkdir()
+    (test_dir / "test_current.py").write_text("def test_x(): pass\n")
+    (test_dir / "test_sibling.py").write_text("import pytest\n")
+    task = {
+        "task_key": "TDD-1",
+        "goal": "Do it",
+        "test_file": "tests/test_current.py",
+        "impl_file": "src/foo.py",
+    }
+
+    unbudgeted = PromptBuilder.red(task, base_dir=tmp_path)
+    budgeted = PromptBuilder.build(
+        Stage.RED, task, base_dir=tmp_path,
+        token_budget=estimate_token_count(unbudgeted) - 1,
+    )
+    assert "SIBLING TESTS" in unbudgeted
+    assert "SIBLING TESTS" not in budgeted
@@ -0,0 +1,136 @@
+"""Unit tests for the stat-keyed prompt enrichment cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tdd_orchestrator.prompt_cache import (
+    EnrichmentCache,
+    get_enrichment_cache,
+    invalidate_enrichment_cache,
+)
+from tdd_orchestrator.prompt_enrichment import discover_sibling_tests, read_file_safe
+
+
+def _bump_mtime(path: Path) -> None:
+    """Force a distinct mtime so the stat fingerprint changes."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_read_text_hits_cache_when_file_unchanged(tmp_path: Path) -> None:
+    """Second read of an unchanged file does not touch the disk."""
+    target = tmp_path / "a.py"
+    target.write_text("x = 1\n")
+    cache = EnrichmentCache()
+
+    assert cache.read_text(target) == "x = 1\n"
+    with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+        assert cache.read_text(target) == "x = 1\n"
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_read_text_rereads_when_file_changes(tmp_path: Path) -> None:
+    """A modified file is re-read on the next lookup."""
+    target = tmp_path / "a.py"
+    target.write_text("x = 1\n")
+    cache = EnrichmentCache()
+    cache.read_text(target)
+
+    target.write_text("x = 22\n")
+    _bump_mtime(target)
+    assert cache.read_text(target) == "x = 22\n"
+
+
+def test_read_text_raises_for_missing_file(tmp_path: Path) -> None:
+    """Missing files surface as OSError, matching Path.read_text."""
+    with pytest.raises(OSError):
+        EnrichmentCache().read_text(tmp_path / "missing.py")
+
+
+def test_list_dir_sees_new_files(tmp_path: Path) -> None:
+    """Adding a file to the directory invalidates the cached listing."""
+    (tmp_path / "test_a.py").write_text("")
+    cache = EnrichmentCache()
+    assert [p.name for p in cache.list_dir(tmp_path, "test_*.py")] == ["test_a.py"]
+
+    (tmp_path / "test_b.py").write_text("")
+    _bump_mtime(tmp_path)
+    assert [p.name for p in cache.list_dir(tmp_path, "test_*.py")] == [
+        "test_a.py",
+        "test_b.py",
+    ]
+
+
+def test_derive_memoizes_per_file_version(tmp_path: Path) -> None:
+    """Derived values are computed once per file version."""
+    target = tmp_path / "a.py"
+    target.write_text("abc")
+    cache = EnrichmentCache()
+    calls: list[str] = []
+
+    def compute(content: str) -> int:
+        calls.append(content)
+        return len(content)
+
+    assert cache.derive(target, "len", compute) == 3
+    assert cache.derive(target, "len", compute) == 3
+    assert calls == ["abc"]
+
+
+def test_invalidate_scoped_to_base_dir(tmp_path: Path) -> None:
+    """Scoped invalidation only drops entries under the given directory."""
+    inside = tmp_path / "proj"
+    inside.mkdir()
+    (inside / "a.py").write_text("a")
+    outside = tmp_path / "b.py"
+    outside.write_text("b")
+    cache = EnrichmentCache()
+    cache.read_text(inside / "a.py")
+    cache.read_text(outside)
+
+    cache.invalidate(inside)
+    assert len(cache) == 1
+
+
+def test_lru_eviction_bounds_entries(tmp_path: Path) -> None:
+    """The cache never holds more than max_entries files."""
+    cache = EnrichmentCache(max_entries=2)
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.write_text(name)
+        cache.read_text(path)
+    assert len(cache) == 2
+
+
+def test_enrichment_helpers_share_process_cache(tmp_path: Path) -> None:
+    """Repeated prompt enrichment for the same tree is served from cache."""
+    test_dir = tmp_path / "tests"
+    test_dir.mkdir()
+    (test_dir / "test_current.py").write_text("def test_x(): pass\n")
+    (test_dir / "test_sibling.py").write_text("import pytest\n")
+    invalidate_enrichment_cache()
+
+    first = discover_sibling_tests(tmp_path, "tests/test_current.py")
+    hits_before = get_enrichment_cache().hits
+    second = discover_sibling_tests(tmp_path, "tests/test_current.py")
+
+    assert first == second
+    assert "import pytest" in second
+    assert get_enrichment_cache().hits > hits_before
+
+
+def test_read_file_safe_reflects_invalidation(tmp_path: Path) -> None:
+    """After invalidation, read_file_safe returns current disk contents."""
+    target = tmp_path / "impl.py"
+    target.write_text("old")
+    assert read_file_safe(tmp_path, "impl.py", 100, "") == "old"
+
+    target.write_text("new")
+    invalidate_enrichment_cache(tmp_path)
+    assert read_file_safe(tmp_path, "impl.py", 100, "") == "new"
@@ -0,0 +1,135 @@
+"""Unit tests for the AST-based project symbol index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tdd_orchestrator.symbol_index import SymbolIndex, module_name_for
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> SymbolIndex:
+    idx = SymbolIndex(tmp_path, db_path=":memory:")
+    yield idx  # type: ignore[misc]
+    idx.close()
+
+
+def _write(base: Path, rel: str, content: str) -> None:
+    path = base / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class TestModuleName:
+    def test_strips_src_prefix(self) -> None:
+        assert module_name_for("src/pkg/mod.py") == "pkg.mod"
+
+    def test_package_init(self) -> None:
+        assert module_name_for("src/pkg/__init__.py") == "pkg"
+
+
+class TestFileSymbols:
+    def test_defined_names_and_signatures(self, tmp_path: Path, index: SymbolIndex) -> None:
+        _write(tmp_path, "src/foo.py", (
+            "@cache\n"
+            "def compute(x: int) -> int:\n"
+            "    return x\n\n"
+            "class Service(Base):\n"
+            "    async def run(self, *, retries: int = 3) -> None:\n"
+            "        pass\n"
+        ))
+        info = index.file_symbols("src/foo.py")
+
+        assert info.exists and info.parses
+        assert info.defined_names == frozenset({"compute", "Service"})
+        assert info.signatures == (
+            "@cache\ndef compute(x: int) -> int:",
+            "class Service(Base):",
+            "    async def run(self, *, retries: int=3) -> None:",
+        )
+
+    def test_exports_respect_dunder_all(self, tmp_path: Path, index: SymbolIndex) -> None:
+        _write(tmp_path, "src/foo.py", (
+            "__all__ = ['public']\n"
+            "def public(): pass\n"
+            "def other(): pass\n"
+        ))
+        assert index.file_symbols("src/foo.py").exports == frozenset({"public"})
+
+    def test_exports_default_to_public_names(self, tmp_path: Path, index: SymbolIndex) -> None:
+        _write(tmp_path, "src/foo.py", "LIMIT = 3\n_hidden = 1\ndef run(): pass\n")
+        assert index.file_symbols("src/foo.py").exports == frozenset({"LIMIT", "run"})
+
+    def test_missing_file(self, index: SymbolIndex) -> None:
+        info = index.file_symbols("src/missing.py")
+        assert not info.exists
+        assert not info.parses
+
+    def test_syntax_error_marks_unparseable(self, tmp_path: Path, index: SymbolIndex) -> None:
+        _write(tmp_path, "src/foo.py", "def broken(:\n")
+        info = index.file_symbols("src/foo.py")
+        assert info.exists
+        assert not info.parses
+
+    def test_rejects_path_traversal(self, index: SymbolIndex) -> None:
+        assert not index.file_symbols("../etc/passwd").exists
+
+    def test_reindexes_changed_file(self, tmp_path: Path, index: SymbolIndex) -> None:
+        _write(tmp_path, "src/foo.py", "def a(): pass\n")
+        assert index.defines("src/foo.py", "a")
+
+        path = tmp_path / "src/foo.py"
+        path.write_text("def bb(): pass\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert not index.defines("src/foo.py", "a")
+        assert index.defines("src/foo.py", "bb")
+
+
+class TestRefreshAndEdges:
+    def test_tests_for_module(self, tmp_path: Path, index: SymbolIndex) -> None:
+        _write(tmp_path, "src/pkg/__init__.py", "")
+        _write(tmp_path, "src/pkg/mod.py", "def run(): pass\n")
+        _write(tmp_path, "tests/test_a.py", "from pkg.mod import run\n")
+        _write(tmp_path, "tests/test_b.py", "from pkg import mod\n")
+        _write(tmp_path, "tests/test_c.py", "import os\n")
+
+        assert index.refresh() == 5
+        assert index.tests_for_module("src/pkg/mod.py") == ["tests/test_a.py", "tests/test_b.py"]
+
+    def test_refresh_is_incremental(self, tmp_path: Path, index: SymbolIndex) -> None:
+        _write(tmp_path, "src/a.py", "def a(): pass\n")
+        _write(tmp_path, "src/b.py", "def b(): pass\n")
+        assert index.refresh() == 2
+        assert index.refresh() == 0
+
+        (tmp_path / "src/b.py").unlink()
+        index.refresh()
+        assert index.modules_defining("b") == []
+        assert index.modules_defining("a") == ["src/a.py"]
+
+    def test_relative_imports_resolved(self, tmp_path: Path, index: SymbolIndex) -> None:
+        _write(tmp_path, "src/pkg/__init__.py", "")
+        _write(tmp_path, "src/pkg/mod.py", "def run(): pass\n")
+        _write(tmp_path, "src/pkg/tests/test_mod.py", "from ..mod import run\n")
+        index.refresh()
+        assert index.tests_for_module("src/pkg/mod.py") == ["src/pkg/tests/test_mod.py"]
+
+    def test_persists_under_tdd_dir(self, tmp_path: Path) -> None:
+        (tmp_path / ".tdd").mkdir()
+        _write(tmp_path, "src/a.py", "def a(): pass\n")
+        first = SymbolIndex(tmp_path)
+        first.refresh()
+        first.close()
+
+        second = SymbolIndex(tmp_path)
+        try:
+            assert (tmp_path / ".tdd" / "symbols.db").exists()
+            assert second.refresh() == 0
+            assert second.modules_defining("a") == ["src/a.py"]
+        finally:
+            second.close()
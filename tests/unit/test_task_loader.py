@@ -8,7 +8,15 @@ import pytest
 
 from tdd_orchestrator.database import reset_db
 from tdd_orchestrator.database.core import OrchestratorDB
-from tdd_orchestrator.task_loader import update_task_depends_on
+from tdd_orchestrator.task_loader import (
+    _insert_rows_individually,
+    _task_row,
+    load_tdd_tasks,
+    update_acceptance_criteria_bulk,
+    update_depends_on_bulk,
+    update_task_depends_on,
+    write_tasks_incremental,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -64,3 +72,118 @@ async def test_update_task_depends_on_empty_list(db_with_task: OrchestratorDB) -
     assert task is not None
     deps = json.loads(task["depends_on"]) if task["depends_on"] else []
     assert deps == []
+
+
+def _tasks(count: int, prefix: str = "BULK") -> list[dict[str, object]]:
+    return [
+        {
+            "task_key": f"{prefix}-{i:04d}",
+            "title": f"Task {i}",
+            "acceptance_criteria": [f"criterion {i}"],
+            "depends_on": [f"{prefix}-{i - 1:04d}"] if i else [],
+            "phase": i % 3,
+            "sequence": i,
+        }
+        for i in range(count)
+    ]
+
+
+async def test_load_tdd_tasks_bulk_inserts_in_one_transaction() -> None:
+    db = OrchestratorDB(":memory:")
+    await db.connect()
+    result = await load_tdd_tasks(_tasks(1000), db=db)
+
+    assert result["loaded"] == 1000
+    assert result["task_keys"][:2] == ["BULK-0000", "BULK-0001"]
+    task = await db.get_task_by_key("BULK-0002")
+    assert task is not None
+    assert json.loads(task["depends_on"]) == ["BULK-0001"]
+    assert task["phase"] == 2
+    await db.close()
+
+
+async def test_load_tdd_tasks_skips_existing_and_repeated_keys(
+    db_with_task: OrchestratorDB,
+) -> None:
+    tasks = [
+        {"task_key": "TEST-TDD-01-01", "title": "Existing"},
+        {"task_key": "NEW-1", "title": "New"},
+        {"task_key": "NEW-1", "title": "Repeated"},
+    ]
+    result = await load_tdd_tasks(tasks, db=db_with_task)
+
+    assert result["loaded"] == 1
+    assert result["skipped"] == 2
+    assert result["errors"] == []
+    task = await db_with_task.get_task_by_key("NEW-1")
+    assert task is not None and task["title"] == "New"
+
+
+async def test_load_tdd_tasks_reports_duplicates_when_not_skipping(
+    db_with_task: OrchestratorDB,
+) -> None:
+    tasks = [{"task_key": "TEST-TDD-01-01", "title": "Dup"}, {"task_key": "N-2", "title": "N"}]
+    result = await load_tdd_tasks(tasks, db=db_with_task, skip_duplicates=False)
+
+    assert result["loaded"] == 1
+    assert result["skipped"] == 1
+    assert len(result["errors"]) == 1
+    assert "TEST-TDD-01-01" in result["errors"][0]
+
+
+async def test_load_tdd_tasks_skips_rows_that_fail_to_insert(
+    db_with_task: OrchestratorDB,
+) -> None:
+    tasks = [
+        {"task_key": "OK-1", "title": "Good"},
+        # A dict cannot be bound as a SQLite parameter
+        {"task_key": "BAD-1", "title": "Bad", "goal": {"not": "bindable"}},
+        {"task_key": "OK-2", "title": "Good"},
+    ]
+    result = await load_tdd_tasks(tasks, db=db_with_task)
+
+    assert result["task_keys"] == ["OK-1", "OK-2"]
+    assert result["loaded"] == 2
+    assert result["skipped"] == 1
+    assert len(result["errors"]) == 1 and "BAD-1" in result["errors"][0]
+    assert await db_with_task.get_task_by_key("OK-2") is not None
+    assert await db_with_task.get_task_by_key("BAD-1") is None
+
+
+async def test_row_by_row_fallback_is_one_transaction(db_with_task: OrchestratorDB) -> None:
+    rows = [_task_row({"task_key": key, "title": key}, 0, None) for key in ("R-1", "R-2")]
+    assert db_with_task._conn is not None
+
+    async with db_with_task._write_lock:
+        assert await _insert_rows_individually(db_with_task, ["R-1", "R-2"], rows) == []
+        assert db_with_task._conn.in_transaction
+        await db_with_task._conn.rollback()
+
+    assert await db_with_task.get_task_by_key("R-1") is None
+    assert await db_with_task.get_task_by_key("R-2") is None
+
+
+async def test_write_tasks_incremental_defaults_phase_and_title(
+    db_with_task: OrchestratorDB,
+) -> None:
+    written = await write_tasks_incremental(
+        [{"task_key": "CYC-1"}, {"task_key": ""}, {"task_key": "TEST-TDD-01-01"}],
+        cycle_number=4,
+        db=db_with_task,
+    )
+    assert written == 1
+    task = await db_with_task.get_task_by_key("CYC-1")
+    assert task is not None
+    assert (task["title"], task["phase"]) == ("Unnamed Task", 4)
+
+
+async def test_bulk_updates_ignore_missing_tasks(db_with_task: OrchestratorDB) -> None:
+    updated = await update_acceptance_criteria_bulk(
+        {"TEST-TDD-01-01": ["works"], "MISSING": ["nope"]}, db=db_with_task
+    )
+    assert updated == ["TEST-TDD-01-01"]
+    assert await update_depends_on_bulk({"MISSING": ["X"]}, db=db_with_task) == []
+
+    task = await db_with_task.get_task_by_key("TEST-TDD-01-01")
+    assert task is not None
+    assert json.loads(task["acceptance_criteria"]) == ["works"]